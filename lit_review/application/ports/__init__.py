@@ -3,7 +3,25 @@
 """Application ports - abstract interfaces for external dependencies."""
 
 from lit_review.application.ports.ai_analyzer import AIAnalyzer, ThemeHierarchy
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.citation_graph import CitationGraphService
+from lit_review.application.ports.enrichment_checkpoint import EnrichmentCheckpoint
 from lit_review.application.ports.paper_repository import PaperRepository
+from lit_review.application.ports.search_events import SearchEvent, SearchEventHook, SearchEventKind
 from lit_review.application.ports.search_service import SearchService
+from lit_review.application.ports.snowball_checkpoint import SnowballCheckpoint, SnowballProgress
 
-__all__ = ["SearchService", "PaperRepository", "AIAnalyzer", "ThemeHierarchy"]
+__all__ = [
+    "SearchService",
+    "SearchEvent",
+    "SearchEventHook",
+    "SearchEventKind",
+    "AsyncSearchService",
+    "PaperRepository",
+    "EnrichmentCheckpoint",
+    "CitationGraphService",
+    "SnowballCheckpoint",
+    "SnowballProgress",
+    "AIAnalyzer",
+    "ThemeHierarchy",
+]
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Async search service port for non-blocking academic database searches.
+
+Defines the abstract interface for asyncio-native search adapters, allowing
+many concurrent queries to run on one event loop without one OS thread per
+in-flight request.
+"""
+
+from abc import ABC, abstractmethod
+
+from lit_review.domain.entities.paper import Paper
+
+
+class AsyncSearchService(ABC):
+    """Abstract base class for asyncio-native academic database search services.
+
+    Implementations should handle API communication with a non-blocking
+    HTTP client, rate limiting via asyncio.sleep, and conversion of search
+    results to Paper entities.
+
+    Example:
+        >>> class AsyncCrossrefAdapter(AsyncSearchService):
+        ...     async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        ...         # Implementation
+        ...         pass
+    """
+
+    @abstractmethod
+    async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search for papers matching the query without blocking the event loop.
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        pass
+
+    @abstractmethod
+    def get_service_name(self) -> str:
+        """Return the name of this search service.
+
+        Returns:
+            Human-readable name of the service (e.g., "Crossref", "PubMed").
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release any resources held by the service (default: no-op)."""
+        pass
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Citation graph port for snowballing through references and citations.
+
+Defines the abstract interface for services that can list the papers a paper
+cites (backward snowballing) and the papers citing it (forward snowballing).
+"""
+
+from abc import ABC, abstractmethod
+
+from lit_review.domain.entities.paper import Paper
+
+
+class CitationGraphService(ABC):
+    """Abstract base class for citation graph lookups.
+
+    Implementations should handle API communication and rate limiting, and
+    must be safe to call from several threads at once.
+
+    Example:
+        >>> class SemanticScholarAdapter(SearchService, CitationGraphService):
+        ...     def get_references(self, doi: str, limit: int = 1000) -> list[Paper]:
+        ...         # Implementation
+        ...         pass
+    """
+
+    @abstractmethod
+    def get_references(self, doi: str, limit: int = 1000) -> list[Paper]:
+        """List the papers a paper cites.
+
+        Args:
+            doi: DOI of the citing paper.
+            limit: Maximum number of references to return.
+
+        Returns:
+            Referenced papers (empty if the paper is unknown).
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If request times out.
+        """
+        pass
+
+    @abstractmethod
+    def get_citations(self, doi: str, limit: int = 1000) -> list[Paper]:
+        """List the papers citing a paper.
+
+        Args:
+            doi: DOI of the cited paper.
+            limit: Maximum number of citing papers to return.
+
+        Returns:
+            Citing papers (empty if the paper is unknown).
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If request times out.
+        """
+        pass
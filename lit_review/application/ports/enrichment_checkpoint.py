@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Enrichment checkpoint port for resumable metadata enrichment.
+
+Defines the abstract interface for recording which papers each database has
+already been asked about, so an interrupted enrichment run can resume
+without repeating completed lookups.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class EnrichmentCheckpoint(ABC):
+    """Abstract base class for enrichment progress storage.
+
+    Implementations must make record() durable before returning, since a
+    run may be interrupted at any point.
+
+    Example:
+        >>> done = checkpoint.load()
+        >>> if doi not in done.get("crossref", set()):
+        ...     ...  # look the paper up, then
+        ...     checkpoint.record("crossref", [doi])
+    """
+
+    @abstractmethod
+    def load(self) -> dict[str, set[str]]:
+        """Load completed lookups.
+
+        Returns:
+            Mapping of database name to the DOIs it was already asked about.
+
+        Raises:
+            IOError: If unable to read from storage.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, database: str, dois: list[str]) -> None:
+        """Record that a database was asked about some DOIs.
+
+        Args:
+            database: Database name.
+            dois: DOIs looked up in a completed batch.
+
+        Raises:
+            IOError: If unable to write to storage.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all recorded lookups (start the next run from scratch).
+
+        Raises:
+            IOError: If unable to delete from storage.
+        """
+        pass
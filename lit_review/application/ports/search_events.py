@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Instrumentation events emitted by search service adapters.
+
+Adapters report what each search spends its time on (network requests,
+rate-limit sleeps, retries and response parsing) as structured events
+passed to a pluggable hook. SearchPapersUseCase aggregates them into
+per-database statistics (see SearchStatsCollector).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+
+class SearchEventKind(Enum):
+    """Kind of an instrumentation event."""
+
+    REQUEST_START = "request_start"
+    REQUEST_END = "request_end"
+    RETRY = "retry"
+    RATE_LIMIT_SLEEP = "rate_limit_sleep"
+    PARSE = "parse"
+
+
+@dataclass(frozen=True)
+class SearchEvent:
+    """One instrumentation event of a search adapter.
+
+    Fields not relevant to an event's kind keep their defaults.
+
+    Attributes:
+        kind: What happened.
+        service: Name of the emitting service (e.g. "Crossref").
+        url: Request URL, or E-utility name for PubMed.
+        seconds: Duration: request time (REQUEST_END), backoff before the
+            next attempt (RETRY), time slept (RATE_LIMIT_SLEEP) or parse
+            time (PARSE).
+        bytes_received: Response body size (REQUEST_END).
+        status_code: HTTP status (REQUEST_END; None if no response arrived).
+        attempt: Zero-based attempt number (REQUEST_START, REQUEST_END)
+            or number of the attempt about to be made (RETRY).
+        produced: Papers converted from the parsed records (PARSE).
+        dropped: Records skipped as malformed or incomplete (PARSE).
+        error: Description of the failure (REQUEST_END, RETRY).
+
+    Example:
+        >>> SearchEvent(SearchEventKind.PARSE, "Crossref", seconds=0.004, produced=98, dropped=2)
+    """
+
+    kind: SearchEventKind
+    service: str
+    url: str = ""
+    seconds: float = 0.0
+    bytes_received: int = 0
+    status_code: int | None = None
+    attempt: int = 0
+    produced: int = 0
+    dropped: int = 0
+    error: str = ""
+
+
+# Receives every event of the services it is attached to; must be thread-safe
+SearchEventHook = Callable[[SearchEvent], None]
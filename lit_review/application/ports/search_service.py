@@ -7,7 +7,11 @@ academic databases like Crossref, PubMed, and ArXiv.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
 
+from lit_review.application.ports.search_events import SearchEvent, SearchEventHook, SearchEventKind
 from lit_review.domain.entities.paper import Paper
 
 
@@ -17,6 +21,13 @@ class SearchService(ABC):
     Implementations should handle API communication, rate limiting,
     and conversion of search results to Paper entities.
 
+    Attributes:
+        RESULT_CAP: Most results one query can return, however it is paged
+            (None if unlimited). Queries with more hits are split into
+            publication-date partitions by SearchPapersUseCase.execute_partitioned.
+        event_hook: Receives the adapter's instrumentation events (requests,
+            retries, rate-limit sleeps, parsing); None disables them.
+
     Example:
         >>> class CrossrefAdapter(SearchService):
         ...     def search(self, query: str, limit: int = 100) -> list[Paper]:
@@ -24,6 +35,9 @@ class SearchService(ABC):
         ...         pass
     """
 
+    RESULT_CAP: int | None = None
+    event_hook: SearchEventHook | None = None
+
     @abstractmethod
     def search(self, query: str, limit: int = 100) -> list[Paper]:
         """Search for papers matching the query.
@@ -41,6 +55,164 @@ class SearchService(ABC):
         """
         pass
 
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        """Lazily yield papers matching the query.
+
+        The default implementation yields the results of search(). Adapters
+        that page through results override it to yield each page's papers
+        as soon as that page arrives.
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            limit: Maximum number of results to yield (default 100).
+
+        Yields:
+            Paper entities matching the query.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        yield from self.search(query, limit=limit)
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search for papers added to the database on or after a date.
+
+        Used by delta updates of saved searches. The default implementation
+        returns a full search() unfiltered: publication year says nothing
+        about when a record was indexed, so filtering on it would drop late
+        additions. Papers already in the review are removed as duplicates
+        when the results are added. Adapters override it with a server-side
+        date filter (e.g. Crossref ``from-index-date`` or PubMed ``mindate``).
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            since: Earliest date of interest (inclusive).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        return self.search(query, limit=limit)
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search for papers published within a date range.
+
+        Used to run one partition of a query that exceeds RESULT_CAP. The
+        default implementation runs a full search() and keeps papers whose
+        publication year falls within the range. Adapters override it with
+        a server-side publication date filter.
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        return [
+            p
+            for p in self.search(query, limit=limit)
+            if start.year <= p.publication_year <= end.year
+        ]
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count papers published within a date range without fetching them.
+
+        Lets the partition planner size partitions before searching. The
+        default implementation returns None (unknown); partitions are then
+        split only after their results come back full.
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            Number of matching records, or None if the service cannot tell.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        return None
+
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search for lightweight paper stubs for title screening.
+
+        Stubs carry DOI, title, authors, year and venue but no abstract or
+        keywords; hydrate() fills those in for the papers that survive
+        screening. The default implementation returns full records from
+        search(). Adapters override it with a minimal field projection.
+
+        Args:
+            query: Search query string (keywords, title fragments, etc.).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        return self.search(query, limit=limit)
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        """Fetch missing abstracts, keywords and authors for papers, in batches.
+
+        Only missing fields are filled: an empty abstract or keyword list,
+        or the "Unknown" placeholder author. Papers are updated in place, so
+        they keep their identity in a review. The default implementation
+        fetches nothing.
+
+        Each service fills the fields its own search results carry: PubMed
+        and OpenAlex fill abstract, keywords and authors; Crossref fills
+        abstract and authors only (its records have no keywords); Semantic
+        Scholar fills abstract and authors and adds a "citations:<count>"
+        keyword.
+
+        Args:
+            papers: Papers to complete (e.g. stubs without abstract).
+
+        Returns:
+            The papers that were hydrated.
+
+        Raises:
+            ConnectionError: If unable to connect to the service.
+            TimeoutError: If the request times out.
+        """
+        return []
+
+    def set_event_hook(self, hook: SearchEventHook | None) -> None:
+        """Attach an instrumentation hook (or detach it with None).
+
+        Args:
+            hook: Callable receiving every SearchEvent this service emits.
+        """
+        self.event_hook = hook
+
+    def _emit(self, kind: SearchEventKind, **fields: Any) -> None:
+        """Send an instrumentation event to the hook, if one is attached.
+
+        Args:
+            kind: Event kind.
+            **fields: Other SearchEvent fields.
+        """
+        hook = self.event_hook
+        if hook is not None:
+            hook(SearchEvent(kind, self.get_service_name(), **fields))
+
     @abstractmethod
     def get_service_name(self) -> str:
         """Return the name of this search service.
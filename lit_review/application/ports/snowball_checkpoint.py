@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Snowball checkpoint port for resumable citation snowballing.
+
+Defines the abstract interface for storing the frontier of a breadth-first
+snowballing run and the frontier papers already expanded, so an interrupted
+run resumes at the level it reached instead of starting from the seeds.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SnowballProgress:
+    """Saved state of a snowballing run.
+
+    Attributes:
+        direction: Snowball direction the run used.
+        level: Zero-based level being expanded.
+        frontier: DOIs to expand at this level.
+        expanded: Frontier DOIs already expanded, mapped to the new DOIs found.
+        seeds: Seed DOIs the run started from (empty for checkpoints written
+            before seeds were recorded).
+    """
+
+    direction: str
+    level: int
+    frontier: list[str]
+    expanded: dict[str, list[str]] = field(default_factory=dict)
+    seeds: list[str] = field(default_factory=list)
+
+
+class SnowballCheckpoint(ABC):
+    """Abstract base class for snowballing progress storage.
+
+    Implementations must make start_level() and record() durable before
+    returning, since a run may be interrupted at any point.
+
+    Example:
+        >>> checkpoint.start_level("both", 0, ["10.1234/seed"], seeds=["10.1234/seed"])
+        >>> checkpoint.record("10.1234/seed", ["10.1234/cited"])
+        >>> checkpoint.load().expanded
+        {'10.1234/seed': ['10.1234/cited']}
+    """
+
+    @abstractmethod
+    def load(self) -> SnowballProgress | None:
+        """Load the state of an interrupted run.
+
+        Returns:
+            Progress of the last level started, or None if there is none.
+
+        Raises:
+            IOError: If unable to read from storage.
+        """
+        pass
+
+    @abstractmethod
+    def start_level(
+        self, direction: str, level: int, frontier: list[str], seeds: list[str] | None = None
+    ) -> None:
+        """Record the frontier of a new level.
+
+        Args:
+            direction: Snowball direction of the run.
+            level: Zero-based level number.
+            frontier: DOIs to expand at this level.
+            seeds: Seed DOIs the run started from.
+
+        Raises:
+            IOError: If unable to write to storage.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, doi: str, found: list[str]) -> None:
+        """Record that a frontier paper was expanded.
+
+        Args:
+            doi: Expanded frontier DOI.
+            found: New DOIs discovered through it.
+
+        Raises:
+            IOError: If unable to write to storage.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget the saved state (start the next run from the seeds).
+
+        Raises:
+            IOError: If unable to delete from storage.
+        """
+        pass
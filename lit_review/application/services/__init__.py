@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Application services - resilience, planning, instrumentation and analysis shared by use cases."""
+
+from lit_review.application.services.circuit_breaker import CircuitBreaker, CircuitState
+from lit_review.application.services.latency_tracker import LatencyHistogram
+from lit_review.application.services.paper_table import PaperTable
+from lit_review.application.services.partition_planner import DateRange, PartitionPlanner
+from lit_review.application.services.search_stats import DatabaseStats, SearchStatsCollector
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "LatencyHistogram",
+    "PaperTable",
+    "DateRange",
+    "PartitionPlanner",
+    "DatabaseStats",
+    "SearchStatsCollector",
+]
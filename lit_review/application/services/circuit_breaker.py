@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Circuit breaker for search databases.
+
+A database that keeps failing (e.g. during a Crossref or NCBI incident) is
+"opened" and skipped immediately instead of burning retries and timeouts on
+every query. After a cool-down a single trial request is let through
+("half-open"); its outcome closes the circuit again or re-opens it.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """States of a circuit breaker.
+
+    CLOSED -> OPEN after repeated failures, OPEN -> HALF_OPEN after the
+    reset timeout, HALF_OPEN -> CLOSED on success or back to OPEN on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds an open circuit waits before a trial request.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         papers = service.search(query)
+        ...         breaker.record_success()
+        ...     except ConnectionError:
+        ...         breaker.record_failure()
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (at least 1).
+            reset_timeout: Seconds before an open circuit allows a trial request.
+            clock: Monotonic time source (injectable for tests).
+
+        Raises:
+            ValueError: If failure_threshold is below 1 or reset_timeout is negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"Failure threshold must be at least 1, got {failure_threshold}")
+        if reset_timeout < 0:
+            raise ValueError(f"Reset timeout must be non-negative, got {reset_timeout}")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN to HALF_OPEN once the reset timeout elapsed."""
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent.
+
+        In the half-open state only one trial request is allowed at a time.
+
+        Returns:
+            True if the caller may query the database.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed.
+
+        A failed half-open trial re-opens the circuit immediately.
+        """
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            self._trial_in_flight = False
+            if state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+    def _current_state(self) -> CircuitState:
+        """Return the state, applying the open -> half-open transition.
+
+        Must be called with the lock held.
+        """
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Rolling latency histogram for adaptive per-database timeouts.
+
+Instead of one fixed timeout for every database, SearchPapersUseCase derives
+each database's timeout from its recent latencies (e.g. p95 x 3), so a
+normally fast database is abandoned quickly when it hangs while a slow but
+healthy one still gets the time it usually needs.
+"""
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyHistogram:
+    """Thread-safe rolling window of request latencies.
+
+    Attributes:
+        window: Number of most recent samples kept.
+
+    Example:
+        >>> histogram = LatencyHistogram(window=100)
+        >>> histogram.record(0.42)
+        >>> histogram.percentile(95)
+        0.42
+    """
+
+    def __init__(self, window: int = 100) -> None:
+        """Initialize latency histogram.
+
+        Args:
+            window: Number of most recent samples kept (at least 1).
+
+        Raises:
+            ValueError: If window is below 1.
+        """
+        if window < 1:
+            raise ValueError(f"Window must be at least 1, got {window}")
+
+        self.window = window
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record one request latency.
+
+        Args:
+            seconds: Request duration in seconds.
+        """
+        with self._lock:
+            self._samples.append(max(0.0, seconds))
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile using the nearest-rank method.
+
+        Args:
+            percent: Percentile between 0 and 100.
+
+        Returns:
+            Latency in seconds, or None if no samples were recorded.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(1, math.ceil(percent / 100 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+    def adaptive_timeout(
+        self,
+        default: float,
+        multiplier: float = 3.0,
+        percent: float = 95.0,
+        min_samples: int = 5,
+        minimum: float = 1.0,
+    ) -> float:
+        """Derive a timeout from recent latencies.
+
+        Args:
+            default: Timeout used until enough samples exist; also the upper bound.
+            multiplier: Factor applied to the percentile latency.
+            percent: Percentile the timeout is based on.
+            min_samples: Samples required before adapting.
+            minimum: Lower bound for the adaptive timeout.
+
+        Returns:
+            Timeout in seconds, between ``minimum`` and ``default``.
+        """
+        if len(self._samples) < min_samples:
+            return default
+        latency = self.percentile(percent)
+        if latency is None:
+            return default
+        return min(default, max(minimum, latency * multiplier))
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Publication-date partition planner for result-capped search APIs.
+
+Some APIs stop returning results past a fixed ceiling (PubMed's 10,000
+ESearch records, one arXiv or Semantic Scholar request), so a broad query
+silently truncates. The planner splits the query's publication-date span
+into disjoint ranges, bisecting every range whose hit count reaches the cap:
+by whole years while a range covers several years, then by days.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """Inclusive publication-date range of a query partition.
+
+    Attributes:
+        start: First day of the range.
+        end: Last day of the range.
+
+    Example:
+        >>> DateRange.years(2015, 2024).bisect()
+        (DateRange(2015-01-01, 2019-12-31), DateRange(2020-01-01, 2024-12-31))
+    """
+
+    start: date
+    end: date
+
+    def __post_init__(self) -> None:
+        """Validate that the range is not empty."""
+        if self.end < self.start:
+            raise ValueError(f"Date range ends before it starts: {self.start} > {self.end}")
+
+    @classmethod
+    def years(cls, first: int, last: int) -> "DateRange":
+        """Create a range covering whole years.
+
+        Args:
+            first: First year.
+            last: Last year (inclusive).
+
+        Returns:
+            DateRange from January 1 of ``first`` to December 31 of ``last``.
+        """
+        return cls(date(first, 1, 1), date(last, 12, 31))
+
+    def can_bisect(self) -> bool:
+        """Check whether the range spans more than one day."""
+        return self.end > self.start
+
+    def bisect(self) -> tuple["DateRange", "DateRange"]:
+        """Split the range into two disjoint halves.
+
+        Ranges spanning several years are split on a year boundary, so
+        APIs that only filter by year still get exact partitions; ranges
+        within one year are split by days.
+
+        Returns:
+            The earlier and the later half.
+
+        Raises:
+            ValueError: If the range is a single day.
+        """
+        if not self.can_bisect():
+            raise ValueError(f"Cannot bisect single-day range {self}")
+
+        if self.start.year != self.end.year:
+            middle = (self.start.year + self.end.year) // 2
+            return (
+                DateRange(self.start, date(middle, 12, 31)),
+                DateRange(date(middle + 1, 1, 1), self.end),
+            )
+
+        middle_day = self.start + timedelta(days=(self.end - self.start).days // 2)
+        earlier = DateRange(self.start, middle_day)
+        return earlier, DateRange(middle_day + timedelta(days=1), self.end)
+
+    def __str__(self) -> str:
+        """Return the range as years where it is aligned to whole years."""
+        if (self.start.month, self.start.day, self.end.month, self.end.day) == (1, 1, 12, 31):
+            if self.start.year == self.end.year:
+                return str(self.start.year)
+            return f"{self.start.year}-{self.end.year}"
+        return f"{self.start.isoformat()}..{self.end.isoformat()}"
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return f"DateRange({self.start.isoformat()}, {self.end.isoformat()})"
+
+
+@dataclass
+class PartitionPlanner:
+    """Plans date partitions that each stay below a database's result cap.
+
+    Attributes:
+        max_partitions: Upper bound on partitions per query, so a query
+            matching millions of records cannot explode into endless requests.
+
+    Example:
+        >>> planner = PartitionPlanner()
+        >>> planner.plan(DateRange.years(2000, 2024), cap=10_000, count_many=count_pubmed)
+        [DateRange(2000-01-01, 2012-12-31), DateRange(2013-01-01, 2018-12-31), ...]
+    """
+
+    max_partitions: int = 256
+
+    def plan(
+        self,
+        span: DateRange,
+        cap: int,
+        count_many: Callable[[list[DateRange]], list[int | None]],
+    ) -> list[DateRange]:
+        """Bisect a span until every partition's hit count is below the cap.
+
+        Hit counts of each round of partitions are requested together, so
+        the caller can count them in parallel. Partitions with zero hits
+        are dropped; partitions whose count is unknown are kept as they are
+        (split_truncated() handles them once their results come back full).
+
+        Args:
+            span: Publication-date span of the query.
+            cap: Most results one request sequence can return.
+            count_many: Returns the hit count of each range (None if unknown).
+
+        Returns:
+            Disjoint partitions covering every range with hits, in date order.
+        """
+        partitions: list[DateRange] = []
+        frontier = [span]
+        leaves = 1
+
+        while frontier:
+            counts = count_many(frontier)
+            next_frontier: list[DateRange] = []
+            for part, count in zip(frontier, counts, strict=True):
+                if count == 0:
+                    continue
+                if (
+                    count is not None
+                    and count >= cap
+                    and part.can_bisect()
+                    and leaves < self.max_partitions
+                ):
+                    next_frontier.extend(part.bisect())
+                    leaves += 1
+                else:
+                    partitions.append(part)
+            frontier = next_frontier
+
+        return sorted(partitions, key=lambda part: part.start)
+
+    def split_truncated(self, part: DateRange, planned: int) -> list[DateRange]:
+        """Split a partition whose results reached the cap.
+
+        Args:
+            part: Partition that came back full.
+            planned: Number of partitions planned for the query so far.
+
+        Returns:
+            The two halves, or an empty list if the partition cannot be
+            split (a single day, or max_partitions reached).
+        """
+        if not part.can_bisect() or planned >= self.max_partitions:
+            return []
+        return list(part.bisect())
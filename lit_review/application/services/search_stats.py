@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Per-database aggregation of search adapter instrumentation events.
+
+Splits where a slow search spent its time: network requests, rate-limit
+sleeps, retry backoff or response parsing, and how many records the
+adapter's converter dropped.
+"""
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from lit_review.application.ports.search_events import (
+    SearchEvent,
+    SearchEventHook,
+    SearchEventKind,
+)
+
+
+@dataclass
+class DatabaseStats:
+    """Aggregated instrumentation of one database.
+
+    Attributes:
+        requests: Requests completed (with or without a response).
+        failed_requests: Requests without a response or with status >= 400.
+        bytes_received: Total response body size.
+        request_seconds: Total time spent in requests.
+        retries: Retried attempts (adapter and use case retries).
+        retry_seconds: Total backoff before retries.
+        rate_limit_sleeps: Requests that had to wait for the rate limiter.
+        rate_limit_seconds: Total time slept by the rate limiter.
+        parse_seconds: Total time spent converting responses to papers.
+        papers_produced: Papers converted from responses.
+        papers_dropped: Records skipped as malformed or incomplete.
+        status_codes: Number of responses per HTTP status.
+    """
+
+    requests: int = 0
+    failed_requests: int = 0
+    bytes_received: int = 0
+    request_seconds: float = 0.0
+    retries: int = 0
+    retry_seconds: float = 0.0
+    rate_limit_sleeps: int = 0
+    rate_limit_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    papers_produced: int = 0
+    papers_dropped: int = 0
+    status_codes: dict[int, int] = field(default_factory=dict)
+
+    def add(self, event: SearchEvent) -> None:
+        """Fold one event into the totals.
+
+        Args:
+            event: Instrumentation event of this database.
+        """
+        if event.kind is SearchEventKind.REQUEST_END:
+            self.requests += 1
+            self.request_seconds += event.seconds
+            self.bytes_received += event.bytes_received
+            if event.status_code is None or event.status_code >= 400:
+                self.failed_requests += 1
+            if event.status_code is not None:
+                self.status_codes[event.status_code] = (
+                    self.status_codes.get(event.status_code, 0) + 1
+                )
+        elif event.kind is SearchEventKind.RETRY:
+            self.retries += 1
+            self.retry_seconds += event.seconds
+        elif event.kind is SearchEventKind.RATE_LIMIT_SLEEP:
+            self.rate_limit_sleeps += 1
+            self.rate_limit_seconds += event.seconds
+        elif event.kind is SearchEventKind.PARSE:
+            self.parse_seconds += event.seconds
+            self.papers_produced += event.produced
+            self.papers_dropped += event.dropped
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["status_codes"] = {str(code): n for code, n in sorted(self.status_codes.items())}
+        return data
+
+
+class SearchStatsCollector:
+    """Thread-safe per-database aggregation of instrumentation events.
+
+    Example:
+        >>> stats = SearchStatsCollector()
+        >>> adapter.set_event_hook(stats.hook("crossref"))
+        >>> adapter.search("sepsis")
+        >>> stats.summary()["crossref"].rate_limit_seconds
+        0.42
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self._stats: dict[str, DatabaseStats] = {}
+        self._lock = threading.Lock()
+
+    def hook(self, database: str) -> SearchEventHook:
+        """Create the event hook of one database.
+
+        Args:
+            database: Name the database's events are aggregated under.
+
+        Returns:
+            Hook to attach with SearchService.set_event_hook.
+        """
+
+        def record(event: SearchEvent) -> None:
+            self.record(database, event)
+
+        return record
+
+    def record(self, database: str, event: SearchEvent) -> None:
+        """Aggregate one event.
+
+        Args:
+            database: Database the event belongs to.
+            event: Instrumentation event.
+        """
+        with self._lock:
+            stats = self._stats.get(database)
+            if stats is None:
+                stats = self._stats[database] = DatabaseStats()
+            stats.add(event)
+
+    def summary(self) -> dict[str, DatabaseStats]:
+        """Return a snapshot of the totals per database.
+
+        Returns:
+            Mapping of database name to a copy of its DatabaseStats.
+        """
+        with self._lock:
+            return {
+                name: DatabaseStats(**{**asdict(stats), "status_codes": dict(stats.status_codes)})
+                for name, stats in self._stats.items()
+            }
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the totals per database as JSON-serializable dictionaries."""
+        return {name: stats.to_dict() for name, stats in self.summary().items()}
+
+    def reset(self) -> None:
+        """Discard all totals."""
+        with self._lock:
+            self._stats.clear()
@@ -3,13 +3,24 @@
 """Application use cases - orchestrate domain entities."""
 
 from lit_review.application.usecases.analyze_themes import AnalyzeThemesUseCase
+from lit_review.application.usecases.enrich_papers import EnrichmentResult, EnrichPapersUseCase
 from lit_review.application.usecases.export_review import ExportReviewUseCase
 from lit_review.application.usecases.generate_synthesis import GenerateSynthesisUseCase
 from lit_review.application.usecases.search_papers import SearchPapersUseCase
+from lit_review.application.usecases.snowball_papers import (
+    SnowballDirection,
+    SnowballPapersUseCase,
+    SnowballResult,
+)
 
 __all__ = [
     "SearchPapersUseCase",
     "ExportReviewUseCase",
     "AnalyzeThemesUseCase",
     "GenerateSynthesisUseCase",
+    "EnrichPapersUseCase",
+    "EnrichmentResult",
+    "SnowballPapersUseCase",
+    "SnowballDirection",
+    "SnowballResult",
 ]
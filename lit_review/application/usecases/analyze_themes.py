@@ -17,6 +17,7 @@ from scipy.spatial.distance import pdist
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from lit_review.application.ports.ai_analyzer import ThemeHierarchy
+from lit_review.application.services.paper_table import PaperTable
 from lit_review.domain.entities.paper import Paper
 
 
@@ -39,13 +40,14 @@ class AnalyzeThemesUseCase:
 
     def execute(
         self,
-        papers: list[Paper],
+        papers: list[Paper] | PaperTable,
         max_themes: int = 10,
     ) -> ThemeHierarchy:
         """Extract hierarchical themes from papers.
 
         Args:
-            papers: List of papers to analyze (must have abstracts).
+            papers: Papers to analyze, as a list or a PaperTable (papers
+                without abstracts are skipped).
             max_themes: Maximum number of themes to extract.
 
         Returns:
@@ -55,19 +57,23 @@ class AnalyzeThemesUseCase:
             ValueError: If papers list is empty, no abstracts available,
                        or max_themes is invalid.
         """
-        if not papers:
+        if not len(papers):
             raise ValueError("Cannot analyze themes from empty paper list")
 
         if max_themes < 1:
             raise ValueError("max_themes must be at least 1")
 
-        # Filter papers with abstracts
-        papers_with_abstracts = [p for p in papers if p.abstract]
-        if not papers_with_abstracts:
+        # Build documents from papers with abstracts
+        documents = (
+            self._table_documents(papers)
+            if isinstance(papers, PaperTable)
+            else self._paper_documents([p for p in papers if p.abstract])
+        )
+        if not documents:
             raise ValueError("No papers with abstracts available for analysis")
 
         # Extract keywords using TF-IDF
-        keywords, tfidf_matrix = self._extract_keywords(papers_with_abstracts)
+        keywords, tfidf_matrix = self._extract_keywords(documents)
 
         # Build co-occurrence matrix
         cooccurrence = self._build_cooccurrence_matrix(tfidf_matrix)
@@ -79,7 +85,7 @@ class AnalyzeThemesUseCase:
         relationships = self._calculate_theme_relationships(theme_clusters, cooccurrence, keywords)
 
         # Generate summary
-        summary = self._generate_summary(theme_clusters, len(papers_with_abstracts))
+        summary = self._generate_summary(theme_clusters, len(documents))
 
         return ThemeHierarchy(
             themes=theme_clusters,
@@ -87,16 +93,15 @@ class AnalyzeThemesUseCase:
             summary=summary,
         )
 
-    def _extract_keywords(self, papers: list[Paper]) -> tuple[list[str], np.ndarray[Any, Any]]:
-        """Extract keywords from papers using TF-IDF.
+    def _paper_documents(self, papers: list[Paper]) -> list[str]:
+        """Combine title, abstract, and keywords of each paper into one document.
 
         Args:
             papers: Papers with abstracts.
 
         Returns:
-            Tuple of (keyword list, TF-IDF matrix).
+            One document per paper.
         """
-        # Combine title, abstract, and keywords for better feature extraction
         documents = []
         for paper in papers:
             text_parts = [paper.title]
@@ -105,7 +110,40 @@ class AnalyzeThemesUseCase:
             if paper.keywords:
                 text_parts.extend(paper.keywords)
             documents.append(" ".join(text_parts))
+        return documents
 
+    def _table_documents(self, table: PaperTable) -> list[str]:
+        """Combine title, abstract, and keywords of each table row with an abstract.
+
+        Args:
+            table: Papers as columns.
+
+        Returns:
+            One document per row with an abstract.
+        """
+        rows = np.flatnonzero(table.abstracts.astype(bool))
+        offsets = table.keyword_offsets.tolist()
+        codes = table.keyword_codes.tolist()
+        return [
+            " ".join(
+                [
+                    table.titles[row],
+                    table.abstracts[row],
+                    *(table.keywords[code] for code in codes[offsets[row] : offsets[row + 1]]),
+                ]
+            )
+            for row in rows.tolist()
+        ]
+
+    def _extract_keywords(self, documents: list[str]) -> tuple[list[str], np.ndarray[Any, Any]]:
+        """Extract keywords from documents using TF-IDF.
+
+        Args:
+            documents: Combined title, abstract, and keywords of each paper.
+
+        Returns:
+            Tuple of (keyword list, TF-IDF matrix).
+        """
         # Adjust parameters for small datasets
         num_docs = len(documents)
         min_df = min(self.min_df, max(1, num_docs // 10))  # At least 1, max 10% of docs
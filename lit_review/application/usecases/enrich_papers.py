@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Enrich papers use case filling missing metadata from batch endpoints.
+
+Papers missing an abstract, keywords or real authors are looked up in
+batches through each database's SearchService.hydrate() (Semantic Scholar
+paper batch, Crossref multi-DOI filters, PubMed efetch by PMID list). The
+databases form a cascade: a paper still incomplete after one database's
+batch is queued for the next one, while batches for different databases run
+concurrently with a bounded number of requests in flight. Completed lookups
+are written to an EnrichmentCheckpoint so that an interrupted run resumes
+where it stopped.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from lit_review.application.ports.enrichment_checkpoint import EnrichmentCheckpoint
+from lit_review.application.ports.search_service import SearchService
+from lit_review.application.services.circuit_breaker import CircuitBreaker
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.review import Review
+
+
+@dataclass
+class EnrichmentResult:
+    """Outcome of an enrichment run.
+
+    Attributes:
+        enriched: Papers that gained at least one field.
+        incomplete: Papers still missing metadata after every database.
+        failed: Number of papers per database whose batch lookup failed.
+        skipped: Lookups skipped because the checkpoint already had them.
+    """
+
+    enriched: list[Paper] = field(default_factory=list)
+    incomplete: list[Paper] = field(default_factory=list)
+    failed: dict[str, int] = field(default_factory=dict)
+    skipped: int = 0
+
+
+@dataclass
+class EnrichPapersUseCase:
+    """Use case for filling missing paper metadata with batched lookups.
+
+    Attributes:
+        services: Databases to ask, in cascade order (name -> SearchService).
+        checkpoint: Optional store of completed lookups for resuming.
+        batch_size: Papers per hydrate() call.
+        max_in_flight: Maximum concurrent batch lookups overall.
+        max_in_flight_per_database: Maximum concurrent batch lookups per database.
+        checkpoint_interval: Minimum seconds between checkpoint writes.
+        failure_threshold: Failed batches that open a database's circuit.
+        reset_timeout: Seconds before an open circuit allows a trial batch.
+
+    Example:
+        >>> use_case = EnrichPapersUseCase(
+        ...     services={"semantic-scholar": SemanticScholarAdapter()},
+        ...     checkpoint=JSONLinesEnrichmentCheckpoint(Path("enrich.jsonl")),
+        ... )
+        >>> result = use_case.execute(review, on_checkpoint=lambda: repo.save(review))
+    """
+
+    services: dict[str, SearchService] = field(default_factory=dict)
+    checkpoint: EnrichmentCheckpoint | None = None
+    batch_size: int = 100
+    max_in_flight: int = 4
+    max_in_flight_per_database: int = 2
+    checkpoint_interval: float = 5.0
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0
+    _breakers: dict[str, CircuitBreaker] = field(default_factory=dict, init=False, repr=False)
+
+    def add_service(self, name: str, service: SearchService) -> None:
+        """Add a database to the end of the cascade.
+
+        Args:
+            name: Database name (e.g., "crossref", "semantic-scholar").
+            service: SearchService implementation.
+        """
+        self.services[name] = service
+
+    def execute(
+        self,
+        review: Review,
+        databases: list[str] | None = None,
+        on_checkpoint: Callable[[], None] | None = None,
+    ) -> EnrichmentResult:
+        """Fill missing abstracts, keywords and authors of a review's papers.
+
+        Papers excluded during screening are skipped; the others are
+        updated in place. Before lookups are recorded in the
+        checkpoint, ``on_checkpoint`` is called so the caller can persist
+        the review; a crash between the two only repeats those lookups. The
+        checkpoint is cleared once a run finishes without failed batches.
+
+        Args:
+            review: Review whose papers are enriched.
+            databases: Databases to ask, in order. If None, asks all.
+            on_checkpoint: Callback persisting the review (e.g. repo.save).
+
+        Returns:
+            EnrichmentResult with enriched and still incomplete papers.
+        """
+        if databases is None:
+            names = list(self.services.keys())
+        else:
+            names = [name for name in databases if name in self.services]
+
+        targets = sorted(
+            (p for p in review.papers if p.is_incomplete() and p.included is not False),
+            key=lambda paper: paper.doi.value,
+        )
+        result = EnrichmentResult()
+        done = self.checkpoint.load() if self.checkpoint else {}
+        queued: dict[str, list[Paper]] = {name: [] for name in names}
+        in_flight = dict.fromkeys(names, 0)
+        pending: dict[Future[list[Paper]], tuple[int, list[Paper]]] = {}
+        enriched: set[int] = set()
+        unrecorded: list[tuple[str, list[str]]] = []
+
+        def route(paper: Paper, start: int) -> None:
+            # Queue the paper for the next database that has not seen it
+            for index in range(start, len(names)):
+                if paper.doi.value in done.get(names[index], ()):
+                    result.skipped += 1
+                    continue
+                queued[names[index]].append(paper)
+                return
+
+        def upstream_idle(index: int) -> bool:
+            return all(not queued[name] and not in_flight[name] for name in names[:index])
+
+        def dispatch() -> None:
+            progress = True
+            while progress and len(pending) < self.max_in_flight:
+                progress = False
+                for index, name in enumerate(names):
+                    if len(pending) >= self.max_in_flight:
+                        break
+                    if not queued[name] or in_flight[name] >= self.max_in_flight_per_database:
+                        continue
+                    # Wait for a full batch while earlier databases may still pass papers on
+                    if len(queued[name]) < self.batch_size and not upstream_idle(index):
+                        continue
+                    batch = queued[name][: self.batch_size]
+                    del queued[name][: self.batch_size]
+                    progress = True
+                    if not self._circuit_breaker(name).allow_request():
+                        # Open circuit: pass the batch on without asking
+                        result.failed[name] = result.failed.get(name, 0) + len(batch)
+                        for paper in batch:
+                            route(paper, index + 1)
+                        continue
+                    future = executor.submit(self.services[name].hydrate, batch)
+                    pending[future] = (index, batch)
+                    in_flight[name] += 1
+
+        def flush() -> None:
+            if not unrecorded:
+                return
+            if on_checkpoint is not None:
+                on_checkpoint()
+            if self.checkpoint is not None:
+                for name, dois in unrecorded:
+                    self.checkpoint.record(name, dois)
+            unrecorded.clear()
+
+        for paper in targets:
+            route(paper, 0)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        last_flush = time.monotonic()
+        try:
+            dispatch()
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index, batch = pending.pop(future)
+                    name = names[index]
+                    in_flight[name] -= 1
+                    breaker = self._circuit_breaker(name)
+                    try:
+                        enriched.update(id(paper) for paper in future.result())
+                    except Exception:
+                        # Failed batch, later databases may still fill it in
+                        breaker.record_failure()
+                        result.failed[name] = result.failed.get(name, 0) + len(batch)
+                    else:
+                        breaker.record_success()
+                        unrecorded.append((name, [paper.doi.value for paper in batch]))
+                    for paper in batch:
+                        if paper.is_incomplete():
+                            route(paper, index + 1)
+
+                if time.monotonic() - last_flush >= self.checkpoint_interval:
+                    flush()
+                    last_flush = time.monotonic()
+                dispatch()
+        finally:
+            # Do not wait for abandoned lookups; keep completed ones
+            executor.shutdown(wait=False, cancel_futures=True)
+            flush()
+
+        if self.checkpoint is not None and not result.failed:
+            self.checkpoint.clear()
+
+        result.enriched = [paper for paper in targets if id(paper) in enriched]
+        result.incomplete = [paper for paper in targets if paper.is_incomplete()]
+        return result
+
+    def _circuit_breaker(self, name: str) -> CircuitBreaker:
+        """Return the circuit breaker for a database, creating it on first use.
+
+        Args:
+            name: Database name.
+
+        Returns:
+            CircuitBreaker shared by all batches for this database.
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[name] = breaker
+        return breaker
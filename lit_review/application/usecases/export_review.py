@@ -11,6 +11,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from lit_review.application.services.paper_table import PaperTable
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review
 from lit_review.domain.services.citation_formatter import CitationFormatter
@@ -55,6 +56,7 @@ class ExportReviewUseCase:
         export_format: ExportFormat,
         output_path: Path,
         included_only: bool = True,
+        table: PaperTable | None = None,
     ) -> int:
         """Export review to specified format.
 
@@ -63,6 +65,8 @@ class ExportReviewUseCase:
             export_format: Target format.
             output_path: Path to write output file.
             included_only: If True, only export included papers.
+            table: Papers to export instead of the review's, for example a
+                filtered PaperTable of the review.
 
         Returns:
             Number of papers exported.
@@ -71,7 +75,7 @@ class ExportReviewUseCase:
             IOError: If unable to write to output path.
             ValueError: If format is unsupported.
         """
-        papers = review.get_included_papers() if included_only else list(review.papers)
+        papers = self._select_papers(review, included_only, table)
 
         if export_format == ExportFormat.BIBTEX:
             content = self._format_bibtex(papers)
@@ -94,6 +98,7 @@ class ExportReviewUseCase:
         review: Review,
         export_format: ExportFormat,
         included_only: bool = True,
+        table: PaperTable | None = None,
     ) -> str:
         """Export review to string in specified format.
 
@@ -101,6 +106,8 @@ class ExportReviewUseCase:
             review: Review to export.
             export_format: Target format.
             included_only: If True, only export included papers.
+            table: Papers to export instead of the review's, for example a
+                filtered PaperTable of the review.
 
         Returns:
             Formatted string content.
@@ -108,7 +115,7 @@ class ExportReviewUseCase:
         Raises:
             ValueError: If format is unsupported.
         """
-        papers = review.get_included_papers() if included_only else list(review.papers)
+        papers = self._select_papers(review, included_only, table)
 
         if export_format == ExportFormat.BIBTEX:
             return self._format_bibtex(papers)
@@ -123,6 +130,23 @@ class ExportReviewUseCase:
         else:
             raise ValueError(f"Unsupported format: {export_format}")
 
+    def _select_papers(
+        self, review: Review, included_only: bool, table: PaperTable | None
+    ) -> list[Paper]:
+        """Select the papers to export.
+
+        Args:
+            review: Review being exported.
+            included_only: If True, only export included papers.
+            table: Optional table of papers replacing the review's.
+
+        Returns:
+            Papers to export.
+        """
+        if table is None:
+            return review.get_included_papers() if included_only else list(review.papers)
+        return (table.filter(included=True) if included_only else table).to_papers()
+
     def _format_bibtex(self, papers: list[Paper]) -> str:
         """Format papers as BibTeX entries.
 
@@ -3,16 +3,150 @@
 """Search papers use case for querying academic databases.
 
 Orchestrates searching across multiple academic databases and
-deduplicates results by DOI with parallel execution.
+deduplicates results by DOI with parallel execution, either on a
+thread pool or natively on an asyncio event loop. Results can also be
+streamed batch by batch as they arrive, and many query variants can be
+run as one batch with per-query provenance. Each database has a circuit
+breaker and an adaptive timeout derived from its recent latencies, so a
+failing or hanging database is skipped instead of stalling every query.
+Queries exceeding a database's result cap can be split into publication-date
+partitions for complete recall. Adapter instrumentation events can be
+aggregated into per-database statistics.
 """
 
+import asyncio
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import UTC, date, datetime
+from functools import partial
 
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.search_events import SearchEvent, SearchEventKind
 from lit_review.application.ports.search_service import SearchService
+from lit_review.application.services.circuit_breaker import CircuitBreaker, CircuitState
+from lit_review.application.services.latency_tracker import LatencyHistogram
+from lit_review.application.services.partition_planner import DateRange, PartitionPlanner
+from lit_review.application.services.search_stats import SearchStatsCollector
 from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.saved_search import SavedSearch
+from lit_review.domain.services.deduplication import PaperDeduplicator
+
+# First publication year searched by execute_partitioned unless given
+DEFAULT_START_YEAR = 1900
+
+# How often to check on searches that have not started their first attempt
+# yet, or on databases waiting for another caller's half-open trial
+_POLL_SECONDS = 0.05
+
+
+class _AttemptDeadline:
+    """Deadline of the running attempt of a search on a worker thread.
+
+    The adaptive timeout bounds one attempt, not the whole retry loop: the
+    worker restarts the deadline when each attempt begins and extends it
+    over backoff sleeps, and time spent queued for a thread does not count.
+    A caller that gives up on the search abandons it: the worker then stops
+    retrying, wakes from its backoff sleep, and reports nothing more to the
+    circuit breaker, whose failure the caller has already recorded.
+
+    Attributes:
+        timeout: Seconds allowed per attempt.
+        expires_at: Monotonic deadline of the current attempt, or None
+            until the first attempt starts.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize deadline.
+
+        Args:
+            timeout: Seconds allowed per attempt.
+        """
+        self.timeout = timeout
+        self.expires_at: float | None = None
+        self._abandoned = threading.Event()
+
+    @property
+    def abandoned(self) -> bool:
+        """Whether the caller has given up on the search."""
+        return self._abandoned.is_set()
+
+    def abandon(self) -> None:
+        """Give up on the search, stopping its retries."""
+        self._abandoned.set()
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep through a backoff unless the search is abandoned meanwhile.
+
+        Returns:
+            False if the search was abandoned.
+        """
+        return not self._abandoned.wait(seconds)
+
+    def start(self, delay: float = 0.0) -> None:
+        """Start the clock of an attempt beginning after ``delay`` seconds."""
+        self.expires_at = time.monotonic() + delay + self.timeout
+
+    def expired(self, now: float) -> bool:
+        """Check whether the running attempt has overrun its timeout."""
+        return self.expires_at is not None and self.expires_at <= now
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One (query, database) pair of a batch search.
+
+    Attributes:
+        query: Query string.
+        database: Database name.
+        partition: Publication-date range the search is restricted to
+            (only for the partitions run by execute_partitioned).
+    """
+
+    query: str
+    database: str
+    partition: DateRange | None = None
+
+
+@dataclass
+class BatchSearchResult:
+    """Merged result of a multi-query batch search.
+
+    Attributes:
+        papers: Unique papers found by any query in any database.
+        provenance: Maps each paper's DOI to the (query, database) pairs that
+            found it, in query order then database order.
+        failed: (query, database) pairs that failed, timed out or were
+            skipped because the database's circuit was open.
+        partitions: Publication-date partitions each (query, database) pair
+            was split into by execute_partitioned.
+
+    Example:
+        >>> result = use_case.execute_batch(["sepsis AND ml", "sepsis AND ai"])
+        >>> result.provenance["10.1234/abc"]
+        [SearchHit(query='sepsis AND ml', database='crossref')]
+    """
+
+    papers: list[Paper] = field(default_factory=list)
+    provenance: dict[str, list[SearchHit]] = field(default_factory=dict)
+    failed: list[SearchHit] = field(default_factory=list)
+    partitions: dict[SearchHit, list[DateRange]] = field(default_factory=dict)
+
+    def papers_by_query(self) -> dict[str, int]:
+        """Count unique papers found by each query.
+
+        Returns:
+            Mapping of query to number of papers it found.
+        """
+        counts: dict[str, int] = {}
+        for hits in self.provenance.values():
+            for query in dict.fromkeys(hit.query for hit in hits):
+                counts[query] = counts.get(query, 0) + 1
+        return counts
 
 
 @dataclass
@@ -25,9 +159,32 @@ class SearchPapersUseCase:
 
     Attributes:
         services: Dictionary mapping service names to SearchService instances.
+        async_services: Dictionary mapping service names to AsyncSearchService
+            instances, used by execute_async.
         max_workers: Maximum number of parallel search threads.
-        timeout_per_database: Timeout in seconds for each database search.
+        timeout_per_database: Timeout in seconds for each search attempt
+            of a database, used until the database has a latency history
+            and as the upper bound of its adaptive timeout. execute_stream
+            uses it as its single global timeout.
         max_retries: Maximum number of retry attempts for failed searches.
+        stream_batch_size: Maximum papers per batch yielded by execute_stream.
+        max_concurrency_per_database: Maximum concurrent requests to one
+            database in execute_batch, so one database's rate-limit sleeps
+            cannot occupy every worker.
+        deduplicator: Optional fuzzy deduplicator applied after DOI
+            deduplication in execute and execute_async, merging records of
+            the same work found under different DOIs.
+        failure_threshold: Consecutive failures (attempts or timeouts) that
+            open a database's circuit breaker.
+        reset_timeout: Seconds an open circuit skips its database before a
+            trial request is allowed.
+        timeout_multiplier: Adaptive timeout as a multiple of the database's
+            p95 latency.
+        min_timeout: Lower bound in seconds for adaptive timeouts.
+        planner: Splits queries exceeding a database's RESULT_CAP into
+            publication-date partitions (execute_partitioned).
+        stats: Aggregates the services' instrumentation events per database
+            (see enable_stats); None leaves the services uninstrumented.
 
     Example:
         >>> use_case = SearchPapersUseCase(services={
@@ -38,9 +195,31 @@ class SearchPapersUseCase:
     """
 
     services: dict[str, SearchService] = field(default_factory=dict)
+    async_services: dict[str, AsyncSearchService] = field(default_factory=dict)
     max_workers: int = 4
     timeout_per_database: float = 30.0
     max_retries: int = 3
+    stream_batch_size: int = 25
+    max_concurrency_per_database: int = 1
+    deduplicator: PaperDeduplicator | None = None
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    timeout_multiplier: float = 3.0
+    min_timeout: float = 1.0
+    planner: PartitionPlanner = field(default_factory=PartitionPlanner)
+    stats: SearchStatsCollector | None = None
+    _breakers: dict[str, CircuitBreaker] = field(default_factory=dict, init=False, repr=False)
+    _latencies: dict[str, LatencyHistogram] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Attach the stats collector to the initial services."""
+        self._attach_stats()
+
+    def _attach_stats(self) -> None:
+        """Point every service's event hook at the stats collector, if any."""
+        if self.stats is not None:
+            for name, service in self.services.items():
+                service.set_event_hook(self.stats.hook(name))
 
     def add_service(self, name: str, service: SearchService) -> None:
         """Add a search service.
@@ -50,23 +229,111 @@ class SearchPapersUseCase:
             service: SearchService implementation.
         """
         self.services[name] = service
+        if self.stats is not None:
+            service.set_event_hook(self.stats.hook(name))
+
+    def enable_stats(self) -> SearchStatsCollector:
+        """Aggregate the instrumentation events of every service per database.
+
+        Returns:
+            The collector (created on first call), whose summary() gives
+            request, retry, rate-limit and parse totals per database.
+
+        Example:
+            >>> stats = use_case.enable_stats()
+            >>> use_case.execute("sepsis", limit=500)
+            >>> stats.summary()["pubmed"].rate_limit_seconds
+            1.67
+        """
+        if self.stats is None:
+            self.stats = SearchStatsCollector()
+            self._attach_stats()
+        return self.stats
+
+    def add_async_service(self, name: str, service: AsyncSearchService) -> None:
+        """Add an asyncio-native search service.
+
+        Args:
+            name: Service identifier.
+            service: AsyncSearchService implementation.
+        """
+        self.async_services[name] = service
+
+    def get_circuit_breaker(self, name: str) -> CircuitBreaker:
+        """Get the circuit breaker of a database, creating it on first use.
+
+        Args:
+            name: Service identifier.
+
+        Returns:
+            CircuitBreaker shared by all searches of this use case.
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                name, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            )
+        return breaker
+
+    def get_timeout(self, name: str) -> float:
+        """Get the adaptive per-attempt timeout of a database.
+
+        Once a database has a few successful searches, its timeout is
+        timeout_multiplier x its p95 latency, clamped between min_timeout
+        and timeout_per_database.
+
+        Args:
+            name: Service identifier.
+
+        Returns:
+            Timeout in seconds.
+        """
+        return self._latency_histogram(name).adaptive_timeout(
+            self.timeout_per_database,
+            multiplier=self.timeout_multiplier,
+            minimum=self.min_timeout,
+        )
+
+    def _latency_histogram(self, name: str) -> LatencyHistogram:
+        """Get the latency histogram of a database, creating it on first use."""
+        histogram = self._latencies.get(name)
+        if histogram is None:
+            histogram = self._latencies.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def _allowed_services(self, service_names: list[str]) -> list[str]:
+        """Drop databases whose circuit is open.
+
+        Args:
+            service_names: Requested database names.
+
+        Returns:
+            Databases that may be queried now.
+        """
+        return [name for name in service_names if self.get_circuit_breaker(name).allow_request()]
 
     def execute(
         self,
         query: str,
         databases: list[str] | None = None,
         limit: int = 100,
+        stubs: bool = False,
     ) -> list[Paper]:
         """Execute search across databases with parallel execution and deduplication.
 
         Searches multiple databases in parallel using ThreadPoolExecutor.
-        Implements timeout per database and exponential backoff for retries.
-        Returns partial results if some databases fail.
+        Databases with an open circuit are skipped immediately, and failed
+        attempts are retried with exponential backoff while the circuit
+        stays closed. A database is abandoned when one attempt runs longer
+        than its adaptive timeout; backoff sleeps and time queued for a
+        worker thread do not count. Returns partial results if some
+        databases fail.
 
         Args:
             query: Search query string.
             databases: List of database names to search. If None, searches all.
             limit: Maximum results per database.
+            stubs: Fetch lightweight stubs without abstracts (see hydrate()).
 
         Returns:
             List of unique Paper entities (deduplicated by DOI).
@@ -80,48 +347,118 @@ class SearchPapersUseCase:
         else:
             service_names = [name for name in databases if name in self.services]
 
+        # Skip databases whose circuit is open
+        service_names = self._allowed_services(service_names)
         if not service_names:
             return []
 
-        # Execute searches in parallel
+        # Execute searches in parallel, each attempt with its own deadline
         all_papers: list[Paper] = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending: dict[Future[list[Paper]], str] = {}
+        deadlines: dict[Future[list[Paper]], _AttemptDeadline] = {}
+        for name in service_names:
+            deadline = _AttemptDeadline(self.get_timeout(name))
+            future = executor.submit(
+                self._search_with_retry, name, query, limit, None, stubs, None, deadline
+            )
+            pending[future] = name
+            deadlines[future] = deadline
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all search tasks
-            future_to_service: dict[Any, str] = {
-                executor.submit(self._search_with_retry, self.services[name], query, limit): name
-                for name in service_names
-            }
-
-            # Collect results as they complete
-            try:
-                for future in as_completed(
-                    future_to_service, timeout=self.timeout_per_database * len(service_names)
-                ):
+        try:
+            while pending:
+                done, expired = self._wait_for_attempts(pending, deadlines)
+                for future in done:
+                    del pending[future]
                     try:
-                        papers = future.result(timeout=self.timeout_per_database)
-                        all_papers.extend(papers)
-                    except TimeoutError:
-                        # Database search timed out, continue with other databases
-                        continue
+                        all_papers.extend(future.result())
                     except Exception:
-                        # Other errors, continue with partial results
+                        # Failed database, continue with partial results
                         continue
-            except TimeoutError:
-                # Overall timeout reached, return whatever we have
-                pass
 
-        # Deduplicate by DOI
-        unique_papers = self._deduplicate_by_doi(all_papers)
-        return unique_papers
+                for future in expired:
+                    # Timed out: count against the circuit, keep other results
+                    deadlines[future].abandon()
+                    self.get_circuit_breaker(pending.pop(future)).record_failure()
+        finally:
+            # Do not wait for abandoned searches, and stop their retries
+            for future in pending:
+                deadlines[future].abandon()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Deduplicate by DOI (and by fuzzy matching if configured)
+        return self._deduplicate(all_papers)
+
+    @staticmethod
+    def _wait_for_attempts(
+        pending: Iterable[Future[list[Paper]]],
+        deadlines: dict[Future[list[Paper]], _AttemptDeadline],
+    ) -> tuple[set[Future[list[Paper]]], list[Future[list[Paper]]]]:
+        """Wait until a search finishes or a running attempt overruns its deadline.
+
+        Args:
+            pending: Searches still running or queued.
+            deadlines: Attempt deadline of each search.
+
+        Returns:
+            Finished searches, and unfinished searches whose current
+            attempt has run out of time.
+        """
+        pending = list(pending)
+        started = [deadlines[f].expires_at for f in pending]
+        expiries = [expires_at for expires_at in started if expires_at is not None]
+        timeout = max(0.0, min(expiries) - time.monotonic()) if expiries else None
+        if len(expiries) < len(started):
+            # Queued searches set their deadline once a thread picks them up
+            timeout = _POLL_SECONDS if timeout is None else min(timeout, _POLL_SECONDS)
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        expired = [f for f in pending if f not in done and deadlines[f].expired(now)]
+        return done, expired
+
+    def _record_retry(self, name: str, error: Exception, attempt: int, delay: float) -> None:
+        """Count a use-case level retry in the database's stats.
 
-    def _search_with_retry(self, service: SearchService, query: str, limit: int) -> list[Paper]:
-        """Search a service with exponential backoff retry.
+        Args:
+            name: Database name.
+            error: Failure of the attempt.
+            attempt: Zero-based number of the failed attempt.
+            delay: Seconds slept before the next attempt.
+        """
+        if self.stats is not None:
+            service = self.services[name].get_service_name()
+            event = SearchEvent(
+                SearchEventKind.RETRY, service, seconds=delay, attempt=attempt + 1, error=str(error)
+            )
+            self.stats.record(name, event)
+
+    def _search_with_retry(
+        self,
+        name: str,
+        query: str,
+        limit: int,
+        since: date | None = None,
+        stubs: bool = False,
+        partition: DateRange | None = None,
+        deadline: _AttemptDeadline | None = None,
+    ) -> list[Paper]:
+        """Search a database with exponential backoff retry.
+
+        Every attempt is reported to the database's circuit breaker, and
+        retrying stops as soon as the circuit opens. The latency of the
+        successful attempt feeds the adaptive timeout.
 
         Args:
-            service: SearchService to query.
+            name: Database name.
             query: Search query string.
             limit: Maximum results.
+            since: If set, only fetch records added on or after this date.
+            stubs: Fetch lightweight stubs via search_stubs.
+            partition: If set, only fetch papers published within this range.
+            deadline: Restarted at each attempt so the caller can abandon an
+                attempt that overruns the adaptive timeout. Once it is
+                abandoned, retries stop and late outcomes are not reported
+                to the circuit breaker or the latency histogram.
 
         Returns:
             List of papers from this service.
@@ -129,27 +466,810 @@ class SearchPapersUseCase:
         Raises:
             Exception: If all retries fail.
         """
+        service = self.services[name]
+        breaker = self.get_circuit_breaker(name)
         last_exception = None
 
         for attempt in range(self.max_retries):
+            if deadline is not None:
+                if deadline.abandoned:
+                    break
+                deadline.start()
             try:
-                return service.search(query, limit=limit)
+                started = time.monotonic()
+                if stubs:
+                    papers = service.search_stubs(query, limit=limit)
+                elif partition is not None:
+                    papers = service.search_range(
+                        query, partition.start, partition.end, limit=limit
+                    )
+                elif since is None:
+                    papers = service.search(query, limit=limit)
+                else:
+                    papers = service.search_since(query, since, limit=limit)
             except (ConnectionError, TimeoutError, OSError) as e:
                 last_exception = e
-                if attempt < self.max_retries - 1:
+                if deadline is not None and deadline.abandoned:
+                    # The caller already counted the timeout
+                    break
+                breaker.record_failure()
+                if attempt < self.max_retries - 1 and breaker.allow_request():
                     # Exponential backoff: 1s, 2s, 4s
                     wait_time = 2**attempt
-                    time.sleep(wait_time)
-                continue
+                    self._record_retry(name, e, attempt, wait_time)
+                    if deadline is None:
+                        time.sleep(wait_time)
+                        continue
+                    deadline.start(delay=wait_time)
+                    if deadline.sleep(wait_time):
+                        continue
+                break
             except Exception as e:
                 # Non-retryable error
+                if deadline is None or not deadline.abandoned:
+                    breaker.record_failure()
                 raise e
+            if deadline is not None and deadline.abandoned:
+                # Answered after the caller gave up: a late success must
+                # not reset the failure the timeout counted
+                raise TimeoutError(f"{name} answered after its search was abandoned")
+            self._latency_histogram(name).record(time.monotonic() - started)
+            breaker.record_success()
+            return papers
 
-        # All retries failed
+        # All retries failed (or the caller gave up)
         if last_exception:
             raise last_exception
+        if deadline is not None and deadline.abandoned:
+            raise TimeoutError(f"{name} search was abandoned")
         return []
 
+    def execute_batch(
+        self,
+        queries: list[str],
+        databases: list[str] | None = None,
+        limit: int = 100,
+    ) -> BatchSearchResult:
+        """Run many query variants across databases on one shared executor.
+
+        All query x database pairs are scheduled on a single thread pool of
+        max_workers threads. Databases are served round-robin with at most
+        max_concurrency_per_database requests in flight each, so while one
+        database waits on its rate limiter the others keep working; each
+        adapter's own (thread-safe) rate limiter still paces its requests.
+        Circuit breakers, adaptive timeouts and retries apply per pair as in
+        execute(). Results are deduplicated across all pairs.
+
+        Args:
+            queries: Query strings (duplicates are searched once).
+            databases: List of database names to search. If None, searches all.
+            limit: Maximum results per query and database.
+
+        Returns:
+            BatchSearchResult with merged papers and per-DOI provenance.
+
+        Example:
+            >>> result = use_case.execute_batch(
+            ...     ["sepsis AND machine learning", "sepsis AND deep learning"],
+            ...     databases=["crossref", "pubmed"],
+            ... )
+            >>> result.papers_by_query()
+            {'sepsis AND machine learning': 87, 'sepsis AND deep learning': 42}
+        """
+        queries = list(dict.fromkeys(queries))
+        if databases is None:
+            service_names = list(self.services.keys())
+        else:
+            service_names = [name for name in databases if name in self.services]
+
+        hits = [SearchHit(query, name) for query in queries for name in service_names]
+        return self._run_batch(hits, dict.fromkeys(hits, limit), {})
+
+    def execute_saved(
+        self, searches: list[SavedSearch], now: datetime | None = None
+    ) -> BatchSearchResult:
+        """Re-run saved searches, fetching only records newer than their last run.
+
+        Searches that ran before use the database's search_since with the
+        saved watermark (Crossref from-index-date, PubMed entry date, arXiv
+        submittedDate, Semantic Scholar year); new ones run a full search.
+        All searches share the execute_batch scheduler. The watermark of
+        each search that succeeded is advanced to ``now``; failed searches
+        keep theirs so the next update retries the same window.
+
+        Args:
+            searches: Saved searches (searches for unknown databases are skipped).
+            now: Start time of this run (defaults to the current UTC time).
+
+        Returns:
+            BatchSearchResult with the new papers and their provenance.
+
+        Example:
+            >>> result = use_case.execute_saved(review.saved_searches)
+            >>> review.add_papers(result.papers)
+        """
+        run_at = now or datetime.now(UTC)
+        runnable = [s for s in searches if s.database in self.services]
+        hits = list(dict.fromkeys(SearchHit(s.query, s.database) for s in runnable))
+        limits = {SearchHit(s.query, s.database): s.limit for s in runnable}
+        since = {SearchHit(s.query, s.database): s.since for s in runnable if s.since is not None}
+
+        result = self._run_batch(hits, limits, since)
+
+        failed = set(result.failed)
+        for saved in runnable:
+            if SearchHit(saved.query, saved.database) not in failed:
+                saved.record_run(run_at)
+        return result
+
+    def execute_partitioned(
+        self,
+        query: str,
+        databases: list[str] | None = None,
+        limit: int = 10_000,
+        start_year: int = DEFAULT_START_YEAR,
+        end_year: int | None = None,
+    ) -> BatchSearchResult:
+        """Search with complete recall on databases that cap results per query.
+
+        A database whose RESULT_CAP is below ``limit`` gets the query split
+        into disjoint publication-date partitions: the planner bisects the
+        span until each partition's hit count (count_range) is below the
+        cap, and a partition whose results still come back full is bisected
+        again and re-run. All partitions share the execute_batch scheduler,
+        so each database's rate limiter, concurrency bound and circuit
+        breaker apply. Databases without a cap below ``limit`` run one plain
+        search. Results are deduplicated across partitions and databases.
+
+        Args:
+            query: Search query string.
+            databases: List of database names to search. If None, searches all.
+            limit: Results wanted per database; capped databases are
+                partitioned only if their cap is below it.
+            start_year: First publication year of partitioned searches.
+            end_year: Last publication year (defaults to the current year).
+
+        Returns:
+            BatchSearchResult with provenance and failures per (query,
+            database) pair, and the partitions each pair was split into.
+
+        Example:
+            >>> result = use_case.execute_partitioned(
+            ...     "machine learning AND sepsis", databases=["pubmed", "arxiv"], start_year=2000
+            ... )
+            >>> [str(part) for part in result.partitions[SearchHit(query, "arxiv")]]
+            ['2000-2018', '2019-2021', '2022', '2023', '2024']
+        """
+        if databases is None:
+            service_names = list(self.services.keys())
+        else:
+            service_names = [name for name in databases if name in self.services]
+
+        span = DateRange.years(start_year, end_year or date.today().year)
+        hits = [SearchHit(query, name) for name in service_names]
+        result = BatchSearchResult()
+        runs: list[SearchHit] = []
+        limits: dict[SearchHit, int] = {}
+
+        for hit in hits:
+            cap = self.services[hit.database].RESULT_CAP
+            if cap is None or limit <= cap:
+                runs.append(hit)
+                limits[hit] = limit
+                continue
+            parts = self.planner.plan(span, cap, partial(self._count_ranges, hit.database, query))
+            result.partitions[hit] = parts
+            for part in parts:
+                run = SearchHit(query, hit.database, part)
+                runs.append(run)
+                limits[run] = cap
+
+        found: list[tuple[SearchHit, list[Paper]]] = []
+        failed: list[SearchHit] = []
+        while runs:
+            round_found, round_failed = self._run_hits(runs, limits, {})
+            found.extend(round_found)
+            failed.extend(round_failed)
+
+            # Re-run partitions that still hit the cap as two halves
+            runs = []
+            for run, papers in round_found:
+                if run.partition is None or len(papers) < limits[run]:
+                    continue
+                parts = result.partitions[SearchHit(run.query, run.database)]
+                halves = self.planner.split_truncated(run.partition, len(parts))
+                if not halves:
+                    continue
+                parts.remove(run.partition)
+                parts.extend(halves)
+                parts.sort(key=lambda part: part.start)
+                for half in halves:
+                    rerun = SearchHit(run.query, run.database, half)
+                    runs.append(rerun)
+                    limits[rerun] = limits[run]
+
+        # Report partitions under their (query, database) pair
+        result.failed.extend(dict.fromkeys(SearchHit(h.query, h.database) for h in failed))
+        merged = [(SearchHit(h.query, h.database), papers) for h, papers in found]
+        self._merge_batch(merged, hits, result)
+        return result
+
+    def _count_ranges(self, name: str, query: str, ranges: list[DateRange]) -> list[int | None]:
+        """Count a query's hits in several date ranges of one database.
+
+        Counts run concurrently, up to max_concurrency_per_database at a
+        time; a failed count is reported as unknown.
+
+        Args:
+            name: Database name.
+            query: Search query string.
+            ranges: Date ranges to count.
+
+        Returns:
+            Hit count per range (None where unknown).
+        """
+        service = self.services[name]
+
+        def count(part: DateRange) -> int | None:
+            try:
+                return service.count_range(query, part.start, part.end)
+            except (ConnectionError, TimeoutError, OSError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency_per_database)) as pool:
+            return list(pool.map(count, ranges))
+
+    def _run_batch(
+        self,
+        hits: list[SearchHit],
+        limits: dict[SearchHit, int],
+        since: dict[SearchHit, date],
+    ) -> BatchSearchResult:
+        """Run (query, database) pairs on one shared, round-robin scheduler.
+
+        Args:
+            hits: Pairs to run, in result order.
+            limits: Maximum results per pair.
+            since: Delta-search start dates for pairs that have one.
+
+        Returns:
+            Merged BatchSearchResult.
+        """
+        result = BatchSearchResult()
+        if not hits:
+            return result
+
+        found, failed = self._run_hits(hits, limits, since)
+        result.failed.extend(failed)
+        self._merge_batch(found, hits, result)
+        return result
+
+    def _run_hits(
+        self,
+        hits: list[SearchHit],
+        limits: dict[SearchHit, int],
+        since: dict[SearchHit, date],
+    ) -> tuple[list[tuple[SearchHit, list[Paper]]], list[SearchHit]]:
+        """Schedule (query, database) pairs round-robin and collect raw results.
+
+        Args:
+            hits: Pairs to run.
+            limits: Maximum results per pair.
+            since: Delta-search start dates for pairs that have one.
+
+        Returns:
+            Papers returned by each successful pair, and the failed pairs.
+        """
+        failed: list[SearchHit] = []
+
+        # One FIFO of queries per database, served round-robin
+        backlog: dict[str, deque[SearchHit]] = {}
+        for hit in hits:
+            backlog.setdefault(hit.database, deque()).append(hit)
+        service_names = list(backlog)
+        in_flight = dict.fromkeys(service_names, 0)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending: dict[Future[list[Paper]], SearchHit] = {}
+        deadlines: dict[Future[list[Paper]], _AttemptDeadline] = {}
+        found: list[tuple[SearchHit, list[Paper]]] = []
+
+        def dispatch() -> None:
+            progress = True
+            while progress and len(pending) < self.max_workers:
+                progress = False
+                for name in service_names:
+                    if len(pending) >= self.max_workers:
+                        break
+                    if not backlog[name] or in_flight[name] >= self.max_concurrency_per_database:
+                        continue
+                    breaker = self.get_circuit_breaker(name)
+                    if not breaker.allow_request():
+                        if breaker.state == CircuitState.OPEN:
+                            # Open circuit: skip the database's remaining queries
+                            failed.extend(backlog[name])
+                            backlog[name].clear()
+                        # Half-open: keep the queries until the trial's outcome
+                        continue
+                    hit = backlog[name].popleft()
+                    deadline = _AttemptDeadline(self.get_timeout(name))
+                    future = executor.submit(
+                        self._search_with_retry,
+                        name,
+                        hit.query,
+                        limits[hit],
+                        since.get(hit),
+                        False,
+                        hit.partition,
+                        deadline,
+                    )
+                    pending[future] = hit
+                    deadlines[future] = deadline
+                    in_flight[name] += 1
+                    progress = True
+
+        try:
+            dispatch()
+            while pending or any(backlog.values()):
+                if not pending:
+                    # Every queued database awaits another caller's trial request
+                    time.sleep(_POLL_SECONDS)
+                    dispatch()
+                    continue
+                done, expired = self._wait_for_attempts(pending, deadlines)
+                for future in done:
+                    hit = pending.pop(future)
+                    in_flight[hit.database] -= 1
+                    try:
+                        found.append((hit, future.result()))
+                    except Exception:
+                        # Failed pair, continue with partial results
+                        failed.append(hit)
+
+                for future in expired:
+                    # Timed out: count against the circuit, keep other results
+                    deadlines[future].abandon()
+                    hit = pending.pop(future)
+                    in_flight[hit.database] -= 1
+                    self.get_circuit_breaker(hit.database).record_failure()
+                    failed.append(hit)
+
+                dispatch()
+        finally:
+            # Do not wait for abandoned searches, and stop their retries
+            for future in pending:
+                deadlines[future].abandon()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return found, failed
+
+    def _merge_batch(
+        self,
+        found: list[tuple[SearchHit, list[Paper]]],
+        hits: list[SearchHit],
+        result: BatchSearchResult,
+    ) -> None:
+        """Deduplicate batch results and attach provenance to each paper.
+
+        Args:
+            found: Papers returned by each successful (query, database) pair.
+            hits: All pairs in result order.
+            result: Result to fill in.
+        """
+        order = {hit: i for i, hit in enumerate(hits)}
+        found.sort(key=lambda item: order[item[0]])
+        result.failed.sort(key=lambda hit: order[hit])
+
+        hits_by_doi: dict[str, list[SearchHit]] = {}
+        all_papers: list[Paper] = []
+        for hit, papers in found:
+            for paper in papers:
+                paper_hits = hits_by_doi.setdefault(paper.doi.value, [])
+                if hit not in paper_hits:
+                    paper_hits.append(hit)
+                all_papers.append(paper)
+
+        unique = self._deduplicate_by_doi(all_papers)
+        deduplicator = self.deduplicator
+        if deduplicator is None:
+            groups = [[paper] for paper in unique]
+        else:
+            groups = deduplicator.find_duplicates(unique)
+
+        for group in groups:
+            merged = group[0] if deduplicator is None else deduplicator.merge(group)
+            group_hits = [hit for paper in group for hit in hits_by_doi[paper.doi.value]]
+            result.papers.append(merged)
+            result.provenance[merged.doi.value] = sorted(
+                dict.fromkeys(group_hits), key=lambda hit: order[hit]
+            )
+
+    def execute_stream(
+        self,
+        query: str,
+        databases: list[str] | None = None,
+        limit: int = 100,
+        stubs: bool = False,
+        completed: set[str] | None = None,
+    ) -> Iterator[tuple[str, list[Paper]]]:
+        """Stream search results as each page of each database arrives.
+
+        Databases are searched in parallel threads via their iter_search,
+        so paging adapters deliver results page by page instead of after
+        the whole search. Batches are deduplicated by DOI on the fly: each
+        paper is yielded at most once across all databases. Failing
+        databases are skipped (partial results), as in execute(), and
+        databases with an open circuit are not queried. Streaming uses one
+        global timeout rather than per-database adaptive ones: if no
+        database delivers a batch or finishes within timeout_per_database
+        seconds, the stream ends and every unfinished search is abandoned
+        (without counting against the circuit breakers). Closing the
+        generator early stops the remaining searches after their current
+        page.
+
+        Args:
+            query: Search query string.
+            databases: List of database names to search. If None, searches all.
+            limit: Maximum results per database.
+            stubs: Fetch lightweight stubs without abstracts (see hydrate()).
+            completed: If given, receives the name of each database whose
+                search ran to the end without failing, so callers can tell
+                a complete result from partial results.
+
+        Yields:
+            (database name, batch of new unique papers) tuples.
+
+        Example:
+            >>> for database, batch in use_case.execute_stream("sepsis", limit=500):
+            ...     review.add_papers(batch)
+        """
+        if databases is None:
+            service_names = list(self.services.keys())
+        else:
+            service_names = [name for name in databases if name in self.services]
+
+        service_names = self._allowed_services(service_names)
+        if not service_names:
+            return
+
+        results: queue.Queue[tuple[str, list[Paper] | Exception | None]] = queue.Queue()
+        stop = threading.Event()
+        seen_dois: set[str] = set()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        try:
+            for name in service_names:
+                executor.submit(self._stream_service, name, query, limit, results, stop, stubs)
+
+            remaining = len(service_names)
+            while remaining:
+                try:
+                    name, batch = results.get(timeout=self.timeout_per_database)
+                except queue.Empty:
+                    # No database produced anything in time, stop with partial results
+                    return
+
+                if batch is None or isinstance(batch, Exception):
+                    remaining -= 1
+                    if batch is None and completed is not None:
+                        completed.add(name)
+                    continue
+
+                new_papers = []
+                for paper in batch:
+                    if paper.doi.value not in seen_dois:
+                        seen_dois.add(paper.doi.value)
+                        new_papers.append(paper)
+                if new_papers:
+                    yield name, new_papers
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stream_service(
+        self,
+        name: str,
+        query: str,
+        limit: int,
+        results: queue.Queue[tuple[str, list[Paper] | Exception | None]],
+        stop: threading.Event,
+        stubs: bool = False,
+    ) -> None:
+        """Push one database's result batches onto the results queue.
+
+        Finishes with a (name, None) marker once the search completed, or a
+        (name, exception) marker if it failed.
+
+        Args:
+            name: Database name.
+            query: Search query string.
+            limit: Maximum results.
+            results: Queue consumed by execute_stream.
+            stop: Set when the consumer is no longer interested.
+            stubs: Fetch lightweight stubs via search_stubs.
+        """
+        try:
+            for batch in self._iter_batches_with_retry(name, query, limit, stubs, stop):
+                if stop.is_set():
+                    return
+                results.put((name, batch))
+        except Exception as e:
+            # Failed database, continue with partial results
+            results.put((name, e))
+        else:
+            results.put((name, None))
+
+    def _iter_batches_with_retry(
+        self,
+        name: str,
+        query: str,
+        limit: int,
+        stubs: bool = False,
+        stop: threading.Event | None = None,
+    ) -> Iterator[list[Paper]]:
+        """Yield batches from a database's iter_search with exponential backoff.
+
+        A failed search is retried only if it has not yielded anything yet
+        and the circuit is still closed; once results have been streamed, a
+        failure ends the stream. The circuit breaker records a success as
+        soon as the first batch arrives.
+
+        Args:
+            name: Database name.
+            query: Search query string.
+            limit: Maximum results.
+            stubs: Fetch lightweight stubs via search_stubs (not paged).
+            stop: Set when the consumer is no longer interested; ends a
+                backoff sleep and the retries after it.
+
+        Yields:
+            Lists of at most stream_batch_size papers.
+
+        Raises:
+            Exception: If all retries fail or a failure occurs mid-stream.
+        """
+        service = self.services[name]
+        breaker = self.get_circuit_breaker(name)
+        for attempt in range(self.max_retries):
+            yielded = False
+            try:
+                batch: list[Paper] = []
+                if stubs:
+                    records: Iterable[Paper] = service.search_stubs(query, limit=limit)
+                else:
+                    records = service.iter_search(query, limit=limit)
+                for paper in records:
+                    batch.append(paper)
+                    if len(batch) >= self.stream_batch_size:
+                        if not yielded:
+                            breaker.record_success()
+                        yielded = True
+                        yield batch
+                        batch = []
+                if not yielded:
+                    breaker.record_success()
+                if batch:
+                    yield batch
+                return
+            except Exception as e:
+                breaker.record_failure()
+                retryable = isinstance(e, ConnectionError | TimeoutError | OSError)
+                if not retryable or yielded or attempt == self.max_retries - 1:
+                    raise
+                if not breaker.allow_request():
+                    raise
+                # Exponential backoff: 1s, 2s, 4s
+                self._record_retry(name, e, attempt, 2**attempt)
+                if stop is None:
+                    time.sleep(2**attempt)
+                elif stop.wait(2**attempt):
+                    raise
+
+    async def execute_async(
+        self,
+        query: str,
+        databases: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[Paper]:
+        """Execute search across databases concurrently on the event loop.
+
+        Async services are awaited directly; databases that only have a
+        blocking SearchService are run via asyncio.to_thread. Databases with
+        an open circuit are skipped, each database gets its own adaptive
+        timeout, and failures or timeouts yield partial results.
+
+        Args:
+            query: Search query string.
+            databases: List of database names to search. If None, searches all.
+            limit: Maximum results per database.
+
+        Returns:
+            List of unique Paper entities (deduplicated by DOI).
+        """
+        available = self.get_available_databases()
+        if databases is None:
+            service_names = available
+        else:
+            service_names = [name for name in databases if name in available]
+
+        service_names = self._allowed_services(service_names)
+        if not service_names:
+            return []
+
+        results = await asyncio.gather(
+            *(self._search_one_async(name, query, limit) for name in service_names),
+            return_exceptions=True,
+        )
+
+        all_papers: list[Paper] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                # Timed out or failed, continue with partial results
+                continue
+            all_papers.extend(result)
+
+        return self._deduplicate(all_papers)
+
+    async def _search_one_async(self, name: str, query: str, limit: int) -> list[Paper]:
+        """Search one database, abandoning it when an attempt overruns its adaptive timeout.
+
+        Prefers the database's async implementation. As in execute(), the
+        timeout bounds each attempt, not the retries and backoff sleeps
+        around it. A timeout counts as a failure for the database's circuit
+        breaker.
+
+        Args:
+            name: Database name.
+            query: Search query string.
+            limit: Maximum results.
+
+        Returns:
+            List of papers from this database.
+
+        Raises:
+            TimeoutError: If an attempt did not answer in time.
+        """
+        deadline = _AttemptDeadline(self.get_timeout(name))
+        if name in self.async_services:
+            task = asyncio.ensure_future(
+                self._search_async_with_retry(name, query, limit, deadline)
+            )
+        else:
+            task = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self._search_with_retry, name, query, limit, None, False, None, deadline
+                )
+            )
+        try:
+            while True:
+                expires_at = deadline.expires_at
+                if expires_at is None:
+                    timeout = _POLL_SECONDS
+                else:
+                    timeout = max(0.0, expires_at - time.monotonic())
+                done, _ = await asyncio.wait({task}, timeout=timeout)
+                if done:
+                    return task.result()
+                if deadline.expired(time.monotonic()):
+                    deadline.abandon()
+                    self.get_circuit_breaker(name).record_failure()
+                    raise TimeoutError(f"{name} did not answer within {deadline.timeout:.1f}s")
+        finally:
+            # A worker thread cannot be cancelled: stop its retries instead
+            deadline.abandon()
+            task.cancel()
+
+    async def _search_async_with_retry(
+        self, name: str, query: str, limit: int, deadline: _AttemptDeadline | None = None
+    ) -> list[Paper]:
+        """Search an async service with exponential backoff retry.
+
+        Mirrors _search_with_retry: attempts are reported to the circuit
+        breaker and successful latencies feed the adaptive timeout.
+
+        Args:
+            name: Database name.
+            query: Search query string.
+            limit: Maximum results.
+            deadline: Restarted at each attempt (see _search_with_retry).
+
+        Returns:
+            List of papers from this service.
+
+        Raises:
+            Exception: If all retries fail.
+        """
+        service = self.async_services[name]
+        breaker = self.get_circuit_breaker(name)
+        last_exception: Exception | None = None
+
+        for attempt in range(self.max_retries):
+            if deadline is not None:
+                deadline.start()
+            try:
+                started = time.monotonic()
+                papers = await service.search(query, limit=limit)
+            except (ConnectionError, TimeoutError, OSError) as e:
+                last_exception = e
+                breaker.record_failure()
+                if attempt < self.max_retries - 1 and breaker.allow_request():
+                    # Exponential backoff: 1s, 2s, 4s
+                    if deadline is not None:
+                        deadline.start(delay=2**attempt)
+                    await asyncio.sleep(2**attempt)
+                    continue
+                break
+            except Exception:
+                breaker.record_failure()
+                raise
+            self._latency_histogram(name).record(time.monotonic() - started)
+            breaker.record_success()
+            return papers
+
+        if last_exception:
+            raise last_exception
+        return []
+
+    def hydrate(self, papers: list[Paper], databases: list[str] | None = None) -> list[Paper]:
+        """Fetch abstracts and keywords for stub papers that survived screening.
+
+        Papers without an abstract are passed to each database's batched
+        hydrate() in turn; a paper completed by one database is not sent
+        to the next. Papers are updated in place. Failing databases and
+        databases with an open circuit are skipped.
+
+        Args:
+            papers: Papers to complete (papers with an abstract are skipped).
+            databases: Databases to ask, in order. If None, asks all.
+
+        Returns:
+            The papers that were hydrated.
+
+        Example:
+            >>> stubs = use_case.execute("sepsis", limit=5000, stubs=True)
+            >>> kept = [p for p in stubs if "sepsis" in p.title.lower()]
+            >>> use_case.hydrate(kept)
+        """
+        if databases is None:
+            service_names = list(self.services.keys())
+        else:
+            service_names = [name for name in databases if name in self.services]
+
+        hydrated: dict[int, Paper] = {}
+        remaining = [paper for paper in papers if not paper.abstract]
+        for name in service_names:
+            if not remaining:
+                break
+            breaker = self.get_circuit_breaker(name)
+            if not breaker.allow_request():
+                # Open circuit (a granted half-open trial is always reported)
+                continue
+            try:
+                completed = self.services[name].hydrate(remaining)
+            except (ConnectionError, TimeoutError, OSError):
+                # Failed database, try the next one
+                breaker.record_failure()
+                continue
+            breaker.record_success()
+            for paper in completed:
+                hydrated.setdefault(id(paper), paper)
+            remaining = [paper for paper in remaining if not paper.abstract]
+
+        return list(hydrated.values())
+
+    def _deduplicate(self, papers: list[Paper]) -> list[Paper]:
+        """Deduplicate by DOI, then merge near-duplicates if configured.
+
+        Args:
+            papers: List of papers (may contain duplicates).
+
+        Returns:
+            List of unique papers.
+        """
+        unique = self._deduplicate_by_doi(papers)
+        if self.deduplicator is None:
+            return unique
+        return self.deduplicator.deduplicate(unique)
+
     def _deduplicate_by_doi(self, papers: list[Paper]) -> list[Paper]:
         """Remove duplicate papers by DOI.
 
@@ -174,6 +1294,8 @@ class SearchPapersUseCase:
         """Get list of available database names.
 
         Returns:
-            List of configured database names.
+            List of configured database names (sync and async).
         """
-        return list(self.services.keys())
+        names = list(self.services.keys())
+        names.extend(name for name in self.async_services if name not in self.services)
+        return names
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Snowball papers use case expanding seeds through the citation graph.
+
+Starting from seed DOIs, each level looks up the references (backward) and/or
+citations (forward) of every frontier paper; papers not seen before form the
+next level's frontier. Lookups of one level run concurrently with a bounded
+number in flight, all sharing the citation service's rate limiter. Each level's
+frontier and every expanded paper are written to a SnowballCheckpoint, so an
+interrupted run resumes at the level it reached.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+
+from lit_review.application.ports.citation_graph import CitationGraphService
+from lit_review.application.ports.snowball_checkpoint import SnowballCheckpoint
+from lit_review.domain.entities.paper import Paper
+
+
+class SnowballDirection(Enum):
+    """Which citation links to follow."""
+
+    BACKWARD = "backward"  # References of each paper
+    FORWARD = "forward"  # Papers citing each paper
+    BOTH = "both"
+
+
+@dataclass
+class SnowballResult:
+    """Outcome of a snowballing run.
+
+    Attributes:
+        papers: New papers discovered by this run, in discovery order.
+        parents: DOI of each new paper mapped to the frontier DOIs it was found through.
+        failed: Frontier DOIs whose lookups failed (retried when resuming).
+        skipped: Frontier DOIs not looked up because the checkpoint had them.
+        levels: Number of levels expanded.
+        discarded: Whether a checkpoint from a run with other seeds or
+            another direction was discarded instead of resumed.
+    """
+
+    papers: list[Paper] = field(default_factory=list)
+    parents: dict[str, set[str]] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+    skipped: int = 0
+    levels: int = 0
+    discarded: bool = False
+
+
+@dataclass
+class SnowballPapersUseCase:
+    """Use case for breadth-first forward/backward snowballing.
+
+    Attributes:
+        graph: Citation graph service (e.g. SemanticScholarAdapter).
+        checkpoint: Optional store of the frontier for resuming.
+        max_in_flight: Maximum concurrent lookups.
+        limit_per_paper: Maximum references or citations fetched per paper.
+        checkpoint_interval: Minimum seconds between checkpoint writes.
+
+    Example:
+        >>> use_case = SnowballPapersUseCase(graph=SemanticScholarAdapter())
+        >>> result = use_case.execute(["10.1234/seed"], depth=2, known=review_dois)
+        >>> review.add_papers(result.papers)
+    """
+
+    graph: CitationGraphService
+    checkpoint: SnowballCheckpoint | None = None
+    max_in_flight: int = 4
+    limit_per_paper: int = 1000
+    checkpoint_interval: float = 5.0
+
+    def execute(
+        self,
+        seeds: list[str],
+        depth: int = 1,
+        direction: SnowballDirection = SnowballDirection.BOTH,
+        known: set[str] | None = None,
+        on_checkpoint: Callable[[list[Paper]], None] | None = None,
+    ) -> SnowballResult:
+        """Expand seed papers through their references and/or citations.
+
+        Papers whose DOI is in ``known`` (e.g. already in the review) are
+        neither returned nor expanded. Before expanded papers are recorded
+        in the checkpoint, ``on_checkpoint`` receives the papers found since
+        the previous call so the caller can persist them; a crash between
+        the two only repeats those lookups. A level with failed lookups
+        ends the run, so that resuming retries them before going deeper;
+        the checkpoint is cleared once a run finishes without failures.
+        A checkpoint is only resumed by a run with the same seeds and
+        direction; any other run discards it and starts from its seeds.
+
+        Args:
+            seeds: DOIs to start from.
+            depth: Number of levels to expand (1 = direct links of the seeds).
+            direction: Which citation links to follow.
+            known: DOIs that are already known (compared case-insensitively).
+            on_checkpoint: Callback persisting newly found papers.
+
+        Returns:
+            SnowballResult with the new papers and their provenance.
+        """
+        result = SnowballResult()
+        visited = {doi.lower() for doi in known or ()}
+        unsaved: list[Paper] = []
+        unrecorded: list[tuple[str, list[str]]] = []
+
+        level, frontier = 0, self._unique(seeds)
+        seed_set = sorted({doi.lower() for doi in seeds})
+        expanded: dict[str, list[str]] = {}
+        progress = self.checkpoint.load() if self.checkpoint else None
+        resuming = (
+            progress is not None
+            and progress.direction == direction.value
+            and sorted({doi.lower() for doi in progress.seeds}) == seed_set
+            and progress.level < depth
+        )
+        result.discarded = progress is not None and not resuming
+        if progress is not None and resuming:
+            level, frontier, expanded = progress.level, progress.frontier, progress.expanded
+            for children in expanded.values():
+                visited.update(doi.lower() for doi in children)
+        visited.update(doi.lower() for doi in seeds)
+        visited.update(doi.lower() for doi in frontier)
+
+        def flush() -> None:
+            if on_checkpoint is not None and unsaved:
+                on_checkpoint(list(unsaved))
+            unsaved.clear()
+            if self.checkpoint is not None:
+                for node, found in unrecorded:
+                    self.checkpoint.record(node, found)
+            unrecorded.clear()
+
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        last_flush = time.monotonic()
+        try:
+            while level < depth and frontier:
+                if self.checkpoint is not None and not resuming:
+                    self.checkpoint.start_level(direction.value, level, frontier, seed_set)
+                resuming = False
+
+                next_frontier: list[str] = []
+                todo: deque[str] = deque()
+                for node in frontier:
+                    if node in expanded:
+                        result.skipped += 1
+                        next_frontier.extend(expanded[node])
+                    else:
+                        todo.append(node)
+
+                pending: dict[Future[list[Paper]], str] = {}
+                while todo or pending:
+                    # Keep at most max_in_flight lookups queued or running
+                    while todo and len(pending) < self.max_in_flight:
+                        node = todo.popleft()
+                        pending[executor.submit(self._neighbours, node, direction)] = node
+
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        node = pending.pop(future)
+                        try:
+                            papers = future.result()
+                        except Exception:
+                            # Not recorded, so a resumed run retries it
+                            result.failed.append(node)
+                            continue
+
+                        found: list[str] = []
+                        for paper in papers:
+                            doi = paper.doi.value
+                            if doi in result.parents:
+                                result.parents[doi].add(node)
+                            if doi.lower() in visited:
+                                continue
+                            visited.add(doi.lower())
+                            found.append(doi)
+                            result.papers.append(paper)
+                            result.parents[doi] = {node}
+                            unsaved.append(paper)
+                        next_frontier.extend(found)
+                        unrecorded.append((node, found))
+
+                    if time.monotonic() - last_flush >= self.checkpoint_interval:
+                        flush()
+                        last_flush = time.monotonic()
+
+                flush()
+                result.levels += 1
+                if result.failed:
+                    # Stop here so that resuming retries them before going deeper
+                    break
+                level += 1
+                frontier, expanded = next_frontier, {}
+        finally:
+            # Do not wait for abandoned lookups; keep completed ones
+            executor.shutdown(wait=False, cancel_futures=True)
+            flush()
+
+        if self.checkpoint is not None and not result.failed:
+            self.checkpoint.clear()
+
+        return result
+
+    def _neighbours(self, doi: str, direction: SnowballDirection) -> list[Paper]:
+        """Look up the papers linked to one frontier paper.
+
+        Args:
+            doi: Frontier DOI.
+            direction: Which citation links to follow.
+
+        Returns:
+            References and/or citing papers.
+        """
+        papers: list[Paper] = []
+        if direction in (SnowballDirection.BACKWARD, SnowballDirection.BOTH):
+            papers.extend(self.graph.get_references(doi, self.limit_per_paper))
+        if direction in (SnowballDirection.FORWARD, SnowballDirection.BOTH):
+            papers.extend(self.graph.get_citations(doi, self.limit_per_paper))
+        return papers
+
+    @staticmethod
+    def _unique(dois: list[str]) -> list[str]:
+        """Drop repeated DOIs (case-insensitively), keeping the first spelling.
+
+        Args:
+            dois: DOIs in order.
+
+        Returns:
+            DOIs without repeats.
+        """
+        seen: set[str] = set()
+        unique: list[str] = []
+        for doi in dois:
+            if doi.lower() not in seen:
+                seen.add(doi.lower())
+                unique.append(doi)
+        return unique
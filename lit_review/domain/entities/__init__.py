@@ -3,6 +3,8 @@
 """Domain entities - Paper, Review, Citation."""
 
 from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.paper_collection import PaperCollection, PaperCounts
 from lit_review.domain.entities.review import Review, ReviewStage
+from lit_review.domain.entities.saved_search import SavedSearch
 
-__all__ = ["Paper", "Review", "ReviewStage"]
+__all__ = ["Paper", "PaperCollection", "PaperCounts", "Review", "ReviewStage", "SavedSearch"]
@@ -6,20 +6,33 @@ The Paper entity is the core domain object representing a scholarly article
 with metadata, quality assessment, and citation generation capabilities.
 """
 
+import sys
+import weakref
+from collections.abc import Iterable, Mapping
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from lit_review.domain.exceptions import ValidationError
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
 
+if TYPE_CHECKING:
+    from lit_review.domain.entities.paper_collection import PaperCollection
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
     """Academic paper entity with business logic.
 
     Represents a scholarly publication with full metadata. Papers are uniquely
     identified by their DOI and can be assessed for quality during review.
+    Instances have no ``__dict__``, and the journal name and keywords are
+    interned because the same few values recur across thousands of papers.
+    A paper keeps weak references to the PaperCollections holding it, so
+    that ``assess`` keeps their indexes up to date; copies and pickles
+    are not held by any collection.
 
     Attributes:
         doi: Digital Object Identifier (unique identifier).
@@ -53,9 +66,103 @@ class Paper:
     quality_score: float | None = None
     included: bool | None = None
     assessment_notes: str = ""
+    _collections: "tuple[weakref.ref[PaperCollection], ...]" = field(
+        default=(), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate paper fields on creation."""
+        self._validate_fields(datetime.now().year)
+        self.journal = sys.intern(self.journal)
+        self.keywords = [sys.intern(keyword) for keyword in self.keywords]
+
+    @classmethod
+    def from_trusted_records(cls, records: Iterable[Mapping[str, Any]]) -> list["Paper"]:
+        """Build papers from records that were validated when first stored.
+
+        Skips the per-object validation of the paper, its DOI and its
+        authors, which dominates load time for large reviews. Repeated
+        strings are still interned, and authors with identical fields share
+        one immutable Author. Use validate_all() to check the papers later
+        if the records may have been edited by hand.
+
+        Args:
+            records: Mappings in the saved-review format: ``doi`` as a
+                string, ``authors`` as mappings of ``last_name``,
+                ``first_name``, ``initials`` and optional ``orcid``, and
+                optional ``abstract``, ``keywords``, ``quality_score``,
+                ``included`` and ``assessment_notes``.
+
+        Returns:
+            Papers in record order.
+
+        Raises:
+            KeyError: If a record lacks a required field.
+        """
+        known_authors: dict[tuple[str, str, str, str | None], Author] = {}
+        return [cls._from_trusted_record(record, known_authors) for record in records]
+
+    @classmethod
+    def _from_trusted_record(
+        cls,
+        record: Mapping[str, Any],
+        known_authors: dict[tuple[str, str, str, str | None], Author],
+    ) -> "Paper":
+        """Build one paper without validation (see from_trusted_records)."""
+        set_field = object.__setattr__
+        intern = sys.intern
+        authors = []
+        for data in record["authors"]:
+            key = (data["last_name"], data["first_name"], data["initials"], data.get("orcid"))
+            author = known_authors.get(key)
+            if author is None:
+                author = known_authors[key] = Author.trusted(*key)
+            authors.append(author)
+
+        paper = object.__new__(cls)
+        set_field(paper, "doi", DOI.trusted(record["doi"]))
+        set_field(paper, "title", record["title"])
+        set_field(paper, "authors", authors)
+        set_field(paper, "publication_year", record["publication_year"])
+        set_field(paper, "journal", intern(record["journal"]))
+        set_field(paper, "abstract", record.get("abstract", ""))
+        set_field(paper, "keywords", [intern(k) for k in record.get("keywords", ())])
+        set_field(paper, "quality_score", record.get("quality_score"))
+        set_field(paper, "included", record.get("included"))
+        set_field(paper, "assessment_notes", record.get("assessment_notes", ""))
+        set_field(paper, "_collections", ())
+        return paper
+
+    @classmethod
+    def validate_all(cls, papers: Iterable["Paper"]) -> None:
+        """Validate papers in one pass, computing the current year once.
+
+        Args:
+            papers: Papers to check, typically from from_trusted_records().
+
+        Raises:
+            ValidationError: For the first invalid paper, DOI or author.
+        """
+        current_year = datetime.now().year
+        for paper in papers:
+            paper.validate(current_year)
+
+    def validate(self, current_year: int | None = None) -> None:
+        """Validate the paper, its DOI and its authors.
+
+        Args:
+            current_year: Latest valid publication year (default: this year).
+
+        Raises:
+            ValidationError: If any field is invalid.
+        """
+        self.doi.validate()
+        for author in self.authors:
+            author.validate()
+        self._validate_fields(datetime.now().year if current_year is None else current_year)
+
+    def _validate_fields(self, current_year: int) -> None:
+        """Validate the paper's own fields."""
         if not self.title or not self.title.strip():
             raise ValidationError("Paper title cannot be empty")
 
@@ -65,7 +172,6 @@ class Paper:
         if not self.journal or not self.journal.strip():
             raise ValidationError("Paper journal cannot be empty")
 
-        current_year = datetime.now().year
         if self.publication_year < 1900 or self.publication_year > current_year:
             raise ValidationError(
                 f"Publication year must be between 1900 and {current_year}, "
@@ -75,6 +181,35 @@ class Paper:
         if self.quality_score is not None:
             self._validate_quality_score(self.quality_score)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Copy and pickle the paper's fields, without its collections."""
+        return {name: getattr(self, name) for name in _STATE_FIELDS}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a copied or unpickled paper, held by no collection."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._collections = ()
+
+    def _attach(self, collection: "PaperCollection") -> None:
+        """Register a collection to re-index this paper when it is assessed."""
+        self._collections = (*self._collections, weakref.ref(collection))
+
+    def _detach(self, collection: "PaperCollection") -> None:
+        """Stop re-indexing this paper in a collection (and in dead ones)."""
+        self._collections = tuple(
+            ref for ref in self._collections if ref() is not None and ref() is not collection
+        )
+
+    def _reindexing(self) -> ExitStack:
+        """Take this paper out of its collections' indexes until the stack exits."""
+        stack = ExitStack()
+        for ref in self._collections:
+            collection = ref()
+            if collection is not None:
+                stack.enter_context(collection.updating(self))
+        return stack
+
     def _validate_quality_score(self, score: float) -> None:
         """Validate quality score is in valid range."""
         if score < 0 or score > 10:
@@ -90,11 +225,15 @@ class Paper:
             ValidationError: If score is out of range.
         """
         self._validate_quality_score(score)
-        self.quality_score = score
+        with self._reindexing():
+            self.quality_score = score
 
     def assess(self, score: float, include: bool, notes: str = "") -> None:
         """Assess paper for quality and inclusion.
 
+        The indexes of every collection holding the paper (e.g. its
+        review's) are updated.
+
         Args:
             score: Quality score between 0 and 10.
             include: Whether to include paper in review.
@@ -104,9 +243,10 @@ class Paper:
             ValidationError: If score is out of range.
         """
         self._validate_quality_score(score)
-        self.quality_score = score
-        self.included = include
-        self.assessment_notes = notes
+        with self._reindexing():
+            self.quality_score = score
+            self.included = include
+            self.assessment_notes = notes
 
     def get_citation_key(self) -> str:
         """Generate citation key for BibTeX.
@@ -131,6 +271,25 @@ class Paper:
         else:
             return f"{self.authors[0].last_name}EtAl{self.publication_year}"
 
+    def has_placeholder_authors(self) -> bool:
+        """Check if the author list is only the "Unknown" placeholder.
+
+        Adapters substitute ``Author("Unknown", "Author", "U.")`` when a
+        record has no author metadata.
+
+        Returns:
+            True if no real author is known.
+        """
+        return all(author.last_name == "Unknown" for author in self.authors)
+
+    def is_incomplete(self) -> bool:
+        """Check if the paper is missing metadata that enrichment can fill.
+
+        Returns:
+            True if the abstract, keywords or real authors are missing.
+        """
+        return not self.abstract or not self.keywords or self.has_placeholder_authors()
+
     def is_assessed(self) -> bool:
         """Check if paper has been assessed.
 
@@ -148,3 +307,7 @@ class Paper:
     def __hash__(self) -> int:
         """Hash based on DOI for use in sets."""
         return hash(self.doi)
+
+
+# Fields copied and pickled: everything but the collections holding the paper
+_STATE_FIELDS = tuple(name for name in Paper.__dataclass_fields__ if name != "_collections")
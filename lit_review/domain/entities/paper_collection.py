@@ -0,0 +1,320 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Ordered, DOI-indexed collection of papers with secondary indexes.
+
+Backs ``Review.papers``. Papers are kept in insertion order under their
+DOI, and secondary indexes on inclusion decision, assessment state and
+publication year are maintained as papers are added, removed or assessed,
+so lookups and filtered views never rescan the whole review.
+"""
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping, MutableSet
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.doi import DOI
+
+# Secondary index keys: (index name, indexed value)
+_IndexKey = tuple[str, Hashable]
+
+
+@dataclass(frozen=True)
+class PaperCounts:
+    """Paper counts read from a collection's indexes.
+
+    Attributes:
+        total: All papers.
+        assessed: Papers with a quality score and inclusion decision.
+        included: Papers marked for inclusion.
+        excluded: Papers marked for exclusion.
+        by_year: Papers per publication year, ascending by year.
+    """
+
+    total: int
+    assessed: int
+    included: int
+    excluded: int
+    by_year: dict[int, int]
+
+    @property
+    def unassessed(self) -> int:
+        """Papers still awaiting assessment."""
+        return self.total - self.assessed
+
+
+class PaperCollection(MutableSet[Paper]):
+    """Set of papers with an O(1) DOI index and maintained secondary indexes.
+
+    Behaves like the ``set[Paper]`` it replaces: papers are unique by DOI
+    and adding a paper whose DOI is present keeps the existing paper.
+    Iteration follows insertion order.
+
+    Held papers keep a weak reference to the collection, so
+    ``Paper.assess`` and ``Paper.set_quality_score`` update its indexes.
+    Call ``reindex`` after setting an indexed field (``included``,
+    ``quality_score`` or ``publication_year``) directly. A paper's DOI is
+    its identity; use ``rekey`` after changing it in place.
+
+    Example:
+        >>> papers = PaperCollection([paper])
+        >>> papers.get(DOI("10.1234/test")) is paper
+        True
+        >>> paper.assess(8.0, include=True)
+        >>> papers.included()
+        [paper]
+    """
+
+    def __init__(self, papers: Iterable[Paper] = ()) -> None:
+        """Initialize collection.
+
+        Args:
+            papers: Initial papers (later duplicates by DOI are ignored).
+        """
+        self._papers: dict[DOI, Paper] = {}
+        self._buckets: dict[_IndexKey, dict[DOI, Paper]] = {}
+        for paper in papers:
+            self.add(paper)
+
+    @staticmethod
+    def _keys(paper: Paper) -> tuple[_IndexKey, ...]:
+        """Secondary index keys of a paper in its current state."""
+        return (
+            ("included", paper.included),
+            ("assessed", paper.is_assessed()),
+            ("year", paper.publication_year),
+        )
+
+    def _index(self, paper: Paper) -> None:
+        """Add a paper to the secondary indexes of its current state."""
+        for key in self._keys(paper):
+            self._buckets.setdefault(key, {})[paper.doi] = paper
+
+    def _unindex(self, paper: Paper, doi: DOI | None = None) -> None:
+        """Remove a paper from the secondary indexes it was entered in.
+
+        Args:
+            paper: Paper to remove.
+            doi: DOI the paper is held under (default: its current DOI).
+        """
+        doi = paper.doi if doi is None else doi
+        keys: Iterable[_IndexKey] = self._keys(paper)
+        if not all(doi in self._buckets.get(key, ()) for key in keys):
+            # Changed since it was indexed: find its entries by DOI, which
+            # costs one lookup per distinct indexed value
+            keys = [key for key, bucket in self._buckets.items() if doi in bucket]
+        for key in keys:
+            bucket = self._buckets[key]
+            del bucket[doi]
+            if not bucket:
+                del self._buckets[key]
+
+    def _bucket(self, name: str, value: Hashable) -> list[Paper]:
+        return list(self._buckets.get((name, value), {}).values())
+
+    def _count(self, name: str, value: Hashable) -> int:
+        return len(self._buckets.get((name, value), ()))
+
+    def __contains__(self, paper: object) -> bool:
+        """Check whether a paper with the same DOI is in the collection."""
+        return isinstance(paper, Paper) and paper.doi in self._papers
+
+    def __iter__(self) -> Iterator[Paper]:
+        """Iterate papers in insertion order."""
+        return iter(self._papers.values())
+
+    def __len__(self) -> int:
+        """Number of papers."""
+        return len(self._papers)
+
+    def __repr__(self) -> str:
+        """Represent the collection by its size."""
+        return f"{type(self).__name__}({len(self)} papers)"
+
+    def __reduce__(self) -> tuple[type["PaperCollection"], tuple[list[Paper]]]:
+        """Copy and pickle as the papers, re-attaching them when rebuilt."""
+        return type(self), (list(self._papers.values()),)
+
+    def add(self, paper: Paper) -> None:
+        """Add a paper unless one with the same DOI is present.
+
+        Args:
+            paper: Paper to add.
+        """
+        if paper.doi in self._papers:
+            return
+        self._papers[paper.doi] = paper
+        self._index(paper)
+        paper._attach(self)
+
+    def discard(self, paper: Paper) -> None:
+        """Remove the paper with the same DOI, if present.
+
+        Args:
+            paper: Paper to remove.
+        """
+        held = self._papers.pop(paper.doi, None)
+        if held is not None:
+            self._unindex(held)
+            held._detach(self)
+
+    def clear(self) -> None:
+        """Remove all papers."""
+        for paper in self._papers.values():
+            paper._detach(self)
+        self._papers.clear()
+        self._buckets.clear()
+
+    def update(self, papers: Iterable[Paper]) -> None:
+        """Add papers, ignoring those whose DOI is present.
+
+        Args:
+            papers: Papers to add.
+        """
+        for paper in papers:
+            self.add(paper)
+
+    def assess(self, paper: Paper, score: float, include: bool, notes: str = "") -> None:
+        """Assess the held paper with this DOI (see Paper.assess).
+
+        Args:
+            paper: Paper in the collection.
+            score: Quality score between 0 and 10.
+            include: Whether to include the paper in the review.
+            notes: Optional assessment notes.
+
+        Raises:
+            KeyError: If no paper with this DOI is in the collection.
+            ValidationError: If score is out of range.
+        """
+        self._papers[paper.doi].assess(score, include, notes)
+
+    @contextmanager
+    def updating(self, paper: Paper) -> Iterator[None]:
+        """Move a held paper between the indexes around changes to its fields.
+
+        Args:
+            paper: Paper in the collection.
+
+        Yields:
+            Nothing; change the paper's indexed fields in the block.
+
+        Raises:
+            KeyError: If the paper is not in the collection.
+        """
+        if self._papers.get(paper.doi) is not paper:
+            raise KeyError(paper.doi)
+        self._unindex(paper)
+        try:
+            yield
+        finally:
+            self._index(paper)
+
+    def reindex(self, paper: Paper) -> None:
+        """Re-index a held paper after its indexed fields were changed directly.
+
+        Args:
+            paper: Paper in the collection.
+
+        Raises:
+            KeyError: If no paper with this DOI is in the collection.
+        """
+        held = self._papers[paper.doi]
+        self._unindex(held)
+        self._index(held)
+
+    def rekey(self, renamed: Mapping[DOI, Paper]) -> None:
+        """Move held papers whose DOI was changed in place to their new DOI.
+
+        Papers keep their position in the collection. This costs one pass
+        over the collection however many papers were renamed, so rename in
+        batches.
+
+        Args:
+            renamed: Renamed papers by the DOI they are held under.
+
+        Raises:
+            ValueError: If a new DOI is held by another paper.
+        """
+        if not renamed:
+            return
+        for paper in renamed.values():
+            held = self._papers.get(paper.doi)
+            if held is not None and held is not paper and paper.doi not in renamed:
+                raise ValueError(f"DOI {paper.doi.value} is already held by another paper")
+        for doi, paper in renamed.items():
+            self._unindex(paper, doi)
+        self._papers = {
+            paper.doi if doi in renamed else doi: paper for doi, paper in self._papers.items()
+        }
+        for paper in renamed.values():
+            self._index(paper)
+
+    def get(self, doi: DOI) -> Paper | None:
+        """Find a paper by its DOI in O(1).
+
+        Args:
+            doi: DOI to look up.
+
+        Returns:
+            Paper if found, None otherwise.
+        """
+        return self._papers.get(doi)
+
+    def included(self) -> list[Paper]:
+        """Papers marked for inclusion."""
+        return self._bucket("included", True)
+
+    def excluded(self) -> list[Paper]:
+        """Papers marked for exclusion."""
+        return self._bucket("included", False)
+
+    def assessed(self) -> list[Paper]:
+        """Papers with a quality score and inclusion decision."""
+        return self._bucket("assessed", True)
+
+    def unassessed(self) -> list[Paper]:
+        """Papers still awaiting assessment."""
+        return self._bucket("assessed", False)
+
+    def years(self) -> list[int]:
+        """Distinct publication years, ascending."""
+        return sorted(
+            value for name, value in self._buckets if name == "year" and isinstance(value, int)
+        )
+
+    def counts(self) -> PaperCounts:
+        """Count papers by assessment state, decision and year.
+
+        The indexes are maintained as papers are added and assessed, so
+        counting never walks the papers: it costs one lookup per index
+        plus one per distinct publication year.
+
+        Returns:
+            Current counts.
+        """
+        return PaperCounts(
+            total=len(self._papers),
+            assessed=self._count("assessed", True),
+            included=self._count("included", True),
+            excluded=self._count("included", False),
+            by_year={year: self._count("year", year) for year in self.years()},
+        )
+
+    def by_year(self, start: int, end: int | None = None) -> list[Paper]:
+        """Papers published in a year range.
+
+        Args:
+            start: First publication year.
+            end: Last publication year, inclusive (default: start).
+
+        Returns:
+            Papers ordered by year, then by when they entered the index.
+        """
+        end = start if end is None else end
+        return [
+            paper
+            for year in self.years()
+            if start <= year <= end
+            for paper in self._bucket("year", year)
+        ]
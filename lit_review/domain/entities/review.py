@@ -6,14 +6,20 @@ The Review entity manages a systematic literature review, enforcing workflow
 stages and tracking papers through the review process.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from lit_review.domain.entities.paper import Paper
-from lit_review.domain.exceptions import ValidationError, WorkflowError
+from lit_review.domain.entities.paper_collection import PaperCollection
+from lit_review.domain.entities.saved_search import SavedSearch
+from lit_review.domain.exceptions import EntityNotFoundError, ValidationError, WorkflowError
 from lit_review.domain.values.doi import DOI
 
+if TYPE_CHECKING:
+    from lit_review.domain.services.deduplication import DuplicateIndex, PaperDeduplicator
+
 
 class ReviewStage(Enum):
     """Workflow stages for a literature review.
@@ -55,7 +61,9 @@ class Review:
         inclusion_criteria: List of inclusion criteria.
         exclusion_criteria: List of exclusion criteria.
         stage: Current workflow stage.
-        papers: Set of papers in the review.
+        papers: Papers in the review, indexed by DOI, inclusion, assessment
+            and year.
+        saved_searches: Searches re-run by delta updates of a living review.
 
     Example:
         >>> review = Review(
@@ -71,7 +79,11 @@ class Review:
     inclusion_criteria: list[str]
     exclusion_criteria: list[str]
     stage: ReviewStage = ReviewStage.PLANNING
-    papers: set[Paper] = field(default_factory=set)
+    papers: PaperCollection = field(default_factory=PaperCollection)
+    saved_searches: list[SavedSearch] = field(default_factory=list)
+    _duplicate_index: "DuplicateIndex | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate review fields on creation."""
@@ -139,6 +151,112 @@ class Review:
             self.papers.add(paper)
         return len(self.papers) - initial_count
 
+    def merge_duplicates(
+        self, deduplicator: "PaperDeduplicator", new: Iterable[Paper] | None = None
+    ) -> int:
+        """Merge papers that describe the same work under different DOIs.
+
+        Catches duplicates that DOI-based add_papers cannot, such as a
+        PubMed record with a synthetic DOI and its Crossref counterpart, or
+        an arXiv preprint and its journal version.
+
+        The review keeps a duplicate index of its papers for the
+        deduplicator, so only papers not indexed yet are hashed and
+        compared; papers the review already held are indexed first. A
+        duplicate is merged in place into the paper it matches, which keeps
+        its position and any assessment, and is then removed.
+
+        Args:
+            deduplicator: Deduplication service used to match and merge papers.
+            new: Papers just added to the review. If given, only these are
+                counted, so that subtracting the result from the number
+                added gives the new works found.
+
+        Returns:
+            Number of papers removed by merging (with ``new``, the number
+            of new papers that turned out to duplicate another paper).
+        """
+        index = self._duplicate_index
+        if index is None or index.deduplicator is not deduplicator:
+            index = self._duplicate_index = deduplicator.index()
+
+        pending = [paper for paper in self.papers if paper not in index]
+        new_dois = {paper.doi for paper in pending} if new is None else {p.doi for p in new}
+        # Index earlier papers before matching the new ones against them
+        pending.sort(key=lambda paper: paper.doi in new_dois)
+
+        removed = 0
+        # Papers that took a duplicate's DOI, by the DOI they are held under
+        renamed: dict[DOI, Paper] = {}
+        held_as: dict[int, DOI] = {}
+        for paper in pending:
+            match = index.find(paper)
+            if match is None or self.papers.get(held_as.get(id(match), match.doi)) is not match:
+                # Distinct, or matched a paper no longer in the review
+                index.add(paper)
+                continue
+
+            match_doi = held_as.get(id(match), match.doi)
+            self.papers.discard(paper)
+            if deduplicator.merge_into(match, paper) is not None and id(match) not in held_as:
+                renamed[match_doi] = match
+                held_as[id(match)] = match_doi
+            elif id(match) not in held_as:
+                self.papers.reindex(match)
+            index.add(paper, under=match)
+            if paper.doi in new_dois:
+                removed += 1
+
+        self.papers.rekey(renamed)
+        return removed
+
+    def save_search(self, query: str, database: str, limit: int = 100) -> SavedSearch:
+        """Persist a search so that later updates can re-run it.
+
+        Saving the same query and database again keeps the existing
+        watermark and only updates the limit.
+
+        Args:
+            query: Search query string.
+            database: Database name.
+            limit: Maximum results per run.
+
+        Returns:
+            The saved search.
+
+        Raises:
+            ValidationError: If the query, database or limit is invalid.
+        """
+        for saved in self.saved_searches:
+            if saved.matches(query, database):
+                saved.limit = limit
+                return saved
+        saved = SavedSearch(query=query, database=database, limit=limit)
+        self.saved_searches.append(saved)
+        return saved
+
+    def assess_paper(self, doi: DOI, score: float, include: bool, notes: str = "") -> Paper:
+        """Look up a paper in the review by DOI and assess it (see Paper.assess).
+
+        Args:
+            doi: DOI of the paper to assess.
+            score: Quality score between 0 and 10.
+            include: Whether to include the paper in the review.
+            notes: Optional assessment notes.
+
+        Returns:
+            The assessed paper.
+
+        Raises:
+            EntityNotFoundError: If no paper with this DOI is in the review.
+            ValidationError: If score is out of range.
+        """
+        paper = self.papers.get(doi)
+        if paper is None:
+            raise EntityNotFoundError(f"Paper with DOI {doi.value} not found in review")
+        self.papers.assess(paper, score, include, notes)
+        return paper
+
     def get_paper_by_doi(self, doi: DOI) -> Paper | None:
         """Find a paper by its DOI.
 
@@ -148,10 +266,7 @@ class Review:
         Returns:
             Paper if found, None otherwise.
         """
-        for paper in self.papers:
-            if paper.doi == doi:
-                return paper
-        return None
+        return self.papers.get(doi)
 
     def get_unassessed_papers(self) -> list[Paper]:
         """Get papers that haven't been assessed yet.
@@ -159,7 +274,7 @@ class Review:
         Returns:
             List of unassessed papers.
         """
-        return [p for p in self.papers if not p.is_assessed()]
+        return self.papers.unassessed()
 
     def get_included_papers(self) -> list[Paper]:
         """Get papers marked for inclusion.
@@ -167,7 +282,7 @@ class Review:
         Returns:
             List of included papers.
         """
-        return [p for p in self.papers if p.included is True]
+        return self.papers.included()
 
     def get_excluded_papers(self) -> list[Paper]:
         """Get papers marked for exclusion.
@@ -175,26 +290,39 @@ class Review:
         Returns:
             List of excluded papers.
         """
-        return [p for p in self.papers if p.included is False]
+        return self.papers.excluded()
+
+    def get_papers_by_year(self, start: int, end: int | None = None) -> list[Paper]:
+        """Get papers published in a year range.
+
+        Args:
+            start: First publication year.
+            end: Last publication year, inclusive (default: start).
+
+        Returns:
+            List of papers ordered by year.
+        """
+        return self.papers.by_year(start, end)
 
     def generate_statistics(self) -> dict[str, Any]:
         """Generate review statistics.
 
+        Counts come from the indexes that the paper collection maintains as
+        papers are added and assessed, so no paper is visited.
+
         Returns:
             Dictionary with review statistics.
         """
-        total = len(self.papers)
-        assessed = sum(1 for p in self.papers if p.is_assessed())
-        included = len(self.get_included_papers())
-        excluded = len(self.get_excluded_papers())
+        counts = self.papers.counts()
 
         return {
-            "total_papers": total,
-            "assessed_papers": assessed,
-            "unassessed_papers": total - assessed,
-            "included_papers": included,
-            "excluded_papers": excluded,
-            "inclusion_rate": included / assessed if assessed > 0 else 0.0,
+            "total_papers": counts.total,
+            "assessed_papers": counts.assessed,
+            "unassessed_papers": counts.unassessed,
+            "included_papers": counts.included,
+            "excluded_papers": counts.excluded,
+            "inclusion_rate": counts.included / counts.assessed if counts.assessed > 0 else 0.0,
+            "papers_by_year": counts.by_year,
             "current_stage": self.stage.value,
         }
 
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Saved search entity for living reviews.
+
+A SavedSearch records a query run against one database together with the
+time it last ran successfully. Re-running it later (delta mode) only asks
+the database for records added since that watermark.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from lit_review.domain.exceptions import ValidationError
+
+
+@dataclass
+class SavedSearch:
+    """Query persisted on a review with its last-run watermark.
+
+    Attributes:
+        query: Search query string in the database's syntax.
+        database: Database name (e.g. "crossref", "pubmed").
+        limit: Maximum results per run.
+        last_run: UTC time of the last successful run (None if never run).
+
+    Example:
+        >>> saved = SavedSearch(query="sepsis AND machine learning", database="pubmed")
+        >>> saved.record_run(datetime.now(UTC))
+        >>> saved.since  # date of the last run
+    """
+
+    query: str
+    database: str
+    limit: int = 100
+    last_run: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Validate saved search fields on creation."""
+        if not self.query or not self.query.strip():
+            raise ValidationError("Saved search query cannot be empty")
+
+        if not self.database or not self.database.strip():
+            raise ValidationError("Saved search database cannot be empty")
+
+        if self.limit < 1:
+            raise ValidationError(f"Saved search limit must be positive, got {self.limit}")
+
+    @property
+    def since(self) -> date | None:
+        """Date to fetch new records from, or None for a full search.
+
+        The watermark is a whole day, so a run overlaps the previous one on
+        that day instead of risking a gap; overlapping records are dropped
+        by DOI deduplication.
+        """
+        return self.last_run.date() if self.last_run else None
+
+    def matches(self, query: str, database: str) -> bool:
+        """Check whether this saved search is for a query and database.
+
+        Args:
+            query: Search query string.
+            database: Database name.
+
+        Returns:
+            True if both match.
+        """
+        return self.query == query and self.database == database
+
+    def record_run(self, run_at: datetime) -> None:
+        """Advance the watermark after a successful run.
+
+        Args:
+            run_at: Time the run started (so records added during the run
+                are picked up next time).
+        """
+        if self.last_run is None or run_at > self.last_run:
+            self.last_run = run_at
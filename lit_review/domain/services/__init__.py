@@ -4,5 +4,6 @@
 
 from lit_review.domain.services.bibtex_parser import BibtexParser
 from lit_review.domain.services.citation_formatter import CitationFormatter
+from lit_review.domain.services.deduplication import PaperDeduplicator
 
-__all__ = ["BibtexParser", "CitationFormatter"]
+__all__ = ["BibtexParser", "CitationFormatter", "PaperDeduplicator"]
@@ -0,0 +1,624 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Cross-source duplicate detection and merging for papers.
+
+DOI equality misses many duplicates: PubMed records without a DOI get
+synthetic ``10.9999/pubmed.<PMID>`` identifiers, and arXiv preprints carry
+``10.48550/arXiv.*`` DOIs that differ from their journal versions. This
+service groups papers that describe the same work using
+
+1. exact DOI matches,
+2. a blocking key of normalized title, first-author surname, year and
+   journal, and
+3. MinHash signatures of title tokens with locality-sensitive hashing
+   (LSH) banding to find near-duplicate titles,
+
+and merges each group into one Paper. Only candidate pairs that share a
+block or an LSH bucket are compared, so deduplication runs in near-linear
+time even for 100k records. A DuplicateIndex keeps the keys and buckets of
+papers already known to be distinct, so that new records can be matched
+against them without hashing or comparing the known papers again.
+
+Two registered DOIs that differ always mean two works: generic titles such
+as "Correction" or "Editorial" recur across journals, so papers are only
+merged across DOIs when at least one of them is synthetic or a preprint
+DOI.
+"""
+
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import replace
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+
+# LSH bucket key: (band number, signature values of the band)
+_BandKey = tuple[int, tuple[int, ...]]
+
+# DOI prefixes assigned by adapters when a record has no publisher DOI
+SYNTHETIC_DOI_PREFIXES = ("10.9999/", "10.58121/s2.")
+
+# DOI prefix of arXiv preprints (journal versions are preferred when merging)
+PREPRINT_DOI_PREFIXES = ("10.48550/arxiv.",)
+
+# Words ignored when comparing titles
+TITLE_STOPWORDS = frozenset(
+    {"a", "an", "and", "as", "at", "by", "for", "from", "in", "of", "on", "or", "the", "to", "with"}
+)
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_PLACEHOLDER_SURNAME = "unknown"
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for comparison.
+
+    Strips accents and markup punctuation, lowercases and collapses
+    whitespace, so that "Deep Learning: A Review." and "deep learning - a
+    review" compare equal.
+
+    Args:
+        title: Raw paper title.
+
+    Returns:
+        Normalized title.
+
+    Example:
+        >>> normalize_title("Sepsis Prediction: A Review.")
+        'sepsis prediction a review'
+    """
+    if not title.isascii():
+        decomposed = unicodedata.normalize("NFKD", title)
+        title = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", title.casefold()).strip()
+
+
+def is_synthetic_doi(doi: str) -> bool:
+    """Check whether a DOI was synthesized by an adapter.
+
+    Args:
+        doi: DOI string.
+
+    Returns:
+        True if the DOI is a placeholder rather than a registered DOI.
+    """
+    return doi.lower().startswith(SYNTHETIC_DOI_PREFIXES)
+
+
+def is_preprint_doi(doi: str) -> bool:
+    """Check whether a DOI identifies an arXiv preprint.
+
+    Args:
+        doi: DOI string.
+
+    Returns:
+        True for arXiv DOIs.
+    """
+    return doi.lower().startswith(PREPRINT_DOI_PREFIXES)
+
+
+class PaperDeduplicator:
+    """Service for finding and merging duplicate papers across sources.
+
+    Two papers are duplicates if they share a DOI, or if their publication
+    years differ by at most ``year_tolerance``, their first authors are
+    compatible and the Jaccard similarity of their title tokens is at least
+    ``threshold``. A group never holds two different registered DOIs, and
+    placeholder authors ("Unknown") never count as a matching author.
+    Candidate pairs come from exact blocking keys and MinHash LSH buckets;
+    a bucket larger than ``max_bucket_size`` (e.g. thousands of papers
+    titled "Editorial") is skipped for fuzzy matching to keep the running
+    time near-linear.
+
+    The blocking and matching steps are public (title_tokens, exact_keys,
+    band_keys, is_match, dois_compatible) so that DuplicateIndex can reuse
+    them for incremental matching.
+
+    Attributes:
+        threshold: Minimum title-token Jaccard similarity for duplicates.
+        year_tolerance: Maximum difference in publication year, allowing a
+            preprint and its journal version to match.
+        num_perm: Number of MinHash permutations per signature.
+        bands: Number of LSH bands (num_perm must be divisible by bands).
+        max_bucket_size: Largest LSH bucket compared pairwise.
+
+    Example:
+        >>> deduplicator = PaperDeduplicator()
+        >>> unique = deduplicator.deduplicate(pubmed_papers + arxiv_papers)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        year_tolerance: int = 1,
+        num_perm: int = 32,
+        bands: int = 8,
+        max_bucket_size: int = 200,
+    ) -> None:
+        """Initialize deduplicator.
+
+        Args:
+            threshold: Minimum title-token Jaccard similarity (0-1].
+            year_tolerance: Maximum difference in publication year.
+            num_perm: Number of MinHash permutations.
+            bands: Number of LSH bands.
+            max_bucket_size: Largest LSH bucket compared pairwise.
+
+        Raises:
+            ValueError: If the settings are out of range.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Threshold must be in (0, 1], got {threshold}")
+        if year_tolerance < 0:
+            raise ValueError(f"Year tolerance must be non-negative, got {year_tolerance}")
+        if bands < 1 or num_perm < bands or num_perm % bands:
+            raise ValueError(
+                f"num_perm ({num_perm}) must be a positive multiple of bands ({bands})"
+            )
+
+        self.threshold = threshold
+        self.year_tolerance = year_tolerance
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_bucket_size = max_bucket_size
+
+        # Universal hash family h(x) = (a * x + b) mod p, fixed for determinism
+        seed = 0x9E3779B97F4A7C15
+        self._permutations: list[tuple[int, int]] = []
+        for _ in range(num_perm):
+            seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            a = seed % (_MERSENNE_PRIME - 1) + 1
+            seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            b = seed % _MERSENNE_PRIME
+            self._permutations.append((a, b))
+
+    def find_duplicates(self, papers: list[Paper]) -> list[list[Paper]]:
+        """Group papers that describe the same work.
+
+        Args:
+            papers: Papers from one or more sources.
+
+        Returns:
+            Groups of papers in order of first occurrence; every paper
+            appears in exactly one group and singletons are included.
+        """
+        titles = [normalize_title(paper.title) for paper in papers]
+        tokens = [self.title_tokens(title) for title in titles]
+        parent = list(range(len(papers)))
+        # Registered DOI of each group root (None while a group has only
+        # synthetic and preprint DOIs)
+        registered = [self._registered_doi(paper) for paper in papers]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i: int, j: int) -> None:
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                return
+            doi_i, doi_j = registered[root_i], registered[root_j]
+            if doi_i and doi_j and doi_i != doi_j:
+                return  # Distinct registered DOIs are distinct works
+            # Keep the earliest paper as the root so groups keep input order
+            root, child = min(root_i, root_j), max(root_i, root_j)
+            parent[child] = root
+            registered[root] = doi_i or doi_j
+
+        # Exact keys: same DOI, or same (title, first author, year, journal)
+        # block; papers without a real first author get no block
+        exact: dict[object, int] = {}
+        for i, paper in enumerate(papers):
+            for key in self.exact_keys(paper, titles[i], tokens[i]):
+                if key in exact:
+                    union(exact[key], i)
+                else:
+                    exact[key] = i
+
+        # Near-duplicate titles: compare pairs sharing an LSH bucket
+        token_hashes: dict[str, tuple[int, ...]] = {}
+        buckets: dict[_BandKey, list[int]] = defaultdict(list)
+        for i, title_tokens in enumerate(tokens):
+            for band_key in self.band_keys(title_tokens, token_hashes):
+                buckets[band_key].append(i)
+
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > self.max_bucket_size:
+                continue
+            for pos, i in enumerate(members):
+                for j in members[pos + 1 :]:
+                    if find(i) != find(j) and self.is_match(
+                        papers[i], papers[j], tokens[i], tokens[j]
+                    ):
+                        union(i, j)
+
+        groups: dict[int, list[Paper]] = {}
+        for i, paper in enumerate(papers):
+            groups.setdefault(find(i), []).append(paper)
+        return list(groups.values())
+
+    def deduplicate(self, papers: list[Paper]) -> list[Paper]:
+        """Remove duplicates, merging the metadata of each duplicate group.
+
+        Args:
+            papers: Papers from one or more sources.
+
+        Returns:
+            One merged paper per distinct work, in order of first occurrence.
+        """
+        return [self.merge(group) for group in self.find_duplicates(papers)]
+
+    def merge(self, papers: list[Paper]) -> Paper:
+        """Merge duplicate records of one work into a single Paper.
+
+        The record with the most authoritative DOI (registered over
+        synthetic, journal over preprint) provides the identity, title,
+        year and venue. Other fields are combined: the longest abstract,
+        the most complete author list, the union of keywords and the first
+        existing assessment.
+
+        Args:
+            papers: Non-empty list of duplicate papers.
+
+        Returns:
+            Merged paper (the input paper itself if there is only one).
+
+        Raises:
+            ValueError: If papers is empty.
+        """
+        if not papers:
+            raise ValueError("Cannot merge an empty group of papers")
+        if len(papers) == 1:
+            return papers[0]
+
+        primary = min(papers, key=self._primary_rank)
+
+        # Keep an existing screening decision rather than forcing re-assessment
+        assessed = next((p for p in [primary, *papers] if p.is_assessed()), primary)
+
+        return replace(
+            primary,
+            authors=self._best_authors(papers),
+            abstract=max((p.abstract for p in papers), key=len),
+            keywords=self._merged_keywords([primary, *papers]),
+            quality_score=assessed.quality_score,
+            included=assessed.included,
+            assessment_notes=assessed.assessment_notes,
+        )
+
+    def merge_into(self, paper: Paper, duplicate: Paper) -> DOI | None:
+        """Merge a duplicate record into a paper in place.
+
+        The paper object survives, so references to it and its screening
+        decision stay valid. It takes over the duplicate's DOI, title, year
+        and venue only while it is unassessed and the duplicate's DOI is
+        more authoritative (registered over synthetic, journal over
+        preprint). Other fields are combined as in merge.
+
+        Fields are assigned directly, not through Paper.assess, so a
+        collection holding the paper must be updated by the caller:
+        PaperCollection.reindex after any merge, and PaperCollection.rekey
+        when a DOI is returned. Review.merge_duplicates does both.
+
+        Args:
+            paper: Paper that survives the merge.
+            duplicate: Record of the same work, discarded by the caller.
+
+        Returns:
+            The paper's new DOI if it changed, otherwise None.
+        """
+        records = [paper, duplicate]
+        paper.authors = self._best_authors(records)
+        paper.abstract = max(paper.abstract, duplicate.abstract, key=len)
+        paper.keywords = self._merged_keywords(records)
+
+        if paper.is_assessed():
+            return None
+        if duplicate.is_assessed():
+            paper.quality_score = duplicate.quality_score
+            paper.included = duplicate.included
+            paper.assessment_notes = duplicate.assessment_notes
+        elif self._primary_rank(duplicate)[:2] < self._primary_rank(paper)[:2]:
+            paper.doi = duplicate.doi
+            paper.title = duplicate.title
+            paper.publication_year = duplicate.publication_year
+            paper.journal = duplicate.journal
+            return paper.doi
+        return None
+
+    def index(self, papers: Iterable[Paper] = ()) -> "DuplicateIndex":
+        """Build an index that matches new records against distinct papers.
+
+        Args:
+            papers: Papers already known to be distinct.
+
+        Returns:
+            Index using this deduplicator's settings.
+        """
+        index = DuplicateIndex(self)
+        for paper in papers:
+            index.add(paper)
+        return index
+
+    def blocking_key(self, paper: Paper) -> tuple[str, str, int, str]:
+        """Build the exact blocking key of a paper.
+
+        Args:
+            paper: Paper to key.
+
+        Returns:
+            (normalized title, first-author surname, publication year,
+            normalized journal).
+        """
+        return (
+            normalize_title(paper.title),
+            self._first_surname(paper),
+            paper.publication_year,
+            normalize_title(paper.journal),
+        )
+
+    def is_match(
+        self, first: Paper, second: Paper, first_tokens: set[str], second_tokens: set[str]
+    ) -> bool:
+        """Verify that a candidate pair (e.g. sharing an LSH bucket) are duplicates.
+
+        Args:
+            first: First paper.
+            second: Second paper.
+            first_tokens: Title tokens of the first paper.
+            second_tokens: Title tokens of the second paper.
+
+        Returns:
+            True if the papers are duplicates.
+        """
+        if abs(first.publication_year - second.publication_year) > self.year_tolerance:
+            return False
+        if not self.dois_compatible(first, second):
+            return False
+        if not self._authors_compatible(first.authors, second.authors):
+            return False
+        overlap = len(first_tokens & second_tokens)
+        return overlap / (len(first_tokens) + len(second_tokens) - overlap) >= self.threshold
+
+    def _authors_compatible(self, first: list[Author], second: list[Author]) -> bool:
+        """Check that either first author appears in the other author list.
+
+        Placeholder authors ("Unknown") are not evidence of a match: a
+        paper without real authors is compatible with no one.
+
+        Args:
+            first: Authors of the first paper.
+            second: Authors of the second paper.
+
+        Returns:
+            True if the author lists may belong to the same work.
+        """
+        first_names = {self._surname(a) for a in first} - {_PLACEHOLDER_SURNAME, ""}
+        second_names = {self._surname(a) for a in second} - {_PLACEHOLDER_SURNAME, ""}
+        if not first_names or not second_names:
+            return False
+        return self._surname(first[0]) in second_names or self._surname(second[0]) in first_names
+
+    def dois_compatible(self, first: Paper, second: Paper) -> bool:
+        """Check that two papers' DOIs allow them to be the same work.
+
+        Args:
+            first: First paper.
+            second: Second paper.
+
+        Returns:
+            True if the DOIs match or either is synthetic or a preprint DOI.
+        """
+        first_doi, second_doi = self._registered_doi(first), self._registered_doi(second)
+        return first_doi is None or second_doi is None or first_doi == second_doi
+
+    @staticmethod
+    def _registered_doi(paper: Paper) -> str | None:
+        """Lowercased DOI of a paper, or None if it is synthetic or a preprint DOI."""
+        doi = paper.doi.value
+        if is_synthetic_doi(doi) or is_preprint_doi(doi):
+            return None
+        return doi.lower()
+
+    def exact_keys(self, paper: Paper, title: str, tokens: set[str]) -> list[object]:
+        """Build the keys under which exact duplicates of a paper collide.
+
+        Args:
+            paper: Paper to key.
+            title: The paper's title, normalized with normalize_title.
+            tokens: Title tokens from title_tokens.
+
+        Returns:
+            The lowercased DOI, plus the blocking key if the paper has a
+            title and a real first author.
+        """
+        keys: list[object] = [paper.doi.value.lower()]
+        surname = self._first_surname(paper)
+        if tokens and surname not in ("", _PLACEHOLDER_SURNAME):
+            keys.append((title, surname, paper.publication_year, normalize_title(paper.journal)))
+        return keys
+
+    def band_keys(
+        self, tokens: set[str], token_hashes: dict[str, tuple[int, ...]]
+    ) -> list[_BandKey]:
+        """Build the LSH bucket keys of a title, one per band.
+
+        Titles sharing a bucket key are candidate near-duplicates, to be
+        verified with is_match.
+
+        Args:
+            tokens: Title tokens from title_tokens.
+            token_hashes: Memo of per-token hash vectors, shared across titles.
+
+        Returns:
+            (band, band signature) keys; none for an empty title.
+        """
+        if not tokens:
+            return []
+        rows = self.num_perm // self.bands
+        signature = self._minhash(tokens, token_hashes)
+        return [
+            (band, tuple(signature[band * rows : (band + 1) * rows])) for band in range(self.bands)
+        ]
+
+    def _minhash(
+        self, tokens: Iterable[str], token_hashes: dict[str, tuple[int, ...]]
+    ) -> list[int]:
+        """Compute the MinHash signature of a token set.
+
+        Each distinct token is hashed under all permutations once and
+        memoized in ``token_hashes``; a signature is then the element-wise
+        minimum of its tokens' hash vectors.
+
+        Args:
+            tokens: Non-empty set of title tokens.
+            token_hashes: Memo of per-token hash vectors, shared across titles.
+
+        Returns:
+            Signature with num_perm values.
+        """
+        vectors = []
+        for token in tokens:
+            vector = token_hashes.get(token)
+            if vector is None:
+                h = zlib.crc32(token.encode("utf-8"))
+                vector = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._permutations)
+                token_hashes[token] = vector
+            vectors.append(vector)
+        return list(map(min, zip(*vectors, strict=False)))
+
+    @staticmethod
+    def title_tokens(title: str) -> set[str]:
+        """Split a normalized title into comparable tokens, dropping stopwords.
+
+        Args:
+            title: Title normalized with normalize_title.
+
+        Returns:
+            Set of tokens.
+        """
+        tokens = set(title.split())
+        return tokens - TITLE_STOPWORDS or tokens
+
+    def _first_surname(self, paper: Paper) -> str:
+        """Normalize the first author's surname of a paper."""
+        return self._surname(paper.authors[0]) if paper.authors else ""
+
+    @staticmethod
+    def _surname(author: Author) -> str:
+        """Normalize an author's surname for comparison."""
+        return normalize_title(author.last_name).replace(" ", "")
+
+    @staticmethod
+    def _primary_rank(paper: Paper) -> tuple[bool, bool, int]:
+        """Sort key choosing the record whose identity survives a merge.
+
+        Registered DOIs beat synthetic ones and journal versions beat
+        preprints; ties go to the record with the longest abstract.
+        """
+        doi = paper.doi.value
+        return (is_synthetic_doi(doi), is_preprint_doi(doi), -len(paper.abstract))
+
+    def _best_authors(self, papers: list[Paper]) -> list[Author]:
+        """Copy of the most complete real author list among the records."""
+        return list(max(papers, key=lambda p: self._author_rank(p.authors)).authors)
+
+    @staticmethod
+    def _merged_keywords(papers: list[Paper]) -> list[str]:
+        """Union of the records' keywords in order, ignoring case."""
+        keywords: list[str] = []
+        seen: set[str] = set()
+        for paper in papers:
+            for keyword in paper.keywords:
+                if keyword.casefold() not in seen:
+                    seen.add(keyword.casefold())
+                    keywords.append(keyword)
+        return keywords
+
+    def _author_rank(self, authors: list[Author]) -> tuple[int, int]:
+        """Sort key preferring real, long author lists."""
+        real = sum(1 for a in authors if self._surname(a) != _PLACEHOLDER_SURNAME)
+        return (real, len(authors))
+
+
+class DuplicateIndex:
+    """Exact keys and LSH buckets of distinct papers, for matching new records.
+
+    Matching a record hashes only that record and compares it only with the
+    indexed papers sharing a key or bucket with it, so once N papers are
+    indexed, matching k new records costs O(k) rather than O(N + k).
+    Records merged into an indexed paper are indexed under that paper, so
+    later variants of either record still find it.
+
+    Build one with PaperDeduplicator.index().
+
+    Attributes:
+        deduplicator: Deduplicator whose settings and match rules are used.
+    """
+
+    def __init__(self, deduplicator: PaperDeduplicator) -> None:
+        """Initialize an empty index.
+
+        Args:
+            deduplicator: Deduplicator whose settings and match rules are used.
+        """
+        self.deduplicator = deduplicator
+        self._exact: dict[object, Paper] = {}
+        self._buckets: dict[_BandKey, list[tuple[Paper, set[str]]]] = defaultdict(list)
+        self._token_hashes: dict[str, tuple[int, ...]] = {}
+
+    def __contains__(self, paper: object) -> bool:
+        """Check whether this paper object is indexed as a distinct paper."""
+        return isinstance(paper, Paper) and self._exact.get(paper.doi.value.lower()) is paper
+
+    def add(self, paper: Paper, under: Paper | None = None) -> None:
+        """Index a distinct paper, or a record merged into an indexed paper.
+
+        Args:
+            paper: Record whose keys and title are indexed.
+            under: Indexed paper the record was merged into (default: the
+                record itself).
+        """
+        target = paper if under is None else under
+        title = normalize_title(paper.title)
+        tokens = self.deduplicator.title_tokens(title)
+        for key in self.deduplicator.exact_keys(paper, title, tokens):
+            self._exact.setdefault(key, target)
+        for band_key in self.deduplicator.band_keys(tokens, self._token_hashes):
+            self._buckets[band_key].append((target, tokens))
+
+    def find(self, paper: Paper) -> Paper | None:
+        """Find the indexed paper that a record duplicates.
+
+        Args:
+            paper: Record to match.
+
+        Returns:
+            The first indexed paper the record duplicates, or None.
+        """
+        deduplicator = self.deduplicator
+        title = normalize_title(paper.title)
+        tokens = deduplicator.title_tokens(title)
+        for key in deduplicator.exact_keys(paper, title, tokens):
+            match = self._exact.get(key)
+            if match is not None and match is not paper:
+                if deduplicator.dois_compatible(match, paper):
+                    return match
+
+        for band_key in deduplicator.band_keys(tokens, self._token_hashes):
+            members = self._buckets.get(band_key, ())
+            if len(members) > deduplicator.max_bucket_size:
+                continue
+            for candidate, candidate_tokens in members:
+                if candidate is not paper and deduplicator.is_match(
+                    candidate, paper, candidate_tokens, tokens
+                ):
+                    return candidate
+        return None
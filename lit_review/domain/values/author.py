@@ -6,6 +6,7 @@ Represents an author with name components and optional ORCID identifier.
 """
 
 import re
+import sys
 from dataclasses import dataclass
 
 from lit_review.domain.exceptions import ValidationError
@@ -14,12 +15,14 @@ from lit_review.domain.exceptions import ValidationError
 ORCID_PATTERN = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Author:
     """Immutable author value object.
 
     Represents an author with structured name components for proper citation
-    formatting and an optional ORCID identifier for disambiguation.
+    formatting and an optional ORCID identifier for disambiguation. Name
+    components are interned, so an author appearing on many papers shares
+    one copy of each string.
 
     Attributes:
         last_name: Author's family name (required).
@@ -45,7 +48,44 @@ class Author:
     orcid: str | None = None
 
     def __post_init__(self) -> None:
-        """Validate author fields on creation."""
+        """Validate and intern author fields on creation."""
+        self.validate()
+        object.__setattr__(self, "last_name", sys.intern(self.last_name))
+        object.__setattr__(self, "first_name", sys.intern(self.first_name))
+        object.__setattr__(self, "initials", sys.intern(self.initials))
+
+    @classmethod
+    def trusted(
+        cls, last_name: str, first_name: str, initials: str, orcid: str | None = None
+    ) -> "Author":
+        """Create an author without validating it.
+
+        For values that were validated when first stored, such as authors
+        loaded from a saved review. Name components are still interned.
+        Call validate() to check them later.
+
+        Args:
+            last_name: Author's family name.
+            first_name: Author's given name.
+            initials: Author's initials.
+            orcid: Optional ORCID identifier.
+
+        Returns:
+            Author value object.
+        """
+        author = object.__new__(cls)
+        object.__setattr__(author, "last_name", sys.intern(last_name))
+        object.__setattr__(author, "first_name", sys.intern(first_name))
+        object.__setattr__(author, "initials", sys.intern(initials))
+        object.__setattr__(author, "orcid", orcid)
+        return author
+
+    def validate(self) -> None:
+        """Check the required name components and ORCID format.
+
+        Raises:
+            ValidationError: If a name component is empty or the ORCID is invalid.
+        """
         if not self.last_name or not self.last_name.strip():
             raise ValidationError("Author last_name cannot be empty")
 
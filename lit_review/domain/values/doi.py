@@ -16,7 +16,7 @@ from lit_review.domain.exceptions import ValidationError
 DOI_PATTERN = re.compile(r"^10\.\d{4,}/[-._;()/:\w]+$")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DOI:
     """Immutable DOI value object with format validation.
 
@@ -42,6 +42,31 @@ class DOI:
 
     def __post_init__(self) -> None:
         """Validate DOI format on creation."""
+        self.validate()
+
+    @classmethod
+    def trusted(cls, value: str) -> "DOI":
+        """Create a DOI without validating it.
+
+        For values that were validated when first stored, such as DOIs
+        loaded from a saved review. Call validate() to check them later.
+
+        Args:
+            value: Previously validated DOI string.
+
+        Returns:
+            DOI value object.
+        """
+        doi = object.__new__(cls)
+        object.__setattr__(doi, "value", value)
+        return doi
+
+    def validate(self) -> None:
+        """Check the DOI format.
+
+        Raises:
+            ValidationError: If the DOI format is invalid.
+        """
         if not self.value:
             raise ValidationError("DOI cannot be empty")
 
@@ -6,22 +6,38 @@ Implements the SearchService port for ArXiv with rate limiting
 and ATOM feed parsing.
 """
 
+import asyncio
 import time
+from datetime import date
 from xml.etree import ElementTree
 
 import httpx
 
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.search_events import SearchEventKind
 from lit_review.application.ports.search_service import SearchService
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
-
-
-class ArxivAdapter(SearchService):
+from lit_review.infrastructure.adapters.http_client import (
+    PooledAsyncHTTPClientMixin,
+    PooledHTTPClientMixin,
+    backoff_delay,
+    backoff_delay_async,
+)
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    default_rate_limiter,
+)
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
+
+
+class ArxivAdapter(PooledHTTPClientMixin, SearchService):
     """ArXiv API adapter with rate limiting.
 
     Implements rate-limited ArXiv searches using the ArXiv API v2.
     Respects ArXiv rate limits: 1 request per 3 seconds.
+    Requests share one pooled HTTP client for the lifetime of the adapter.
 
     Attributes:
         base_url: ArXiv API base URL.
@@ -35,13 +51,23 @@ class ArxivAdapter(SearchService):
     """
 
     BASE_URL = "https://export.arxiv.org/api/query"
-    NAMESPACE = {"atom": "http://www.w3.org/2005/Atom"}
+    NAMESPACE = {
+        "atom": "http://www.w3.org/2005/Atom",
+        "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
+    }
+    RESULT_CAP = 100  # One request per query, at most 100 results
 
     def __init__(
         self,
         timeout: int = 30,
         max_retries: int = 3,
         rate_limit: float = 3.0,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        burst: int = 1,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize ArXiv adapter.
 
@@ -49,18 +75,27 @@ class ArxivAdapter(SearchService):
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts.
             rate_limit: Minimum seconds between requests (default 3.0).
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            burst: Requests allowed back-to-back before spacing applies.
+            rate_limiter: Shared limiter (e.g. from shared_rate_limiter) to
+                use instead of the default built from rate_limit and burst.
+            cache: Optional on-disk response cache; fresh hits skip the
+                network and the rate limiter.
         """
-        self.timeout = timeout
+        self._init_http_client(timeout, http2, max_connections, max_keepalive_connections, cache)
         self.max_retries = max_retries
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
+        self.rate_limiter = rate_limiter or default_rate_limiter(
+            "arxiv", rate_limit, capacity=burst
+        )
 
     def _rate_limit_sleep(self) -> None:
-        """Sleep to respect rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        """Block until the rate limiter grants a request token."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
 
     def search(self, query: str, limit: int = 100) -> list[Paper]:
         """Search ArXiv for papers matching query.
@@ -76,35 +111,161 @@ class ArxivAdapter(SearchService):
             ConnectionError: If unable to connect to ArXiv.
             TimeoutError: If request times out.
         """
-        params = {
-            "search_query": query,
-            "start": 0,
-            "max_results": min(limit, 100),  # ArXiv recommends max 100
-            "sortBy": "relevance",
-            "sortOrder": "descending",
-        }
+        return self._fetch(self._build_params(query, limit))
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search ArXiv for papers submitted on or after a date.
+
+        Restricts the query to a ``submittedDate`` range ending today and
+        sorts by submission date, so the newest preprints come first.
+
+        Args:
+            query: Search query string (ArXiv query syntax).
+            since: Earliest submission date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, limit)
+        params["search_query"] = self._submitted_query(query, since, date.today())
+        params["sortBy"] = "submittedDate"
+        return self._fetch(params)
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search ArXiv for papers submitted within a date range.
+
+        ArXiv has no publication date, so the first submission date is used.
+
+        Args:
+            query: Search query string (ArXiv query syntax).
+            start: First submission date (inclusive).
+            end: Last submission date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, limit)
+        params["search_query"] = self._submitted_query(query, start, end)
+        return self._fetch(params)
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count papers submitted within a date range (``max_results=0``).
 
+        Args:
+            query: Search query string (ArXiv query syntax).
+            start: First submission date (inclusive).
+            end: Last submission date (inclusive).
+
+        Returns:
+            The feed's ``opensearch:totalResults``, or None if missing.
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, 0)
+        params["search_query"] = self._submitted_query(query, start, end)
+        content = self._request(params)
+        if content is None:
+            return None
+        total = ElementTree.fromstring(content).find("opensearch:totalResults", self.NAMESPACE)
+        if total is None or not (total.text or "").strip().isdigit():
+            return None
+        return int((total.text or "").strip())
+
+    def _submitted_query(self, query: str, start: date, end: date) -> str:
+        """Restrict a query to a ``submittedDate`` range.
+
+        Args:
+            query: Search query string (ArXiv query syntax).
+            start: First submission date (inclusive).
+            end: Last submission date (inclusive).
+
+        Returns:
+            The combined ``search_query`` value.
+        """
+        return f"({query}) AND submittedDate:[{start:%Y%m%d}0000 TO {end:%Y%m%d}2359]"
+
+    def _fetch(self, params: dict[str, str | int]) -> list[Paper]:
+        """Run one ArXiv API query and parse the Atom feed.
+
+        Args:
+            params: Query parameters from _build_params.
+
+        Returns:
+            List of Paper entities from the response.
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
+        content = self._request(params)
+        return self._parse_atom(content) if content is not None else []
+
+    def _request(self, params: dict[str, str | int]) -> bytes | None:
+        """Send one ArXiv API request with rate limiting and exponential backoff.
+
+        Args:
+            params: Query parameters.
+
+        Returns:
+            Raw Atom feed (None if no attempt was made).
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
         # Retry with exponential backoff
         for attempt in range(self.max_retries):
             try:
-                self._rate_limit_sleep()
+                if not self._cache_fresh(self.BASE_URL, params):
+                    self._rate_limit_sleep()
 
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.get(self.BASE_URL, params=params)
-                    response.raise_for_status()
+                response = self._send(self.BASE_URL, attempt, params=params)
+                response.raise_for_status()
 
-                return self._parse_atom(response.content)
+                return response.content
 
-            except httpx.TimeoutException:
+            except httpx.TimeoutException as e:
                 if attempt == self.max_retries - 1:
                     raise TimeoutError(f"ArXiv request timed out after {self.max_retries} attempts")
-                time.sleep(2**attempt)
+                time.sleep(self._report_retry(e, attempt, 2**attempt))
             except httpx.HTTPError as e:
                 if attempt == self.max_retries - 1:
                     raise ConnectionError(f"ArXiv request failed: {e}") from e
-                time.sleep(2**attempt)
+                time.sleep(
+                    self._report_retry(e, attempt, backoff_delay(e, attempt, self.rate_limiter))
+                )
 
-        return []
+        return None
+
+    def _build_params(self, query: str, limit: int) -> dict[str, str | int]:
+        """Build ArXiv query parameters.
+
+        Args:
+            query: Search query string (ArXiv query syntax).
+            limit: Maximum number of results.
+
+        Returns:
+            Query parameters for the ArXiv API.
+        """
+        return {
+            "search_query": query,
+            "start": 0,
+            "max_results": min(limit, 100),  # ArXiv recommends max 100
+            "sortBy": "relevance",
+            "sortOrder": "descending",
+        }
 
     def _parse_atom(self, atom_data: bytes) -> list[Paper]:
         """Parse ArXiv ATOM feed to Paper entities.
@@ -115,10 +276,12 @@ class ArxivAdapter(SearchService):
         Returns:
             List of Paper entities.
         """
+        started = time.perf_counter()
         papers: list[Paper] = []
         root = ElementTree.fromstring(atom_data)
+        entries = root.findall("atom:entry", self.NAMESPACE)
 
-        for entry in root.findall("atom:entry", self.NAMESPACE):
+        for entry in entries:
             try:
                 paper = self._entry_to_paper(entry)
                 if paper:
@@ -127,6 +290,12 @@ class ArxivAdapter(SearchService):
                 # Skip malformed entries
                 continue
 
+        self._emit(
+            SearchEventKind.PARSE,
+            seconds=time.perf_counter() - started,
+            produced=len(papers),
+            dropped=len(entries) - len(papers),
+        )
         return papers
 
     def _entry_to_paper(self, entry: ElementTree.Element) -> Paper | None:
@@ -332,3 +501,98 @@ class ArxivAdapter(SearchService):
     def get_service_name(self) -> str:
         """Return service name."""
         return "ArXiv"
+
+
+class AsyncArxivAdapter(PooledAsyncHTTPClientMixin, AsyncSearchService):
+    """Asyncio-native ArXiv adapter using a pooled httpx.AsyncClient.
+
+    Shares request building and ATOM parsing with ArxivAdapter. Concurrent
+    searches are spaced by awaiting rate-limiter tokens instead of sleeping threads.
+
+    Attributes:
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts.
+        rate_limit: Minimum seconds between requests.
+
+    Example:
+        >>> async with AsyncArxivAdapter() as adapter:
+        ...     papers = await adapter.search("machine learning", limit=10)
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        rate_limit: float = 3.0,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize async ArXiv adapter.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_retries: Maximum retry attempts.
+            rate_limit: Minimum seconds between requests (default 3.0).
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            rate_limiter: Shared limiter to use instead of the default.
+            cache: Optional on-disk response cache.
+        """
+        self._parser = ArxivAdapter(
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+            rate_limiter=rate_limiter,
+        )
+        self._init_async_http_client(
+            timeout,
+            http2,
+            max_connections,
+            max_keepalive_connections,
+            rate_limit,
+            self._parser.rate_limiter,
+            cache,
+        )
+        self.max_retries = max_retries
+
+    async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search ArXiv for papers matching query without blocking.
+
+        Args:
+            query: Search query string (ArXiv query syntax).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to ArXiv.
+            TimeoutError: If request times out.
+        """
+        params = self._parser._build_params(query, limit)
+
+        for attempt in range(self.max_retries):
+            try:
+                if not self._cache_fresh(ArxivAdapter.BASE_URL, params):
+                    await self._rate_limit_wait()
+                response = await self._get_async_client().get(ArxivAdapter.BASE_URL, params=params)
+                response.raise_for_status()
+                return self._parser._parse_atom(response.content)
+            except httpx.TimeoutException:
+                if attempt == self.max_retries - 1:
+                    raise TimeoutError(f"ArXiv request timed out after {self.max_retries} attempts")
+                await asyncio.sleep(2**attempt)
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise ConnectionError(f"ArXiv request failed: {e}") from e
+                await asyncio.sleep(await backoff_delay_async(e, attempt, self.rate_limiter))
+
+        return []
+
+    def get_service_name(self) -> str:
+        """Return service name."""
+        return "ArXiv"
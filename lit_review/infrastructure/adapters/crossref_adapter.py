@@ -3,43 +3,190 @@
 """Crossref API adapter for searching academic papers.
 
 Implements the SearchService port for the Crossref API with
-rate limiting and response parsing.
+rate limiting, cursor-based deep paging, and response parsing.
 """
 
+import asyncio
 import os
-from time import sleep
+from collections.abc import Iterator
+from datetime import date
+from time import perf_counter, sleep
 
 import httpx
 
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.search_events import SearchEventHook, SearchEventKind
 from lit_review.application.ports.search_service import SearchService
 from lit_review.domain.entities.paper import Paper
+from lit_review.domain.services.deduplication import is_synthetic_doi
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.http_client import (
+    PooledAsyncHTTPClientMixin,
+    PooledHTTPClientMixin,
+    backoff_delay,
+    backoff_delay_async,
+)
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_fingerprint,
+    default_rate_limiter,
+)
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
+
+
+class CrossrefItemParserMixin:
+    """Mixin converting Crossref work items into Paper entities.
+
+    Shared by CrossrefAdapter (API responses) and the bulk ingester
+    (snapshot dump files).
+    """
+
+    def _item_to_paper(self, item: dict[str, object]) -> Paper | None:
+        """Convert Crossref item to Paper entity.
+
+        Args:
+            item: Single Crossref result item.
+
+        Returns:
+            Paper entity or None if required fields missing.
+        """
+        # Required fields
+        doi_value = item.get("DOI")
+        title_list = item.get("title", [])
+        if not doi_value or not title_list:
+            return None
+
+        title = title_list[0] if title_list else ""
+
+        # Authors
+        authors = self._parse_authors(item.get("author", []))
+        if not authors:
+            # Create placeholder author if none found
+            authors = [Author("Unknown", "Author", "U.")]
+
+        # Publication year
+        published = item.get("published", {})
+        date_parts = published.get("date-parts", [[]])
+        year = date_parts[0][0] if date_parts and date_parts[0] else 2024
+
+        # Journal
+        container = item.get("container-title", [])
+        journal = container[0] if container else "Unknown Journal"
+
+        # Optional: abstract
+        abstract = item.get("abstract", "")
+        # Clean HTML from abstract
+        if abstract:
+            abstract = self._clean_html(abstract)
+
+        try:
+            return Paper(
+                doi=DOI(doi_value),
+                title=title,
+                authors=authors,
+                publication_year=year,
+                journal=journal,
+                abstract=abstract,
+            )
+        except Exception:
+            return None
+
+    def _parse_authors(self, author_list: list[dict[str, object]]) -> list[Author]:
+        """Parse Crossref author list to Author value objects.
+
+        Args:
+            author_list: List of author dicts from Crossref.
+
+        Returns:
+            List of Author value objects.
+        """
+        authors: list[Author] = []
+
+        for author_data in author_list:
+            family = author_data.get("family", "")
+            given = author_data.get("given", "")
+
+            if not family:
+                continue
+
+            # Generate initials from given name
+            initials = ""
+            if given:
+                parts = given.split()
+                initials = ".".join(p[0].upper() for p in parts if p) + "."
+
+            try:
+                authors.append(
+                    Author(
+                        last_name=family,
+                        first_name=given or "Unknown",
+                        initials=initials or "U.",
+                        orcid=author_data.get("ORCID"),
+                    )
+                )
+            except Exception:
+                continue
+
+        return authors
+
+    def _clean_html(self, text: str) -> str:
+        """Remove HTML tags from text.
+
+        Args:
+            text: Text potentially containing HTML.
+
+        Returns:
+            Clean text without HTML tags.
+        """
+        import re
+
+        clean = re.sub(r"<[^>]+>", "", text)
+        return clean.strip()
 
 
-class CrossrefAdapter(SearchService):
+class CrossrefAdapter(CrossrefItemParserMixin, PooledHTTPClientMixin, SearchService):
     """Crossref API adapter with rate limiting.
 
     Searches the Crossref API for academic papers and converts
-    results to Paper entities.
+    results to Paper entities. A single pooled HTTP client is reused
+    across requests; use the adapter as a context manager or call
+    close() to release connections.
 
     Attributes:
         base_url: Crossref API base URL.
         timeout: Request timeout in seconds.
         max_retries: Maximum retry attempts on failure.
+        page_size: Rows requested per cursor page (max 1000).
+        rate_limit: Minimum seconds between requests.
+        rate_limiter: Token bucket consulted before every request.
 
     Example:
-        >>> adapter = CrossrefAdapter()
-        >>> papers = adapter.search("machine learning healthcare", limit=10)
+        >>> with CrossrefAdapter() as adapter:
+        ...     papers = adapter.search("machine learning healthcare", limit=10)
+        ...     for paper in adapter.iter_search("sepsis prediction", limit=50_000):
+        ...         process(paper)
     """
 
     BASE_URL = "https://api.crossref.org/works"
+    MAX_ROWS = 1000  # Crossref maximum rows per request
+    FULL_SELECT = "DOI,title,author,published,container-title,abstract"
+    STUB_SELECT = "DOI,title,author,published,container-title"
+    HYDRATE_BATCH = 50  # DOIs per filter request, keeps URLs short
 
     def __init__(
         self,
         timeout: int = 30,
         max_retries: int = 3,
         email: str | None = None,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        page_size: int = MAX_ROWS,
+        rate_limit: float = 0.02,
+        burst: int = 1,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize Crossref adapter.
 
@@ -47,58 +194,329 @@ class CrossrefAdapter(SearchService):
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts.
             email: Email for polite API access (recommended).
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            page_size: Rows requested per cursor page (capped at 1000).
+            rate_limit: Minimum seconds between requests (default 0.02,
+                the polite pool's 50 requests/second).
+            burst: Requests allowed back-to-back before spacing applies.
+            rate_limiter: Shared limiter (e.g. from shared_rate_limiter) to
+                use instead of the default built from rate_limit and burst.
+            cache: Optional on-disk response cache; fresh hits skip the
+                network and the rate limiter.
         """
-        self.timeout = timeout
+        self._init_http_client(timeout, http2, max_connections, max_keepalive_connections, cache)
         self.max_retries = max_retries
         self.email = email or os.environ.get("CROSSREF_EMAIL")
+        self.page_size = max(1, min(page_size, self.MAX_ROWS))
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or default_rate_limiter(
+            f"crossref:{credential_fingerprint(self.email)}", rate_limit, capacity=burst
+        )
 
     def search(self, query: str, limit: int = 100) -> list[Paper]:
         """Search Crossref for papers matching query.
 
+        Pages through results with Crossref's cursor protocol until
+        ``limit`` papers have been collected or results are exhausted.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        return list(self.iter_search(query, limit=limit))
+
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        """Lazily yield papers matching query, one cursor page at a time.
+
+        Uses Crossref deep paging (``cursor=*`` followed by each response's
+        ``next-cursor``) with up to ``page_size`` rows per request, so memory
+        stays bounded to a single page regardless of result set size. Every
+        page request is rate limited and retried independently.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of papers to yield.
+
+        Yields:
+            Paper entities in relevance order.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        yield from self._iter_works(self._build_params(query, limit), limit)
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search Crossref for papers indexed on or after a date.
+
+        Adds a ``from-index-date`` filter, so only works deposited or
+        updated since the last run are returned.
+
         Args:
             query: Search query string.
+            since: Earliest index date (inclusive).
             limit: Maximum number of results.
 
         Returns:
             List of Paper entities from search results.
 
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query, limit)
+        params["filter"] = f"from-index-date:{since.isoformat()}"
+        return list(self._iter_works(params, limit))
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search Crossref for papers published within a date range.
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query, limit)
+        params["filter"] = self._pub_date_filter(start, end)
+        return list(self._iter_works(params, limit))
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count papers published within a date range (``rows=0``).
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            Crossref's ``total-results`` for the filtered query.
+
         Raises:
             ConnectionError: If unable to connect after retries.
             TimeoutError: If all requests timeout.
         """
         params: dict[str, str | int] = {
             "query": query,
-            "rows": min(limit, 100),  # Crossref max is 100 per request
-            "select": "DOI,title,author,published,container-title,abstract",
+            "rows": 0,
+            "filter": self._pub_date_filter(start, end),
         }
+        message = self._fetch_page(params, self._build_headers()).get("message", {})
+        total = message.get("total-results") if isinstance(message, dict) else None
+        return total if isinstance(total, int) else None
 
-        headers = {"Accept": "application/json"}
-        if self.email:
-            headers["User-Agent"] = f"LitReview/1.0 (mailto:{self.email})"
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search Crossref for paper stubs without abstracts.
+
+        Selects only DOI, title, author, published and container-title,
+        which keeps pages small for broad queries.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities without abstracts.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query, limit)
+        params["select"] = self.STUB_SELECT
+        return list(self._iter_works(params, limit))
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        """Fetch missing abstracts and authors, up to HYDRATE_BATCH DOIs per request.
+
+        Papers with synthetic DOIs (not registered with Crossref) are skipped.
+        Keywords and citation counts are left alone: Crossref search results
+        carry neither, unlike Semantic Scholar's.
+
+        Args:
+            papers: Papers to complete.
+
+        Returns:
+            The papers that received an abstract or authors.
 
-        # Retry with exponential backoff
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        by_doi = {
+            paper.doi.value.casefold(): paper
+            for paper in papers
+            if not is_synthetic_doi(paper.doi.value)
+        }
+        dois = list(by_doi)
+        headers = self._build_headers()
+        hydrated: list[Paper] = []
+
+        for start in range(0, len(dois), self.HYDRATE_BATCH):
+            batch = dois[start : start + self.HYDRATE_BATCH]
+            params: dict[str, str | int] = {
+                "filter": ",".join(f"doi:{doi}" for doi in batch),
+                "rows": len(batch),
+                "select": "DOI,abstract,author",
+            }
+            data = self._fetch_page(params, headers)
+            for item in data.get("message", {}).get("items", []):
+                paper = by_doi.pop(str(item.get("DOI", "")).casefold(), None)
+                if paper is not None and self._fill_missing(paper, item):
+                    hydrated.append(paper)
+
+        return hydrated
+
+    def _fill_missing(self, paper: Paper, item: dict[str, object]) -> bool:
+        """Copy abstract and authors from a Crossref item where the paper lacks them.
+
+        Args:
+            paper: Paper to update in place.
+            item: Crossref item for the same DOI.
+
+        Returns:
+            True if any field was filled.
+        """
+        filled = False
+        abstract = item.get("abstract")
+        if abstract and not paper.abstract:
+            paper.abstract = self._clean_html(abstract)
+            filled = True
+        if paper.has_placeholder_authors():
+            authors = self._parse_authors(item.get("author", []))
+            if authors:
+                paper.authors = authors
+                filled = True
+        return filled
+
+    def _iter_works(self, params: dict[str, str | int], limit: int) -> Iterator[Paper]:
+        """Yield papers for a works query, following the deep-paging cursor.
+
+        Args:
+            params: First-page query parameters from _build_params.
+            limit: Maximum number of papers to yield.
+
+        Yields:
+            Paper entities in relevance order.
+        """
+        headers = self._build_headers()
+        params["cursor"] = "*"
+        yielded = 0
+
+        while yielded < limit:
+            rows = min(limit - yielded, self.page_size)
+            params["rows"] = rows
+            data = self._fetch_page(params, headers)
+
+            message = data.get("message", {})
+            items = message.get("items", [])
+            for paper in self._parse_response(data):
+                yield paper
+                yielded += 1
+                if yielded >= limit:
+                    return
+
+            next_cursor = message.get("next-cursor")
+            if not items or len(items) < rows or not next_cursor:
+                return
+            params["cursor"] = next_cursor
+
+    def _fetch_page(
+        self, params: dict[str, str | int], headers: dict[str, str]
+    ) -> dict[str, object]:
+        """Fetch one page of results with rate limiting and exponential backoff.
+
+        Args:
+            params: Query parameters for the works endpoint.
+            headers: HTTP headers.
+
+        Returns:
+            Decoded JSON response.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.get(
-                        self.BASE_URL,
-                        params=params,
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    return self._parse_response(response.json())
-            except httpx.TimeoutException:
+                if not self._cache_fresh(self.BASE_URL, params):
+                    self._rate_limit_sleep()
+                response = self._send(self.BASE_URL, attempt, params=params, headers=headers)
+                response.raise_for_status()
+                return response.json()
+            except httpx.TimeoutException as e:
                 if attempt == self.max_retries - 1:
                     raise TimeoutError(
                         f"Crossref request timed out after {self.max_retries} attempts"
                     )
-                sleep(2**attempt)
+                sleep(self._report_retry(e, attempt, 2**attempt))
             except httpx.HTTPError as e:
                 if attempt == self.max_retries - 1:
                     raise ConnectionError(f"Crossref request failed: {e}") from e
-                sleep(2**attempt)
+                sleep(self._report_retry(e, attempt, backoff_delay(e, attempt, self.rate_limiter)))
+
+        return {}
+
+    def _rate_limit_sleep(self) -> None:
+        """Block until the rate limiter grants a request token."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
+
+    def _build_params(self, query: str, limit: int) -> dict[str, str | int]:
+        """Build Crossref query parameters for the first page.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            Query parameters for the works endpoint.
+        """
+        return {
+            "query": query,
+            "rows": min(limit, self.page_size),
+            "select": self.FULL_SELECT,
+        }
 
-        return []
+    def _pub_date_filter(self, start: date, end: date) -> str:
+        """Build a publication date range filter.
+
+        Args:
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            Value for the works endpoint's ``filter`` parameter.
+        """
+        return f"from-pub-date:{start.isoformat()},until-pub-date:{end.isoformat()}"
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers, identifying the polite pool when an email is set.
+
+        Returns:
+            HTTP headers for Crossref requests.
+        """
+        headers = {"Accept": "application/json"}
+        if self.email:
+            headers["User-Agent"] = f"LitReview/1.0 (mailto:{self.email})"
+        return headers
 
     def _parse_response(self, data: dict[str, object]) -> list[Paper]:
         """Parse Crossref API response to Paper entities.
@@ -109,6 +527,7 @@ class CrossrefAdapter(SearchService):
         Returns:
             List of Paper entities.
         """
+        started = perf_counter()
         papers: list[Paper] = []
         items = data.get("message", {}).get("items", [])
 
@@ -121,109 +540,200 @@ class CrossrefAdapter(SearchService):
                 # Skip malformed entries
                 continue
 
+        self._emit(
+            SearchEventKind.PARSE,
+            seconds=perf_counter() - started,
+            produced=len(papers),
+            dropped=len(items) - len(papers),
+        )
         return papers
 
-    def _item_to_paper(self, item: dict[str, object]) -> Paper | None:
-        """Convert Crossref item to Paper entity.
+    def get_service_name(self) -> str:
+        """Return service name."""
+        return "Crossref"
 
-        Args:
-            item: Single Crossref result item.
 
-        Returns:
-            Paper entity or None if required fields missing.
-        """
-        # Required fields
-        doi_value = item.get("DOI")
-        title_list = item.get("title", [])
-        if not doi_value or not title_list:
-            return None
+class AsyncCrossrefAdapter(PooledAsyncHTTPClientMixin, AsyncSearchService):
+    """Asyncio-native Crossref adapter using a pooled httpx.AsyncClient.
 
-        title = title_list[0] if title_list else ""
+    Shares request building and response parsing with CrossrefAdapter, so
+    results are identical to the blocking adapter.
 
-        # Authors
-        authors = self._parse_authors(item.get("author", []))
-        if not authors:
-            # Create placeholder author if none found
-            authors = [Author("Unknown", "Author", "U.")]
+    Attributes:
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts on failure.
+        email: Email for polite API access.
+        page_size: Rows requested per cursor page (max 1000).
 
-        # Publication year
-        published = item.get("published", {})
-        date_parts = published.get("date-parts", [[]])
-        year = date_parts[0][0] if date_parts and date_parts[0] else 2024
+    Example:
+        >>> async with AsyncCrossrefAdapter() as adapter:
+        ...     papers = await adapter.search("machine learning healthcare", limit=10)
+    """
 
-        # Journal
-        container = item.get("container-title", [])
-        journal = container[0] if container else "Unknown Journal"
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        email: str | None = None,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        page_size: int = CrossrefAdapter.MAX_ROWS,
+        rate_limit: float = 0.02,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize async Crossref adapter.
 
-        # Optional: abstract
-        abstract = item.get("abstract", "")
-        # Clean HTML from abstract
-        if abstract:
-            abstract = self._clean_html(abstract)
+        Args:
+            timeout: Request timeout in seconds.
+            max_retries: Maximum retry attempts.
+            email: Email for polite API access (recommended).
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            page_size: Rows requested per cursor page (capped at 1000).
+            rate_limit: Minimum seconds between requests (default 0.02).
+            rate_limiter: Shared limiter to use instead of the default.
+            cache: Optional on-disk response cache.
+        """
+        self._parser = CrossrefAdapter(
+            timeout=timeout,
+            max_retries=max_retries,
+            email=email,
+            page_size=page_size,
+            rate_limit=rate_limit,
+            rate_limiter=rate_limiter,
+        )
+        self._init_async_http_client(
+            timeout,
+            http2,
+            max_connections,
+            max_keepalive_connections,
+            rate_limit,
+            self._parser.rate_limiter,
+            cache,
+        )
+        self.max_retries = max_retries
+        self.email = self._parser.email
+        self.page_size = self._parser.page_size
 
-        try:
-            return Paper(
-                doi=DOI(doi_value),
-                title=title,
-                authors=authors,
-                publication_year=year,
-                journal=journal,
-                abstract=abstract,
-            )
-        except Exception:
-            return None
+    async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search Crossref for papers matching query without blocking.
 
-    def _parse_authors(self, author_list: list[dict[str, object]]) -> list[Author]:
-        """Parse Crossref author list to Author value objects.
+        Pages through results with Crossref's cursor protocol, like
+        CrossrefAdapter.search, until ``limit`` papers have been collected
+        or results are exhausted.
 
         Args:
-            author_list: List of author dicts from Crossref.
+            query: Search query string.
+            limit: Maximum number of results.
 
         Returns:
-            List of Author value objects.
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
         """
-        authors: list[Author] = []
+        params = self._parser._build_params(query, limit)
+        headers = self._parser._build_headers()
+        params["cursor"] = "*"
+        papers: list[Paper] = []
 
-        for author_data in author_list:
-            family = author_data.get("family", "")
-            given = author_data.get("given", "")
+        while len(papers) < limit:
+            rows = min(limit - len(papers), self.page_size)
+            params["rows"] = rows
+            data = await self._fetch_page(params, headers)
 
-            if not family:
-                continue
+            message = data.get("message", {})
+            items = message.get("items", [])
+            papers.extend(self._parser._parse_response(data)[: limit - len(papers)])
 
-            # Generate initials from given name
-            initials = ""
-            if given:
-                parts = given.split()
-                initials = ".".join(p[0].upper() for p in parts if p) + "."
+            next_cursor = message.get("next-cursor")
+            if not items or len(items) < rows or not next_cursor:
+                break
+            params["cursor"] = next_cursor
 
-            try:
-                authors.append(
-                    Author(
-                        last_name=family,
-                        first_name=given or "Unknown",
-                        initials=initials or "U.",
-                        orcid=author_data.get("ORCID"),
-                    )
-                )
-            except Exception:
-                continue
+        return papers
 
-        return authors
+    def set_event_hook(self, hook: SearchEventHook | None) -> None:
+        """Attach an instrumentation hook (or detach it with None).
 
-    def _clean_html(self, text: str) -> str:
-        """Remove HTML tags from text.
+        Args:
+            hook: Callable receiving every SearchEvent this adapter emits.
+        """
+        self._parser.set_event_hook(hook)
+
+    async def _fetch_page(
+        self, params: dict[str, str | int], headers: dict[str, str]
+    ) -> dict[str, object]:
+        """Fetch one page of results with rate limiting and exponential backoff.
+
+        Reports requests and retries through the parser's event hook, like
+        CrossrefAdapter._fetch_page.
 
         Args:
-            text: Text potentially containing HTML.
+            params: Query parameters for the works endpoint.
+            headers: HTTP headers.
 
         Returns:
-            Clean text without HTML tags.
+            Decoded JSON response.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
         """
-        import re
+        url = CrossrefAdapter.BASE_URL
+        emit = self._parser._emit
+        for attempt in range(self.max_retries):
+            try:
+                if not self._cache_fresh(url, params):
+                    await self._rate_limit_wait()
+                emit(SearchEventKind.REQUEST_START, url=url, attempt=attempt)
+                started = perf_counter()
+                try:
+                    response = await self._get_async_client().get(
+                        url, params=params, headers=headers
+                    )
+                except httpx.HTTPError as e:
+                    emit(
+                        SearchEventKind.REQUEST_END,
+                        url=url,
+                        seconds=perf_counter() - started,
+                        attempt=attempt,
+                        error=str(e) or type(e).__name__,
+                    )
+                    raise
+                emit(
+                    SearchEventKind.REQUEST_END,
+                    url=url,
+                    seconds=perf_counter() - started,
+                    bytes_received=len(response.content),
+                    status_code=response.status_code,
+                    attempt=attempt,
+                )
+                response.raise_for_status()
+                return response.json()
+            except httpx.TimeoutException as e:
+                if attempt == self.max_retries - 1:
+                    raise TimeoutError(
+                        f"Crossref request timed out after {self.max_retries} attempts"
+                    )
+                await asyncio.sleep(self._parser._report_retry(e, attempt, 2**attempt))
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise ConnectionError(f"Crossref request failed: {e}") from e
+                delay = await backoff_delay_async(e, attempt, self.rate_limiter)
+                await asyncio.sleep(self._parser._report_retry(e, attempt, delay))
 
-        clean = re.sub(r"<[^>]+>", "", text)
-        return clean.strip()
+        return {}
+
+    async def _rate_limit_wait(self) -> None:
+        """Await a rate limiter token, reporting any wait like the blocking adapter."""
+        waited = await self.rate_limiter.acquire_async()
+        if waited:
+            self._parser._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
 
     def get_service_name(self) -> str:
         """Return service name."""
@@ -0,0 +1,429 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Pooled HTTP client support for httpx-based search adapters.
+
+Provides mixins that give each adapter a single long-lived httpx.Client
+(or httpx.AsyncClient) with keep-alive connection pooling, optional HTTP/2,
+and context manager support for clean shutdown.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, Self
+
+import httpx
+
+from lit_review.application.ports.search_events import SearchEventKind
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
+from lit_review.infrastructure.adapters.response_cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    ResponseCache,
+)
+
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed.
+
+    Returns:
+        True if HTTP/2 can be enabled on httpx clients.
+    """
+    try:
+        import h2  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def backoff_delay(
+    error: httpx.HTTPError, attempt: int, rate_limiter: TokenBucketRateLimiter
+) -> float:
+    """Return how long to sleep before retrying a failed request.
+
+    A 429/503 response carrying Retry-After pauses the shared rate limiter
+    for the advertised period (so every caller sharing the budget backs off)
+    and no extra sleep is needed: the next acquire() waits it out. Other
+    failures use exponential backoff.
+
+    Args:
+        error: The failed request's exception.
+        attempt: Zero-based attempt number.
+        rate_limiter: Limiter guarding the failed endpoint.
+
+    Returns:
+        Seconds to sleep before the next attempt.
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        rate_limiter.penalize(retry_after)
+        return 0.0
+    return float(2**attempt)
+
+
+async def backoff_delay_async(
+    error: httpx.HTTPError, attempt: int, rate_limiter: TokenBucketRateLimiter
+) -> float:
+    """Return how long to sleep before retrying, without blocking the event loop.
+
+    Same as backoff_delay, for asyncio adapters: pausing a file-backed
+    limiter waits for its file lock on a worker thread.
+
+    Args:
+        error: The failed request's exception.
+        attempt: Zero-based attempt number.
+        rate_limiter: Limiter guarding the failed endpoint.
+
+    Returns:
+        Seconds to sleep before the next attempt.
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        await rate_limiter.penalize_async(retry_after)
+        return 0.0
+    return float(2**attempt)
+
+
+def _retry_after(error: httpx.HTTPError) -> float | None:
+    """Seconds advertised by the Retry-After header of a 429/503 response, if any."""
+    if (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in RETRY_AFTER_STATUS_CODES
+    ):
+        return parse_retry_after(error.response.headers.get("Retry-After"))
+    return None
+
+
+class PooledHTTPClientMixin:
+    """Mixin providing a lazily created, reusable httpx.Client.
+
+    The client is created on first use and reused for the lifetime of the
+    adapter, so repeated requests share DNS lookups, TCP connections and TLS
+    sessions. Call close() or use the adapter as a context manager to release
+    pooled connections. With a ResponseCache, GET requests go through a
+    CachingTransport. Requests sent with _send() are reported to the
+    adapter's instrumentation hook.
+
+    Attributes:
+        timeout: Request timeout in seconds.
+        http2: Whether HTTP/2 is enabled (requires the optional h2 package).
+        max_connections: Maximum number of concurrent pooled connections.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        cache: Optional on-disk response cache.
+
+    Example:
+        >>> with CrossrefAdapter(http2=True, max_connections=20) as adapter:
+        ...     papers = adapter.search("machine learning")
+    """
+
+    timeout: float
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    cache: ResponseCache | None
+    _client: httpx.Client | None
+    _client_lock: threading.Lock
+    _emit: Callable[..., None]
+
+    def _init_http_client(
+        self,
+        timeout: float,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Store connection pool settings; the client itself is created lazily.
+
+        Args:
+            timeout: Request timeout in seconds.
+            http2: Enable HTTP/2 if the h2 package is installed (falls back
+                to HTTP/1.1 otherwise).
+            max_connections: Maximum number of concurrent pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            cache: Optional response cache for GET requests.
+        """
+        self.timeout = timeout
+        self.http2 = http2 and http2_available()
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.cache = cache
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared client, creating it on first use.
+
+        Adapters are shared across search threads, so creation is guarded by
+        a lock: concurrent first requests get the same client and pool.
+
+        Returns:
+            Long-lived httpx.Client with pooled connections.
+        """
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                )
+                if self.cache is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout, http2=self.http2, limits=limits
+                    )
+                else:
+                    transport = httpx.HTTPTransport(http2=self.http2, limits=limits)
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        transport=CachingTransport(self.cache, transport),
+                    )
+            return self._client
+
+    def _send(self, url: str, attempt: int = 0, json: Any = None, **kwargs: Any) -> httpx.Response:
+        """Send one request on the shared client, emitting REQUEST_START and REQUEST_END.
+
+        Args:
+            url: Request URL.
+            attempt: Zero-based attempt number, reported with the events.
+            json: JSON body; if given the request is a POST, otherwise a GET.
+            **kwargs: Passed to the client (params, headers).
+
+        Returns:
+            The response (its status is not checked).
+
+        Raises:
+            httpx.HTTPError: If the request failed without a response.
+        """
+        self._emit(SearchEventKind.REQUEST_START, url=url, attempt=attempt)
+        started = time.perf_counter()
+        client = self._get_client()
+        try:
+            if json is None:
+                response = client.get(url, **kwargs)
+            else:
+                response = client.post(url, json=json, **kwargs)
+        except httpx.HTTPError as e:
+            self._emit(
+                SearchEventKind.REQUEST_END,
+                url=url,
+                seconds=time.perf_counter() - started,
+                attempt=attempt,
+                error=str(e) or type(e).__name__,
+            )
+            raise
+        self._emit(
+            SearchEventKind.REQUEST_END,
+            url=url,
+            seconds=time.perf_counter() - started,
+            bytes_received=len(response.content),
+            status_code=response.status_code,
+            attempt=attempt,
+        )
+        return response
+
+    def _report_retry(self, error: Exception, attempt: int, delay: float) -> float:
+        """Emit a RETRY event for a failed attempt.
+
+        Args:
+            error: Failure of the attempt.
+            attempt: Zero-based number of the failed attempt.
+            delay: Seconds the adapter waits before the next attempt.
+
+        Returns:
+            The delay, for the caller to sleep.
+        """
+        self._emit(SearchEventKind.RETRY, seconds=delay, attempt=attempt + 1, error=str(error))
+        return delay
+
+    def _cache_fresh(self, url: str, params: dict[str, str | int] | None = None) -> bool:
+        """Check whether a GET request will be answered from the cache.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+
+        Returns:
+            True if a fresh cache entry exists (no rate-limit token needed).
+        """
+        if self.cache is None:
+            return False
+        return self.cache.contains_fresh(ResponseCache.make_key("GET", url, params))
+
+    def close(self) -> None:
+        """Close the pooled client and release its connections."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close pooled connections."""
+        self.close()
+
+
+class PooledAsyncHTTPClientMixin:
+    """Mixin providing a lazily created, reusable httpx.AsyncClient.
+
+    Async counterpart of PooledHTTPClientMixin. Rate limiting goes through a
+    TokenBucketRateLimiter, which may be shared with sync adapters, other
+    tasks and other processes using the same API budget.
+
+    An httpx.AsyncClient's connection pool belongs to the event loop it was
+    first used on, so an adapter must be driven from one event loop until
+    aclose() is called. Use one adapter per loop (e.g. per thread running
+    asyncio.run) to search from several loops.
+
+    Attributes:
+        timeout: Request timeout in seconds.
+        http2: Whether HTTP/2 is enabled (requires the optional h2 package).
+        max_connections: Maximum number of concurrent pooled connections.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        rate_limit: Minimum seconds between requests.
+        rate_limiter: Token bucket consulted before every request.
+        cache: Optional on-disk response cache.
+
+    Example:
+        >>> async with AsyncCrossrefAdapter() as adapter:
+        ...     papers = await adapter.search("machine learning")
+    """
+
+    timeout: float
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    rate_limit: float
+    rate_limiter: TokenBucketRateLimiter
+    cache: ResponseCache | None
+    _async_client: httpx.AsyncClient | None
+    _async_client_loop: asyncio.AbstractEventLoop | None
+    _async_client_lock: threading.Lock
+
+    def _init_async_http_client(
+        self,
+        timeout: float,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        rate_limit: float = 0.0,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Store connection pool settings; the client itself is created lazily.
+
+        Args:
+            timeout: Request timeout in seconds.
+            http2: Enable HTTP/2 if the h2 package is installed.
+            max_connections: Maximum number of concurrent pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            rate_limit: Minimum seconds between requests (0 disables spacing).
+            rate_limiter: Shared limiter to use instead of a private one
+                built from rate_limit.
+            cache: Optional response cache for GET requests.
+        """
+        self.timeout = timeout
+        self.http2 = http2 and http2_available()
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter.from_interval(rate_limit)
+        self.cache = cache
+        self._async_client = None
+        self._async_client_loop = None
+        self._async_client_lock = threading.Lock()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared async client, creating it on first use.
+
+        The client is bound to the running event loop that created it.
+
+        Returns:
+            Long-lived httpx.AsyncClient with pooled connections.
+
+        Raises:
+            RuntimeError: If the client was created on another event loop
+                and has not been closed with aclose().
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if client is not None:
+            if self._async_client_loop not in (None, loop):
+                raise RuntimeError(
+                    "async client belongs to another event loop; "
+                    "use one adapter per loop or call aclose() first"
+                )
+            return client
+        with self._async_client_lock:
+            if self._async_client is None:
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                )
+                if self.cache is None:
+                    self._async_client = httpx.AsyncClient(
+                        timeout=self.timeout, http2=self.http2, limits=limits
+                    )
+                else:
+                    transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=limits)
+                    self._async_client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        transport=AsyncCachingTransport(self.cache, transport),
+                    )
+                self._async_client_loop = loop
+            return self._async_client
+
+    def _cache_fresh(self, url: str, params: dict[str, str | int] | None = None) -> bool:
+        """Check whether a GET request will be answered from the cache.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+
+        Returns:
+            True if a fresh cache entry exists (no rate-limit token needed).
+        """
+        if self.cache is None:
+            return False
+        return self.cache.contains_fresh(ResponseCache.make_key("GET", url, params))
+
+    async def _rate_limit_wait(self) -> None:
+        """Await a token from the rate limiter without blocking the event loop."""
+        await self.rate_limiter.acquire_async()
+
+    async def aclose(self) -> None:
+        """Close the pooled async client and release its connections."""
+        with self._async_client_lock:
+            client, self._async_client = self._async_client, None
+            self._async_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager and close pooled connections."""
+        await self.aclose()
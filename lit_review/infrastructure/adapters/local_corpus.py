@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Offline search over every paper the review tool has seen.
+
+Papers are stored in a SQLite database with an FTS5 full-text index over
+titles, abstracts and keywords (which carry PubMed's MeSH terms), ranked
+by BM25. JSONReviewRepository feeds the index on every save, so searches
+and re-screening of anything fetched before run without network access.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from lit_review.application.ports.search_service import SearchService
+from lit_review.domain.entities.paper import Paper
+
+# BM25 column weights: title, abstract, keywords
+_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Words of a free-text query that is not valid FTS5 syntax
+_WORD_PATTERN = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id INTEGER PRIMARY KEY,
+    doi TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    abstract TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    publication_year INTEGER NOT NULL,
+    journal TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    indexed_on TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_year ON papers (publication_year);
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, abstract, keywords,
+    content='papers', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts (rowid, title, abstract, keywords)
+    VALUES (new.id, new.title, new.abstract, new.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, keywords)
+    VALUES ('delete', old.id, old.title, old.abstract, old.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, keywords)
+    VALUES ('delete', old.id, old.title, old.abstract, old.keywords);
+    INSERT INTO papers_fts (rowid, title, abstract, keywords)
+    VALUES (new.id, new.title, new.abstract, new.keywords);
+END;
+"""
+
+
+class LocalCorpusSearchService(SearchService):
+    """SearchService over a local SQLite FTS5 index of previously seen papers.
+
+    Only bibliographic metadata is indexed; screening decisions and quality
+    scores belong to a review and are not stored. Indexing is incremental:
+    a paper is rewritten only when its metadata changed since it was last
+    indexed. Safe to share between threads.
+
+    Queries use FTS5 syntax (AND, OR, NOT, "phrases", prefix*). A query
+    that is not valid FTS5 syntax is searched as the AND of its words.
+
+    Attributes:
+        path: SQLite database file.
+
+    Example:
+        >>> corpus = LocalCorpusSearchService(Path("~/.lit_review/corpus.sqlite").expanduser())
+        >>> repo = JSONReviewRepository(Path("./data"), corpus=corpus)
+        >>> repo.save(review)  # indexes the review's papers
+        >>> corpus.search("sepsis AND machine learning", limit=20)
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) a corpus index.
+
+        Args:
+            path: SQLite database file.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def index(self, papers: Iterable[Paper]) -> int:
+        """Add papers to the index, or update those whose metadata changed.
+
+        Change detection happens in the upsert itself (by fingerprint), so
+        unchanged papers cost one primary-key lookup and no index writes,
+        however large the corpus, and several processes may index into the
+        same file.
+
+        Args:
+            papers: Papers to index.
+
+        Returns:
+            Number of papers written (new or changed).
+        """
+        today = date.today().isoformat()
+        rows = []
+        for paper in papers:
+            row = self._to_row(paper)
+            rows.append({**row, "fingerprint": self._fingerprint(row), "indexed_on": today})
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                """
+                INSERT INTO papers (doi, title, abstract, keywords, authors,
+                    publication_year, journal, fingerprint, indexed_on)
+                VALUES (:doi, :title, :abstract, :keywords, :authors,
+                    :publication_year, :journal, :fingerprint, :indexed_on)
+                ON CONFLICT (doi) DO UPDATE SET
+                    title = excluded.title,
+                    abstract = excluded.abstract,
+                    keywords = excluded.keywords,
+                    authors = excluded.authors,
+                    publication_year = excluded.publication_year,
+                    journal = excluded.journal,
+                    fingerprint = excluded.fingerprint
+                WHERE papers.fingerprint != excluded.fingerprint
+                """,
+                rows,
+            )
+            return cursor.rowcount
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search the corpus, best BM25 match first.
+
+        Args:
+            query: FTS5 query or free text.
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+        """
+        return self._query(query, limit)
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search papers first indexed on or after a date.
+
+        Args:
+            query: FTS5 query or free text.
+            since: Earliest indexing date (inclusive).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+        """
+        return self._query(query, limit, "p.indexed_on >= ?", [since.isoformat()])
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search papers published within a range of years.
+
+        Args:
+            query: FTS5 query or free text.
+            start: First publication date (inclusive; only the year is used).
+            end: Last publication date (inclusive; only the year is used).
+            limit: Maximum number of results to return (default 100).
+
+        Returns:
+            List of Paper entities matching the query.
+        """
+        return self._query(
+            query, limit, "p.publication_year BETWEEN ? AND ?", [start.year, end.year]
+        )
+
+    def count_range(self, query: str, start: date, end: date) -> int:
+        """Count papers published within a range of years.
+
+        Args:
+            query: FTS5 query or free text.
+            start: First publication date (inclusive; only the year is used).
+            end: Last publication date (inclusive; only the year is used).
+
+        Returns:
+            Number of matching papers.
+        """
+        sql = (
+            "SELECT COUNT(*) FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid "
+            "WHERE papers_fts MATCH ? AND p.publication_year BETWEEN ? AND ?"
+        )
+        rows = self._execute(sql, query, [start.year, end.year])
+        return int(rows[0][0])
+
+    def get_service_name(self) -> str:
+        """Return service name."""
+        return "Local corpus"
+
+    def __len__(self) -> int:
+        """Return the number of indexed papers."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "LocalCorpusSearchService":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the database."""
+        self.close()
+
+    def _query(
+        self, query: str, limit: int, condition: str = "", params: list[Any] | None = None
+    ) -> list[Paper]:
+        """Run a ranked full-text query and convert the rows to papers.
+
+        Args:
+            query: FTS5 query or free text.
+            limit: Maximum number of results.
+            condition: Extra SQL condition on the papers table (alias ``p``).
+            params: Parameters of the extra condition.
+
+        Returns:
+            Matching papers, best match first.
+        """
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        sql = (
+            "SELECT p.doi, p.title, p.abstract, p.keywords, p.authors, p.publication_year, "
+            "p.journal FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid "
+            f"WHERE papers_fts MATCH ? {'AND ' + condition if condition else ''} "
+            f"ORDER BY bm25(papers_fts, {weights}) LIMIT ?"
+        )
+        return self._to_papers(self._execute(sql, query, [*(params or []), limit]))
+
+    def _execute(self, sql: str, query: str, params: list[Any]) -> list[Any]:
+        """Execute a MATCH query, retrying free text as the AND of its words.
+
+        Args:
+            sql: Statement whose first parameter is the MATCH expression.
+            query: FTS5 query or free text.
+            params: Remaining statement parameters.
+
+        Returns:
+            Result rows.
+        """
+        with self._lock:
+            try:
+                return self._conn.execute(sql, [query, *params]).fetchall()
+            except sqlite3.OperationalError:
+                words = _WORD_PATTERN.findall(query)
+                if not words:
+                    return []
+                match = " ".join(f'"{word}"' for word in words)
+                return self._conn.execute(sql, [match, *params]).fetchall()
+
+    @staticmethod
+    def _to_row(paper: Paper) -> dict[str, Any]:
+        """Convert a paper's bibliographic metadata to a table row.
+
+        Args:
+            paper: Paper to convert.
+
+        Returns:
+            Column values (without fingerprint and indexing date).
+        """
+        return {
+            "doi": paper.doi.value,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "keywords": "\n".join(paper.keywords),
+            "authors": json.dumps(
+                [[a.last_name, a.first_name, a.initials, a.orcid] for a in paper.authors],
+                ensure_ascii=False,
+            ),
+            "publication_year": paper.publication_year,
+            "journal": paper.journal,
+        }
+
+    @staticmethod
+    def _fingerprint(row: dict[str, Any]) -> str:
+        """Hash a row's metadata to detect changes between saves."""
+        encoded = json.dumps(row, sort_keys=True, ensure_ascii=False).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _to_papers(rows: list[tuple[Any, ...]]) -> list[Paper]:
+        """Convert result rows to papers.
+
+        Only papers that passed validation are indexed, so the rows are
+        rebuilt with Paper.from_trusted_records instead of re-validated.
+
+        Args:
+            rows: doi, title, abstract, keywords, authors, year and journal.
+
+        Returns:
+            Paper entities in row order.
+        """
+        return Paper.from_trusted_records(
+            {
+                "doi": doi,
+                "title": title,
+                "authors": [
+                    {"last_name": last, "first_name": first, "initials": initials, "orcid": orcid}
+                    for last, first, initials, orcid in json.loads(authors)
+                ],
+                "publication_year": year,
+                "journal": journal,
+                "abstract": abstract,
+                "keywords": keywords.split("\n") if keywords else [],
+            }
+            for doi, title, abstract, keywords, authors, year, journal in rows
+        )
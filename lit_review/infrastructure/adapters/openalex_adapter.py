@@ -0,0 +1,553 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""OpenAlex API adapter for searching academic papers.
+
+Implements the SearchService port for the OpenAlex works endpoint with
+cursor paging (200 works per page), ``select`` field projection, and
+batched DOI lookups for hydration.
+"""
+
+import os
+from collections.abc import Iterator
+from datetime import date
+from time import perf_counter, sleep
+from typing import Any
+
+import httpx
+
+from lit_review.application.ports.search_events import SearchEventKind
+from lit_review.application.ports.search_service import SearchService
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.services.deduplication import is_synthetic_doi
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.http_client import PooledHTTPClientMixin, backoff_delay
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_fingerprint,
+    default_rate_limiter,
+)
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
+
+
+class OpenAlexAdapter(PooledHTTPClientMixin, SearchService):
+    """OpenAlex API adapter with rate limiting.
+
+    Searches OpenAlex works and converts them to Paper entities. Results
+    are paged with OpenAlex's cursor protocol, so any number of results
+    can be fetched; requests share one pooled HTTP client.
+
+    Attributes:
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts on failure.
+        email: Email for the polite pool (sent as ``mailto``).
+        page_size: Works requested per cursor page (max 200).
+        rate_limit: Minimum seconds between requests.
+        rate_limiter: Token bucket consulted before every request.
+
+    Example:
+        >>> with OpenAlexAdapter(email="me@example.org") as adapter:
+        ...     papers = adapter.search("sepsis prediction", limit=1000)
+        ...     adapter.hydrate(stubs)  # 50 DOIs per request
+    """
+
+    BASE_URL = "https://api.openalex.org/works"
+    MAX_PER_PAGE = 200  # OpenAlex maximum per-page
+    FULL_SELECT = (
+        "id,doi,title,authorships,publication_year,primary_location,"
+        "abstract_inverted_index,keywords"
+    )
+    STUB_SELECT = "id,doi,title,authorships,publication_year,primary_location"
+    HYDRATE_SELECT = "doi,authorships,abstract_inverted_index,keywords"
+    HYDRATE_BATCH = 50  # OpenAlex maximum values in one OR filter
+    FALLBACK_DOI_PREFIX = "10.9999/openalex."
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        email: str | None = None,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        page_size: int = MAX_PER_PAGE,
+        rate_limit: float = 0.1,
+        burst: int = 1,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize OpenAlex adapter.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_retries: Maximum retry attempts.
+            email: Email for the polite pool (recommended; defaults to
+                OPENALEX_EMAIL).
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            page_size: Works requested per cursor page (capped at 200).
+            rate_limit: Minimum seconds between requests (default 0.1,
+                OpenAlex's 10 requests/second).
+            burst: Requests allowed back-to-back before spacing applies.
+            rate_limiter: Shared limiter (e.g. from shared_rate_limiter) to
+                use instead of the default built from rate_limit and burst.
+            cache: Optional on-disk response cache; fresh hits skip the
+                network and the rate limiter.
+        """
+        self._init_http_client(timeout, http2, max_connections, max_keepalive_connections, cache)
+        self.max_retries = max_retries
+        self.email = email or os.environ.get("OPENALEX_EMAIL")
+        self.page_size = max(1, min(page_size, self.MAX_PER_PAGE))
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or default_rate_limiter(
+            f"openalex:{credential_fingerprint(self.email)}", rate_limit, capacity=burst
+        )
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search OpenAlex for works matching query.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        return list(self.iter_search(query, limit=limit))
+
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        """Lazily yield works matching query, one cursor page at a time.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of papers to yield.
+
+        Yields:
+            Paper entities in relevance order.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        yield from self._iter_works(self._build_params(query), limit)
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search OpenAlex for works published on or after a date.
+
+        OpenAlex's creation-date filters need a premium key, so delta runs
+        filter on publication date; works re-fetched for the overlap are
+        dropped by deduplication.
+
+        Args:
+            query: Search query string.
+            since: Earliest publication date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query)
+        params["filter"] = f"from_publication_date:{since.isoformat()}"
+        return list(self._iter_works(params, limit))
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search OpenAlex for works published within a date range.
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query)
+        params["filter"] = self._pub_date_filter(start, end)
+        return list(self._iter_works(params, limit))
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count works published within a date range (one-result page).
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            OpenAlex's ``meta.count`` for the filtered query.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params: dict[str, str | int] = {
+            "search": query,
+            "filter": self._pub_date_filter(start, end),
+            "per-page": 1,
+            "select": "id",
+        }
+        meta = self._fetch_page(params).get("meta") or {}
+        count = meta.get("count")
+        return count if isinstance(count, int) else None
+
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search OpenAlex for work stubs without abstracts or keywords.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities without abstracts.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        params = self._build_params(query)
+        params["select"] = self.STUB_SELECT
+        return list(self._iter_works(params, limit))
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        """Fetch missing abstracts, keywords and authors, HYDRATE_BATCH DOIs per request.
+
+        Papers with synthetic DOIs are skipped.
+
+        Args:
+            papers: Papers to complete.
+
+        Returns:
+            The papers that received an abstract, keywords or authors.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        by_doi = {
+            paper.doi.value.casefold(): paper
+            for paper in papers
+            if not is_synthetic_doi(paper.doi.value)
+        }
+        dois = list(by_doi)
+        hydrated: list[Paper] = []
+
+        for start in range(0, len(dois), self.HYDRATE_BATCH):
+            batch = dois[start : start + self.HYDRATE_BATCH]
+            params: dict[str, str | int] = {
+                "filter": "doi:" + "|".join(batch),
+                "per-page": len(batch),
+                "select": self.HYDRATE_SELECT,
+            }
+            for item in self._fetch_page(params).get("results") or []:
+                paper = by_doi.pop(self._strip_doi(item.get("doi")).casefold(), None)
+                if paper is not None and self._fill_missing(paper, item):
+                    hydrated.append(paper)
+
+        return hydrated
+
+    def _fill_missing(self, paper: Paper, item: dict[str, Any]) -> bool:
+        """Copy abstract, keywords and authors where the paper lacks them.
+
+        Args:
+            paper: Paper to update in place.
+            item: OpenAlex work for the same DOI.
+
+        Returns:
+            True if any field was filled.
+        """
+        filled = False
+        abstract = self._rebuild_abstract(item.get("abstract_inverted_index"))
+        if abstract and not paper.abstract:
+            paper.abstract = abstract
+            filled = True
+        keywords = self._parse_keywords(item.get("keywords"))
+        if keywords and not paper.keywords:
+            paper.keywords = keywords
+            filled = True
+        if paper.has_placeholder_authors():
+            authors = self._parse_authors(item.get("authorships") or [])
+            if authors:
+                paper.authors = authors
+                filled = True
+        return filled
+
+    def _iter_works(self, params: dict[str, str | int], limit: int) -> Iterator[Paper]:
+        """Yield papers for a works query, following the paging cursor.
+
+        Args:
+            params: First-page query parameters from _build_params.
+            limit: Maximum number of papers to yield.
+
+        Yields:
+            Paper entities in relevance order.
+        """
+        params["cursor"] = "*"
+        yielded = 0
+
+        while yielded < limit:
+            per_page = min(limit - yielded, self.page_size)
+            params["per-page"] = per_page
+            data = self._fetch_page(params)
+
+            items = data.get("results") or []
+            for paper in self._parse_response(data):
+                yield paper
+                yielded += 1
+                if yielded >= limit:
+                    return
+
+            next_cursor = (data.get("meta") or {}).get("next_cursor")
+            if not items or len(items) < per_page or not next_cursor:
+                return
+            params["cursor"] = next_cursor
+
+    def _fetch_page(self, params: dict[str, str | int]) -> dict[str, Any]:
+        """Fetch one page of works with rate limiting and exponential backoff.
+
+        Args:
+            params: Query parameters for the works endpoint.
+
+        Returns:
+            Decoded JSON response.
+
+        Raises:
+            ConnectionError: If unable to connect after retries.
+            TimeoutError: If all requests timeout.
+        """
+        if self.email:
+            params = {**params, "mailto": self.email}
+
+        for attempt in range(self.max_retries):
+            try:
+                if not self._cache_fresh(self.BASE_URL, params):
+                    self._rate_limit_sleep()
+                response = self._send(
+                    self.BASE_URL,
+                    attempt,
+                    params=params,
+                    headers={"Accept": "application/json"},
+                )
+                response.raise_for_status()
+                data: dict[str, Any] = response.json()
+                return data
+            except httpx.TimeoutException as e:
+                if attempt == self.max_retries - 1:
+                    raise TimeoutError(
+                        f"OpenAlex request timed out after {self.max_retries} attempts"
+                    )
+                sleep(self._report_retry(e, attempt, 2**attempt))
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise ConnectionError(f"OpenAlex request failed: {e}") from e
+                sleep(self._report_retry(e, attempt, backoff_delay(e, attempt, self.rate_limiter)))
+
+        return {}
+
+    def _rate_limit_sleep(self) -> None:
+        """Block until the rate limiter grants a request token."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
+
+    def _build_params(self, query: str) -> dict[str, str | int]:
+        """Build OpenAlex query parameters for the first page.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            Query parameters for the works endpoint.
+        """
+        return {"search": query, "select": self.FULL_SELECT}
+
+    def _pub_date_filter(self, start: date, end: date) -> str:
+        """Build a publication date range filter.
+
+        Args:
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            Value for the works endpoint's ``filter`` parameter.
+        """
+        return f"from_publication_date:{start.isoformat()},to_publication_date:{end.isoformat()}"
+
+    def _parse_response(self, data: dict[str, Any]) -> list[Paper]:
+        """Parse OpenAlex works response to Paper entities.
+
+        Args:
+            data: OpenAlex API response JSON.
+
+        Returns:
+            List of Paper entities.
+        """
+        started = perf_counter()
+        papers: list[Paper] = []
+        items = data.get("results") or []
+
+        for item in items:
+            try:
+                paper = self._item_to_paper(item)
+                if paper:
+                    papers.append(paper)
+            except Exception:
+                # Skip malformed entries
+                continue
+
+        self._emit(
+            SearchEventKind.PARSE,
+            seconds=perf_counter() - started,
+            produced=len(papers),
+            dropped=len(items) - len(papers),
+        )
+        return papers
+
+    def _item_to_paper(self, item: dict[str, Any]) -> Paper | None:
+        """Convert an OpenAlex work to a Paper entity.
+
+        Args:
+            item: Single OpenAlex work.
+
+        Returns:
+            Paper entity or None if required fields missing.
+        """
+        title = item.get("title")
+        if not title:
+            return None
+
+        # DOI, with the OpenAlex work ID as fallback
+        doi_value = self._strip_doi(item.get("doi"))
+        if not doi_value:
+            work_id = str(item.get("id") or "").rsplit("/", 1)[-1]
+            if not work_id:
+                return None
+            doi_value = f"{self.FALLBACK_DOI_PREFIX}{work_id}"
+
+        authors = self._parse_authors(item.get("authorships") or [])
+        if not authors:
+            authors = [Author("Unknown", "Author", "U.")]
+
+        year = item.get("publication_year")
+        if not isinstance(year, int):
+            year = 2024
+
+        source = (item.get("primary_location") or {}).get("source") or {}
+        journal = source.get("display_name") or "Unknown Journal"
+
+        try:
+            return Paper(
+                doi=DOI(doi_value),
+                title=title,
+                authors=authors,
+                publication_year=year,
+                journal=journal,
+                abstract=self._rebuild_abstract(item.get("abstract_inverted_index")),
+                keywords=self._parse_keywords(item.get("keywords")),
+            )
+        except Exception:
+            return None
+
+    def _strip_doi(self, doi_url: object) -> str:
+        """Strip the resolver prefix from an OpenAlex DOI URL.
+
+        Args:
+            doi_url: DOI as returned by OpenAlex (e.g. "https://doi.org/10.1234/x").
+
+        Returns:
+            Bare DOI, or "" if missing.
+        """
+        if not isinstance(doi_url, str):
+            return ""
+        return doi_url.removeprefix("https://doi.org/").removeprefix("http://doi.org/")
+
+    def _rebuild_abstract(self, inverted_index: object) -> str:
+        """Rebuild an abstract from OpenAlex's inverted index.
+
+        Args:
+            inverted_index: Mapping of each word to its positions.
+
+        Returns:
+            Abstract text, or "" if missing.
+        """
+        if not isinstance(inverted_index, dict) or not inverted_index:
+            return ""
+        positions = {
+            position: word
+            for word, word_positions in inverted_index.items()
+            for position in word_positions
+        }
+        return " ".join(positions[i] for i in sorted(positions))
+
+    def _parse_keywords(self, keywords: object) -> list[str]:
+        """Extract keyword names.
+
+        Args:
+            keywords: OpenAlex ``keywords`` list.
+
+        Returns:
+            Keyword display names.
+        """
+        if not isinstance(keywords, list):
+            return []
+        return [
+            k["display_name"] for k in keywords if isinstance(k, dict) and k.get("display_name")
+        ]
+
+    def _parse_authors(self, authorships: list[dict[str, Any]]) -> list[Author]:
+        """Parse OpenAlex authorships to Author value objects.
+
+        OpenAlex gives display names only; the last word is taken as the
+        family name.
+
+        Args:
+            authorships: OpenAlex ``authorships`` list.
+
+        Returns:
+            List of Author value objects.
+        """
+        authors: list[Author] = []
+
+        for authorship in authorships:
+            author = authorship.get("author") or {}
+            name = str(author.get("display_name") or "").strip()
+            if not name:
+                continue
+
+            *given_parts, family = name.split()
+            given = " ".join(given_parts)
+            initials = ".".join(p[0].upper() for p in given_parts) + "." if given_parts else ""
+            orcid = author.get("orcid")
+            if isinstance(orcid, str):
+                orcid = orcid.removeprefix("https://orcid.org/")
+
+            try:
+                authors.append(
+                    Author(
+                        last_name=family,
+                        first_name=given or "Unknown",
+                        initials=initials or "U.",
+                        orcid=orcid or None,
+                    )
+                )
+            except Exception:
+                continue
+
+        return authors
+
+    def get_service_name(self) -> str:
+        """Return service name."""
+        return "OpenAlex"
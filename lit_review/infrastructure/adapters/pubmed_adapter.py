@@ -3,128 +3,89 @@
 """PubMed API adapter using Biopython's Entrez module.
 
 Implements the SearchService port for PubMed with proper rate limiting,
-XML parsing, and DOI fallback handling.
+history-server batched fetching, streaming XML parsing, and DOI fallback
+handling.
 """
 
+import io
 import os
+import re
 import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import date
+from typing import IO, Any
+from urllib.error import HTTPError
 from xml.etree import ElementTree
 
 from Bio import Entrez
 
+from lit_review.application.ports.search_events import SearchEventKind
 from lit_review.application.ports.search_service import SearchService
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.http_client import RETRY_AFTER_STATUS_CODES
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_fingerprint,
+    default_rate_limiter,
+    parse_retry_after,
+)
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
 
 
-class PubMedAdapter(SearchService):
-    """PubMed API adapter with Entrez E-utilities.
-
-    Implements rate-limited PubMed searches using Biopython's Entrez module.
-    Respects NCBI rate limits: 3 requests/sec (10/sec with API key).
+class _TimedHandle:
+    """E-utilities response handle that times and counts its reads.
 
     Attributes:
-        email: Email address for NCBI API (required).
-        api_key: Optional NCBI API key for higher rate limits.
-        rate_limit: Request rate limit (requests per second).
-        timeout: Request timeout in seconds.
-
-    Example:
-        >>> adapter = PubMedAdapter(email="researcher@example.com")
-        >>> papers = adapter.search("machine learning healthcare", limit=10)
+        seconds: Time spent opening the handle and reading from it.
+        bytes_received: Bytes read so far.
     """
 
-    def __init__(
-        self,
-        email: str | None = None,
-        api_key: str | None = None,
-        timeout: int = 30,
-    ) -> None:
-        """Initialize PubMed adapter.
+    def __init__(self, handle: Any, opened_in: float) -> None:
+        """Wrap a handle returned by an Entrez function.
 
         Args:
-            email: Email address for NCBI (required by NCBI policy).
-            api_key: Optional NCBI API key for higher rate limits.
-            timeout: Request timeout in seconds.
-
-        Raises:
-            ValueError: If email is not provided.
+            handle: File-like response handle.
+            opened_in: Seconds the Entrez call took to return it.
         """
-        self.email = email or os.environ.get("NCBI_EMAIL")
-        if not self.email:
-            raise ValueError(
-                "Email is required for PubMed API. Set NCBI_EMAIL environment "
-                "variable or pass email parameter."
-            )
-
-        self.api_key = api_key or os.environ.get("NCBI_API_KEY")
-        self.timeout = timeout
-
-        # Set rate limit based on API key presence
-        self.rate_limit = 10 if self.api_key else 3  # requests per second
-        self._last_request_time = 0.0
-
-        # Configure Entrez
-        Entrez.email = self.email  # type: ignore[assignment]
-        if self.api_key:
-            Entrez.api_key = self.api_key  # type: ignore[assignment]
+        self._handle = handle
+        self.seconds = opened_in
+        self.bytes_received = 0
 
-    def _rate_limit_sleep(self) -> None:
-        """Sleep to respect rate limits."""
-        elapsed = time.time() - self._last_request_time
-        min_interval = 1.0 / self.rate_limit
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
-
-    def search(self, query: str, limit: int = 100) -> list[Paper]:
-        """Search PubMed for papers matching query.
+    def read(self, size: int = -1) -> bytes:
+        """Read from the underlying handle.
 
         Args:
-            query: Search query string (PubMed query syntax).
-            limit: Maximum number of results.
+            size: Maximum number of bytes (-1 for all).
 
         Returns:
-            List of Paper entities from search results.
-
-        Raises:
-            ConnectionError: If unable to connect to PubMed.
-            TimeoutError: If request times out.
+            Bytes read.
         """
-        try:
-            # Step 1: Search for PMIDs
-            self._rate_limit_sleep()
-            search_handle = Entrez.esearch(
-                db="pubmed",
-                term=query,
-                retmax=limit,
-                sort="relevance",
-            )
-            search_results = Entrez.read(search_handle)
-            search_handle.close()
+        started = time.perf_counter()
+        data: bytes = self._handle.read(size)
+        self.seconds += time.perf_counter() - started
+        if isinstance(data, bytes):
+            self.bytes_received += len(data)
+        return data
 
-            pmids = search_results["IdList"]
-            if not pmids:
-                return []
+    def close(self) -> None:
+        """Close the underlying handle."""
+        self._handle.close()
 
-            # Step 2: Fetch full records
-            self._rate_limit_sleep()
-            fetch_handle = Entrez.efetch(
-                db="pubmed",
-                id=",".join(pmids),
-                retmode="xml",
-            )
-            records = fetch_handle.read()
-            fetch_handle.close()
 
-            # Step 3: Parse XML to Paper entities
-            return self._parse_xml(records)
+class PubMedXMLParserMixin:
+    """Mixin converting PubmedArticleSet XML into Paper entities.
 
-        except Exception as e:
-            if "timeout" in str(e).lower():
-                raise TimeoutError(f"PubMed request timed out: {e}") from e
-            raise ConnectionError(f"PubMed request failed: {e}") from e
+    Shared by PubMedAdapter (efetch responses) and the bulk ingester
+    (baseline dump files). Parsing is reported as a PARSE event through
+    _emit().
+    """
+
+    FALLBACK_DOI_PREFIX = "10.9999/pubmed."
+
+    _emit: Callable[..., None]
 
     def _parse_xml(self, xml_data: bytes) -> list[Paper]:
         """Parse PubMed XML response to Paper entities.
@@ -135,19 +96,70 @@ class PubMedAdapter(SearchService):
         Returns:
             List of Paper entities.
         """
-        papers: list[Paper] = []
-        root = ElementTree.fromstring(xml_data)
+        return list(self._iter_parse_xml(io.BytesIO(xml_data)))
 
-        for article in root.findall(".//PubmedArticle"):
-            try:
-                paper = self._article_to_paper(article)
-                if paper:
-                    papers.append(paper)
-            except Exception:
-                # Skip malformed articles
-                continue
+    def _iter_parse_xml(self, source: IO[bytes] | _TimedHandle) -> Iterator[Paper]:
+        """Incrementally parse a PubMed XML stream into Paper entities.
+
+        Uses iterparse and clears each PubmedArticle (and the root's
+        references to it) once converted, so the in-memory tree never
+        holds more than one article. The PARSE event emitted at the end
+        excludes time spent by the consumer and, for a response streamed
+        off the connection, time spent waiting for the body.
+
+        Args:
+            source: Binary file-like object containing PubmedArticleSet XML.
+
+        Yields:
+            Paper entities in document order.
+        """
+        root: ElementTree.Element | None = None
+        produced = dropped = 0
+        parsing = 0.0
+        read_before = source.seconds if isinstance(source, _TimedHandle) else 0.0
+        resumed = time.perf_counter()
+        suspended = False
+
+        try:
+            for event, elem in ElementTree.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    continue
 
-        return papers
+                if elem.tag != "PubmedArticle":
+                    continue
+
+                try:
+                    paper = self._article_to_paper(elem)
+                except Exception:
+                    # Skip malformed articles
+                    paper = None
+
+                elem.clear()
+                if root is not None and root is not elem:
+                    root.clear()
+
+                if paper:
+                    produced += 1
+                    parsing += time.perf_counter() - resumed
+                    suspended = True
+                    yield paper
+                    suspended = False
+                    resumed = time.perf_counter()
+                else:
+                    dropped += 1
+        finally:
+            if not suspended:
+                parsing += time.perf_counter() - resumed
+            if isinstance(source, _TimedHandle):
+                parsing -= source.seconds - read_before
+            self._emit(
+                SearchEventKind.PARSE,
+                seconds=max(0.0, parsing),
+                produced=produced,
+                dropped=dropped,
+            )
 
     def _article_to_paper(self, article: ElementTree.Element) -> Paper | None:
         """Convert PubMed article XML to Paper entity.
@@ -243,7 +255,7 @@ class PubMedAdapter(SearchService):
         # Fallback to PMID (PubMed ID)
         pmid_elem = medline_citation.find(".//PMID")
         if pmid_elem is not None and pmid_elem.text:
-            return f"10.9999/pubmed.{pmid_elem.text}"
+            return f"{self.FALLBACK_DOI_PREFIX}{pmid_elem.text}"
 
         return None
 
@@ -317,8 +329,6 @@ class PubMedAdapter(SearchService):
         medline_date_elem = pub_date.find("MedlineDate")
         if medline_date_elem is not None and medline_date_elem.text:
             # Extract first 4 digits from date like "2024 Jan-Feb"
-            import re
-
             match = re.search(r"\d{4}", medline_date_elem.text)
             if match:
                 return int(match.group())
@@ -353,6 +363,594 @@ class PubMedAdapter(SearchService):
 
         return keywords[:10]  # Limit to 10 keywords
 
+
+class PubMedAdapter(PubMedXMLParserMixin, SearchService):
+    """PubMed API adapter with Entrez E-utilities.
+
+    Implements rate-limited PubMed searches using Biopython's Entrez module.
+    Respects NCBI rate limits: 3 requests/sec (10/sec with API key).
+    Large result sets are fetched from the NCBI history server in batches
+    and stream-parsed.
+
+    Attributes:
+        email: Email address for NCBI API (required).
+        api_key: Optional NCBI API key for higher rate limits.
+        rate_limit: Request rate limit (requests per second).
+        rate_limiter: Token bucket consulted before every E-utilities call.
+        timeout: Request timeout in seconds.
+        batch_size: Records fetched per efetch request.
+        cache: Optional on-disk cache of efetch batches.
+
+    Example:
+        >>> adapter = PubMedAdapter(email="researcher@example.com")
+        >>> papers = adapter.search("machine learning healthcare", limit=10)
+    """
+
+    EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+    ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+    DOI_LOOKUP_BATCH = 200  # DOIs per esearch lookup during hydration
+    RESULT_CAP = 10_000  # PubMed serves only the first 10,000 records of a search
+
+    def __init__(
+        self,
+        email: str | None = None,
+        api_key: str | None = None,
+        timeout: int = 30,
+        batch_size: int = 500,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize PubMed adapter.
+
+        Args:
+            email: Email address for NCBI (required by NCBI policy).
+            api_key: Optional NCBI API key for higher rate limits.
+            timeout: Request timeout in seconds.
+            batch_size: Records fetched per efetch request (default 500).
+            rate_limiter: Shared limiter to use instead of the default.
+                NCBI budgets are per API key, so by default jobs sharing a
+                key share one file-backed limiter (see rate_limit_dir).
+            cache: Optional on-disk cache of efetch batches, keyed by query
+                and offset. Cached batches skip the network and the limiter.
+
+        Raises:
+            ValueError: If email is not provided.
+        """
+        self.email = email or os.environ.get("NCBI_EMAIL")
+        if not self.email:
+            raise ValueError(
+                "Email is required for PubMed API. Set NCBI_EMAIL environment "
+                "variable or pass email parameter."
+            )
+
+        self.api_key = api_key or os.environ.get("NCBI_API_KEY")
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.cache = cache
+
+        # Set rate limit based on API key presence
+        self.rate_limit = 10 if self.api_key else 3  # requests per second
+        self.rate_limiter = rate_limiter or default_rate_limiter(
+            f"ncbi:{credential_fingerprint(self.api_key)}", 1.0 / self.rate_limit
+        )
+
+        # Configure Entrez
+        Entrez.email = self.email  # type: ignore[assignment]
+        if self.api_key:
+            Entrez.api_key = self.api_key  # type: ignore[assignment]
+
+    def _rate_limit_sleep(self) -> None:
+        """Block until the rate limiter grants a request token."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
+
+    @contextmanager
+    def _entrez_request(self, utility: str, **params: Any) -> Iterator[_TimedHandle]:
+        """Call an E-utility after waiting for the rate limiter.
+
+        Emits REQUEST_START before the call and REQUEST_END once the
+        handle is closed, with the time spent opening and reading it.
+
+        Args:
+            utility: Entrez function name ("esearch", "efetch" or "esummary").
+            **params: Parameters passed to the Entrez function.
+
+        Yields:
+            The response handle; it is closed on exit.
+        """
+        self._rate_limit_sleep()
+        self._emit(SearchEventKind.REQUEST_START, url=utility)
+        started = time.perf_counter()
+        try:
+            handle = _TimedHandle(getattr(Entrez, utility)(**params), time.perf_counter() - started)
+        except Exception as e:
+            self._emit(
+                SearchEventKind.REQUEST_END,
+                url=utility,
+                seconds=time.perf_counter() - started,
+                status_code=e.code if isinstance(e, HTTPError) else None,
+                error=str(e),
+            )
+            raise
+        try:
+            yield handle
+        finally:
+            handle.close()
+            self._emit(
+                SearchEventKind.REQUEST_END,
+                url=utility,
+                seconds=handle.seconds,
+                bytes_received=handle.bytes_received,
+                status_code=200,
+            )
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search PubMed for papers matching query.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        return list(self.iter_search(query, limit=limit))
+
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        """Lazily yield papers matching query, fetching records in batches.
+
+        Runs esearch with ``usehistory=y`` so the result set is stored on the
+        NCBI history server, then pages through it with efetch
+        (WebEnv/query_key, retstart/retmax) in batches of ``batch_size``.
+        Each batch is parsed incrementally, so memory stays bounded to a
+        single record regardless of result set size. PubMed serves only the
+        first RESULT_CAP records of a search, even from the history server,
+        so at most that many are yielded; use search_range (or
+        SearchPapersUseCase.execute_partitioned) to reach the rest.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            limit: Maximum number of papers to fetch.
+
+        Yields:
+            Paper entities in relevance order.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        yield from self._iter_esearch(query, limit, {})
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search PubMed for papers entered on or after a date.
+
+        Restricts esearch to an Entrez date range (``datetype=edat``,
+        ``mindate`` to today), so only records added since the last run
+        are fetched.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            since: Earliest Entrez date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        filters = {
+            "datetype": "edat",
+            "mindate": since.strftime("%Y/%m/%d"),
+            "maxdate": date.today().strftime("%Y/%m/%d"),
+        }
+        return list(self._iter_esearch(query, limit, filters))
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search PubMed for papers published within a date range.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        return list(self._iter_esearch(query, limit, self._pub_date_filters(start, end)))
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count papers published within a date range with one esearch call.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            esearch ``Count`` for the date-restricted query.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        with (
+            self._entrez_errors(),
+            self._entrez_request(
+                "esearch", db="pubmed", term=query, retmax=0, **self._pub_date_filters(start, end)
+            ) as handle,
+        ):
+            results = Entrez.read(handle)
+        return int(results.get("Count", 0))
+
+    def _pub_date_filters(self, start: date, end: date) -> dict[str, str]:
+        """Build esearch parameters for a publication date range.
+
+        Args:
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            ``datetype=pdat`` with ``mindate``/``maxdate``.
+        """
+        return {
+            "datetype": "pdat",
+            "mindate": start.strftime("%Y/%m/%d"),
+            "maxdate": end.strftime("%Y/%m/%d"),
+        }
+
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search PubMed for paper stubs using esummary instead of efetch.
+
+        Document summaries carry title, authors, date, journal and DOI but
+        no abstract or MeSH terms, and are a fraction of the size of full
+        PubMed XML records.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities without abstracts.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        return list(self._iter_esearch(query, limit, {}, stubs=True))
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        """Fetch missing abstracts, MeSH keywords and authors with efetch.
+
+        PMIDs come from fallback DOIs directly; other DOIs are resolved with
+        one esearch per batch. Full records are then fetched in batches of
+        ``batch_size`` and matched back to the papers by DOI.
+
+        Args:
+            papers: Papers to complete.
+
+        Returns:
+            The papers that received an abstract, keywords or authors.
+
+        Raises:
+            ConnectionError: If unable to connect to PubMed.
+            TimeoutError: If request times out.
+        """
+        by_doi = {paper.doi.value.casefold(): paper for paper in papers}
+        pmids = [
+            doi.removeprefix(self.FALLBACK_DOI_PREFIX)
+            for doi in by_doi
+            if doi.startswith(self.FALLBACK_DOI_PREFIX)
+        ]
+        dois = [doi for doi in by_doi if not doi.startswith(self.FALLBACK_DOI_PREFIX)]
+        hydrated: list[Paper] = []
+
+        with self._entrez_errors():
+            for start in range(0, len(dois), self.DOI_LOOKUP_BATCH):
+                batch = dois[start : start + self.DOI_LOOKUP_BATCH]
+                with self._entrez_request(
+                    "esearch",
+                    db="pubmed",
+                    term=" OR ".join(f'"{doi}"[doi]' for doi in batch),
+                    retmax=len(batch),
+                ) as search_handle:
+                    search_results = Entrez.read(search_handle)
+                pmids.extend(search_results["IdList"])
+
+            for start in range(0, len(pmids), self.batch_size):
+                batch_ids = ",".join(pmids[start : start + self.batch_size])
+                for record in self._fetch_batch(None, id=batch_ids):
+                    paper = by_doi.pop(record.doi.value.casefold(), None)
+                    if paper is not None and self._fill_missing(paper, record):
+                        hydrated.append(paper)
+
+        return hydrated
+
+    def _fill_missing(self, paper: Paper, record: Paper) -> bool:
+        """Copy abstract, keywords and authors from a full record where missing.
+
+        Args:
+            paper: Paper to update in place.
+            record: Full PubMed record for the same DOI.
+
+        Returns:
+            True if any field was filled.
+        """
+        filled = False
+        if record.abstract and not paper.abstract:
+            paper.abstract = record.abstract
+            filled = True
+        if record.keywords and not paper.keywords:
+            paper.keywords = list(record.keywords)
+            filled = True
+        if paper.has_placeholder_authors() and not record.has_placeholder_authors():
+            paper.authors = list(record.authors)
+            filled = True
+        return filled
+
+    def _iter_esearch(
+        self, query: str, limit: int, filters: dict[str, str], stubs: bool = False
+    ) -> Iterator[Paper]:
+        """Run esearch with optional filters and yield the fetched papers.
+
+        Args:
+            query: Search query string (PubMed query syntax).
+            limit: Maximum number of papers to fetch.
+            filters: Extra esearch parameters (e.g. a date range).
+            stubs: Fetch document summaries (esummary) instead of full records.
+
+        Yields:
+            Paper entities in relevance order.
+        """
+        fetch = self._fetch_summaries if stubs else self._fetch_batch
+        url = self.ESUMMARY_URL if stubs else self.EFETCH_URL
+
+        with self._entrez_errors():
+            # Step 1: Search, storing the result set on the history server
+            with self._entrez_request(
+                "esearch",
+                db="pubmed",
+                term=query,
+                retmax=0,  # IDs are retrieved from the history server
+                sort="relevance",
+                usehistory="y",
+                **filters,
+            ) as search_handle:
+                search_results = Entrez.read(search_handle)
+
+            webenv = search_results.get("WebEnv")
+            query_key = search_results.get("QueryKey")
+            # efetch rejects a retstart past the cap, history server or not
+            total = min(limit, int(search_results.get("Count", 0)), self.RESULT_CAP)
+
+            # Step 2: Fetch records batch by batch and stream-parse them
+            if webenv and query_key:
+                for retstart in range(0, total, self.batch_size):
+                    yield from fetch(
+                        self._batch_cache_key(query, retstart, total, filters, url),
+                        webenv=webenv,
+                        query_key=query_key,
+                        retstart=retstart,
+                        retmax=min(self.batch_size, total - retstart),
+                    )
+            elif total:
+                # History server unavailable: the retmax=0 search returned no
+                # IDs, so search again for the PMIDs and fetch them explicitly
+                with self._entrez_request(
+                    "esearch",
+                    db="pubmed",
+                    term=query,
+                    retmax=total,
+                    sort="relevance",
+                    **filters,
+                ) as search_handle:
+                    id_results = Entrez.read(search_handle)
+                pmids = list(id_results["IdList"])[:limit]
+                for start in range(0, len(pmids), self.batch_size):
+                    batch_ids = ",".join(pmids[start : start + self.batch_size])
+                    yield from fetch(None, id=batch_ids)
+
+    @contextmanager
+    def _entrez_errors(self) -> Iterator[None]:
+        """Translate E-utilities failures into ConnectionError or TimeoutError.
+
+        A 429/503 with Retry-After also pauses the shared rate limiter.
+
+        Raises:
+            ConnectionError: If an E-utilities request failed.
+            TimeoutError: If an E-utilities request timed out.
+        """
+        try:
+            yield
+        except HTTPError as e:
+            if e.code in RETRY_AFTER_STATUS_CODES:
+                retry_after = parse_retry_after(e.headers.get("Retry-After"))
+                if retry_after is not None:
+                    self.rate_limiter.penalize(retry_after)
+            raise ConnectionError(f"PubMed request failed: {e}") from e
+        except Exception as e:
+            if "timeout" in str(e).lower():
+                raise TimeoutError(f"PubMed request timed out: {e}") from e
+            raise ConnectionError(f"PubMed request failed: {e}") from e
+
+    def _fetch_summaries(self, cache_key: str | None, **summary_params: Any) -> Iterator[Paper]:
+        """Fetch one esummary batch and yield a stub paper per document summary.
+
+        Args:
+            cache_key: Response cache key for this batch (None to bypass).
+            **summary_params: Batch selection passed to Entrez.esummary.
+
+        Yields:
+            Paper entities without abstracts.
+        """
+        entry = None
+        if self.cache is not None and cache_key is not None:
+            entry = self.cache.get(cache_key)
+
+        if entry is not None and self.cache is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            content = entry.content
+        else:
+            with self._entrez_request("esummary", db="pubmed", **summary_params) as handle:
+                content = handle.read()
+            if self.cache is not None and cache_key is not None:
+                self.cache.record_miss()
+                self.cache.put(cache_key, content)
+
+        started = time.perf_counter()
+        papers: list[Paper] = []
+        summaries = Entrez.read(io.BytesIO(content))
+        for summary in summaries:
+            try:
+                paper = self._summary_to_paper(summary)
+            except Exception:
+                # Skip malformed summaries
+                paper = None
+            if paper:
+                papers.append(paper)
+        self._emit(
+            SearchEventKind.PARSE,
+            seconds=time.perf_counter() - started,
+            produced=len(papers),
+            dropped=len(summaries) - len(papers),
+        )
+        yield from papers
+
+    def _fetch_batch(self, cache_key: str | None, **fetch_params: Any) -> Iterator[Paper]:
+        """Fetch one efetch batch and yield its papers as they are parsed.
+
+        Without a cache the response is stream-parsed straight off the
+        connection. With a cache, a fresh stored batch is parsed from disk;
+        otherwise the batch body is read, stored, then parsed.
+
+        Args:
+            cache_key: Response cache key for this batch (None to bypass).
+            **fetch_params: Batch selection passed to Entrez.efetch (either
+                webenv/query_key/retstart/retmax or an explicit id list).
+
+        Yields:
+            Paper entities from this batch.
+        """
+        if self.cache is None or cache_key is None:
+            with self._entrez_request(
+                "efetch", db="pubmed", retmode="xml", **fetch_params
+            ) as fetch_handle:
+                yield from self._iter_parse_xml(fetch_handle)
+            return
+
+        entry = self.cache.get(cache_key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            yield from self._iter_parse_xml(io.BytesIO(entry.content))
+            return
+
+        with self._entrez_request(
+            "efetch", db="pubmed", retmode="xml", **fetch_params
+        ) as fetch_handle:
+            content = fetch_handle.read()
+        self.cache.record_miss()
+        self.cache.put(cache_key, content)
+        yield from self._iter_parse_xml(io.BytesIO(content))
+
+    def _batch_cache_key(
+        self,
+        query: str,
+        retstart: int,
+        total: int,
+        filters: dict[str, str] | None = None,
+        url: str = EFETCH_URL,
+    ) -> str | None:
+        """Build the cache key for one history-server batch.
+
+        WebEnv tokens differ between sessions, so batches are keyed by the
+        query and their position in the relevance-ordered result set.
+
+        Args:
+            query: Search query string.
+            retstart: Offset of the batch.
+            total: Number of records being fetched.
+            filters: esearch filters the result set was built with.
+            url: E-utility the batch is fetched from (efetch or esummary).
+
+        Returns:
+            Cache key, or None if caching is disabled.
+        """
+        if self.cache is None:
+            return None
+        return ResponseCache.make_key(
+            "GET",
+            url,
+            {
+                "db": "pubmed",
+                "term": query,
+                "sort": "relevance",
+                "retstart": retstart,
+                "retmax": min(self.batch_size, total - retstart),
+                **(filters or {}),
+            },
+        )
+
+    def _summary_to_paper(self, summary: dict[str, Any]) -> Paper | None:
+        """Convert an esummary document summary to a stub Paper.
+
+        Args:
+            summary: Document summary as returned by Entrez.read.
+
+        Returns:
+            Paper entity without abstract, or None if required fields missing.
+        """
+        title = str(summary.get("Title", "")).strip()
+        if not title:
+            return None
+
+        # DOI (ArticleIds first, fallback to PMID)
+        article_ids = summary.get("ArticleIds") or {}
+        doi_value = article_ids.get("doi") or summary.get("DOI")
+        if not doi_value:
+            pmid = str(summary.get("Id", ""))
+            if not pmid:
+                return None
+            doi_value = f"{self.FALLBACK_DOI_PREFIX}{pmid}"
+
+        # Authors ("Smith JA" name strings)
+        authors: list[Author] = []
+        for name in summary.get("AuthorList", []):
+            parts = str(name).split()
+            if len(parts) < 2:
+                continue
+            initials = "".join(f"{letter}." for letter in parts[-1])
+            authors.append(Author(" ".join(parts[:-1]), "Unknown", initials))
+        if not authors:
+            authors = [Author("Unknown", "Author", "U.")]
+
+        # Publication year ("2024 Jan 5", "2024 Jan-Feb")
+        match = re.match(r"\d{4}", str(summary.get("PubDate", "")))
+        year = int(match.group()) if match else 2024
+
+        journal = str(summary.get("FullJournalName") or summary.get("Source") or "")
+
+        try:
+            return Paper(
+                doi=DOI(str(doi_value)),
+                title=title,
+                authors=authors,
+                publication_year=year,
+                journal=journal or "Unknown Journal",
+            )
+        except Exception:
+            return None
+
     def get_service_name(self) -> str:
         """Return service name."""
         return "PubMed"
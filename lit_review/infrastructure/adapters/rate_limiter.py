@@ -0,0 +1,407 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Token-bucket rate limiter shared across threads, asyncio tasks and processes.
+
+Search adapters acquire a token before every API request. A limiter can be
+private to one adapter, shared by several adapters in one process, or backed
+by a state file (guarded with fcntl locks) so that concurrent CLI invocations
+on the same host share one request budget, e.g. one NCBI API key. Adapters
+share file-backed limiters by default, stored in LIT_REVIEW_RATE_LIMIT_DIR
+(default: the ``ratelimits`` directory under LIT_REVIEW_DATA_DIR); set
+LIT_REVIEW_RATE_LIMIT_DIR=off to give each adapter a private limiter.
+File locks need fcntl, so on platforms without it (e.g. Windows) adapters
+always get private limiters.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+# State directory used when neither LIT_REVIEW_RATE_LIMIT_DIR nor
+# LIT_REVIEW_DATA_DIR is set
+DEFAULT_RATE_LIMIT_DIR = Path.home() / ".lit_review" / "ratelimits"
+
+# LIT_REVIEW_RATE_LIMIT_DIR value that disables shared limiters
+RATE_LIMIT_DIR_OFF = "off"
+
+
+@dataclass
+class _BucketState:
+    """Mutable token-bucket state (persisted as JSON when file-backed).
+
+    Attributes:
+        tokens: Available tokens; negative values are outstanding reservations.
+        updated: Wall-clock time tokens were last refilled. May lie in the
+            future while a Retry-After penalty is in effect.
+    """
+
+    tokens: float
+    updated: float
+
+
+# State transition: mutates the bucket at time ``now`` and returns a wait time
+_StateUpdate = Callable[[_BucketState, float], float]
+
+
+class TokenBucketRateLimiter:
+    """Token-bucket rate limiter with burst capacity and Retry-After support.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each acquire() reserves a token (allowing the balance to go negative)
+    and sleeps until the reservation is covered, so concurrent callers are
+    spaced out fairly without polling. When ``state_file`` is set, the bucket
+    lives on disk and every reservation is made under an exclusive file lock,
+    so separate processes share one budget.
+
+    Attributes:
+        rate: Tokens added per second (math.inf disables limiting).
+        capacity: Maximum burst size in tokens.
+        state_file: Optional path of the shared on-disk bucket.
+
+    Example:
+        >>> limiter = TokenBucketRateLimiter(rate=10, capacity=10)
+        >>> limiter.acquire()  # returns seconds slept
+        0.0
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        state_file: Path | None = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rate: Tokens added per second (must be positive; math.inf for unlimited).
+            capacity: Maximum burst size in tokens (at least 1).
+            state_file: Optional state file for cross-process sharing.
+
+        Raises:
+            ValueError: If rate is not positive or capacity is below 1.
+            OSError: If state_file is set on a platform without fcntl.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"Capacity must be at least 1, got {capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.state_file = Path(state_file) if state_file else None
+        if self.state_file:
+            if not file_locks_available():
+                raise OSError("File-backed rate limiting requires fcntl (POSIX only)")
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._state = _BucketState(tokens=capacity, updated=time.time())
+
+    @classmethod
+    def from_interval(
+        cls,
+        interval: float,
+        capacity: float = 1.0,
+        state_file: Path | None = None,
+    ) -> "TokenBucketRateLimiter":
+        """Create a limiter from a minimum interval between requests.
+
+        Args:
+            interval: Minimum seconds between requests (0 disables limiting).
+            capacity: Maximum burst size in tokens.
+            state_file: Optional state file for cross-process sharing.
+
+        Returns:
+            Configured TokenBucketRateLimiter.
+        """
+        rate = 1.0 / interval if interval > 0 else math.inf
+        return cls(rate=rate, capacity=capacity, state_file=state_file)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the calling thread until a token is available.
+
+        Args:
+            tokens: Number of tokens to consume.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait without blocking the event loop until a token is available.
+
+        A file-backed reservation waits for the file lock, which another
+        process may hold, so it is made on a worker thread.
+
+        Args:
+            tokens: Number of tokens to consume.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        if self.state_file is None:
+            wait = self._reserve(tokens)
+        else:
+            wait = await asyncio.to_thread(self._reserve, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Pause the bucket, e.g. after a 429 response with Retry-After.
+
+        Drains available tokens and delays refilling until ``seconds`` from
+        now, so every thread, task and process sharing the bucket backs off.
+
+        Args:
+            seconds: Seconds to pause.
+        """
+        if seconds <= 0 or math.isinf(self.rate):
+            return
+
+        def apply(state: _BucketState, now: float) -> float:
+            state.tokens = min(state.tokens, 0.0)
+            state.updated = max(state.updated, now + seconds)
+            return 0.0
+
+        self._update(apply)
+
+    async def penalize_async(self, seconds: float) -> None:
+        """Pause the bucket like penalize() without blocking the event loop.
+
+        Args:
+            seconds: Seconds to pause.
+        """
+        if self.state_file is None:
+            self.penalize(seconds)
+        else:
+            await asyncio.to_thread(self.penalize, seconds)
+
+    def _reserve(self, tokens: float) -> float:
+        """Reserve tokens and return how long the caller must wait.
+
+        Args:
+            tokens: Number of tokens to consume.
+
+        Returns:
+            Seconds until the reservation is covered.
+        """
+        if math.isinf(self.rate):
+            return 0.0
+
+        def apply(state: _BucketState, now: float) -> float:
+            if now > state.updated:
+                state.tokens = min(self.capacity, state.tokens + (now - state.updated) * self.rate)
+                state.updated = now
+            state.tokens -= tokens
+            ready_at = state.updated + max(0.0, -state.tokens) / self.rate
+            return max(0.0, ready_at - now)
+
+        return self._update(apply)
+
+    def _update(self, apply: _StateUpdate) -> float:
+        """Apply a state transition under the thread lock (and file lock if shared).
+
+        Args:
+            apply: Function mutating the state and returning a wait time.
+
+        Returns:
+            Value returned by ``apply``.
+        """
+        with self._lock:
+            if self.state_file is None:
+                return apply(self._state, time.time())
+
+            import fcntl
+
+            with open(self.state_file, "a+", encoding="utf-8") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    state = self._read_state(f.read())
+                    result = apply(state, time.time())
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(asdict(state), f)
+                    f.flush()
+                    return result
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_state(self, raw: str) -> _BucketState:
+        """Decode persisted state, starting with a full bucket if absent or corrupt.
+
+        Args:
+            raw: JSON text from the state file.
+
+        Returns:
+            Bucket state.
+        """
+        try:
+            data = json.loads(raw)
+            return _BucketState(tokens=float(data["tokens"]), updated=float(data["updated"]))
+        except (ValueError, KeyError, TypeError):
+            return _BucketState(tokens=self.capacity, updated=time.time())
+
+
+def file_locks_available() -> bool:
+    """Check whether fcntl file locks, needed by file-backed limiters, exist.
+
+    Returns:
+        True on POSIX platforms.
+    """
+    try:
+        import fcntl  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+
+    Example:
+        >>> parse_retry_after("5")
+        5.0
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+_shared_limiters: dict[tuple[str, Path | None], TokenBucketRateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def shared_rate_limiter(
+    key: str,
+    rate: float,
+    capacity: float = 1.0,
+    state_dir: Path | None = None,
+) -> TokenBucketRateLimiter:
+    """Return the process-wide limiter for ``key``, creating it on first use.
+
+    Adapters talking to the same API with the same credentials should share
+    one limiter. When ``state_dir`` is given the bucket is file-backed, so
+    separate processes share it too. The first caller's rate and capacity
+    win for a given key and state directory.
+
+    Args:
+        key: Budget identifier, e.g. "ncbi:<key-fingerprint>".
+        rate: Tokens added per second.
+        capacity: Maximum burst size in tokens.
+        state_dir: Directory for cross-process state files.
+
+    Returns:
+        Shared TokenBucketRateLimiter.
+
+    Raises:
+        OSError: If the state directory cannot be created.
+    """
+    state_file = None
+    if state_dir is not None:
+        safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        state_file = Path(state_dir) / f"{safe_key}.json"
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get((key, state_file))
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(rate=rate, capacity=capacity, state_file=state_file)
+            _shared_limiters[(key, state_file)] = limiter
+        return limiter
+
+
+def default_rate_limiter(
+    key: str, interval: float, capacity: float = 1.0
+) -> TokenBucketRateLimiter:
+    """Build the limiter an adapter uses when none is injected.
+
+    Returns the file-backed shared limiter for ``key``, so that every job
+    on the host using the same API credentials draws from one budget. A
+    private limiter is returned instead if LIT_REVIEW_RATE_LIMIT_DIR is
+    ``off``, the state directory cannot be created or the platform has no
+    file locks.
+
+    Args:
+        key: Budget identifier, e.g. "ncbi:<key-fingerprint>".
+        interval: Minimum seconds between requests (0 disables limiting).
+        capacity: Maximum burst size in tokens.
+
+    Returns:
+        TokenBucketRateLimiter for the adapter.
+    """
+    state_dir = rate_limit_dir()
+    if state_dir is None or not file_locks_available():
+        return TokenBucketRateLimiter.from_interval(interval, capacity=capacity)
+    rate = 1.0 / interval if interval > 0 else math.inf
+    try:
+        return shared_rate_limiter(key, rate, capacity=capacity, state_dir=state_dir)
+    except OSError:
+        # Read-only home or similar: pace this process at least
+        return TokenBucketRateLimiter.from_interval(interval, capacity=capacity)
+
+
+def rate_limit_dir() -> Path | None:
+    """Return the directory of the shared limiters' state files.
+
+    Returns:
+        LIT_REVIEW_RATE_LIMIT_DIR, else ``ratelimits`` under
+        LIT_REVIEW_DATA_DIR, else DEFAULT_RATE_LIMIT_DIR; None if
+        LIT_REVIEW_RATE_LIMIT_DIR is ``off``.
+    """
+    configured = os.environ.get("LIT_REVIEW_RATE_LIMIT_DIR")
+    if configured:
+        if configured.strip().lower() == RATE_LIMIT_DIR_OFF:
+            return None
+        return Path(configured).expanduser()
+    data_dir = os.environ.get("LIT_REVIEW_DATA_DIR")
+    if data_dir:
+        return Path(data_dir).expanduser() / "ratelimits"
+    return DEFAULT_RATE_LIMIT_DIR
+
+
+def credential_fingerprint(secret: str | None) -> str:
+    """Return a short, non-reversible identifier for an API credential.
+
+    Used to build rate-limit keys without writing secrets to disk.
+
+    Args:
+        secret: API key or email (None for anonymous access).
+
+    Returns:
+        12-character hex fingerprint, or "public" for anonymous access.
+    """
+    if not secret:
+        return "public"
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:12]
@@ -0,0 +1,486 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Persistent on-disk HTTP response cache for search adapters.
+
+Responses are stored in a SQLite database keyed by the normalized request
+URL (scheme, host, path and sorted query parameters). Fresh entries are
+served without touching the network; stale entries carrying an ETag or
+Last-Modified validator are revalidated with a conditional request, so an
+unchanged result costs a 304 instead of a full download. The cache is
+bounded in size and evicts least recently used entries first.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+# Headers describing the wire encoding; cached bodies are stored decoded
+_HOP_BY_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters.
+
+    Attributes:
+        hits: Requests served from a fresh cache entry.
+        revalidations: Stale entries confirmed unchanged by a 304 response.
+        misses: Requests that required a full network fetch.
+        evictions: Entries removed to stay within the size bound.
+    """
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from cache (including revalidations)."""
+        total = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with its validators.
+
+    Attributes:
+        status_code: HTTP status code of the original response.
+        headers: Response headers (without wire-encoding headers).
+        content: Decoded response body.
+        stored_at: Wall-clock time the entry was stored or last revalidated.
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """ETag validator, if the server sent one."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Last-Modified validator, if the server sent one."""
+        return self.headers.get("last-modified")
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild an httpx.Response for the given request.
+
+        Args:
+            request: Request being answered from cache.
+
+        Returns:
+            Response carrying the cached status, headers and body.
+        """
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class ResponseCache:
+    """Size-bounded SQLite response cache with TTL and LRU eviction.
+
+    Safe to share between threads, sync and async clients, and (through
+    SQLite's own locking) separate processes.
+
+    Attributes:
+        path: SQLite database file.
+        ttl: Seconds an entry is served without revalidation.
+        max_bytes: Upper bound on the total size of cached bodies.
+        stats: Hit/miss counters for this cache instance.
+
+    Example:
+        >>> cache = ResponseCache(Path("~/.lit_review/cache/http.sqlite").expanduser())
+        >>> with CrossrefAdapter(cache=cache) as adapter:
+        ...     adapter.search("sepsis")  # network
+        ...     adapter.search("sepsis")  # served from cache
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 24 * 60 * 60,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """Open (or create) a response cache.
+
+        Args:
+            path: SQLite database file.
+            ttl: Seconds an entry is served without revalidation (default 24h).
+            max_bytes: Maximum total size of cached bodies (default 256 MiB).
+
+        Raises:
+            ValueError: If ttl is negative or max_bytes is not positive.
+        """
+        if ttl < 0:
+            raise ValueError(f"TTL must be non-negative, got {ttl}")
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str | httpx.URL,
+        params: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Build a normalized cache key for a request.
+
+        Scheme and host are lower-cased and query parameters sorted, so
+        equivalent requests map to the same entry regardless of parameter
+        order.
+
+        Args:
+            method: HTTP method.
+            url: Request URL (may already contain a query string).
+            params: Additional query parameters.
+
+        Returns:
+            Cache key string.
+        """
+        full_url = httpx.URL(url, params=params) if params else httpx.URL(url)
+        query = sorted(full_url.params.multi_items())
+        normalized = full_url.copy_with(
+            scheme=full_url.scheme.lower(),
+            host=full_url.host.lower(),
+            query=None,
+            fragment=None,
+        )
+        return f"{method.upper()} {normalized}?{urlencode(query)}"
+
+    def key_for_request(self, request: httpx.Request) -> str:
+        """Return the cache key for an httpx request.
+
+        Args:
+            request: Outgoing request.
+
+        Returns:
+            Cache key string.
+        """
+        return self.make_key(request.method, request.url)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry (fresh or stale) and mark it recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached response, or None if absent.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return CachedResponse(
+            status_code=row[0],
+            headers=json.loads(row[1]),
+            content=row[2],
+            stored_at=row[3],
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Check whether an entry can be served without revalidation.
+
+        Args:
+            entry: Cached response.
+
+        Returns:
+            True if the entry is younger than the TTL.
+        """
+        return time.time() - entry.stored_at < self.ttl
+
+    def contains_fresh(self, key: str) -> bool:
+        """Check for a fresh entry without updating its recency or counters.
+
+        Adapters use this to skip rate limiting for requests the cache
+        will answer.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if a fresh entry exists.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Store a response body, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key.
+            content: Decoded response body.
+            status_code: HTTP status code.
+            headers: Response headers (wire-encoding headers are dropped).
+        """
+        stored_headers = {
+            name.lower(): value
+            for name, value in (headers or {}).items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        }
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, status_code, headers, content, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    status_code,
+                    json.dumps(stored_headers),
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly validated (after a 304 response).
+
+        Args:
+            key: Cache key.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._conn.commit()
+
+    def record_hit(self) -> None:
+        """Count a request served from a fresh entry."""
+        with self._lock:
+            self.stats.hits += 1
+
+    def record_revalidation(self) -> None:
+        """Count a stale entry confirmed by a 304 response."""
+        with self._lock:
+            self.stats.revalidations += 1
+
+    def record_miss(self) -> None:
+        """Count a request that needed a full network fetch."""
+        with self._lock:
+            self.stats.misses += 1
+
+    def total_size(self) -> int:
+        """Return the total size of cached bodies in bytes."""
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used entries until within max_bytes (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.stats.evictions += 1
+
+
+class CachingTransport(httpx.BaseTransport):
+    """httpx transport that answers GET requests from a ResponseCache.
+
+    Fresh entries are returned without network access. Stale entries with
+    validators are revalidated using If-None-Match / If-Modified-Since.
+    Successful (200) responses are stored; everything else passes through.
+
+    Example:
+        >>> transport = CachingTransport(cache, httpx.HTTPTransport())
+        >>> client = httpx.Client(transport=transport)
+    """
+
+    def __init__(self, cache: ResponseCache, transport: httpx.BaseTransport) -> None:
+        """Wrap a transport with caching.
+
+        Args:
+            cache: Response cache.
+            transport: Transport used for network requests.
+        """
+        self.cache = cache
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from cache or the wrapped transport.
+
+        Args:
+            request: Outgoing request.
+
+        Returns:
+            Cached or network response.
+        """
+        if request.method != "GET":
+            return self._transport.handle_request(request)
+
+        key = self.cache.key_for_request(request)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            return entry.to_response(request)
+
+        _add_validators(request, entry)
+        response = self._transport.handle_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.touch(key)
+            self.cache.record_revalidation()
+            return entry.to_response(request)
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            response.read()
+            self.cache.put(key, response.content, response.status_code, response.headers)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of CachingTransport for httpx.AsyncClient."""
+
+    def __init__(self, cache: ResponseCache, transport: httpx.AsyncBaseTransport) -> None:
+        """Wrap an async transport with caching.
+
+        Args:
+            cache: Response cache.
+            transport: Async transport used for network requests.
+        """
+        self.cache = cache
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from cache or the wrapped transport.
+
+        Args:
+            request: Outgoing request.
+
+        Returns:
+            Cached or network response.
+        """
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = self.cache.key_for_request(request)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            return entry.to_response(request)
+
+        _add_validators(request, entry)
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            self.cache.touch(key)
+            self.cache.record_revalidation()
+            return entry.to_response(request)
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            await response.aread()
+            self.cache.put(key, response.content, response.status_code, response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+def _add_validators(request: httpx.Request, entry: CachedResponse | None) -> None:
+    """Turn a request into a conditional request using a stale entry's validators.
+
+    Args:
+        request: Outgoing request (modified in place).
+        entry: Stale cache entry, if any.
+    """
+    if entry is None:
+        return
+    if entry.etag:
+        request.headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        request.headers["If-Modified-Since"] = entry.last_modified
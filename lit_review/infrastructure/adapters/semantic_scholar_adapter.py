@@ -3,25 +3,44 @@
 """Semantic Scholar API adapter for searching academic papers.
 
 Implements the SearchService port for Semantic Scholar with rate limiting,
-citation count metadata, and JSON parsing.
+citation count metadata, and JSON parsing, and the CitationGraphService port
+through the references and citations endpoints.
 """
 
+import asyncio
 import time
+from datetime import date
 from typing import Any
 
 import httpx
 
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.citation_graph import CitationGraphService
+from lit_review.application.ports.search_events import SearchEventKind
 from lit_review.application.ports.search_service import SearchService
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
-
-
-class SemanticScholarAdapter(SearchService):
+from lit_review.infrastructure.adapters.http_client import (
+    PooledAsyncHTTPClientMixin,
+    PooledHTTPClientMixin,
+    backoff_delay,
+    backoff_delay_async,
+)
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_fingerprint,
+    default_rate_limiter,
+)
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
+
+
+class SemanticScholarAdapter(PooledHTTPClientMixin, SearchService, CitationGraphService):
     """Semantic Scholar API adapter with rate limiting.
 
     Implements rate-limited Semantic Scholar searches using the public API.
     Respects rate limits: 100 requests per 5 minutes (1 request per 3 seconds).
+    Requests share one pooled HTTP client for the lifetime of the adapter.
 
     Attributes:
         base_url: Semantic Scholar API base URL.
@@ -36,6 +55,11 @@ class SemanticScholarAdapter(SearchService):
     """
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    FULL_FIELDS = "paperId,externalIds,title,authors,year,venue,abstract,citationCount"
+    STUB_FIELDS = "paperId,externalIds,title,authors,year,venue"
+    HYDRATE_BATCH = 500  # Maximum IDs per paper batch request
+    GRAPH_PAGE = 1000  # Maximum references/citations per request
+    RESULT_CAP = 100  # One search request per query, at most 100 results
 
     def __init__(
         self,
@@ -43,6 +67,12 @@ class SemanticScholarAdapter(SearchService):
         max_retries: int = 3,
         rate_limit: float = 3.0,
         api_key: str | None = None,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        burst: int = 1,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize Semantic Scholar adapter.
 
@@ -51,19 +81,28 @@ class SemanticScholarAdapter(SearchService):
             max_retries: Maximum retry attempts.
             rate_limit: Minimum seconds between requests (default 3.0).
             api_key: Optional API key for higher rate limits.
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            burst: Requests allowed back-to-back before spacing applies.
+            rate_limiter: Shared limiter (e.g. from shared_rate_limiter) to
+                use instead of the default built from rate_limit and burst.
+            cache: Optional on-disk response cache; fresh hits skip the
+                network and the rate limiter.
         """
-        self.timeout = timeout
+        self._init_http_client(timeout, http2, max_connections, max_keepalive_connections, cache)
         self.max_retries = max_retries
         self.rate_limit = rate_limit
         self.api_key = api_key
-        self._last_request_time = 0.0
+        self.rate_limiter = rate_limiter or default_rate_limiter(
+            f"semantic_scholar:{credential_fingerprint(api_key)}", rate_limit, capacity=burst
+        )
 
     def _rate_limit_sleep(self) -> None:
-        """Sleep to respect rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        """Block until the rate limiter grants a request token."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=waited)
 
     def search(self, query: str, limit: int = 100) -> list[Paper]:
         """Search Semantic Scholar for papers matching query.
@@ -79,42 +118,325 @@ class SemanticScholarAdapter(SearchService):
             ConnectionError: If unable to connect to Semantic Scholar.
             TimeoutError: If request times out.
         """
-        # Semantic Scholar search endpoint
-        url = f"{self.BASE_URL}/paper/search"
+        return self._fetch(self._build_params(query, limit))
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        """Search Semantic Scholar for papers published in or after a date's year.
+
+        The API only filters by publication year, so a delta run re-fetches
+        the current year; overlapping papers are dropped by deduplication.
+
+        Args:
+            query: Search query string.
+            since: Earliest date of interest; only its year is used.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, limit)
+        params["year"] = f"{since.year}-"
+        return self._fetch(params)
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        """Search Semantic Scholar for papers published within a date range.
+
+        Uses ``publicationDateOrYear``, so papers known only by year match
+        ranges that cover their year.
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, limit)
+        params["publicationDateOrYear"] = f"{start.isoformat()}:{end.isoformat()}"
+        return self._fetch(params)
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        """Count papers published within a date range from the search ``total``.
+
+        Args:
+            query: Search query string.
+            start: First publication date (inclusive).
+            end: Last publication date (inclusive).
+
+        Returns:
+            Semantic Scholar's (approximate) total, or None if missing.
 
-        params = {
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        params: dict[str, str | int] = {
             "query": query,
-            "limit": min(limit, 100),  # API max is 100 per request
-            "fields": "paperId,externalIds,title,authors,year,venue,abstract,citationCount",
+            "limit": 1,
+            "fields": "paperId",
+            "publicationDateOrYear": f"{start.isoformat()}:{end.isoformat()}",
         }
+        data = self._request(f"{self.BASE_URL}/paper/search", params)
+        total = data.get("total") if data else None
+        return total if isinstance(total, int) else None
 
-        headers = {"Accept": "application/json"}
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search Semantic Scholar for paper stubs without abstracts.
+
+        Requests only the identifier, title, author, year and venue fields.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities without abstracts.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        params = self._build_params(query, limit)
+        params["fields"] = self.STUB_FIELDS
+        return self._fetch(params)
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        """Fetch missing abstracts, authors and citation counts via the batch endpoint.
+
+        Looks papers up by DOI (or by S2 paper ID for fallback DOIs), up to
+        HYDRATE_BATCH papers per request.
+
+        Args:
+            papers: Papers to complete.
+
+        Returns:
+            The papers that received an abstract, authors or citation count.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        url = f"{self.BASE_URL}/paper/batch"
+        params: dict[str, str | int] = {"fields": "abstract,authors,citationCount"}
+        hydrated: list[Paper] = []
+
+        for start in range(0, len(papers), self.HYDRATE_BATCH):
+            batch = papers[start : start + self.HYDRATE_BATCH]
+            ids = [self._paper_id(paper.doi.value) for paper in batch]
+            items = self._request(url, params, body={"ids": ids}) or []
+            for paper, item in zip(batch, items, strict=False):
+                if item and self._fill_missing(paper, item):
+                    hydrated.append(paper)
+
+        return hydrated
+
+    def get_references(self, doi: str, limit: int = 1000) -> list[Paper]:
+        """List the papers a paper cites (backward snowballing).
+
+        Args:
+            doi: DOI of the citing paper (or an S2 fallback DOI).
+            limit: Maximum number of references to return.
+
+        Returns:
+            Referenced papers (empty if Semantic Scholar does not know the paper).
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        return self._fetch_graph(doi, "references", "citedPaper", limit)
+
+    def get_citations(self, doi: str, limit: int = 1000) -> list[Paper]:
+        """List the papers citing a paper (forward snowballing).
+
+        Args:
+            doi: DOI of the cited paper (or an S2 fallback DOI).
+            limit: Maximum number of citing papers to return.
+
+        Returns:
+            Citing papers (empty if Semantic Scholar does not know the paper).
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        return self._fetch_graph(doi, "citations", "citingPaper", limit)
+
+    def _fetch_graph(self, doi: str, edge: str, key: str, limit: int) -> list[Paper]:
+        """Page through a paper's references or citations.
+
+        Args:
+            doi: DOI of the paper.
+            edge: Endpoint name ("references" or "citations").
+            key: Field holding the linked paper in each entry.
+            limit: Maximum number of linked papers to return.
+
+        Returns:
+            Linked papers.
+        """
+        url = f"{self.BASE_URL}/paper/{self._paper_id(doi)}/{edge}"
+        papers: list[Paper] = []
+        offset = 0
+
+        while offset < limit:
+            params: dict[str, str | int] = {
+                "fields": self.FULL_FIELDS,
+                "offset": offset,
+                "limit": min(self.GRAPH_PAGE, limit - offset),
+            }
+            data = self._request(url, params)
+            entries = (data.get("data") or []) if data else []
+            items = [entry.get(key) or {} for entry in entries]
+            papers.extend(self._parse_response({"data": items}))
+            offset += len(entries)
+            if not entries or "next" not in data:
+                break
+
+        return papers
+
+    def _fill_missing(self, paper: Paper, item: dict[str, Any]) -> bool:
+        """Copy abstract, authors and citation count where the paper lacks them.
+
+        Args:
+            paper: Paper to update in place.
+            item: Batch endpoint result for the same paper.
+
+        Returns:
+            True if any field was filled.
+        """
+        filled = False
+        abstract = item.get("abstract")
+        if abstract and not paper.abstract:
+            paper.abstract = abstract
+            filled = True
+        if paper.has_placeholder_authors():
+            authors = self._parse_authors(item.get("authors") or [])
+            if authors:
+                paper.authors = authors
+                filled = True
+        citation_count = item.get("citationCount")
+        if citation_count is not None and not any(
+            keyword.startswith("citations:") for keyword in paper.keywords
+        ):
+            paper.keywords.append(f"citations:{citation_count}")
+            filled = True
+        return filled
+
+    def _paper_id(self, doi: str) -> str:
+        """Return the API identifier for a paper.
+
+        Args:
+            doi: DOI of the paper to look up.
+
+        Returns:
+            S2 paper ID for fallback DOIs, otherwise "DOI:<doi>".
+        """
+        prefix = "10.58121/S2."
+        if doi.startswith(prefix):
+            return doi[len(prefix) :]
+        return f"DOI:{doi}"
+
+    def _fetch(self, params: dict[str, str | int]) -> list[Paper]:
+        """Run one paper search request.
+
+        Args:
+            params: Query parameters from _build_params.
+
+        Returns:
+            List of Paper entities from the response.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        # Semantic Scholar search endpoint
+        data = self._request(f"{self.BASE_URL}/paper/search", params)
+        return self._parse_response(data) if data else []
+
+    def _request(
+        self, url: str, params: dict[str, str | int], body: dict[str, Any] | None = None
+    ) -> Any:
+        """Send one API request with rate limiting and exponential backoff.
+
+        Args:
+            url: Request URL.
+            params: Query parameters.
+            body: JSON body; if given the request is a POST, otherwise a GET.
+
+        Returns:
+            Decoded JSON response (None for 404 or if no attempt was made).
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        headers = self._build_headers()
 
         # Retry with exponential backoff
         for attempt in range(self.max_retries):
             try:
-                self._rate_limit_sleep()
+                if body is not None or not self._cache_fresh(url, params):
+                    self._rate_limit_sleep()
 
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.get(url, params=params, headers=headers)
-                    response.raise_for_status()
+                response = self._send(url, attempt, params=params, headers=headers, json=body)
+                if response.status_code == 404:
+                    # Unknown paper ID; retrying cannot help
+                    return None
+                response.raise_for_status()
 
-                return self._parse_response(response.json())
+                return response.json()
 
-            except httpx.TimeoutException:
+            except httpx.TimeoutException as e:
                 if attempt == self.max_retries - 1:
                     raise TimeoutError(
                         f"Semantic Scholar request timed out after {self.max_retries} attempts"
                     )
-                time.sleep(2**attempt)
+                time.sleep(self._report_retry(e, attempt, 2**attempt))
             except httpx.HTTPError as e:
                 if attempt == self.max_retries - 1:
                     raise ConnectionError(f"Semantic Scholar request failed: {e}") from e
-                time.sleep(2**attempt)
+                time.sleep(
+                    self._report_retry(e, attempt, backoff_delay(e, attempt, self.rate_limiter))
+                )
 
-        return []
+        return None
+
+    def _build_params(self, query: str, limit: int) -> dict[str, str | int]:
+        """Build paper search query parameters.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            Query parameters for the paper search endpoint.
+        """
+        return {
+            "query": query,
+            "limit": min(limit, 100),  # API max is 100 per request
+            "fields": self.FULL_FIELDS,
+        }
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers, including the API key when configured.
+
+        Returns:
+            HTTP headers for Semantic Scholar requests.
+        """
+        headers = {"Accept": "application/json"}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+        return headers
 
     def _parse_response(self, data: dict[str, Any]) -> list[Paper]:
         """Parse Semantic Scholar API response to Paper entities.
@@ -125,6 +447,7 @@ class SemanticScholarAdapter(SearchService):
         Returns:
             List of Paper entities.
         """
+        started = time.perf_counter()
         papers: list[Paper] = []
         items = data.get("data", [])
 
@@ -137,6 +460,12 @@ class SemanticScholarAdapter(SearchService):
                 # Skip malformed entries
                 continue
 
+        self._emit(
+            SearchEventKind.PARSE,
+            seconds=time.perf_counter() - started,
+            produced=len(papers),
+            dropped=len(items) - len(papers),
+        )
         return papers
 
     def _item_to_paper(self, item: dict[str, Any]) -> Paper | None:
@@ -278,3 +607,108 @@ class SemanticScholarAdapter(SearchService):
     def get_service_name(self) -> str:
         """Return service name."""
         return "Semantic Scholar"
+
+
+class AsyncSemanticScholarAdapter(PooledAsyncHTTPClientMixin, AsyncSearchService):
+    """Asyncio-native Semantic Scholar adapter using a pooled httpx.AsyncClient.
+
+    Shares request building and response parsing with SemanticScholarAdapter.
+    Concurrent searches are spaced by awaiting rate-limiter tokens instead of
+    sleeping threads.
+
+    Attributes:
+        timeout: Request timeout in seconds.
+        max_retries: Maximum retry attempts.
+        rate_limit: Minimum seconds between requests.
+        api_key: Optional API key for higher rate limits.
+
+    Example:
+        >>> async with AsyncSemanticScholarAdapter() as adapter:
+        ...     papers = await adapter.search("machine learning", limit=10)
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        rate_limit: float = 3.0,
+        api_key: str | None = None,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize async Semantic Scholar adapter.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_retries: Maximum retry attempts.
+            rate_limit: Minimum seconds between requests (default 3.0).
+            api_key: Optional API key for higher rate limits.
+            http2: Enable HTTP/2 (requires the optional h2 package).
+            max_connections: Maximum number of pooled connections.
+            max_keepalive_connections: Maximum number of idle keep-alive connections.
+            rate_limiter: Shared limiter to use instead of the default.
+            cache: Optional on-disk response cache.
+        """
+        self._parser = SemanticScholarAdapter(
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+            api_key=api_key,
+            rate_limiter=rate_limiter,
+        )
+        self._init_async_http_client(
+            timeout,
+            http2,
+            max_connections,
+            max_keepalive_connections,
+            rate_limit,
+            self._parser.rate_limiter,
+            cache,
+        )
+        self.max_retries = max_retries
+        self.api_key = api_key
+
+    async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        """Search Semantic Scholar for papers matching query without blocking.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+
+        Returns:
+            List of Paper entities from search results.
+
+        Raises:
+            ConnectionError: If unable to connect to Semantic Scholar.
+            TimeoutError: If request times out.
+        """
+        url = f"{SemanticScholarAdapter.BASE_URL}/paper/search"
+        params = self._parser._build_params(query, limit)
+        headers = self._parser._build_headers()
+
+        for attempt in range(self.max_retries):
+            try:
+                if not self._cache_fresh(url, params):
+                    await self._rate_limit_wait()
+                response = await self._get_async_client().get(url, params=params, headers=headers)
+                response.raise_for_status()
+                return self._parser._parse_response(response.json())
+            except httpx.TimeoutException:
+                if attempt == self.max_retries - 1:
+                    raise TimeoutError(
+                        f"Semantic Scholar request timed out after {self.max_retries} attempts"
+                    )
+                await asyncio.sleep(2**attempt)
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise ConnectionError(f"Semantic Scholar request failed: {e}") from e
+                await asyncio.sleep(await backoff_delay_async(e, attempt, self.rate_limiter))
+
+        return []
+
+    def get_service_name(self) -> str:
+        """Return service name."""
+        return "Semantic Scholar"
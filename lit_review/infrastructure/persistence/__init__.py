@@ -2,6 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 """Infrastructure persistence - storage implementations."""
 
+from lit_review.infrastructure.persistence.enrichment_checkpoint import (
+    JSONLinesEnrichmentCheckpoint,
+)
+from lit_review.infrastructure.persistence.ingest_checkpoint import JSONLinesIngestCheckpoint
 from lit_review.infrastructure.persistence.json_repository import JSONReviewRepository
+from lit_review.infrastructure.persistence.snowball_checkpoint import JSONLinesSnowballCheckpoint
 
-__all__ = ["JSONReviewRepository"]
+__all__ = [
+    "JSONReviewRepository",
+    "JSONLinesEnrichmentCheckpoint",
+    "JSONLinesIngestCheckpoint",
+    "JSONLinesSnowballCheckpoint",
+]
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""JSON Lines checkpoint for resumable enrichment runs.
+
+Implements the EnrichmentCheckpoint port as an append-only JSON Lines file
+with one line per completed batch.
+"""
+
+from pathlib import Path
+
+from lit_review.application.ports.enrichment_checkpoint import EnrichmentCheckpoint
+from lit_review.infrastructure.persistence.json_lines import append_json_line, read_json_lines
+
+
+class JSONLinesEnrichmentCheckpoint(EnrichmentCheckpoint):
+    """Append-only JSON Lines enrichment checkpoint.
+
+    Attributes:
+        path: Checkpoint file (created on the first record()).
+
+    Example:
+        >>> checkpoint = JSONLinesEnrichmentCheckpoint.for_review(data_dir, "ML Review")
+        >>> checkpoint.record("crossref", ["10.1234/a", "10.1234/b"])
+        >>> checkpoint.load()
+        {'crossref': {'10.1234/a', '10.1234/b'}}
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize checkpoint.
+
+        Args:
+            path: Checkpoint file path.
+        """
+        self.path = Path(path)
+
+    @classmethod
+    def for_review(cls, data_dir: Path, review_id: str) -> "JSONLinesEnrichmentCheckpoint":
+        """Create the checkpoint for a review under a data directory.
+
+        Args:
+            data_dir: Review data directory.
+            review_id: Review identifier.
+
+        Returns:
+            Checkpoint stored in ``data_dir/.checkpoints``.
+        """
+        safe_id = review_id.replace(" ", "_").replace("/", "_")
+        return cls(Path(data_dir) / ".checkpoints" / f"{safe_id}.enrich.jsonl")
+
+    def load(self) -> dict[str, set[str]]:
+        """Load completed lookups, ignoring a truncated last line.
+
+        Returns:
+            Mapping of database name to the DOIs it was already asked about.
+        """
+        done: dict[str, set[str]] = {}
+        for entry in read_json_lines(self.path):
+            done.setdefault(entry["database"], set()).update(entry["dois"])
+        return done
+
+    def record(self, database: str, dois: list[str]) -> None:
+        """Append one completed batch and flush it to disk.
+
+        Args:
+            database: Database name.
+            dois: DOIs looked up in the batch.
+        """
+        if dois:
+            append_json_line(self.path, {"database": database, "dois": dois})
+
+    def clear(self) -> None:
+        """Delete the checkpoint file."""
+        self.path.unlink(missing_ok=True)
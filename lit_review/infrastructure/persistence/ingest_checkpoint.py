@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""JSON Lines checkpoint for resumable bulk ingestion of dump files.
+
+One line is appended per dump file once all of its records are committed
+to the local corpus, so an interrupted ingestion resumes with the first
+unfinished file.
+"""
+
+from pathlib import Path
+
+from lit_review.infrastructure.persistence.json_lines import append_json_line, read_json_lines
+
+
+class JSONLinesIngestCheckpoint:
+    """Append-only record of completely ingested dump files.
+
+    Files are identified by name, size and modification time, so a dump
+    file replaced by a newer release is ingested again.
+
+    Attributes:
+        path: Checkpoint file (created on the first record()).
+
+    Example:
+        >>> checkpoint = JSONLinesIngestCheckpoint(data_dir / ".checkpoints" / "ingest.jsonl")
+        >>> checkpoint.record(Path("pubmed25n0001.xml.gz"), papers=29_871)
+        >>> checkpoint.is_done(Path("pubmed25n0001.xml.gz"))
+        True
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize checkpoint.
+
+        Args:
+            path: Checkpoint file path.
+        """
+        self.path = Path(path)
+        self._done: set[str] | None = None
+
+    @staticmethod
+    def file_key(file: Path) -> str:
+        """Identify a dump file by name, size and modification time.
+
+        Args:
+            file: Dump file.
+
+        Returns:
+            Key recorded in the checkpoint.
+        """
+        stat = file.stat()
+        return f"{file.name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def load(self) -> set[str]:
+        """Load the keys of completed files, ignoring a truncated last line.
+
+        Returns:
+            Keys of files already ingested.
+        """
+        return {entry["file"] for entry in read_json_lines(self.path)}
+
+    def is_done(self, file: Path) -> bool:
+        """Check whether a dump file was already ingested completely.
+
+        Args:
+            file: Dump file.
+
+        Returns:
+            True if the file is recorded with its current size and mtime.
+        """
+        if self._done is None:
+            self._done = self.load()
+        return self.file_key(file) in self._done
+
+    def record(self, file: Path, papers: int) -> None:
+        """Append one completed file and flush it to disk.
+
+        Args:
+            file: Dump file whose records are all committed.
+            papers: Papers converted from the file.
+        """
+        key = self.file_key(file)
+        append_json_line(self.path, {"file": key, "papers": papers})
+        if self._done is not None:
+            self._done.add(key)
+
+    def clear(self) -> None:
+        """Delete the checkpoint file."""
+        self.path.unlink(missing_ok=True)
+        self._done = None
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Durable append-only JSON Lines files for checkpoints.
+
+Each entry is one line appended and fsynced before returning, so recording
+progress never rewrites earlier entries and a crash can at worst truncate
+the last line, which readers skip.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+def append_json_line(path: Path, entry: dict[str, Any]) -> None:
+    """Append one JSON entry to a file and flush it to disk.
+
+    Args:
+        path: JSON Lines file (created with its directory if missing).
+        entry: JSON-serializable entry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(entry, ensure_ascii=False)
+    with open(path, "a+b") as f:
+        # Start a fresh line after a truncated one
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(line.encode("utf-8") + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_json_lines(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the entries of a JSON Lines file, skipping truncated lines.
+
+    Args:
+        path: JSON Lines file.
+
+    Yields:
+        Decoded entries in file order (nothing if the file is missing).
+    """
+    if not path.exists():
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Interrupted write
+                continue
+            if isinstance(entry, dict):
+                yield entry
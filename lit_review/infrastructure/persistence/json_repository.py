@@ -7,9 +7,12 @@ atomic writes, automatic backups, file locking, and soft delete.
 """
 
 import fcntl
+import gc
 import json
 import shutil
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -17,9 +20,26 @@ from typing import Any
 from lit_review.application.ports.paper_repository import PaperRepository
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review, ReviewStage
+from lit_review.domain.entities.saved_search import SavedSearch
 from lit_review.domain.exceptions import EntityNotFoundError
-from lit_review.domain.values.author import Author
-from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.local_corpus import LocalCorpusSearchService
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection, then restore its previous state.
+
+    None of the objects built while loading a review can be garbage, so
+    collecting cycles while creating hundreds of thousands of them only
+    costs time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
 
 class JSONReviewRepository(PaperRepository):
@@ -36,6 +56,11 @@ class JSONReviewRepository(PaperRepository):
         backup_dir: Directory for backup files.
         deleted_dir: Directory for soft-deleted files.
         max_backups: Maximum number of backups to retain (default 5).
+        corpus: Optional local corpus index updated with the papers of every
+            saved review.
+        validate_on_load: Whether loaded papers are re-validated. Papers are
+            validated when first created, so by default they are rebuilt
+            without checks.
 
     Example:
         >>> repo = JSONReviewRepository(Path("./data"))
@@ -43,12 +68,20 @@ class JSONReviewRepository(PaperRepository):
         >>> loaded = repo.load("my-review")
     """
 
-    def __init__(self, data_dir: Path, max_backups: int = 5) -> None:
+    def __init__(
+        self,
+        data_dir: Path,
+        max_backups: int = 5,
+        corpus: LocalCorpusSearchService | None = None,
+        validate_on_load: bool = False,
+    ) -> None:
         """Initialize repository.
 
         Args:
             data_dir: Directory for storing review files.
             max_backups: Maximum number of backups to retain per file.
+            corpus: Optional local corpus index to keep up to date on save.
+            validate_on_load: Re-validate papers of hand-edited review files.
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -60,6 +93,8 @@ class JSONReviewRepository(PaperRepository):
         self.deleted_dir.mkdir(exist_ok=True)
 
         self.max_backups = max_backups
+        self.corpus = corpus
+        self.validate_on_load = validate_on_load
 
     def _get_review_path(self, review_id: str) -> Path:
         """Get path to review JSON file.
@@ -74,11 +109,15 @@ class JSONReviewRepository(PaperRepository):
         safe_id = review_id.replace(" ", "_").replace("/", "_")
         return self.data_dir / f"{safe_id}.json"
 
-    def save(self, review: Review) -> None:
+    def save(self, review: Review, backup: bool = True) -> None:
         """Persist review to JSON file with atomic write and backup.
 
         Args:
             review: Review to save.
+            backup: Back up the previous version first. Pass False for
+                repeated incremental saves of the same change (e.g. while
+                search results stream in) so they don't rotate out older
+                backups.
 
         Raises:
             IOError: If unable to write file.
@@ -86,7 +125,7 @@ class JSONReviewRepository(PaperRepository):
         path = self._get_review_path(review.title)
 
         # Create backup if file exists
-        if path.exists():
+        if backup and path.exists():
             self._create_backup(path)
 
         # Serialize review
@@ -110,6 +149,25 @@ class JSONReviewRepository(PaperRepository):
                 temp_path.unlink()
             raise OSError(f"Failed to save review: {e}") from e
 
+        # Only new or changed papers are rewritten, so repeated saves are cheap
+        if self.corpus is not None:
+            self.corpus.index(review.papers)
+
+    def index_corpus(self) -> int:
+        """Index the papers of every stored review in the local corpus.
+
+        Backfills a corpus created after reviews were saved.
+
+        Returns:
+            Number of papers written to the corpus (new or changed).
+
+        Raises:
+            ValueError: If the repository has no corpus.
+        """
+        if self.corpus is None:
+            raise ValueError("Repository has no local corpus")
+        return sum(self.corpus.index(self.load(r).papers) for r in self.list_reviews())
+
     def _create_backup(self, path: Path) -> None:
         """Create timestamped backup of file.
 
@@ -154,6 +212,7 @@ class JSONReviewRepository(PaperRepository):
         Raises:
             EntityNotFoundError: If review not found.
             IOError: If unable to read file.
+            ValidationError: If validate_on_load is set and a paper is invalid.
         """
         path = self._get_review_path(review_id)
 
@@ -165,8 +224,9 @@ class JSONReviewRepository(PaperRepository):
                 # Acquire shared lock for reading
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
-                    data = json.load(f)
-                    return self._deserialize_review(data)
+                    with _gc_paused():
+                        data = json.load(f)
+                        return self._deserialize_review(data)
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         except json.JSONDecodeError as e:
@@ -239,6 +299,15 @@ class JSONReviewRepository(PaperRepository):
             "exclusion_criteria": review.exclusion_criteria,
             "stage": review.stage.value,
             "papers": [self._serialize_paper(p) for p in review.papers],
+            "saved_searches": [
+                {
+                    "query": s.query,
+                    "database": s.database,
+                    "limit": s.limit,
+                    "last_run": s.last_run.isoformat() if s.last_run else None,
+                }
+                for s in review.saved_searches
+            ],
         }
 
     def _serialize_paper(self, paper: Paper) -> dict[str, Any]:
@@ -286,50 +355,26 @@ class JSONReviewRepository(PaperRepository):
             inclusion_criteria=data["inclusion_criteria"],
             exclusion_criteria=data.get("exclusion_criteria", []),
             stage=ReviewStage(data.get("stage", "planning")),
+            saved_searches=[
+                SavedSearch(
+                    query=s["query"],
+                    database=s["database"],
+                    limit=s.get("limit", 100),
+                    last_run=datetime.fromisoformat(s["last_run"]) if s.get("last_run") else None,
+                )
+                for s in data.get("saved_searches", [])
+            ],
         )
 
-        # Add papers
-        for paper_data in data.get("papers", []):
-            paper = self._deserialize_paper(paper_data)
-            # Bypass stage check by directly adding to set
-            review.papers.add(paper)
+        # Papers were validated when first saved, so rebuild them in bulk
+        # without checks, and bypass the stage check of add_papers
+        papers = Paper.from_trusted_records(data.get("papers", []))
+        if self.validate_on_load:
+            Paper.validate_all(papers)
+        review.papers.update(papers)
 
         return review
 
-    def _deserialize_paper(self, data: dict[str, Any]) -> Paper:
-        """Deserialize dictionary to Paper.
-
-        Args:
-            data: Dictionary representation.
-
-        Returns:
-            Paper entity.
-        """
-        authors = [
-            Author(
-                last_name=a["last_name"],
-                first_name=a["first_name"],
-                initials=a["initials"],
-                orcid=a.get("orcid"),
-            )
-            for a in data["authors"]
-        ]
-
-        paper = Paper(
-            doi=DOI(data["doi"]),
-            title=data["title"],
-            authors=authors,
-            publication_year=data["publication_year"],
-            journal=data["journal"],
-            abstract=data.get("abstract", ""),
-            keywords=data.get("keywords", []),
-            quality_score=data.get("quality_score"),
-            included=data.get("included"),
-            assessment_notes=data.get("assessment_notes", ""),
-        )
-
-        return paper
-
     def recover_from_backup(self, review_id: str, backup_index: int = 0) -> Review:
         """Recover review from backup.
 
@@ -360,7 +405,8 @@ class JSONReviewRepository(PaperRepository):
         backup_path = backups[backup_index]
 
         try:
-            data = json.loads(backup_path.read_text(encoding="utf-8"))
-            return self._deserialize_review(data)
+            with _gc_paused():
+                data = json.loads(backup_path.read_text(encoding="utf-8"))
+                return self._deserialize_review(data)
         except json.JSONDecodeError as e:
             raise OSError(f"Invalid JSON in backup file: {e}") from e
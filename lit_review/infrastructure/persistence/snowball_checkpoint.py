@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""JSON Lines checkpoint for resumable snowballing runs.
+
+Implements the SnowballCheckpoint port as an append-only JSON Lines file: a
+"level" line stores each new frontier and a "node" line each expanded
+frontier paper, so loading only needs the entries after the last level line.
+"""
+
+from pathlib import Path
+
+from lit_review.application.ports.snowball_checkpoint import SnowballCheckpoint, SnowballProgress
+from lit_review.infrastructure.persistence.json_lines import append_json_line, read_json_lines
+
+
+class JSONLinesSnowballCheckpoint(SnowballCheckpoint):
+    """Append-only JSON Lines snowball checkpoint.
+
+    Attributes:
+        path: Checkpoint file (created on the first start_level()).
+
+    Example:
+        >>> checkpoint = JSONLinesSnowballCheckpoint.for_review(data_dir, "ML Review")
+        >>> checkpoint.start_level("both", 0, ["10.1234/seed"], seeds=["10.1234/seed"])
+        >>> checkpoint.record("10.1234/seed", ["10.1234/cited"])
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize checkpoint.
+
+        Args:
+            path: Checkpoint file path.
+        """
+        self.path = Path(path)
+
+    @classmethod
+    def for_review(cls, data_dir: Path, review_id: str) -> "JSONLinesSnowballCheckpoint":
+        """Create the checkpoint for a review under a data directory.
+
+        Args:
+            data_dir: Review data directory.
+            review_id: Review identifier.
+
+        Returns:
+            Checkpoint stored in ``data_dir/.checkpoints``.
+        """
+        safe_id = review_id.replace(" ", "_").replace("/", "_")
+        return cls(Path(data_dir) / ".checkpoints" / f"{safe_id}.snowball.jsonl")
+
+    def load(self) -> SnowballProgress | None:
+        """Load the last level started and its expanded papers.
+
+        Returns:
+            SnowballProgress, or None if no level was started.
+        """
+        progress: SnowballProgress | None = None
+        for entry in read_json_lines(self.path):
+            if "level" in entry:
+                progress = SnowballProgress(
+                    direction=entry["direction"],
+                    level=entry["level"],
+                    frontier=entry["frontier"],
+                    seeds=entry.get("seeds", []),
+                )
+            elif progress is not None and "node" in entry:
+                progress.expanded[entry["node"]] = entry["found"]
+        return progress
+
+    def start_level(
+        self, direction: str, level: int, frontier: list[str], seeds: list[str] | None = None
+    ) -> None:
+        """Append the frontier of a new level.
+
+        Args:
+            direction: Snowball direction of the run.
+            level: Zero-based level number.
+            frontier: DOIs to expand at this level.
+            seeds: Seed DOIs the run started from.
+        """
+        append_json_line(
+            self.path,
+            {"direction": direction, "level": level, "frontier": frontier, "seeds": seeds or []},
+        )
+
+    def record(self, doi: str, found: list[str]) -> None:
+        """Append one expanded frontier paper.
+
+        Args:
+            doi: Expanded frontier DOI.
+            found: New DOIs discovered through it.
+        """
+        append_json_line(self.path, {"node": doi, "found": found})
+
+    def clear(self) -> None:
+        """Delete the checkpoint file."""
+        self.path.unlink(missing_ok=True)
@@ -6,46 +6,201 @@ Provides Click commands for managing literature reviews including
 initialization, searching, assessment, and export.
 """
 
+import json
 import os
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
 
 import click
 
+from lit_review.application.ports.search_service import SearchService
+from lit_review.application.services.search_stats import SearchStatsCollector
 from lit_review.application.usecases.analyze_themes import AnalyzeThemesUseCase
+from lit_review.application.usecases.enrich_papers import EnrichPapersUseCase
 from lit_review.application.usecases.export_review import ExportFormat, ExportReviewUseCase
 from lit_review.application.usecases.generate_synthesis import GenerateSynthesisUseCase
-from lit_review.application.usecases.search_papers import SearchPapersUseCase
+from lit_review.application.usecases.search_papers import (
+    DEFAULT_START_YEAR,
+    SearchHit,
+    SearchPapersUseCase,
+)
+from lit_review.application.usecases.snowball_papers import (
+    SnowballDirection,
+    SnowballPapersUseCase,
+)
+from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review, ReviewStage
 from lit_review.domain.exceptions import EntityNotFoundError
+from lit_review.domain.services.deduplication import PaperDeduplicator
 from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.arxiv_adapter import ArxivAdapter
+from lit_review.infrastructure.adapters.bulk_ingest import (
+    BulkIngester,
+    DumpFormat,
+    FileIngestResult,
+)
 from lit_review.infrastructure.adapters.crossref_adapter import CrossrefAdapter
+from lit_review.infrastructure.adapters.local_corpus import LocalCorpusSearchService
+from lit_review.infrastructure.adapters.openalex_adapter import OpenAlexAdapter
+from lit_review.infrastructure.adapters.pubmed_adapter import PubMedAdapter
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
+from lit_review.infrastructure.adapters.semantic_scholar_adapter import SemanticScholarAdapter
+from lit_review.infrastructure.persistence.enrichment_checkpoint import (
+    JSONLinesEnrichmentCheckpoint,
+)
+from lit_review.infrastructure.persistence.ingest_checkpoint import JSONLinesIngestCheckpoint
 from lit_review.infrastructure.persistence.json_repository import JSONReviewRepository
+from lit_review.infrastructure.persistence.snowball_checkpoint import JSONLinesSnowballCheckpoint
 
 # Default data directory
 DEFAULT_DATA_DIR = Path.home() / ".lit_review"
 
+# Minimum seconds between incremental saves while search results stream in
+SEARCH_SAVE_INTERVAL = 2.0
+
+# Databases the search commands accept (see get_search_use_case)
+SEARCH_DATABASES = ["crossref", "openalex", "pubmed", "arxiv", "semantic-scholar", "local"]
+
+# Databases searched when none is named; the local corpus only holds papers
+# of stored reviews, so it is searched on request only
+ONLINE_DATABASES = [name for name in SEARCH_DATABASES if name != "local"]
+
+
+def get_data_dir() -> Path:
+    """Get the data directory.
+
+    Returns:
+        Directory from LIT_REVIEW_DATA_DIR, or the default.
+    """
+    return Path(os.environ.get("LIT_REVIEW_DATA_DIR", str(DEFAULT_DATA_DIR)))
+
 
 def get_repository() -> JSONReviewRepository:
     """Get repository instance.
 
     Returns:
-        Configured repository.
+        Configured repository, indexing saved papers in the local corpus.
     """
-    data_dir = Path(os.environ.get("LIT_REVIEW_DATA_DIR", str(DEFAULT_DATA_DIR)))
-    return JSONReviewRepository(data_dir)
+    return JSONReviewRepository(get_data_dir(), corpus=get_local_corpus())
 
 
-def get_search_use_case() -> SearchPapersUseCase:
-    """Get search use case with configured services.
+def get_local_corpus() -> LocalCorpusSearchService:
+    """Get the full-text index of every paper stored in a review.
+
+    Returns:
+        LocalCorpusSearchService stored under the data directory.
+    """
+    return LocalCorpusSearchService(get_data_dir() / "corpus.sqlite")
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the on-disk HTTP response cache shared by search adapters.
+
+    Returns:
+        ResponseCache stored under the data directory.
+    """
+    return ResponseCache(get_data_dir() / "cache" / "http.sqlite")
+
+
+def get_search_use_case(
+    cache: ResponseCache | None = None,
+    databases: list[str] | None = None,
+    corpus: LocalCorpusSearchService | None = None,
+) -> SearchPapersUseCase:
+    """Get search use case with services for the requested databases.
+
+    Only the requested databases' services are built, so a search does not
+    set up clients, rate limiters or corpus connections it never uses.
+    PubMed is only configured when NCBI_EMAIL is set.
+
+    Args:
+        cache: Optional response cache for the search adapters.
+        databases: Databases to configure (default: all SEARCH_DATABASES).
+        corpus: Local corpus to search, e.g. the repository's, so that one
+            connection serves both (default: a new one on the data directory).
 
     Returns:
         Configured SearchPapersUseCase.
     """
-    use_case = SearchPapersUseCase()
-    use_case.add_service("crossref", CrossrefAdapter())
+    factories: dict[str, Callable[[], SearchService]] = {
+        "crossref": lambda: CrossrefAdapter(cache=cache),
+        "openalex": lambda: OpenAlexAdapter(cache=cache),
+        "pubmed": lambda: PubMedAdapter(cache=cache),
+        "arxiv": lambda: ArxivAdapter(cache=cache),
+        "semantic-scholar": lambda: SemanticScholarAdapter(cache=cache),
+        "local": lambda: corpus if corpus is not None else get_local_corpus(),
+    }
+    if not os.environ.get("NCBI_EMAIL"):
+        del factories["pubmed"]
+
+    use_case = SearchPapersUseCase(deduplicator=PaperDeduplicator())
+    for name in databases or SEARCH_DATABASES:
+        if name in factories and name not in use_case.services:
+            use_case.add_service(name, factories[name]())
+    return use_case
+
+
+def _require_configured(use_case: SearchPapersUseCase, databases: list[str]) -> None:
+    """Exit with an error if a requested database has no configured service.
+
+    Args:
+        use_case: Search use case with its configured services.
+        databases: Requested database names.
+
+    Raises:
+        SystemExit: If a database is not configured.
+    """
+    for database in databases:
+        if database not in use_case.services:
+            hint = " Set NCBI_EMAIL to search PubMed." if database == "pubmed" else ""
+            click.echo(f"Error: Database '{database}' is not configured.{hint}", err=True)
+            raise SystemExit(1)
+
+
+def get_enrich_use_case(
+    cache: ResponseCache | None = None,
+    checkpoint: JSONLinesEnrichmentCheckpoint | None = None,
+) -> EnrichPapersUseCase:
+    """Get enrichment use case with its database cascade.
+
+    OpenAlex is asked first (50 DOIs per request at 10 requests/second),
+    then Semantic Scholar's paper batch endpoint, PubMed (when NCBI_EMAIL
+    is set) and finally Crossref.
+
+    Args:
+        cache: Optional response cache for the adapters.
+        checkpoint: Optional checkpoint for resuming interrupted runs.
+
+    Returns:
+        Configured EnrichPapersUseCase.
+    """
+    use_case = EnrichPapersUseCase(checkpoint=checkpoint)
+    use_case.add_service("openalex", OpenAlexAdapter(cache=cache))
+    use_case.add_service("semantic-scholar", SemanticScholarAdapter(cache=cache))
+    if os.environ.get("NCBI_EMAIL"):
+        use_case.add_service("pubmed", PubMedAdapter(cache=cache))
+    use_case.add_service("crossref", CrossrefAdapter(cache=cache))
     return use_case
 
 
+def get_snowball_use_case(
+    cache: ResponseCache | None = None,
+    checkpoint: JSONLinesSnowballCheckpoint | None = None,
+) -> SnowballPapersUseCase:
+    """Get snowballing use case backed by the Semantic Scholar citation graph.
+
+    Args:
+        cache: Optional response cache for the adapter.
+        checkpoint: Optional checkpoint for resuming interrupted runs.
+
+    Returns:
+        Configured SnowballPapersUseCase.
+    """
+    return SnowballPapersUseCase(graph=SemanticScholarAdapter(cache=cache), checkpoint=checkpoint)
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="academic-review")
 def review() -> None:
@@ -105,20 +260,68 @@ def init(title: str, question: str, include: tuple[str, ...], exclude: tuple[str
 @click.option(
     "-d",
     "--database",
-    type=click.Choice(["crossref", "pubmed", "arxiv"]),
+    type=click.Choice(SEARCH_DATABASES),
     default="crossref",
     help="Database to search",
 )
 @click.option("-k", "--keywords", required=True, help="Search keywords")
 @click.option("-l", "--limit", default=20, help="Maximum results")
-def search(title: str, database: str, keywords: str, limit: int) -> None:
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+@click.option(
+    "--stubs",
+    is_flag=True,
+    help="Fetch only DOI, title, authors, year and venue (run 'hydrate' after screening)",
+)
+@click.option(
+    "--partition",
+    is_flag=True,
+    help="Split the query by publication date when the database caps results",
+)
+@click.option(
+    "--start-year",
+    type=int,
+    default=DEFAULT_START_YEAR,
+    show_default=True,
+    help="First publication year searched with --partition",
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    help="Print request, retry, rate-limit and parse statistics per database",
+)
+@click.option(
+    "--stats-json",
+    type=click.Path(dir_okay=False),
+    help="Write the per-database statistics as JSON to this file",
+)
+def search(
+    title: str,
+    database: str,
+    keywords: str,
+    limit: int,
+    no_cache: bool,
+    stubs: bool,
+    partition: bool,
+    start_year: int,
+    show_stats: bool,
+    stats_json: str | None,
+) -> None:
     """Search academic databases for papers.
 
     Searches the specified database and adds results to the review.
-    Review must be in SEARCH stage or later.
+    Review must be in SEARCH stage or later. The search is saved on the
+    review so that ``update`` can later fetch only newer records. With
+    --stubs, abstracts are skipped; ``hydrate`` fetches them later for the
+    papers that survive title screening. With --partition, a limit above
+    the database's result cap (PubMed 10,000, arXiv and Semantic Scholar
+    100) is reached by searching disjoint publication-date ranges. --stats
+    breaks the search time down into network, rate-limit sleeps, retries
+    and parsing. ``-d pubmed`` needs NCBI_EMAIL. ``-d local`` searches,
+    offline, every paper previously stored in any review (see ``index``).
 
     Example:
-        academic-review search "ML Healthcare" -d crossref -k "machine learning diagnosis"
+        academic-review search "ML Healthcare" -d pubmed -k "sepsis" -l 50000 --partition
     """
     repo = get_repository()
 
@@ -144,36 +347,83 @@ def search(title: str, database: str, keywords: str, limit: int) -> None:
     click.echo(f"Limit: {limit}")
     click.echo("")
 
-    use_case = get_search_use_case()
-    papers = []
+    cache = None if no_cache else get_response_cache()
+    use_case = get_search_use_case(cache, [database], corpus=repo.corpus)
+    _require_configured(use_case, [database])
+    search_stats = use_case.enable_stats() if show_stats or stats_json else None
+    deduplicator = PaperDeduplicator()
+    if partition:
+        _search_partitioned(
+            repo, review_obj, use_case, deduplicator, database, keywords, limit, start_year
+        )
+        _report_stats(search_stats, show_stats, stats_json)
+        return
 
+    papers: list[Paper] = []
+    new_papers: list[Paper] = []
+    merged = 0
+    saved = False
+    completed = False
+    searched: set[str] = set()
+    started = datetime.now(UTC)
+    last_save = time.monotonic()
+
+    # Stream results: progress reflects papers actually received, and the
+    # review is saved periodically so an interrupted search keeps its results
     with click.progressbar(
         length=limit,
         label=f"Searching {database}",
         show_percent=True,
     ) as bar:
         try:
-            # Simulate progress updates during search
-            bar.update(limit // 4)
-            papers = use_case.execute(keywords, databases=[database], limit=limit)
-            bar.update(limit - (limit // 4))
+            for source, batch in use_case.execute_stream(
+                keywords, databases=[database], limit=limit, stubs=stubs, completed=searched
+            ):
+                papers.extend(batch)
+                new_papers.extend(_add_new_papers(review_obj, batch))
+                bar.label = f"Searching {source} ({len(papers)} found)"
+                bar.update(len(batch))
+
+                if time.monotonic() - last_save >= SEARCH_SAVE_INTERVAL:
+                    repo.save(review_obj, backup=not saved)
+                    saved = True
+                    last_save = time.monotonic()
+
+            # Streamed batches are deduplicated by DOI only; merge records of
+            # the same work found under different DOIs (preprints, PubMed)
+            if papers:
+                merged = review_obj.merge_duplicates(deduplicator, new=new_papers)
+            # Only a search that ran to the end advances the watermark, so
+            # update does not skip records a failed search never fetched
+            saved_search = review_obj.save_search(keywords, database, limit)
+            if database in searched:
+                saved_search.record_run(started)
+            completed = True
         except (ConnectionError, TimeoutError) as e:
             click.echo(f"\nError: Search failed - {e}", err=True)
             raise SystemExit(1)
+        finally:
+            if papers or completed:
+                repo.save(review_obj, backup=not saved)
+
+    if database not in searched:
+        click.echo(f"Warning: {database} search did not complete; results are partial.", err=True)
 
     if not papers:
         click.echo("No papers found.")
+        _report_stats(search_stats, show_stats, stats_json)
         return
 
     click.echo(f"\n{database}: Found {len(papers)} papers")
+    if cache is not None:
+        stats = cache.stats
+        click.echo(
+            f"Cache: {stats.hits} hits, {stats.revalidations} revalidated, {stats.misses} misses"
+        )
 
-    # Add papers to review with deduplication
-    click.echo("\nDeduplicating papers...")
-    added = review_obj.add_papers(papers)
+    added = len(new_papers) - merged
     duplicates = len(papers) - added
 
-    repo.save(review_obj)
-
     # Display results
     click.echo("\n=== Search Results ===")
     click.echo(f"Papers found: {len(papers)}")
@@ -184,6 +434,431 @@ def search(title: str, database: str, keywords: str, limit: int) -> None:
     if duplicates > 0:
         click.echo(f"\nDeduplication rate: {(duplicates / len(papers) * 100):.1f}%")
 
+    _report_stats(search_stats, show_stats, stats_json)
+
+
+def _report_stats(
+    stats: SearchStatsCollector | None, show_stats: bool, stats_json: str | None
+) -> None:
+    """Print and/or save the per-database search statistics.
+
+    Args:
+        stats: Collector of the search (None if statistics were not requested).
+        show_stats: Print a summary per database.
+        stats_json: File to write the statistics to as JSON.
+    """
+    if stats is None:
+        return
+
+    if stats_json:
+        Path(stats_json).write_text(json.dumps(stats.to_dict(), indent=2) + "\n")
+
+    if not show_stats:
+        return
+
+    click.echo("\n=== Search Statistics ===")
+    for name, db in stats.summary().items():
+        click.echo(name)
+        click.echo(
+            f"  Requests: {db.requests} ({db.failed_requests} failed), "
+            f"{db.bytes_received / 1024:.1f} KiB in {db.request_seconds:.2f}s"
+        )
+        click.echo(f"  Rate-limit sleeps: {db.rate_limit_sleeps} ({db.rate_limit_seconds:.2f}s)")
+        click.echo(f"  Retries: {db.retries} ({db.retry_seconds:.2f}s backoff)")
+        click.echo(
+            f"  Parsing: {db.parse_seconds:.2f}s, "
+            f"{db.papers_produced} papers, {db.papers_dropped} dropped"
+        )
+
+
+def _add_new_papers(review_obj: Review, papers: list[Paper]) -> list[Paper]:
+    """Add papers to the review and return those whose DOI it did not have.
+
+    Args:
+        review_obj: Review receiving the papers.
+        papers: Papers found by a search.
+
+    Returns:
+        The papers added, one per DOI.
+    """
+    new_papers: dict[DOI, Paper] = {}
+    for paper in papers:
+        if paper not in review_obj.papers:
+            new_papers.setdefault(paper.doi, paper)
+    review_obj.add_papers(list(new_papers.values()))
+    return list(new_papers.values())
+
+
+def _search_partitioned(
+    repo: JSONReviewRepository,
+    review_obj: Review,
+    use_case: SearchPapersUseCase,
+    deduplicator: PaperDeduplicator,
+    database: str,
+    keywords: str,
+    limit: int,
+    start_year: int,
+) -> None:
+    """Run a date-partitioned search and add its results to the review.
+
+    Args:
+        repo: Repository the review is saved to.
+        review_obj: Review receiving the papers.
+        use_case: Search use case with the database configured.
+        deduplicator: Deduplicator merging the results into the review.
+        database: Database name.
+        keywords: Search keywords.
+        limit: Results wanted.
+        start_year: First publication year searched.
+    """
+    started = datetime.now(UTC)
+    result = use_case.execute_partitioned(
+        keywords, databases=[database], limit=limit, start_year=start_year
+    )
+    if result.failed:
+        click.echo(f"Warning: {database} failed for some partitions", err=True)
+
+    new_papers = _add_new_papers(review_obj, result.papers)
+    added = len(new_papers) - review_obj.merge_duplicates(deduplicator, new=new_papers)
+    saved_search = review_obj.save_search(keywords, database, limit)
+    if not result.failed:
+        saved_search.record_run(started)
+    repo.save(review_obj)
+
+    parts = result.partitions.get(SearchHit(keywords, database))
+    if parts:
+        click.echo(f"Partitions: {len(parts)} ({', '.join(str(part) for part in parts)})")
+    click.echo("\n=== Search Results ===")
+    click.echo(f"Papers found: {len(result.papers)}")
+    click.echo(f"New papers added: {added}")
+    click.echo(f"Total papers in review: {len(review_obj.papers)}")
+
+
+@review.command("search-batch")
+@click.argument("title")
+@click.argument("queries_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-d",
+    "--database",
+    "databases",
+    type=click.Choice(SEARCH_DATABASES),
+    multiple=True,
+    help="Database to search (can specify multiple; default: all configured except local)",
+)
+@click.option("-l", "--limit", default=20, help="Maximum results per query and database")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+def search_batch(
+    title: str, queries_file: str, databases: tuple[str, ...], limit: int, no_cache: bool
+) -> None:
+    """Run every query variant in QUERIES_FILE as one batch search.
+
+    QUERIES_FILE holds one query per line (blank lines and lines starting
+    with # are ignored). All query x database pairs share one scheduler, so
+    rate-limit waits on one database overlap with work on the others.
+    Without -d every configured database except ``local`` is searched, and
+    each query is saved for ``update`` once per database searched.
+
+    Example:
+        academic-review search-batch "ML Healthcare" queries.txt -d crossref -d pubmed
+    """
+    repo = get_repository()
+
+    try:
+        review_obj = repo.load(title)
+    except EntityNotFoundError:
+        click.echo(f"Error: Review '{title}' not found.", err=True)
+        raise SystemExit(1)
+
+    if review_obj.stage == ReviewStage.PLANNING:
+        review_obj.advance_stage()
+        click.echo("Advanced review to SEARCH stage.")
+
+    if not review_obj.can_add_papers():
+        click.echo(f"Error: Cannot add papers in {review_obj.stage.value} stage.", err=True)
+        raise SystemExit(1)
+
+    lines = Path(queries_file).read_text(encoding="utf-8").splitlines()
+    queries = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+    if not queries:
+        click.echo("Error: No queries found in file.", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"\n=== Batch Search: {len(queries)} queries ===")
+    cache = None if no_cache else get_response_cache()
+    use_case = get_search_use_case(cache, list(databases) or ONLINE_DATABASES, corpus=repo.corpus)
+    deduplicator = PaperDeduplicator()
+    searched = list(databases) or list(use_case.services)
+    _require_configured(use_case, searched)
+    started = datetime.now(UTC)
+    result = use_case.execute_batch(queries, databases=searched, limit=limit)
+
+    new_papers = _add_new_papers(review_obj, result.papers)
+    added = len(new_papers) - review_obj.merge_duplicates(deduplicator, new=new_papers)
+    # Watermark only the (query, database) pairs that ran and succeeded
+    failed = set(result.failed)
+    for query in queries:
+        for database in searched:
+            saved_search = review_obj.save_search(query, database, limit)
+            if SearchHit(query, database) not in failed:
+                saved_search.record_run(started)
+    repo.save(review_obj)
+
+    click.echo("\n=== Results by Query ===")
+    counts = result.papers_by_query()
+    for query in queries:
+        click.echo(f"  {counts.get(query, 0):5d}  {query}")
+    for hit in result.failed:
+        click.echo(f"Warning: {hit.database} failed for query: {hit.query}", err=True)
+
+    click.echo(f"\nUnique papers found: {len(result.papers)}")
+    click.echo(f"New papers added: {added}")
+    click.echo(f"Total papers in review: {len(review_obj.papers)}")
+
+
+@review.command()
+@click.argument("title")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+def hydrate(title: str, no_cache: bool) -> None:
+    """Fetch abstracts and keywords for papers found with --stubs.
+
+    Only papers without an abstract that have not been excluded are
+    hydrated, in batched requests.
+
+    Example:
+        academic-review hydrate "ML Healthcare"
+    """
+    repo = get_repository()
+
+    try:
+        review_obj = repo.load(title)
+    except EntityNotFoundError:
+        click.echo(f"Error: Review '{title}' not found.", err=True)
+        raise SystemExit(1)
+
+    pending = [p for p in review_obj.papers if not p.abstract and p.included is not False]
+    if not pending:
+        click.echo("No papers need hydrating.")
+        return
+
+    click.echo(f"Hydrating {len(pending)} papers...")
+    cache = None if no_cache else get_response_cache()
+    use_case = get_search_use_case(cache, ONLINE_DATABASES)
+    hydrated = use_case.hydrate(pending)
+    if hydrated:
+        repo.save(review_obj)
+
+    click.echo(f"Papers hydrated: {len(hydrated)}")
+    click.echo(f"Still without abstract: {sum(1 for p in pending if not p.abstract)}")
+
+
+@review.command()
+@click.argument("title")
+@click.option(
+    "-d",
+    "--database",
+    "databases",
+    multiple=True,
+    type=click.Choice(["openalex", "semantic-scholar", "pubmed", "crossref"]),
+    help="Database to ask, in order (default: all available)",
+)
+@click.option("--restart", is_flag=True, help="Discard the checkpoint of an interrupted run")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+def enrich(title: str, databases: tuple[str, ...], restart: bool, no_cache: bool) -> None:
+    """Fill missing abstracts, keywords and authors with batched DOI lookups.
+
+    Papers still incomplete after one database are passed on to the next.
+    Progress is checkpointed, so re-running an interrupted enrichment skips
+    the lookups that already completed.
+
+    Example:
+        academic-review enrich "ML Healthcare"
+    """
+    repo = get_repository()
+
+    try:
+        review_obj = repo.load(title)
+    except EntityNotFoundError:
+        click.echo(f"Error: Review '{title}' not found.", err=True)
+        raise SystemExit(1)
+
+    checkpoint = JSONLinesEnrichmentCheckpoint.for_review(get_data_dir(), review_obj.title)
+    if restart:
+        checkpoint.clear()
+
+    pending = sum(1 for p in review_obj.papers if p.is_incomplete() and p.included is not False)
+    if not pending:
+        click.echo("No papers need enriching.")
+        return
+
+    click.echo(f"Enriching {pending} papers...")
+    cache = None if no_cache else get_response_cache()
+    use_case = get_enrich_use_case(cache, checkpoint)
+    result = use_case.execute(
+        review_obj,
+        databases=list(databases) or None,
+        on_checkpoint=lambda: repo.save(review_obj, backup=False),
+    )
+    repo.save(review_obj)
+
+    for name, count in result.failed.items():
+        click.echo(f"Warning: {name} lookups failed for {count} papers", err=True)
+    if result.skipped:
+        click.echo(f"Lookups skipped (checkpoint): {result.skipped}")
+    click.echo(f"Papers enriched: {len(result.enriched)}")
+    click.echo(f"Still incomplete: {len(result.incomplete)}")
+    with_abstract = sum(1 for p in review_obj.papers if p.abstract)
+    click.echo(f"Papers with abstracts: {with_abstract}/{len(review_obj.papers)}")
+
+
+@review.command()
+@click.argument("title")
+@click.option("-s", "--seed", "seeds", multiple=True, help="Seed DOI (default: included papers)")
+@click.option("--depth", default=1, type=click.IntRange(1, 5), help="Citation levels to expand")
+@click.option(
+    "--direction",
+    default=SnowballDirection.BOTH.value,
+    type=click.Choice([d.value for d in SnowballDirection]),
+    help="Follow references (backward), citations (forward) or both",
+)
+@click.option(
+    "--limit-per-paper",
+    default=1000,
+    type=click.IntRange(1),
+    help="Maximum references or citations per paper",
+)
+@click.option("--restart", is_flag=True, help="Discard the checkpoint of an interrupted run")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+def snowball(
+    title: str,
+    seeds: tuple[str, ...],
+    depth: int,
+    direction: str,
+    limit_per_paper: int,
+    restart: bool,
+    no_cache: bool,
+) -> None:
+    """Add papers linked to the seeds by references and citations.
+
+    Expands the seed papers breadth-first through Semantic Scholar's
+    references and citations endpoints. Papers already in the review are
+    not expanded again. Progress is checkpointed, so re-running an
+    interrupted snowball with the same seeds and direction resumes at the
+    level it reached; a run with other seeds starts over.
+
+    Example:
+        academic-review snowball "ML Healthcare" --depth 2 --direction backward
+    """
+    repo = get_repository()
+
+    try:
+        review_obj = repo.load(title)
+    except EntityNotFoundError:
+        click.echo(f"Error: Review '{title}' not found.", err=True)
+        raise SystemExit(1)
+
+    if not review_obj.can_add_papers():
+        click.echo(f"Error: Cannot add papers in {review_obj.stage.value} stage.", err=True)
+        raise SystemExit(1)
+
+    seed_dois = list(seeds) or [p.doi.value for p in review_obj.papers if p.included is True]
+    if not seed_dois:
+        click.echo("Error: No seed papers. Include papers with 'assess' or pass --seed.", err=True)
+        raise SystemExit(1)
+
+    checkpoint = JSONLinesSnowballCheckpoint.for_review(get_data_dir(), review_obj.title)
+    if restart:
+        checkpoint.clear()
+
+    def save_found(papers: list[Paper]) -> None:
+        review_obj.add_papers(papers)
+        repo.save(review_obj, backup=False)
+
+    click.echo(f"Snowballing from {len(seed_dois)} seed papers ({direction}, depth {depth})...")
+    cache = None if no_cache else get_response_cache()
+    use_case = get_snowball_use_case(cache, checkpoint)
+    use_case.limit_per_paper = limit_per_paper
+    deduplicator = PaperDeduplicator()
+    result = use_case.execute(
+        seed_dois,
+        depth=depth,
+        direction=SnowballDirection(direction),
+        known={p.doi.value for p in review_obj.papers},
+        on_checkpoint=save_found,
+    )
+    # Snowballed papers are new to the review (known papers are skipped)
+    review_obj.add_papers(result.papers)
+    added = len(result.papers) - review_obj.merge_duplicates(deduplicator, new=result.papers)
+    repo.save(review_obj)
+
+    if result.discarded:
+        click.echo(
+            "Warning: Discarded the checkpoint of an earlier snowball with other seeds "
+            "or another direction",
+            err=True,
+        )
+    if result.failed:
+        click.echo(
+            f"Warning: Lookups failed for {len(result.failed)} papers; "
+            "run snowball again with the same seeds and direction to retry them",
+            err=True,
+        )
+    if result.skipped:
+        click.echo(f"Lookups skipped (checkpoint): {result.skipped}")
+    click.echo(f"Levels expanded: {result.levels}")
+    click.echo(f"Papers added: {added}")
+
+
+@review.command()
+@click.argument("title")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk response cache")
+def update(title: str, no_cache: bool) -> None:
+    """Re-run the review's saved searches, fetching only new records.
+
+    Each saved search asks its database only for records added since its
+    last successful run. Failed searches keep their watermark and are
+    retried over the same window by the next update.
+
+    Example:
+        academic-review update "ML Healthcare"
+    """
+    repo = get_repository()
+
+    try:
+        review_obj = repo.load(title)
+    except EntityNotFoundError:
+        click.echo(f"Error: Review '{title}' not found.", err=True)
+        raise SystemExit(1)
+
+    if not review_obj.saved_searches:
+        click.echo("Error: Review has no saved searches. Run 'search' first.", err=True)
+        raise SystemExit(1)
+
+    if not review_obj.can_add_papers():
+        click.echo(f"Error: Cannot add papers in {review_obj.stage.value} stage.", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"\n=== Updating {len(review_obj.saved_searches)} saved searches ===")
+    for saved in review_obj.saved_searches:
+        since = saved.since.isoformat() if saved.since else "never run"
+        click.echo(f"  {saved.database:10s} since {since:10s}  {saved.query}")
+
+    cache = None if no_cache else get_response_cache()
+    databases = list(dict.fromkeys(saved.database for saved in review_obj.saved_searches))
+    use_case = get_search_use_case(cache, databases, corpus=repo.corpus)
+    deduplicator = PaperDeduplicator()
+    result = use_case.execute_saved(review_obj.saved_searches)
+
+    new_papers = _add_new_papers(review_obj, result.papers)
+    added = len(new_papers) - review_obj.merge_duplicates(deduplicator, new=new_papers)
+    repo.save(review_obj)
+
+    for hit in result.failed:
+        click.echo(f"Warning: {hit.database} failed for query: {hit.query}", err=True)
+
+    click.echo(f"\nNew records fetched: {len(result.papers)}")
+    click.echo(f"New papers added: {added}")
+    click.echo(f"Total papers in review: {len(review_obj.papers)}")
+
 
 @review.command()
 @click.argument("title")
@@ -218,6 +893,9 @@ def status(title: str) -> None:
 
     if stats["assessed_papers"] > 0:
         click.echo(f"  Inclusion Rate: {stats['inclusion_rate']:.1%}")
+    if stats["papers_by_year"]:
+        by_year = ", ".join(f"{year}: {n}" for year, n in stats["papers_by_year"].items())
+        click.echo(f"  By Year: {by_year}")
 
     click.echo("")
     click.echo("Criteria:")
@@ -367,6 +1045,81 @@ def export_cmd(
         click.echo(f"  {fmt:10s} | {count:3d} papers | {size_kb:7.1f} KB | {file_path}")
 
 
+@review.command()
+def index() -> None:
+    """Index the papers of all reviews in the local corpus.
+
+    Papers are indexed automatically whenever a review is saved; run this
+    once to add reviews saved before the local corpus existed. Search the
+    corpus with ``search -d local``.
+
+    Example:
+        academic-review index
+    """
+    repo = get_repository()
+    written = repo.index_corpus()
+    total = len(repo.corpus) if repo.corpus is not None else 0
+    click.echo(f"Indexed {written} new or changed papers ({total} in local corpus).")
+
+
+@review.command()
+@click.argument(
+    "files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "-f",
+    "--format",
+    "dump_format",
+    type=click.Choice([f.value for f in DumpFormat]),
+    help="Dump format (default: detected from each file name)",
+)
+@click.option(
+    "-w", "--workers", type=click.IntRange(min=1), help="Worker processes (default: CPUs)"
+)
+@click.option("--restart", is_flag=True, help="Re-ingest files completed by an earlier run")
+def ingest(
+    files: tuple[Path, ...], dump_format: str | None, workers: int | None, restart: bool
+) -> None:
+    """Mirror PubMed baseline or Crossref snapshot dumps into the local corpus.
+
+    FILES are PubMed baseline ``.xml.gz`` files or Crossref JSON Lines
+    snapshots (``.jsonl`` / ``.jsonl.gz``). Files are parsed in parallel,
+    and completed files are checkpointed: an interrupted run resumes with
+    the unfinished files. Search the mirror with ``search -d local``.
+
+    Example:
+        academic-review ingest baseline/pubmed25n*.xml.gz --workers 8
+    """
+    checkpoint = JSONLinesIngestCheckpoint(get_data_dir() / ".checkpoints" / "ingest.jsonl")
+    if restart:
+        checkpoint.clear()
+
+    ingester = BulkIngester(get_local_corpus().path, workers=workers, checkpoint=checkpoint)
+
+    def report_file(result: FileIngestResult) -> None:
+        if result.skipped:
+            click.echo(f"  {result.file.name}: already ingested")
+        else:
+            click.echo(
+                f"  {result.file.name}: {result.papers} papers, {result.dropped} dropped, "
+                f"{result.written} new or changed ({result.seconds:.1f}s)"
+            )
+
+    click.echo(f"\n=== Ingesting {len(files)} dump files ===")
+    try:
+        report = ingester.ingest(
+            files,
+            dump_format=DumpFormat(dump_format) if dump_format else None,
+            on_file=report_file,
+        )
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"\nPapers: {report.papers} ({report.written} new or changed)")
+    click.echo(f"Throughput: {report.papers_per_hour:,.0f} papers/hour")
+
+
 @review.command("list")
 def list_cmd() -> None:
     """List all reviews.
@@ -468,7 +1221,7 @@ def assess(
                         errors += 1
                         continue
 
-                    paper.assess(paper_score, paper_include, paper_notes)
+                    review_obj.assess_paper(paper.doi, paper_score, paper_include, paper_notes)
                     assessments_made += 1
                 except (KeyError, ValueError) as e:
                     click.echo(f"Warning: Invalid row - {e}", err=True)
@@ -510,7 +1263,7 @@ def assess(
         click.echo("")
 
         # Assess paper
-        paper.assess(score, include, notes)
+        review_obj.assess_paper(paper.doi, score, include, notes)
         repo.save(review_obj)
 
         click.echo(f"Assessed: {paper.title}")
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for CircuitBreaker."""
+
+import pytest
+
+from lit_review.application.services.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a fake clock starting at zero."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Return a breaker opening after two failures for ten seconds."""
+    return CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Threshold and reset timeout are validated."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(reset_timeout=-1)
+
+    def test_opens_after_consecutive_failures(self, breaker: CircuitBreaker) -> None:
+        """The circuit opens once failures reach the threshold."""
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, breaker: CircuitBreaker) -> None:
+        """Failures must be consecutive to open the circuit."""
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_trial(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        """After the reset timeout exactly one trial request is let through."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10.0
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+    def test_successful_trial_closes_circuit(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """A successful half-open trial closes the circuit."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_trial_reopens_circuit(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        """A failed half-open trial re-opens the circuit for another timeout."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 19.0
+        assert not breaker.allow_request()
+        clock.now = 20.0
+        assert breaker.allow_request()
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for LatencyHistogram."""
+
+import pytest
+
+from lit_review.application.services.latency_tracker import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_rejects_invalid_window(self) -> None:
+        """The window must hold at least one sample."""
+        with pytest.raises(ValueError):
+            LatencyHistogram(window=0)
+
+    def test_percentile_nearest_rank(self) -> None:
+        """Percentiles use the nearest-rank method."""
+        histogram = LatencyHistogram()
+        for seconds in range(1, 21):
+            histogram.record(seconds / 10)
+
+        assert histogram.percentile(50) == pytest.approx(1.0)
+        assert histogram.percentile(95) == pytest.approx(1.9)
+        assert histogram.percentile(100) == pytest.approx(2.0)
+
+    def test_percentile_without_samples(self) -> None:
+        """An empty histogram has no percentiles."""
+        assert LatencyHistogram().percentile(95) is None
+
+    def test_window_keeps_recent_samples(self) -> None:
+        """Old samples fall out of the rolling window."""
+        histogram = LatencyHistogram(window=3)
+        for seconds in [10.0, 0.1, 0.2, 0.3]:
+            histogram.record(seconds)
+
+        assert len(histogram) == 3
+        assert histogram.percentile(100) == pytest.approx(0.3)
+
+    def test_adaptive_timeout_uses_default_until_enough_samples(self) -> None:
+        """Few samples fall back to the default timeout."""
+        histogram = LatencyHistogram()
+        histogram.record(0.5)
+
+        assert histogram.adaptive_timeout(30.0, min_samples=5) == 30.0
+
+    def test_adaptive_timeout_is_clamped(self) -> None:
+        """The timeout is p95 x multiplier within [minimum, default]."""
+        fast = LatencyHistogram()
+        slow = LatencyHistogram()
+        for _ in range(10):
+            fast.record(0.1)
+            slow.record(20.0)
+        medium = LatencyHistogram()
+        for _ in range(10):
+            medium.record(2.0)
+
+        assert fast.adaptive_timeout(30.0, multiplier=3.0, minimum=1.0) == 1.0
+        assert medium.adaptive_timeout(30.0, multiplier=3.0, minimum=1.0) == pytest.approx(6.0)
+        assert slow.adaptive_timeout(30.0, multiplier=3.0, minimum=1.0) == 30.0
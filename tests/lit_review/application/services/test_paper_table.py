@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for PaperTable."""
+
+import numpy as np
+import pytest
+
+from lit_review.application.services.paper_table import (
+    EXCLUDED,
+    INCLUDED,
+    UNDECIDED,
+    PaperTable,
+)
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.review import Review
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+
+SMITH = Author("Smith", "John", "J.")
+DOE = Author("Doe", "Jane", "J.", "0000-0002-1825-0097")
+
+
+def create_paper(
+    doi_suffix: str,
+    year: int = 2020,
+    journal: str = "Journal A",
+    score: float | None = None,
+    include: bool | None = None,
+    authors: list[Author] | None = None,
+    keywords: list[str] | None = None,
+) -> Paper:
+    """Helper to create a test paper."""
+    paper = Paper(
+        doi=DOI(f"10.1234/{doi_suffix}"),
+        title=f"Paper {doi_suffix}",
+        authors=authors or [SMITH],
+        publication_year=year,
+        journal=journal,
+        abstract=f"Abstract {doi_suffix}",
+        keywords=keywords or [],
+    )
+    if score is not None and include is not None:
+        paper.assess(score, include, notes=f"notes {doi_suffix}")
+    return paper
+
+
+@pytest.fixture
+def papers() -> list[Paper]:
+    """Papers across years, journals and decisions."""
+    return [
+        create_paper("a", 2019, "Journal A", 8.0, True, [SMITH, DOE], ["sepsis", "icu"]),
+        create_paper("b", 2019, "Journal B", 3.0, False, [DOE], ["icu"]),
+        create_paper("c", 2020, "Journal A", 9.5, True),
+        create_paper("d", 2020, "Journal A", 1.0, False),
+        create_paper("e", 2021, "Journal B"),
+    ]
+
+
+@pytest.fixture
+def table(papers: list[Paper]) -> PaperTable:
+    """Table of the papers fixture."""
+    return PaperTable.from_papers(papers)
+
+
+class TestPaperTableConversion:
+    """Tests for converting between papers, reviews and tables."""
+
+    def test_columns(self, table: PaperTable) -> None:
+        """Numeric columns and dictionaries are encoded per row."""
+        assert len(table) == 5
+        assert table.years.tolist() == [2019, 2019, 2020, 2020, 2021]
+        assert table.included.tolist() == [INCLUDED, EXCLUDED, INCLUDED, EXCLUDED, UNDECIDED]
+        assert np.isnan(table.scores[4])
+        assert table.journals == ["Journal A", "Journal B"]
+        assert table.journal_codes.tolist() == [0, 1, 0, 0, 1]
+        assert table.authors == [SMITH, DOE]
+        assert table.author_codes.tolist() == [0, 1, 1, 0, 0, 0]
+        assert table.author_offsets.tolist() == [0, 2, 3, 4, 5, 6]
+        assert table.keywords == ["sepsis", "icu"]
+
+    def test_round_trip_to_papers(self, papers: list[Paper], table: PaperTable) -> None:
+        """to_papers rebuilds every field."""
+        rebuilt = table.to_papers()
+
+        for original, copy in zip(papers, rebuilt, strict=True):
+            assert copy == original
+            assert (copy.title, copy.abstract, copy.journal) == (
+                original.title,
+                original.abstract,
+                original.journal,
+            )
+            assert copy.authors == original.authors
+            assert copy.keywords == original.keywords
+            assert (copy.quality_score, copy.included, copy.assessment_notes) == (
+                original.quality_score,
+                original.included,
+                original.assessment_notes,
+            )
+
+    def test_review_round_trip(self, papers: list[Paper]) -> None:
+        """A table converts from a review and back to a review copy."""
+        review = Review(
+            title="Table Review",
+            research_question="Does it round-trip?",
+            inclusion_criteria=["Any"],
+            exclusion_criteria=[],
+        )
+        review.advance_stage()
+        review.add_papers(papers)
+
+        table = PaperTable.from_review(review)
+        copy = table.filter(included=True).to_review(review)
+
+        assert (copy.title, copy.stage) == (review.title, review.stage)
+        assert sorted(p.doi.value for p in copy.papers) == ["10.1234/a", "10.1234/c"]
+        assert len(review.papers) == 5
+        assert table.statistics() == {
+            key: value
+            for key, value in review.generate_statistics().items()
+            if key != "current_stage"
+        }
+
+    def test_empty_table(self) -> None:
+        """An empty table has empty aggregates."""
+        table = PaperTable.from_papers([])
+
+        assert len(table) == 0
+        assert table.to_papers() == []
+        assert table.count_by_year() == {}
+        assert table.inclusion_rate_by_year() == {}
+        assert table.statistics()["inclusion_rate"] == 0.0
+
+
+class TestPaperTableFiltering:
+    """Tests for selecting rows."""
+
+    def test_filter_combines_conditions(self, table: PaperTable) -> None:
+        """filter keeps rows matching all conditions."""
+        selected = table.filter(year_from=2020, journal="Journal A")
+
+        assert selected.dois.tolist() == ["10.1234/c", "10.1234/d"]
+        assert table.filter(included=False, min_score=2.0).dois.tolist() == ["10.1234/b"]
+        assert len(table.filter(journal="Unknown")) == 0
+
+    def test_select_keeps_ragged_columns_aligned(self, table: PaperTable) -> None:
+        """Selected rows keep their own authors and keywords."""
+        selected = table.select(np.array([1, 0]))
+
+        (first, second) = selected.to_papers()
+        assert (first.authors, first.keywords) == ([DOE], ["icu"])
+        assert (second.authors, second.keywords) == ([SMITH, DOE], ["sepsis", "icu"])
+
+
+class TestPaperTableAggregates:
+    """Tests for group-bys, histograms and rates."""
+
+    def test_counts(self, table: PaperTable) -> None:
+        """Papers are counted per year, journal and author."""
+        assert table.count_by_year() == {2019: 2, 2020: 2, 2021: 1}
+        assert table.count_by_journal() == {"Journal A": 3, "Journal B": 2}
+        assert table.count_by_author() == {SMITH: 4, DOE: 2}
+
+    def test_score_histogram(self, table: PaperTable) -> None:
+        """Scored papers are binned over 0-10."""
+        counts, edges = table.score_histogram(bins=5)
+
+        assert counts.tolist() == [1, 1, 0, 0, 2]
+        assert edges.tolist() == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+
+    def test_inclusion_rates(self, table: PaperTable) -> None:
+        """Inclusion rates count only assessed papers."""
+        assert table.inclusion_rate_by_year() == {2019: 0.5, 2020: 0.5}
+        assert table.inclusion_rate_by_journal() == pytest.approx(
+            {"Journal A": 2 / 3, "Journal B": 0.0}
+        )
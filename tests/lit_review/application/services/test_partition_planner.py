@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for DateRange and PartitionPlanner."""
+
+from datetime import date
+
+import pytest
+
+from lit_review.application.services.partition_planner import DateRange, PartitionPlanner
+
+
+class CountByYear:
+    """Counts hits spread evenly within each year, recording each round."""
+
+    def __init__(self, per_year: dict[int, int]) -> None:
+        self.per_year = per_year
+        self.rounds: list[list[DateRange]] = []
+
+    def __call__(self, ranges: list[DateRange]) -> list[int | None]:
+        self.rounds.append(list(ranges))
+        counts: list[int | None] = []
+        for part in ranges:
+            total = 0.0
+            for year, hits in self.per_year.items():
+                first, last = max(part.start, date(year, 1, 1)), min(part.end, date(year, 12, 31))
+                if first <= last:
+                    days = (date(year, 12, 31) - date(year, 1, 1)).days + 1
+                    total += hits * ((last - first).days + 1) / days
+            counts.append(round(total))
+        return counts
+
+
+class TestDateRange:
+    """Tests for DateRange."""
+
+    def test_rejects_reversed_range(self) -> None:
+        """A range may not end before it starts."""
+        with pytest.raises(ValueError):
+            DateRange(date(2024, 1, 2), date(2024, 1, 1))
+
+    def test_bisects_on_year_boundary(self) -> None:
+        """Multi-year ranges are split into whole years."""
+        earlier, later = DateRange.years(2015, 2024).bisect()
+
+        assert (str(earlier), str(later)) == ("2015-2019", "2020-2024")
+
+    def test_bisects_single_year_by_days(self) -> None:
+        """A single year is split into two disjoint day ranges."""
+        earlier, later = DateRange.years(2024, 2024).bisect()
+
+        assert earlier == DateRange(date(2024, 1, 1), date(2024, 7, 1))
+        assert later.start == date(2024, 7, 2)
+        assert str(later) == "2024-07-02..2024-12-31"
+
+    def test_single_day_cannot_be_bisected(self) -> None:
+        """A one-day range is the smallest partition."""
+        day = DateRange(date(2024, 3, 1), date(2024, 3, 1))
+
+        assert not day.can_bisect()
+        with pytest.raises(ValueError):
+            day.bisect()
+
+
+class TestPartitionPlanner:
+    """Tests for PartitionPlanner."""
+
+    def test_span_below_cap_is_not_split(self) -> None:
+        """A query under the cap runs as a single partition."""
+        count = CountByYear({2020: 40, 2021: 50})
+
+        parts = PartitionPlanner().plan(DateRange.years(2020, 2021), 100, count)
+
+        assert parts == [DateRange.years(2020, 2021)]
+        assert len(count.rounds) == 1
+
+    def test_bisects_until_each_partition_is_below_cap(self) -> None:
+        """Dense years are split further than sparse ones."""
+        count = CountByYear({2016: 10, 2021: 20, 2023: 150})
+
+        parts = PartitionPlanner().plan(DateRange.years(2016, 2024), 100, count)
+
+        assert [str(part) for part in parts] == [
+            "2016-2020",
+            "2021-2022",
+            "2023-01-01..2023-07-02",
+            "2023-07-03..2023-12-31",
+        ]
+        assert len(count.rounds) == 5
+
+    def test_drops_empty_ranges_and_keeps_unknown_ones(self) -> None:
+        """Zero-count ranges are skipped; unknown counts are not split."""
+
+        def count_many(ranges: list[DateRange]) -> list[int | None]:
+            if ranges == [DateRange.years(2016, 2024)]:
+                return [500]
+            return [0 if part.start.year < 2020 else None for part in ranges]
+
+        parts = PartitionPlanner().plan(DateRange.years(2016, 2024), 100, count_many)
+
+        assert parts == [DateRange.years(2021, 2024)]
+
+    def test_partition_count_is_bounded(self) -> None:
+        """max_partitions stops the bisection."""
+        count = CountByYear({year: 1000 for year in range(2000, 2025)})
+
+        parts = PartitionPlanner(max_partitions=4).plan(DateRange.years(2000, 2024), 100, count)
+
+        assert len(parts) == 4
+
+    def test_split_truncated(self) -> None:
+        """A full partition is halved unless it is a single day or the bound is reached."""
+        planner = PartitionPlanner(max_partitions=8)
+        year = DateRange.years(2024, 2024)
+
+        assert planner.split_truncated(year, 3) == list(year.bisect())
+        assert planner.split_truncated(year, 8) == []
+        assert planner.split_truncated(DateRange(year.start, year.start), 3) == []
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for SearchStatsCollector."""
+
+import json
+import threading
+
+from lit_review.application.ports.search_events import SearchEvent, SearchEventKind
+from lit_review.application.services.search_stats import DatabaseStats, SearchStatsCollector
+
+
+def _request(status: int | None, seconds: float = 0.5, size: int = 100) -> SearchEvent:
+    return SearchEvent(
+        SearchEventKind.REQUEST_END,
+        "Crossref",
+        seconds=seconds,
+        bytes_received=size,
+        status_code=status,
+    )
+
+
+class TestDatabaseStats:
+    """Tests for folding events into per-database totals."""
+
+    def test_aggregates_each_event_kind(self) -> None:
+        """Requests, retries, rate-limit sleeps and parsing are totalled separately."""
+        stats = DatabaseStats()
+        for event in [
+            SearchEvent(SearchEventKind.REQUEST_START, "Crossref"),
+            _request(503),
+            SearchEvent(SearchEventKind.RETRY, "Crossref", seconds=1.0, attempt=1),
+            SearchEvent(SearchEventKind.RATE_LIMIT_SLEEP, "Crossref", seconds=0.25),
+            _request(200, size=4096),
+            SearchEvent(SearchEventKind.PARSE, "Crossref", seconds=0.1, produced=98, dropped=2),
+        ]:
+            stats.add(event)
+
+        assert (stats.requests, stats.failed_requests) == (2, 1)
+        assert stats.bytes_received == 4196
+        assert stats.request_seconds == 1.0
+        assert (stats.retries, stats.retry_seconds) == (1, 1.0)
+        assert (stats.rate_limit_sleeps, stats.rate_limit_seconds) == (1, 0.25)
+        assert (stats.papers_produced, stats.papers_dropped) == (98, 2)
+        assert stats.status_codes == {503: 1, 200: 1}
+
+    def test_request_without_response_counts_as_failed(self) -> None:
+        """Connection errors have no status but are failed requests."""
+        stats = DatabaseStats()
+        stats.add(_request(None, size=0))
+
+        assert (stats.requests, stats.failed_requests) == (1, 1)
+        assert stats.status_codes == {}
+
+
+class TestSearchStatsCollector:
+    """Tests for the thread-safe collector."""
+
+    def test_hooks_aggregate_per_database(self) -> None:
+        """Each database's hook feeds its own totals."""
+        collector = SearchStatsCollector()
+        collector.hook("crossref")(_request(200))
+        collector.hook("pubmed")(_request(200))
+        collector.hook("pubmed")(_request(429))
+
+        summary = collector.summary()
+
+        assert summary["crossref"].requests == 1
+        assert summary["pubmed"].failed_requests == 1
+
+    def test_summary_is_a_snapshot(self) -> None:
+        """Later events do not change a summary already taken."""
+        collector = SearchStatsCollector()
+        collector.record("crossref", _request(200))
+        summary = collector.summary()
+
+        collector.record("crossref", _request(200))
+
+        assert summary["crossref"].requests == 1
+        assert summary["crossref"].status_codes == {200: 1}
+
+    def test_concurrent_events_are_all_counted(self) -> None:
+        """Hooks may be called from many search threads at once."""
+        collector = SearchStatsCollector()
+        hook = collector.hook("crossref")
+
+        def emit() -> None:
+            for _ in range(500):
+                hook(_request(200))
+
+        threads = [threading.Thread(target=emit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert collector.summary()["crossref"].requests == 4000
+
+    def test_to_dict_is_json_serializable(self) -> None:
+        """The JSON dump keys status codes by string."""
+        collector = SearchStatsCollector()
+        collector.record("crossref", _request(200))
+
+        data = json.loads(json.dumps(collector.to_dict()))
+
+        assert data["crossref"]["status_codes"] == {"200": 1}
+        assert data["crossref"]["bytes_received"] == 100
+
+    def test_reset_discards_totals(self) -> None:
+        """reset() starts over."""
+        collector = SearchStatsCollector()
+        collector.record("crossref", _request(200))
+
+        collector.reset()
+
+        assert collector.summary() == {}
@@ -6,6 +6,7 @@ import time
 
 import pytest
 
+from lit_review.application.services.paper_table import PaperTable
 from lit_review.application.usecases.analyze_themes import AnalyzeThemesUseCase
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.values.author import Author
@@ -118,6 +119,16 @@ class TestAnalyzeThemesUseCaseExecution:
         assert result.summary
         assert "papers" in result.summary.lower()
 
+    def test_execute_with_paper_table(self, sample_papers: list[Paper]) -> None:
+        """A PaperTable is analyzed like the list of its papers."""
+        use_case = AnalyzeThemesUseCase()
+
+        from_list = use_case.execute(sample_papers, max_themes=3)
+        from_table = use_case.execute(PaperTable.from_papers(sample_papers), max_themes=3)
+
+        assert from_table.themes == from_list.themes
+        assert from_table.summary == from_list.summary
+
     def test_execute_with_empty_papers_raises_error(self) -> None:
         """Test that empty papers list raises ValueError."""
         use_case = AnalyzeThemesUseCase()
@@ -0,0 +1,269 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for EnrichPapersUseCase."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lit_review.application.ports.search_service import SearchService
+from lit_review.application.usecases.enrich_papers import EnrichPapersUseCase
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.review import Review
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.persistence.enrichment_checkpoint import (
+    JSONLinesEnrichmentCheckpoint,
+)
+
+
+class EnrichingService(SearchService):
+    """Service whose hydrate() fills selected fields of known DOIs."""
+
+    def __init__(
+        self,
+        name: str,
+        abstracts: set[str] | None = None,
+        keywords: set[str] | None = None,
+        fail: bool = False,
+        delay: float = 0.0,
+    ) -> None:
+        self._name = name
+        self.abstracts = abstracts or set()
+        self.keywords = keywords or set()
+        self.fail = fail
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        return []
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        with self._lock:
+            self.batches.append([p.doi.value for p in papers])
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError("Mock connection error")
+            changed = []
+            for paper in papers:
+                updated = False
+                if not paper.abstract and paper.doi.value in self.abstracts:
+                    paper.abstract = f"Abstract of {paper.doi.value}"
+                    updated = True
+                if not paper.keywords and paper.doi.value in self.keywords:
+                    paper.keywords = ["sepsis"]
+                    updated = True
+                if updated:
+                    changed.append(paper)
+            return changed
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def get_service_name(self) -> str:
+        return self._name
+
+    @property
+    def looked_up(self) -> list[str]:
+        return sorted(doi for batch in self.batches for doi in batch)
+
+
+def make_paper(index: int, abstract: str = "", keywords: list[str] | None = None) -> Paper:
+    return Paper(
+        doi=DOI(f"10.1234/enrich.{index:03d}"),
+        title=f"Paper {index}",
+        authors=[Author("Smith", "John", "J.")],
+        publication_year=2023,
+        journal="Journal",
+        abstract=abstract,
+        keywords=keywords or [],
+    )
+
+
+def make_review(papers: list[Paper]) -> Review:
+    review = Review(
+        title="Test Review",
+        research_question="What is the impact?",
+        inclusion_criteria=["Peer-reviewed"],
+        exclusion_criteria=[],
+    )
+    review.advance_stage()
+    review.add_papers(papers)
+    return review
+
+
+class TestEnrichPapersUseCase:
+    """Tests for the enrichment cascade."""
+
+    def test_cascade_passes_incomplete_papers_on(self) -> None:
+        """Papers still incomplete after one database are asked of the next."""
+        papers = [make_paper(i) for i in range(3)]
+        complete = make_paper(9, abstract="Known", keywords=["known"])
+        first = EnrichingService("first", abstracts={p.doi.value for p in papers})
+        second = EnrichingService("second", keywords={papers[0].doi.value, papers[1].doi.value})
+        use_case = EnrichPapersUseCase(services={"first": first, "second": second})
+
+        result = use_case.execute(make_review([*papers, complete]))
+
+        assert first.looked_up == [p.doi.value for p in papers]
+        assert second.looked_up == [p.doi.value for p in papers]
+        assert len(result.enriched) == 3
+        assert result.incomplete == [papers[2]]
+        assert papers[0].keywords == ["sepsis"]
+        assert result.failed == {}
+
+    def test_complete_papers_stop_the_cascade(self) -> None:
+        """A paper completed by the first database is not looked up again."""
+        paper = make_paper(0)
+        first = EnrichingService("first", abstracts={paper.doi.value}, keywords={paper.doi.value})
+        second = EnrichingService("second")
+        use_case = EnrichPapersUseCase(services={"first": first, "second": second})
+
+        result = use_case.execute(make_review([paper]))
+
+        assert second.batches == []
+        assert result.incomplete == []
+
+    def test_databases_select_and_order_the_cascade(self) -> None:
+        """Only the requested databases are asked, in the given order."""
+        paper = make_paper(0)
+        first = EnrichingService("first")
+        second = EnrichingService("second", abstracts={paper.doi.value})
+        use_case = EnrichPapersUseCase(services={"first": first, "second": second})
+
+        use_case.execute(make_review([paper]), databases=["second", "unknown"])
+
+        assert first.batches == []
+        assert second.looked_up == [paper.doi.value]
+
+    def test_excluded_papers_are_skipped(self) -> None:
+        """Papers excluded during screening are not enriched."""
+        excluded = make_paper(0)
+        excluded.assess(2.0, include=False)
+        service = EnrichingService("first", abstracts={excluded.doi.value})
+        use_case = EnrichPapersUseCase(services={"first": service})
+
+        result = use_case.execute(make_review([excluded]))
+
+        assert service.batches == []
+        assert result.enriched == []
+
+    def test_batches_respect_batch_size(self) -> None:
+        """Lookups are split into batches of at most batch_size papers."""
+        papers = [make_paper(i) for i in range(5)]
+        service = EnrichingService("first")
+        use_case = EnrichPapersUseCase(services={"first": service}, batch_size=2)
+
+        use_case.execute(make_review(papers))
+
+        assert sorted(len(batch) for batch in service.batches) == [1, 2, 2]
+
+    def test_in_flight_batches_are_bounded(self) -> None:
+        """No database has more than max_in_flight_per_database batches at once."""
+        papers = [make_paper(i) for i in range(12)]
+        service = EnrichingService("first", delay=0.05)
+        use_case = EnrichPapersUseCase(
+            services={"first": service}, batch_size=2, max_in_flight_per_database=2
+        )
+
+        use_case.execute(make_review(papers))
+
+        assert len(service.batches) == 6
+        assert service.max_active == 2
+
+    def test_failed_database_falls_through(self) -> None:
+        """A failing database is counted and its papers go to the next one."""
+        paper = make_paper(0)
+        broken = EnrichingService("broken", fail=True)
+        backup = EnrichingService("backup", abstracts={paper.doi.value})
+        use_case = EnrichPapersUseCase(services={"broken": broken, "backup": backup})
+
+        result = use_case.execute(make_review([paper]))
+
+        assert result.failed == {"broken": 1}
+        assert paper.abstract == f"Abstract of {paper.doi.value}"
+        assert result.enriched == [paper]
+
+    def test_open_circuit_skips_database(self) -> None:
+        """After repeated failures the database is not asked any more."""
+        papers = [make_paper(i) for i in range(4)]
+        broken = EnrichingService("broken", fail=True)
+        use_case = EnrichPapersUseCase(
+            services={"broken": broken},
+            batch_size=1,
+            max_in_flight=1,
+            failure_threshold=2,
+        )
+
+        result = use_case.execute(make_review(papers))
+
+        assert len(broken.batches) == 2
+        assert result.failed == {"broken": 4}
+
+    def test_checkpoint_resumes_interrupted_run(self, tmp_path: Path) -> None:
+        """Lookups recorded by an earlier run are skipped."""
+        papers = [make_paper(i) for i in range(3)]
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+        checkpoint.record("first", [papers[0].doi.value])
+        checkpoint.record("second", [papers[0].doi.value])
+        first = EnrichingService("first")
+        second = EnrichingService("second")
+        use_case = EnrichPapersUseCase(
+            services={"first": first, "second": second}, checkpoint=checkpoint
+        )
+
+        result = use_case.execute(make_review(papers))
+
+        assert first.looked_up == [papers[1].doi.value, papers[2].doi.value]
+        assert second.looked_up == [papers[1].doi.value, papers[2].doi.value]
+        assert result.skipped == 2
+        # A run without failures starts fresh next time
+        assert not checkpoint.path.exists()
+
+    def test_checkpoint_kept_after_failures(self, tmp_path: Path) -> None:
+        """Completed lookups stay recorded when some batches failed."""
+        paper = make_paper(0)
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+        saves: list[str] = []
+        use_case = EnrichPapersUseCase(
+            services={
+                "first": EnrichingService("first"),
+                "broken": EnrichingService("broken", fail=True),
+            },
+            checkpoint=checkpoint,
+        )
+
+        use_case.execute(make_review([paper]), on_checkpoint=lambda: saves.append("saved"))
+
+        assert saves == ["saved"]
+        assert checkpoint.load() == {"first": {paper.doi.value}}
+
+    def test_interrupted_run_records_completed_batches(self, tmp_path: Path) -> None:
+        """An exception mid-run still checkpoints the batches that finished."""
+        papers = [make_paper(i) for i in range(2)]
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+
+        def interrupt() -> None:
+            raise KeyboardInterrupt
+
+        use_case = EnrichPapersUseCase(
+            services={"first": EnrichingService("first")},
+            checkpoint=checkpoint,
+            batch_size=1,
+            max_in_flight=1,
+            checkpoint_interval=0.0,
+        )
+
+        with pytest.raises(KeyboardInterrupt):
+            use_case.execute(make_review(papers), on_checkpoint=interrupt)
+
+        # The review was not saved, so nothing may be marked as done
+        assert checkpoint.load() == {}
@@ -6,6 +6,9 @@ import json
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
+from lit_review.application.services.paper_table import PaperTable
 from lit_review.application.usecases.export_review import (
     ExportFormat,
     ExportReviewUseCase,
@@ -109,6 +112,18 @@ class TestExportReviewUseCase:
         finally:
             output_path.unlink()
 
+    def test_execute_exports_table_selection(self) -> None:
+        """A PaperTable replaces the review's papers."""
+        use_case = ExportReviewUseCase()
+        review = create_review_with_papers()
+        table = PaperTable.from_review(review)
+
+        content = use_case.export_to_string(
+            review, ExportFormat.CSV, table=table.filter(included=True).select(np.array([0]))
+        )
+
+        assert len(content.strip().splitlines()) == 2  # header and one paper
+
 
 class TestExportToString:
     """Tests for export_to_string method."""
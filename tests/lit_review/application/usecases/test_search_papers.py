@@ -2,11 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for SearchPapersUseCase."""
 
+import asyncio
+import threading
 import time
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
 
+from lit_review.application.ports.async_search_service import AsyncSearchService
+from lit_review.application.ports.search_events import SearchEventKind
 from lit_review.application.ports.search_service import SearchService
-from lit_review.application.usecases.search_papers import SearchPapersUseCase
+from lit_review.application.services.circuit_breaker import CircuitState
+from lit_review.application.services.search_stats import SearchStatsCollector
+from lit_review.application.usecases.search_papers import SearchHit, SearchPapersUseCase
 from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.saved_search import SavedSearch
+from lit_review.domain.services.deduplication import PaperDeduplicator
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
 
@@ -122,6 +132,32 @@ class TestSearchPapersUseCase:
         results = use_case.execute("test query")
         assert len(results) == 2  # duplicate removed
 
+    def test_execute_merges_fuzzy_duplicates_with_deduplicator(self) -> None:
+        """A configured deduplicator merges the same work under different DOIs."""
+        crossref_paper = create_paper("sepsis-ml")
+        pubmed_paper = Paper(
+            doi=DOI("10.9999/pubmed.123"),
+            title="PAPER SEPSIS-ML.",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2024,
+            journal="Test Journal",
+            abstract="Abstract only PubMed provides.",
+        )
+        services: dict[str, SearchService] = {
+            "crossref": MockSearchService("crossref", [crossref_paper]),
+            "pubmed": MockSearchService("pubmed", [pubmed_paper]),
+        }
+
+        without = SearchPapersUseCase(services=services).execute("sepsis")
+        merged = SearchPapersUseCase(services=services, deduplicator=PaperDeduplicator()).execute(
+            "sepsis"
+        )
+
+        assert len(without) == 2
+        assert len(merged) == 1
+        assert merged[0].doi.value == "10.1234/sepsis-ml"
+        assert merged[0].abstract == "Abstract only PubMed provides."
+
     def test_execute_with_specific_databases(self) -> None:
         """Execute with specific databases only searches those."""
         papers1 = [create_paper("crossref-paper")]
@@ -312,6 +348,366 @@ class TestSearchPapersUseCaseTimeout:
         assert len(results) >= 1  # At least get fast results
 
 
+class TestSearchPapersUseCaseCircuitBreaker:
+    """Tests for per-database circuit breakers and adaptive timeouts."""
+
+    def test_open_circuit_skips_database_immediately(self) -> None:
+        """Once a database's circuit opens it is not queried again."""
+        healthy = MockSearchService("healthy", [create_paper("ok")])
+        failing = MockSearchService("failing", [])
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={"healthy": healthy, "failing": failing},
+            max_retries=1,
+            failure_threshold=2,
+        )
+
+        use_case.execute("q")
+        use_case.execute("q")
+        start = time.time()
+        results = use_case.execute("q")
+
+        assert failing.get_call_count() == 2
+        assert healthy.get_call_count() == 3
+        assert [p.doi.value for p in results] == ["10.1234/ok"]
+        assert time.time() - start < 0.5
+
+    def test_open_circuit_stops_retries(self) -> None:
+        """Retrying stops as soon as the circuit opens."""
+        failing = MockSearchService("failing", [])
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={"failing": failing}, max_retries=3, failure_threshold=1
+        )
+
+        start = time.time()
+        use_case.execute("q")
+
+        assert failing.get_call_count() == 1
+        assert time.time() - start < 0.5  # no backoff sleeps
+
+    def test_half_open_trial_closes_circuit_on_success(self) -> None:
+        """After the reset timeout a successful trial closes the circuit."""
+        service = MockSearchService("flaky", [create_paper("back")])
+        service.set_fail_count(1)
+        use_case = SearchPapersUseCase(
+            services={"flaky": service}, max_retries=1, failure_threshold=1, reset_timeout=0.1
+        )
+
+        assert use_case.execute("q") == []
+        assert use_case.execute("q") == []  # open: skipped
+        time.sleep(0.15)
+
+        assert len(use_case.execute("q")) == 1
+        assert service.get_call_count() == 2
+
+    def test_timeout_counts_as_failure(self) -> None:
+        """A hanging database trips its breaker without blocking the call."""
+        slow = MockSearchService("slow", [create_paper("late")])
+        slow.set_delay(1.0)
+        use_case = SearchPapersUseCase(
+            services={"slow": slow}, timeout_per_database=0.2, failure_threshold=1
+        )
+
+        start = time.time()
+        results = use_case.execute("q")
+
+        assert results == []
+        assert time.time() - start < 0.8
+        assert not use_case.get_circuit_breaker("slow").allow_request()
+
+    def test_late_answers_do_not_close_the_circuit(self) -> None:
+        """A database that answers only after its timeout keeps counting failures."""
+        slow = MockSearchService("slow", [create_paper("late")])
+        slow.set_delay(0.3)
+        use_case = SearchPapersUseCase(
+            services={"slow": slow}, timeout_per_database=0.1, failure_threshold=2
+        )
+
+        use_case.execute("q")
+        time.sleep(0.4)  # the abandoned attempt answers meanwhile
+        use_case.execute("q")
+
+        assert use_case.get_circuit_breaker("slow").state == CircuitState.OPEN
+        assert use_case.get_timeout("slow") == 0.1
+
+    def test_abandoned_search_stops_retrying(self) -> None:
+        """A timed-out search wakes from its backoff sleep and does not retry."""
+        slow = MockSearchService("slow", [])
+        slow.set_should_fail(True)
+        slow.set_delay(0.2)
+        use_case = SearchPapersUseCase(
+            services={"slow": slow}, timeout_per_database=0.1, max_retries=3
+        )
+
+        use_case.execute("q")
+        time.sleep(1.5)  # past the first backoff sleep of one second
+
+        assert slow.get_call_count() == 1
+
+    def test_timeout_adapts_to_latency_history(self) -> None:
+        """Timeouts shrink to a multiple of each database's p95 latency."""
+        service = MockSearchService("fast", [create_paper("a")])
+        service.set_delay(0.01)
+        use_case = SearchPapersUseCase(
+            services={"fast": service},
+            timeout_per_database=30.0,
+            timeout_multiplier=3.0,
+            min_timeout=0.05,
+        )
+        assert use_case.get_timeout("fast") == 30.0
+
+        for _ in range(5):
+            use_case.execute("q")
+
+        assert 0.05 <= use_case.get_timeout("fast") < 1.0
+
+    def test_retry_after_adapting_is_not_a_timeout(self) -> None:
+        """The adaptive timeout bounds each attempt, not the backoff between them."""
+        service = MockSearchService("fast", [create_paper("a")])
+        service.set_delay(0.01)
+        use_case = SearchPapersUseCase(
+            services={"fast": service}, max_retries=2, failure_threshold=2, min_timeout=0.1
+        )
+        for _ in range(5):
+            use_case.execute("q")
+        assert use_case.get_timeout("fast") < 1.0
+
+        service.set_fail_count(1)
+        results = use_case.execute("q")
+
+        assert [p.doi.value for p in results] == ["10.1234/a"]
+        assert use_case.get_circuit_breaker("fast").state == CircuitState.CLOSED
+
+    def test_batch_waits_for_half_open_trial(self) -> None:
+        """Queued queries of a half-open database wait for the trial's outcome."""
+        service = MockSearchService("flaky", [create_paper("back")])
+        service.set_fail_count(1)
+        use_case = SearchPapersUseCase(
+            services={"flaky": service},
+            max_retries=1,
+            failure_threshold=1,
+            reset_timeout=0.1,
+            max_concurrency_per_database=3,
+        )
+        assert use_case.execute_batch(["q"]).failed == [SearchHit("q", "flaky")]
+        time.sleep(0.15)
+        service.set_delay(0.1)  # keep the trial in flight while the rest is dispatched
+
+        result = use_case.execute_batch(["a", "b", "c"])
+
+        assert result.failed == []
+        assert service.get_call_count() == 4
+
+    def test_async_skips_open_circuit(self) -> None:
+        """execute_async also skips databases with an open circuit."""
+        failing = MockAsyncSearchService("failing", [])
+        failing._fail_count = 10
+        use_case = SearchPapersUseCase(max_retries=1, failure_threshold=1)
+        use_case.add_async_service("failing", failing)
+
+        asyncio.run(use_case.execute_async("q"))
+        asyncio.run(use_case.execute_async("q"))
+
+        assert failing._call_count == 1
+
+
+class QueryEchoService(MockSearchService):
+    """Mock service returning papers keyed by query, tracking concurrency."""
+
+    def __init__(self, name: str, results: dict[str, list[Paper]], delay: float = 0.0) -> None:
+        super().__init__(name)
+        self.results = results
+        self.set_delay(delay)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self._papers = self.results.get(query, [])
+            return super().search(query, limit)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestSearchPapersUseCaseBatch:
+    """Tests for execute_batch."""
+
+    def test_execute_batch_with_no_queries_returns_empty(self) -> None:
+        """No queries produce an empty result."""
+        use_case = SearchPapersUseCase(services={"crossref": MockSearchService("crossref")})
+
+        result = use_case.execute_batch([])
+
+        assert result.papers == []
+        assert result.provenance == {}
+
+    def test_execute_batch_merges_with_provenance(self) -> None:
+        """Every DOI records which queries and databases found it."""
+        shared = create_paper("shared")
+        crossref = QueryEchoService(
+            "crossref", {"q1": [shared, create_paper("c1")], "q2": [shared]}
+        )
+        pubmed = QueryEchoService("pubmed", {"q2": [create_paper("shared"), create_paper("p2")]})
+        use_case = SearchPapersUseCase(services={"crossref": crossref, "pubmed": pubmed})
+
+        result = use_case.execute_batch(["q1", "q2"])
+
+        assert sorted(p.doi.value for p in result.papers) == [
+            "10.1234/c1",
+            "10.1234/p2",
+            "10.1234/shared",
+        ]
+        assert result.provenance["10.1234/shared"] == [
+            SearchHit("q1", "crossref"),
+            SearchHit("q2", "crossref"),
+            SearchHit("q2", "pubmed"),
+        ]
+        assert result.papers_by_query() == {"q1": 2, "q2": 2}
+        assert result.failed == []
+
+    def test_execute_batch_overlaps_databases(self) -> None:
+        """Slow (rate-limited) databases run side by side, not one after another."""
+        services: dict[str, SearchService] = {
+            name: QueryEchoService(name, {}, delay=0.1) for name in ["a", "b", "c", "d"]
+        }
+        use_case = SearchPapersUseCase(services=services, max_workers=4)
+
+        start = time.time()
+        use_case.execute_batch([f"q{i}" for i in range(4)])
+        elapsed = time.time() - start
+
+        # 16 pairs of 0.1s on 4 lanes: ~0.4s rather than ~1.6s serially
+        assert elapsed < 1.0
+
+    def test_execute_batch_caps_concurrency_per_database(self) -> None:
+        """One database never gets more than its share of workers."""
+        slow = QueryEchoService("slow", {}, delay=0.05)
+        fast = QueryEchoService("fast", {"q0": [create_paper("fast")]})
+        use_case = SearchPapersUseCase(
+            services={"slow": slow, "fast": fast},
+            max_workers=4,
+            max_concurrency_per_database=2,
+        )
+
+        result = use_case.execute_batch([f"q{i}" for i in range(6)])
+
+        assert slow.max_active == 2
+        assert slow.get_call_count() == 6
+        assert [p.doi.value for p in result.papers] == ["10.1234/fast"]
+
+    def test_execute_batch_reports_failed_pairs(self) -> None:
+        """Failures are reported per pair and open circuits skip the rest."""
+        healthy = QueryEchoService("healthy", {"q1": [create_paper("ok")]})
+        failing = MockSearchService("failing")
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={"healthy": healthy, "failing": failing},
+            max_retries=1,
+            failure_threshold=1,
+        )
+
+        result = use_case.execute_batch(["q1", "q2", "q3"])
+
+        assert [p.doi.value for p in result.papers] == ["10.1234/ok"]
+        assert result.failed == [SearchHit(q, "failing") for q in ["q1", "q2", "q3"]]
+        assert failing.get_call_count() == 1
+
+    def test_execute_batch_merges_fuzzy_duplicates_and_provenance(self) -> None:
+        """Provenance of merged near-duplicates is combined under the kept DOI."""
+        crossref = QueryEchoService("crossref", {"q1": [create_paper("sepsis")]})
+        pubmed_record = Paper(
+            doi=DOI("10.9999/pubmed.1"),
+            title="Paper Sepsis",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2024,
+            journal="Test Journal",
+        )
+        pubmed = QueryEchoService("pubmed", {"q2": [pubmed_record]})
+        use_case = SearchPapersUseCase(
+            services={"crossref": crossref, "pubmed": pubmed},
+            deduplicator=PaperDeduplicator(),
+        )
+
+        result = use_case.execute_batch(["q1", "q2"])
+
+        assert [p.doi.value for p in result.papers] == ["10.1234/sepsis"]
+        assert result.provenance["10.1234/sepsis"] == [
+            SearchHit("q1", "crossref"),
+            SearchHit("q2", "pubmed"),
+        ]
+
+
+class DeltaSearchService(MockSearchService):
+    """Mock service recording the since date of delta searches."""
+
+    def __init__(self, name: str, papers: list[Paper] | None = None) -> None:
+        super().__init__(name, papers)
+        self.since_calls: list[date] = []
+
+    def search_since(self, query: str, since: date, limit: int = 100) -> list[Paper]:
+        self.since_calls.append(since)
+        return self.search(query, limit)
+
+
+class TestSearchPapersUseCaseSaved:
+    """Tests for execute_saved (delta updates of saved searches)."""
+
+    def test_execute_saved_uses_watermark(self) -> None:
+        """Searches that ran before use search_since; new ones run a full search."""
+        pubmed = DeltaSearchService("pubmed", [create_paper("new")])
+        use_case = SearchPapersUseCase(services={"pubmed": pubmed})
+        searches = [
+            SavedSearch("q1", "pubmed", last_run=datetime(2025, 3, 1, 8, tzinfo=UTC)),
+            SavedSearch("q2", "pubmed"),
+        ]
+
+        result = use_case.execute_saved(searches)
+
+        assert [p.doi.value for p in result.papers] == ["10.1234/new"]
+        assert pubmed.since_calls == [date(2025, 3, 1)]
+        assert pubmed.get_call_count() == 2
+
+    def test_execute_saved_advances_watermark_on_success_only(self) -> None:
+        """Failed searches keep their watermark so the next update retries them."""
+        ok = DeltaSearchService("ok", [create_paper("a")])
+        failing = DeltaSearchService("failing")
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(services={"ok": ok, "failing": failing}, max_retries=1)
+        old = datetime(2025, 3, 1, tzinfo=UTC)
+        now = datetime(2025, 4, 1, tzinfo=UTC)
+        searches = [SavedSearch("q", "ok", last_run=old), SavedSearch("q", "failing", last_run=old)]
+
+        result = use_case.execute_saved(searches, now=now)
+
+        assert result.failed == [SearchHit("q", "failing")]
+        assert searches[0].last_run == now
+        assert searches[1].last_run == old
+
+    def test_execute_saved_skips_unknown_databases(self) -> None:
+        """Searches for databases that are not configured are left untouched."""
+        use_case = SearchPapersUseCase(services={"crossref": MockSearchService("crossref")})
+        saved = SavedSearch("q", "scopus")
+
+        result = use_case.execute_saved([saved])
+
+        assert result.papers == []
+        assert saved.last_run is None
+
+    def test_default_search_since_keeps_older_publication_years(self) -> None:
+        """Without a server-side filter, records published before the watermark are kept."""
+        service = MockSearchService("pubmed", [create_paper("late-indexed")])
+
+        papers = service.search_since("q", date(2025, 3, 1))
+
+        assert [p.doi.value for p in papers] == ["10.1234/late-indexed"]
+
+
 class TestSearchPapersUseCasePartialResults:
     """Tests for returning partial results when some databases fail."""
 
@@ -355,3 +751,474 @@ class TestSearchPapersUseCasePartialResults:
 
         results = use_case.execute("test query")
         assert len(results) == 2
+
+
+class MockAsyncSearchService(AsyncSearchService):
+    """Mock asyncio-native search service for testing."""
+
+    def __init__(self, name: str, papers: list[Paper] | None = None) -> None:
+        self._name = name
+        self._papers = papers or []
+        self._fail_count = 0
+        self._call_count = 0
+        self._delay = 0.0
+
+    async def search(self, query: str, limit: int = 100) -> list[Paper]:
+        self._call_count += 1
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+        if self._fail_count > 0:
+            self._fail_count -= 1
+            raise ConnectionError("Mock connection error")
+        return self._papers[:limit]
+
+    def get_service_name(self) -> str:
+        return self._name
+
+
+class TestSearchPapersUseCaseAsync:
+    """Tests for asyncio fan-out with execute_async."""
+
+    def test_execute_async_with_no_services_returns_empty(self) -> None:
+        """execute_async with no services returns empty list."""
+        use_case = SearchPapersUseCase()
+        assert asyncio.run(use_case.execute_async("test query")) == []
+
+    def test_execute_async_combines_and_deduplicates(self) -> None:
+        """execute_async gathers async services and deduplicates by DOI."""
+        use_case = SearchPapersUseCase()
+        use_case.add_async_service(
+            "crossref",
+            MockAsyncSearchService("crossref", [create_paper("dup"), create_paper("a")]),
+        )
+        use_case.add_async_service("arxiv", MockAsyncSearchService("arxiv", [create_paper("dup")]))
+
+        results = asyncio.run(use_case.execute_async("test query"))
+
+        assert sorted(p.doi.value for p in results) == ["10.1234/a", "10.1234/dup"]
+
+    def test_execute_async_runs_services_concurrently(self) -> None:
+        """Async services run concurrently on one event loop."""
+        use_case = SearchPapersUseCase()
+        for i in range(10):
+            service = MockAsyncSearchService(f"s{i}", [create_paper(f"p{i}")])
+            service._delay = 0.1
+            use_case.add_async_service(f"s{i}", service)
+
+        start_time = time.time()
+        results = asyncio.run(use_case.execute_async("test query"))
+        elapsed_time = time.time() - start_time
+
+        assert len(results) == 10
+        assert elapsed_time < 0.5
+
+    def test_execute_async_falls_back_to_sync_service(self) -> None:
+        """Databases without an async implementation run in a worker thread."""
+        use_case = SearchPapersUseCase(
+            services={"pubmed": MockSearchService("pubmed", [create_paper("sync")])}
+        )
+        use_case.add_async_service(
+            "crossref", MockAsyncSearchService("crossref", [create_paper("async")])
+        )
+
+        results = asyncio.run(use_case.execute_async("test query"))
+
+        assert len(results) == 2
+        assert set(use_case.get_available_databases()) == {"pubmed", "crossref"}
+
+    def test_execute_async_per_database_timeout(self) -> None:
+        """A slow database times out without blocking the others."""
+        slow = MockAsyncSearchService("slow", [create_paper("slow")])
+        slow._delay = 5.0
+        use_case = SearchPapersUseCase(timeout_per_database=0.2)
+        use_case.add_async_service("slow", slow)
+        use_case.add_async_service("fast", MockAsyncSearchService("fast", [create_paper("fast")]))
+
+        start_time = time.time()
+        results = asyncio.run(use_case.execute_async("test query"))
+
+        assert time.time() - start_time < 1.0
+        assert [p.doi.value for p in results] == ["10.1234/fast"]
+
+    def test_execute_async_retries_failures(self) -> None:
+        """Async services are retried after connection errors."""
+        service = MockAsyncSearchService("flaky", [create_paper("retry")])
+        service._fail_count = 1
+        use_case = SearchPapersUseCase(max_retries=2)
+        use_case.add_async_service("flaky", service)
+
+        results = asyncio.run(use_case.execute_async("test query"))
+
+        assert len(results) == 1
+        assert service._call_count == 2
+
+    def test_execute_async_respects_database_selection(self) -> None:
+        """execute_async only searches the requested databases."""
+        use_case = SearchPapersUseCase()
+        use_case.add_async_service("a", MockAsyncSearchService("a", [create_paper("a")]))
+        use_case.add_async_service("b", MockAsyncSearchService("b", [create_paper("b")]))
+
+        results = asyncio.run(use_case.execute_async("test query", databases=["b", "unknown"]))
+
+        assert [p.doi.value for p in results] == ["10.1234/b"]
+
+
+class PagedSearchService(MockSearchService):
+    """Mock service whose iter_search delivers papers page by page."""
+
+    def __init__(self, name: str, papers: list[Paper], page_delay: float = 0.0) -> None:
+        super().__init__(name, papers)
+        self._page_delay = page_delay
+        self.pages_served = 0
+
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        for start in range(0, min(limit, len(self._papers)), 2):
+            if self._page_delay:
+                time.sleep(self._page_delay)
+            self.pages_served += 1
+            yield from self._papers[start : min(start + 2, limit)]
+
+
+class TestSearchPapersUseCaseStream:
+    """Tests for streaming results with execute_stream."""
+
+    def test_execute_stream_with_no_services_yields_nothing(self) -> None:
+        """execute_stream with no services yields nothing."""
+        assert list(SearchPapersUseCase().execute_stream("test query")) == []
+
+    def test_execute_stream_yields_batches_per_database(self) -> None:
+        """Each database's results arrive tagged with its name."""
+        use_case = SearchPapersUseCase(
+            services={
+                "crossref": MockSearchService("crossref", [create_paper("c1"), create_paper("c2")]),
+                "pubmed": MockSearchService("pubmed", [create_paper("p1")]),
+            }
+        )
+
+        batches = list(use_case.execute_stream("test query"))
+
+        by_database = {name: [p.doi.value for p in batch] for name, batch in batches}
+        assert by_database == {
+            "crossref": ["10.1234/c1", "10.1234/c2"],
+            "pubmed": ["10.1234/p1"],
+        }
+
+    def test_execute_stream_deduplicates_across_batches(self) -> None:
+        """A DOI already streamed is never yielded again."""
+        use_case = SearchPapersUseCase(
+            services={
+                "crossref": MockSearchService("crossref", [create_paper("dup"), create_paper("a")]),
+                "pubmed": MockSearchService("pubmed", [create_paper("dup"), create_paper("b")]),
+            }
+        )
+
+        dois = [p.doi.value for _, batch in use_case.execute_stream("q") for p in batch]
+
+        assert sorted(dois) == ["10.1234/a", "10.1234/b", "10.1234/dup"]
+
+    def test_execute_stream_reports_completed_databases(self) -> None:
+        """Only databases whose search finished are reported as completed."""
+        failing = MockSearchService("pubmed", [])
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={
+                "crossref": MockSearchService("crossref", [create_paper("a")]),
+                "pubmed": failing,
+            },
+            max_retries=1,
+        )
+        completed: set[str] = set()
+
+        list(use_case.execute_stream("q", completed=completed))
+
+        assert completed == {"crossref"}
+
+    def test_execute_stream_splits_pages_into_batches(self) -> None:
+        """Paging services yield batches of at most stream_batch_size papers."""
+        papers = [create_paper(f"p{i}") for i in range(7)]
+        use_case = SearchPapersUseCase(
+            services={"crossref": PagedSearchService("crossref", papers)},
+            stream_batch_size=3,
+        )
+
+        sizes = [len(batch) for _, batch in use_case.execute_stream("q", limit=7)]
+
+        assert sizes == [3, 3, 1]
+
+    def test_first_batch_arrives_before_slow_database_finishes(self) -> None:
+        """Time to first result is independent of the slowest database."""
+        fast = MockSearchService("fast", [create_paper("fast")])
+        slow = MockSearchService("slow", [create_paper("slow")])
+        slow.set_delay(0.5)
+        use_case = SearchPapersUseCase(services={"fast": fast, "slow": slow})
+
+        start = time.time()
+        stream = use_case.execute_stream("q")
+        first_name, _ = next(stream)
+        first_elapsed = time.time() - start
+        rest = list(stream)
+
+        assert first_name == "fast"
+        assert first_elapsed < 0.3
+        assert [name for name, _ in rest] == ["slow"]
+
+    def test_closing_stream_stops_paging(self) -> None:
+        """Abandoning the stream stops fetching further pages."""
+        papers = [create_paper(f"p{i}") for i in range(20)]
+        service = PagedSearchService("crossref", papers, page_delay=0.05)
+        use_case = SearchPapersUseCase(services={"crossref": service}, stream_batch_size=2)
+
+        stream = use_case.execute_stream("q", limit=20)
+        next(stream)
+        stream.close()
+        time.sleep(0.2)
+
+        assert service.pages_served < 10
+
+    def test_execute_stream_retries_before_first_result(self) -> None:
+        """Failures before anything was streamed are retried."""
+        service = MockSearchService("crossref", [create_paper("a")])
+        service.set_fail_count(1)
+        use_case = SearchPapersUseCase(services={"crossref": service})
+
+        batches = list(use_case.execute_stream("q"))
+
+        assert len(batches) == 1
+        assert service.get_call_count() == 2
+
+    def test_execute_stream_skips_failing_database(self) -> None:
+        """A failing database does not stop the others."""
+        failing = MockSearchService("pubmed")
+        failing.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={
+                "crossref": MockSearchService("crossref", [create_paper("a")]),
+                "pubmed": failing,
+            },
+            max_retries=1,
+        )
+
+        batches = list(use_case.execute_stream("q"))
+
+        assert [name for name, _ in batches] == ["crossref"]
+
+
+class StubSearchService(MockSearchService):
+    """Mock service with separate stub and hydration paths."""
+
+    def __init__(self, name: str, papers: list[Paper], abstracts: dict[str, str]) -> None:
+        super().__init__(name, papers)
+        self.abstracts = abstracts
+        self.stub_calls = 0
+        self.hydrate_calls: list[list[str]] = []
+        self.fail_hydrate = False
+
+    def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+        self.stub_calls += 1
+        return self._papers[:limit]
+
+    def hydrate(self, papers: list[Paper]) -> list[Paper]:
+        self.hydrate_calls.append([p.doi.value for p in papers])
+        if self.fail_hydrate:
+            raise ConnectionError("Mock connection error")
+        hydrated = []
+        for paper in papers:
+            if paper.doi.value in self.abstracts:
+                paper.abstract = self.abstracts[paper.doi.value]
+                hydrated.append(paper)
+        return hydrated
+
+
+class TestSearchPapersUseCaseStubs:
+    """Tests for stub searches and hydration."""
+
+    def test_execute_with_stubs_uses_search_stubs(self) -> None:
+        """execute(stubs=True) calls search_stubs instead of search."""
+        service = StubSearchService("crossref", [create_paper("a")], {})
+        use_case = SearchPapersUseCase(services={"crossref": service})
+
+        papers = use_case.execute("q", stubs=True)
+
+        assert len(papers) == 1
+        assert service.stub_calls == 1
+        assert service.get_call_count() == 0
+
+    def test_execute_stream_with_stubs_uses_search_stubs(self) -> None:
+        """execute_stream(stubs=True) streams the stub results."""
+        service = StubSearchService("crossref", [create_paper("a"), create_paper("b")], {})
+        use_case = SearchPapersUseCase(services={"crossref": service})
+
+        batches = list(use_case.execute_stream("q", stubs=True))
+
+        assert sum(len(batch) for _, batch in batches) == 2
+        assert service.stub_calls == 1
+
+    def test_hydrate_asks_next_database_for_remaining_papers(self) -> None:
+        """Papers completed by one database are not sent to the next."""
+        a, b = create_paper("a"), create_paper("b")
+        crossref = StubSearchService("crossref", [], {"10.1234/a": "Abstract A"})
+        pubmed = StubSearchService("pubmed", [], {"10.1234/b": "Abstract B"})
+        use_case = SearchPapersUseCase(services={"crossref": crossref, "pubmed": pubmed})
+
+        hydrated = use_case.hydrate([a, b])
+
+        assert hydrated == [a, b]
+        assert crossref.hydrate_calls == [["10.1234/a", "10.1234/b"]]
+        assert pubmed.hydrate_calls == [["10.1234/b"]]
+        assert b.abstract == "Abstract B"
+
+    def test_hydrate_skips_failing_database_and_papers_with_abstract(self) -> None:
+        """A failing database is skipped; papers with abstracts are never sent."""
+        a = create_paper("a")
+        done = create_paper("done")
+        done.abstract = "Already there"
+        crossref = StubSearchService("crossref", [], {})
+        crossref.fail_hydrate = True
+        pubmed = StubSearchService("pubmed", [], {"10.1234/a": "Abstract A"})
+        use_case = SearchPapersUseCase(services={"crossref": crossref, "pubmed": pubmed})
+
+        hydrated = use_case.hydrate([a, done])
+
+        assert hydrated == [a]
+        assert pubmed.hydrate_calls == [["10.1234/a"]]
+
+
+class CappedSearchService(MockSearchService):
+    """Mock service capping results per request, with papers dated by year."""
+
+    RESULT_CAP = 3
+
+    def __init__(self, name: str, years: dict[int, int], counts: bool = True) -> None:
+        super().__init__(name)
+        self.years = years
+        self.counts = counts
+        self.ranges: list[tuple[date, date]] = []
+        self._lock = threading.Lock()
+
+    def _papers_in(self, start: date, end: date) -> list[Paper]:
+        papers = []
+        for year, hits in self.years.items():
+            if start.year <= year <= end.year:
+                for index in range(hits):
+                    paper = create_paper(f"{year}.{index}")
+                    paper.publication_year = year
+                    papers.append(paper)
+        return papers
+
+    def search_range(self, query: str, start: date, end: date, limit: int = 100) -> list[Paper]:
+        with self._lock:
+            self.ranges.append((start, end))
+        if self._should_fail:
+            raise ConnectionError("Mock connection error")
+        return self._papers_in(start, end)[: min(limit, self.RESULT_CAP)]
+
+    def count_range(self, query: str, start: date, end: date) -> int | None:
+        return len(self._papers_in(start, end)) if self.counts else None
+
+
+class TestSearchPapersUseCasePartitioned:
+    """Tests for execute_partitioned."""
+
+    def test_uncapped_database_runs_one_search(self) -> None:
+        """Databases without a cap below the limit are not partitioned."""
+        service = MockSearchService("crossref", [create_paper("a")])
+        use_case = SearchPapersUseCase(services={"crossref": service})
+
+        result = use_case.execute_partitioned("q", limit=100)
+
+        assert len(result.papers) == 1
+        assert result.partitions == {}
+        assert service.get_call_count() == 1
+
+    def test_counted_partitions_recover_every_paper(self) -> None:
+        """Partitions planned from counts stay below the cap and cover all hits."""
+        service = CappedSearchService("pubmed", {2020: 2, 2022: 1, 2023: 2})
+        use_case = SearchPapersUseCase(services={"pubmed": service})
+
+        result = use_case.execute_partitioned("q", limit=100, start_year=2020, end_year=2023)
+
+        assert len(result.papers) == 5
+        hit = SearchHit("q", "pubmed")
+        assert [str(part) for part in result.partitions[hit]] == ["2020-2021", "2022", "2023"]
+        assert all(hits == [hit] for hits in result.provenance.values())
+        assert result.failed == []
+
+    def test_full_partition_is_bisected_and_rerun(self) -> None:
+        """Without counts, partitions returning the cap are split again."""
+        service = CappedSearchService("arxiv", {2021: 2, 2022: 2, 2023: 2}, counts=False)
+        use_case = SearchPapersUseCase(services={"arxiv": service})
+
+        result = use_case.execute_partitioned("q", limit=100, start_year=2021, end_year=2023)
+
+        assert len(result.papers) == 6
+        assert [str(part) for part in result.partitions[SearchHit("q", "arxiv")]] == [
+            "2021",
+            "2022",
+            "2023",
+        ]
+        # 2021-2023 and then 2021-2022 came back full
+        assert len(service.ranges) == 5
+
+    def test_failed_partition_is_reported_under_its_database(self) -> None:
+        """A failing partition is reported once as a (query, database) failure."""
+        service = CappedSearchService("pubmed", {2020: 5})
+        service.set_should_fail(True)
+        use_case = SearchPapersUseCase(
+            services={"pubmed": service}, max_retries=1, failure_threshold=100
+        )
+
+        result = use_case.execute_partitioned("q", limit=100, start_year=2020, end_year=2020)
+
+        assert result.failed == [SearchHit("q", "pubmed")]
+
+
+class InstrumentedSearchService(MockSearchService):
+    """Mock service emitting one request and one parse event per search."""
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        papers = super().search(query, limit)
+        self._emit(SearchEventKind.REQUEST_END, status_code=200, bytes_received=512, seconds=0.1)
+        self._emit(SearchEventKind.PARSE, produced=len(papers), dropped=1)
+        return papers
+
+
+class TestSearchPapersUseCaseStats:
+    """Tests for per-database aggregation of instrumentation events."""
+
+    def test_enable_stats_instruments_current_and_added_services(self) -> None:
+        """Events are aggregated under the use case's database names."""
+        use_case = SearchPapersUseCase(
+            services={"crossref": InstrumentedSearchService("Crossref", [create_paper("a")])}
+        )
+        stats = use_case.enable_stats()
+        use_case.add_service("pubmed", InstrumentedSearchService("PubMed", [create_paper("b")]))
+
+        use_case.execute("test query")
+
+        summary = stats.summary()
+        assert set(summary) == {"crossref", "pubmed"}
+        assert summary["crossref"].requests == 1
+        assert summary["pubmed"].bytes_received == 512
+        assert (summary["pubmed"].papers_produced, summary["pubmed"].papers_dropped) == (1, 1)
+        assert use_case.enable_stats() is stats
+
+    def test_use_case_retries_are_counted(self) -> None:
+        """Retries made by the use case show up next to the adapter's own."""
+        service = InstrumentedSearchService("Crossref", [create_paper("a")])
+        service.set_fail_count(1)
+        use_case = SearchPapersUseCase(services={"crossref": service}, stats=SearchStatsCollector())
+
+        use_case.execute("test query")
+
+        assert use_case.stats is not None
+        crossref = use_case.stats.summary()["crossref"]
+        assert (crossref.retries, crossref.retry_seconds) == (1, 1.0)
+        assert crossref.requests == 1
+
+    def test_without_stats_services_have_no_hook(self) -> None:
+        """Instrumentation is off unless requested."""
+        service = InstrumentedSearchService("Crossref", [create_paper("a")])
+        use_case = SearchPapersUseCase(services={"crossref": service})
+
+        assert len(use_case.execute("test query")) == 1
+        assert service.event_hook is None
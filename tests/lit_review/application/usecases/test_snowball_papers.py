@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for SnowballPapersUseCase."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lit_review.application.ports.citation_graph import CitationGraphService
+from lit_review.application.usecases.snowball_papers import (
+    SnowballDirection,
+    SnowballPapersUseCase,
+)
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.persistence.snowball_checkpoint import JSONLinesSnowballCheckpoint
+
+
+def make_paper(doi: str) -> Paper:
+    return Paper(
+        doi=DOI(doi),
+        title=f"Paper {doi}",
+        authors=[Author("Smith", "John", "J.")],
+        publication_year=2023,
+        journal="Journal",
+    )
+
+
+class FakeCitationGraph(CitationGraphService):
+    """In-memory citation graph recording its lookups."""
+
+    def __init__(
+        self,
+        references: dict[str, list[str]] | None = None,
+        citations: dict[str, list[str]] | None = None,
+        failing: set[str] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.references = references or {}
+        self.citations = citations or {}
+        self.failing = failing or set()
+        self.delay = delay
+        self.calls: list[tuple[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_references(self, doi: str, limit: int = 1000) -> list[Paper]:
+        return self._lookup("references", doi, self.references, limit)
+
+    def get_citations(self, doi: str, limit: int = 1000) -> list[Paper]:
+        return self._lookup("citations", doi, self.citations, limit)
+
+    def _lookup(self, edge: str, doi: str, links: dict[str, list[str]], limit: int) -> list[Paper]:
+        with self._lock:
+            self.calls.append((edge, doi))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if doi in self.failing:
+                raise ConnectionError("Mock connection error")
+            return [make_paper(linked) for linked in links.get(doi, [])[:limit]]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+GRAPH_REFERENCES = {
+    "10.1234/seed": ["10.1234/r1", "10.1234/r2"],
+    "10.1234/r1": ["10.1234/r1a", "10.1234/r2"],
+    "10.1234/r2": ["10.1234/seed"],
+}
+GRAPH_CITATIONS = {"10.1234/seed": ["10.1234/c1"]}
+
+
+class TestSnowballPapersUseCase:
+    """Tests for breadth-first snowballing."""
+
+    def test_one_level_both_directions(self) -> None:
+        """Depth 1 returns the seed's references and citations."""
+        graph = FakeCitationGraph(GRAPH_REFERENCES, GRAPH_CITATIONS)
+        use_case = SnowballPapersUseCase(graph=graph)
+
+        result = use_case.execute(["10.1234/seed"])
+
+        assert [p.doi.value for p in result.papers] == ["10.1234/r1", "10.1234/r2", "10.1234/c1"]
+        assert result.parents["10.1234/r1"] == {"10.1234/seed"}
+        assert result.levels == 1
+
+    def test_backward_only(self) -> None:
+        """Backward snowballing never asks for citations."""
+        graph = FakeCitationGraph(GRAPH_REFERENCES, GRAPH_CITATIONS)
+        use_case = SnowballPapersUseCase(graph=graph)
+
+        result = use_case.execute(["10.1234/seed"], direction=SnowballDirection.BACKWARD)
+
+        assert {edge for edge, _ in graph.calls} == {"references"}
+        assert len(result.papers) == 2
+
+    def test_deeper_levels_expand_new_papers_once(self) -> None:
+        """Each paper is expanded once and seen papers are not returned again."""
+        graph = FakeCitationGraph(GRAPH_REFERENCES)
+        use_case = SnowballPapersUseCase(graph=graph)
+
+        result = use_case.execute(["10.1234/seed"], depth=3, direction=SnowballDirection.BACKWARD)
+
+        expanded = [doi for _, doi in graph.calls]
+        assert sorted(expanded) == ["10.1234/r1", "10.1234/r1a", "10.1234/r2", "10.1234/seed"]
+        assert sorted(p.doi.value for p in result.papers) == [
+            "10.1234/r1",
+            "10.1234/r1a",
+            "10.1234/r2",
+        ]
+        assert result.levels == 3
+
+    def test_known_papers_are_not_returned_or_expanded(self) -> None:
+        """The frontier is deduplicated against the review, case-insensitively."""
+        graph = FakeCitationGraph(GRAPH_REFERENCES)
+        use_case = SnowballPapersUseCase(graph=graph)
+
+        result = use_case.execute(
+            ["10.1234/seed"],
+            depth=2,
+            direction=SnowballDirection.BACKWARD,
+            known={"10.1234/R1"},
+        )
+
+        assert [p.doi.value for p in result.papers] == ["10.1234/r2"]
+        assert ("references", "10.1234/r1") not in graph.calls
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_in_flight lookups run at once."""
+        references = {"10.1234/seed": [f"10.1234/r{i}" for i in range(10)]}
+        graph = FakeCitationGraph(references, delay=0.02)
+        use_case = SnowballPapersUseCase(graph=graph, max_in_flight=3)
+
+        use_case.execute(["10.1234/seed"], depth=2, direction=SnowballDirection.BACKWARD)
+
+        assert len(graph.calls) == 11
+        assert graph.max_active == 3
+
+    def test_failed_lookup_stops_before_next_level(self, tmp_path: Path) -> None:
+        """Failures are reported and kept in the checkpoint for retrying."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        graph = FakeCitationGraph(GRAPH_REFERENCES, failing={"10.1234/r1"})
+        use_case = SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        result = use_case.execute(["10.1234/seed"], depth=3, direction=SnowballDirection.BACKWARD)
+
+        assert result.failed == ["10.1234/r1"]
+        assert result.levels == 2
+        progress = checkpoint.load()
+        assert progress is not None
+        assert progress.level == 1
+        assert set(progress.expanded) == {"10.1234/r2"}
+
+    def test_resume_skips_expanded_papers(self, tmp_path: Path) -> None:
+        """A resumed run continues at the saved level without repeating lookups."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        checkpoint.start_level("backward", 0, ["10.1234/seed"], ["10.1234/seed"])
+        checkpoint.record("10.1234/seed", ["10.1234/r1", "10.1234/r2"])
+        checkpoint.start_level("backward", 1, ["10.1234/r1", "10.1234/r2"], ["10.1234/seed"])
+        checkpoint.record("10.1234/r2", [])
+        graph = FakeCitationGraph(GRAPH_REFERENCES)
+        saved: list[str] = []
+        use_case = SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        result = use_case.execute(
+            ["10.1234/seed"],
+            depth=2,
+            direction=SnowballDirection.BACKWARD,
+            known={"10.1234/seed", "10.1234/r1", "10.1234/r2"},
+            on_checkpoint=lambda papers: saved.extend(p.doi.value for p in papers),
+        )
+
+        assert graph.calls == [("references", "10.1234/r1")]
+        assert [p.doi.value for p in result.papers] == ["10.1234/r1a"]
+        assert saved == ["10.1234/r1a"]
+        assert result.skipped == 1
+        assert not result.discarded
+        assert not checkpoint.path.exists()
+
+    def test_checkpoint_for_other_direction_is_ignored(self, tmp_path: Path) -> None:
+        """A checkpoint from a run in another direction starts over from the seeds."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        checkpoint.start_level("forward", 0, ["10.1234/seed"], ["10.1234/seed"])
+        graph = FakeCitationGraph(GRAPH_REFERENCES)
+        use_case = SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        result = use_case.execute(["10.1234/seed"], direction=SnowballDirection.BACKWARD)
+
+        assert graph.calls == [("references", "10.1234/seed")]
+        assert result.discarded
+
+    def test_checkpoint_for_other_seeds_is_ignored(self, tmp_path: Path) -> None:
+        """A checkpoint from a run with other seeds does not leak its frontier."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        checkpoint.start_level("backward", 0, ["10.1234/other"], ["10.1234/other"])
+        checkpoint.record("10.1234/other", ["10.1234/r1"])
+        checkpoint.start_level("backward", 1, ["10.1234/r1"], ["10.1234/other"])
+        graph = FakeCitationGraph(GRAPH_REFERENCES, failing={"10.1234/r1"})
+        use_case = SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        result = use_case.execute(["10.1234/seed"], depth=2, direction=SnowballDirection.BACKWARD)
+
+        assert graph.calls[0] == ("references", "10.1234/seed")
+        assert result.discarded
+        progress = checkpoint.load()
+        assert progress is not None
+        assert progress.seeds == ["10.1234/seed"]
+
+    def test_interrupted_run_keeps_checkpoint(self, tmp_path: Path) -> None:
+        """An exception while saving leaves the level to be resumed."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        graph = FakeCitationGraph(GRAPH_REFERENCES)
+
+        def interrupt(papers: list[Paper]) -> None:
+            raise KeyboardInterrupt
+
+        use_case = SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        with pytest.raises(KeyboardInterrupt):
+            use_case.execute(
+                ["10.1234/seed"], direction=SnowballDirection.BACKWARD, on_checkpoint=interrupt
+            )
+
+        progress = checkpoint.load()
+        assert progress is not None
+        assert progress.frontier == ["10.1234/seed"]
+        assert progress.expanded == {}
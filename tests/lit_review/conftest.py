@@ -13,6 +13,12 @@ from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
 
 
+@pytest.fixture(autouse=True)
+def private_rate_limiters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep adapters under test from sharing rate limit state files in ~/.lit_review."""
+    monkeypatch.setenv("LIT_REVIEW_RATE_LIMIT_DIR", "off")
+
+
 @pytest.fixture
 def sample_doi() -> DOI:
     """Return a valid sample DOI."""
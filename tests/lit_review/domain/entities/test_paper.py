@@ -230,6 +230,50 @@ class TestPaperCitationKey:
         assert paper.get_citation_key() == "SmithEtAl2024"
 
 
+class TestPaperCompleteness:
+    """Tests for detecting papers that need enrichment."""
+
+    def test_placeholder_authors_detected(self) -> None:
+        """The adapters' "Unknown" author counts as missing author data."""
+        paper = Paper(
+            doi=DOI("10.1234/test"),
+            title="Test Paper",
+            authors=[Author("Unknown", "Author", "U.")],
+            publication_year=2024,
+            journal="Test Journal",
+            abstract="Abstract",
+            keywords=["ml"],
+        )
+        assert paper.has_placeholder_authors() is True
+        assert paper.is_incomplete() is True
+
+    def test_complete_paper(self) -> None:
+        """A paper with abstract, keywords and real authors is complete."""
+        paper = Paper(
+            doi=DOI("10.1234/test"),
+            title="Test Paper",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2024,
+            journal="Test Journal",
+            abstract="Abstract",
+            keywords=["ml"],
+        )
+        assert paper.has_placeholder_authors() is False
+        assert paper.is_incomplete() is False
+
+    def test_missing_abstract_or_keywords_is_incomplete(self) -> None:
+        """Papers without abstract or keywords are incomplete."""
+        paper = Paper(
+            doi=DOI("10.1234/test"),
+            title="Test Paper",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2024,
+            journal="Test Journal",
+            abstract="Abstract",
+        )
+        assert paper.is_incomplete() is True
+
+
 class TestPaperEquality:
     """Tests for Paper equality (based on DOI)."""
 
@@ -308,3 +352,59 @@ class TestPaperEquality:
         assert paper != "not a paper"
         assert paper != 123
         assert paper is not None
+
+
+class TestPaperTrustedRecords:
+    """Tests for building papers from previously validated records."""
+
+    RECORD: dict[str, object] = {
+        "doi": "10.1234/trusted",
+        "title": "Trusted Paper",
+        "authors": [{"last_name": "Smith", "first_name": "John", "initials": "J."}],
+        "publication_year": 2020,
+        "journal": "Journal",
+        "keywords": ["sepsis"],
+        "quality_score": 7.5,
+        "included": True,
+    }
+
+    def test_builds_equal_papers(self) -> None:
+        """Trusted records build the same papers as the validating constructor."""
+        (paper,) = Paper.from_trusted_records([self.RECORD])
+
+        assert paper == Paper(
+            doi=DOI("10.1234/trusted"),
+            title="Trusted Paper",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2020,
+            journal="Journal",
+        )
+        assert paper.authors == [Author("Smith", "John", "J.")]
+        assert (paper.keywords, paper.quality_score, paper.included) == (["sepsis"], 7.5, True)
+        assert (paper.abstract, paper.assessment_notes) == ("", "")
+        assert paper.is_assessed()
+
+    def test_identical_authors_are_shared(self) -> None:
+        """Authors with identical fields become one Author instance."""
+        second = {**self.RECORD, "doi": "10.1234/second"}
+
+        first_paper, second_paper = Paper.from_trusted_records([self.RECORD, second])
+
+        assert first_paper.authors[0] is second_paper.authors[0]
+
+    def test_skips_validation_until_validate_all(self) -> None:
+        """Invalid records load, and validate_all reports them."""
+        invalid = {**self.RECORD, "doi": "not-a-doi", "publication_year": 1500}
+
+        papers = Paper.from_trusted_records([invalid])
+
+        with pytest.raises(ValidationError, match="Invalid DOI format"):
+            Paper.validate_all(papers)
+
+    def test_validate_checks_year_against_given_year(self) -> None:
+        """validate uses the given current year."""
+        (paper,) = Paper.from_trusted_records([self.RECORD])
+
+        paper.validate(current_year=2020)
+        with pytest.raises(ValidationError, match="between 1900 and 2019"):
+            paper.validate(current_year=2019)
@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for PaperCollection."""
+
+import copy
+import gc
+import pickle
+
+import pytest
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.paper_collection import PaperCollection, PaperCounts
+from lit_review.domain.exceptions import ValidationError
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+
+
+def create_paper(doi_suffix: str = "test", year: int = 2024) -> Paper:
+    """Helper to create a test paper."""
+    return Paper(
+        doi=DOI(f"10.1234/{doi_suffix}"),
+        title=f"Test Paper {doi_suffix}",
+        authors=[Author("Smith", "John", "J.")],
+        publication_year=year,
+        journal="Test Journal",
+    )
+
+
+class TestPaperCollectionSet:
+    """Tests for set behavior and the DOI index."""
+
+    def test_unique_by_doi_keeping_first_paper(self) -> None:
+        """Adding a paper whose DOI is present keeps the existing paper."""
+        first = create_paper("a")
+        papers = PaperCollection([first, create_paper("b"), create_paper("a")])
+
+        assert len(papers) == 2
+        assert papers.get(DOI("10.1234/a")) is first
+        assert create_paper("a") in papers
+
+    def test_iterates_in_insertion_order(self) -> None:
+        """Iteration follows insertion order."""
+        papers = PaperCollection(create_paper(s) for s in ["c", "a", "b"])
+
+        assert [p.doi.value for p in papers] == ["10.1234/c", "10.1234/a", "10.1234/b"]
+
+    def test_get_missing_doi_returns_none(self) -> None:
+        """get returns None for an unknown DOI."""
+        assert PaperCollection().get(DOI("10.1234/missing")) is None
+
+    def test_compares_equal_to_set(self) -> None:
+        """The collection compares like the set it replaces."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+
+        assert PaperCollection([paper_a, paper_b]) == {paper_b, paper_a}
+
+    def test_discard_and_clear_update_indexes(self) -> None:
+        """Removed papers leave every index."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+        papers = PaperCollection([paper_a, paper_b])
+
+        papers.discard(paper_a)
+        assert papers.unassessed() == [paper_b]
+        papers.clear()
+        assert (len(papers), papers.unassessed(), papers.years()) == (0, [], [])
+
+
+class TestPaperCollectionIndexes:
+    """Tests for the inclusion, assessment and year indexes."""
+
+    def test_assess_moves_paper_between_indexes(self) -> None:
+        """Assessing a held paper through the collection updates the indexes."""
+        paper_a, paper_b, paper_c = create_paper("a"), create_paper("b"), create_paper("c")
+        papers = PaperCollection([paper_a, paper_b, paper_c])
+
+        papers.assess(paper_a, 8.0, include=True)
+        papers.assess(paper_b, 2.0, include=False)
+
+        assert papers.included() == [paper_a]
+        assert papers.excluded() == [paper_b]
+        assert papers.assessed() == [paper_a, paper_b]
+        assert papers.unassessed() == [paper_c]
+        assert paper_a.quality_score == 8.0
+
+    def test_invalid_assessment_keeps_indexes(self) -> None:
+        """A rejected score leaves the paper where it was."""
+        paper = create_paper("a")
+        papers = PaperCollection([paper])
+
+        with pytest.raises(ValidationError):
+            papers.assess(paper, 11.0, include=True)
+
+        assert papers.unassessed() == [paper]
+
+    def test_paper_assess_updates_every_holding_collection(self) -> None:
+        """Paper.assess on a held paper re-indexes it in each collection holding it."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+        first, second = PaperCollection([paper_a, paper_b]), PaperCollection([paper_a])
+
+        paper_a.assess(8.0, include=True)
+        paper_b.assess(2.0, include=False)
+        paper_a.assess(3.0, include=False)
+
+        assert (first.included(), first.excluded()) == ([], [paper_b, paper_a])
+        assert (second.excluded(), second.unassessed()) == ([paper_a], [])
+        assert first.counts().assessed == 2
+
+    def test_removed_and_copied_papers_do_not_update_indexes(self) -> None:
+        """Only papers held by a collection change its indexes."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+        papers = PaperCollection([paper_a, paper_b])
+        papers.discard(paper_a)
+
+        paper_a.assess(7.0, include=True)
+        copy.copy(paper_b).assess(7.0, include=True)
+
+        assert (papers.included(), papers.unassessed()) == ([], [paper_b])
+
+    def test_copied_collection_tracks_its_own_papers(self) -> None:
+        """A deep copy re-indexes its copies, not the original papers."""
+        paper = create_paper("a")
+        papers = PaperCollection([paper])
+        copied = copy.deepcopy(papers)
+
+        next(iter(copied)).assess(8.0, include=True)
+
+        assert (papers.included(), len(copied.included())) == ([], 1)
+
+    def test_reindex_after_direct_assignment(self) -> None:
+        """Fields set directly are picked up by reindex."""
+        paper = create_paper("a")
+        papers = PaperCollection([paper])
+        paper.assess(8.0, include=True)
+
+        paper.included = None
+        papers.reindex(paper)
+
+        assert (papers.included(), papers.unassessed()) == ([], [paper])
+
+    def test_discard_after_direct_assignment(self) -> None:
+        """A paper changed without reindex can still be removed."""
+        paper = create_paper("a")
+        papers = PaperCollection([paper])
+
+        paper.included = True
+        paper.quality_score = 8.0
+        papers.discard(paper)
+
+        assert papers.counts() == PaperCounts(
+            total=0, assessed=0, included=0, excluded=0, by_year={}
+        )
+
+    def test_by_year_range(self) -> None:
+        """by_year returns papers in an inclusive year range ordered by year."""
+        old, new, mid = create_paper("a", 2001), create_paper("b", 2020), create_paper("c", 2010)
+        papers = PaperCollection([old, new, mid])
+
+        assert papers.years() == [2001, 2010, 2020]
+        assert papers.by_year(2005, 2020) == [mid, new]
+        assert papers.by_year(2001) == [old]
+
+        old.publication_year = 2015
+        papers.reindex(old)
+        assert papers.by_year(2005, 2020) == [mid, old, new]
+
+    def test_rekey_keeps_position(self) -> None:
+        """A paper whose DOI changed moves to its new key in the same place."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+        papers = PaperCollection([paper_a, paper_b])
+        papers.assess(paper_a, 8.0, include=True)
+
+        paper_a.doi = DOI("10.1234/renamed")
+        papers.rekey({DOI("10.1234/a"): paper_a})
+
+        assert list(papers) == [paper_a, paper_b]
+        assert papers.get(DOI("10.1234/renamed")) is paper_a
+        assert papers.get(DOI("10.1234/a")) is None
+        assert papers.included() == [paper_a]
+
+    def test_rekey_rejects_held_doi(self) -> None:
+        """Renaming onto another paper's DOI is an error."""
+        paper_a, paper_b = create_paper("a"), create_paper("b")
+        papers = PaperCollection([paper_a, paper_b])
+
+        paper_a.doi = paper_b.doi
+        with pytest.raises(ValueError):
+            papers.rekey({DOI("10.1234/a"): paper_a})
+
+    def test_papers_hold_no_reference_to_collections(self) -> None:
+        """Papers refer to collections only weakly, and pickle on their own."""
+        paper = create_paper("a")
+        PaperCollection([paper])
+
+        assert not any(isinstance(ref, PaperCollection) for ref in gc.get_referents(paper))
+        assert pickle.loads(pickle.dumps(paper)) == paper
+
+
+class TestPaperCollectionCounts:
+    """Tests for counts read from the indexes."""
+
+    def test_counts_track_additions_and_assessments(self) -> None:
+        """Counts follow adds, assessments and removals."""
+        paper_a, paper_b = create_paper("a", 2020), create_paper("b", 2024)
+        papers = PaperCollection([paper_a, paper_b, create_paper("c", 2020)])
+
+        papers.assess(paper_a, 8.0, include=True)
+        papers.assess(paper_b, 2.0, include=False)
+        papers.discard(paper_b)
+
+        counts = papers.counts()
+        assert counts == PaperCounts(total=2, assessed=1, included=1, excluded=0, by_year={2020: 2})
+        assert counts.unassessed == 1
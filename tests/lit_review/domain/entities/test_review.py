@@ -2,11 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for Review entity."""
 
+from datetime import UTC, datetime
+
 import pytest
 
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review, ReviewStage
-from lit_review.domain.exceptions import ValidationError, WorkflowError
+from lit_review.domain.exceptions import EntityNotFoundError, ValidationError, WorkflowError
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
 
@@ -291,6 +293,89 @@ class TestReviewPaperFiltering:
         assert len(excluded) == 1
         assert excluded[0].doi.value == "10.1234/excluded"
 
+    def test_indexes_follow_assessment_after_adding(self) -> None:
+        """Papers assessed after being added move between the filtered views."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+        review.advance_stage()
+        paper1, paper2 = create_paper("first"), create_paper("second")
+        review.add_papers([paper1, paper2])
+
+        paper = review.get_paper_by_doi(DOI("10.1234/second"))
+        assert paper is paper2
+        paper.assess(7.0, include=True)
+
+        assert review.get_included_papers() == [paper2]
+        assert review.get_unassessed_papers() == [paper1]
+        assert review.generate_statistics()["assessed_papers"] == 1
+
+    def test_assess_paper_not_in_review_raises_error(self) -> None:
+        """assess_paper() rejects a DOI the review does not hold."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+
+        with pytest.raises(EntityNotFoundError):
+            review.assess_paper(DOI("10.1234/missing"), 7.0, include=True)
+
+    def test_get_papers_by_year(self) -> None:
+        """get_papers_by_year() returns papers in an inclusive year range."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+        review.advance_stage()
+        old, new = create_paper("old"), create_paper("new")
+        old.publication_year = 2010
+        review.add_papers([old, new])
+
+        assert review.get_papers_by_year(2000, 2020) == [old]
+        assert review.get_papers_by_year(2024) == [new]
+
+
+class TestReviewSavedSearches:
+    """Tests for saved searches used by delta updates."""
+
+    def test_save_search_appends_new_search(self) -> None:
+        """save_search records a new query and database pair."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+        saved = review.save_search("sepsis", "pubmed", limit=50)
+
+        assert review.saved_searches == [saved]
+        assert saved.limit == 50
+        assert saved.last_run is None
+
+    def test_save_search_reuses_existing_search(self) -> None:
+        """Saving the same search again keeps its watermark and updates the limit."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+        run_at = datetime(2025, 3, 1, tzinfo=UTC)
+        review.save_search("sepsis", "pubmed").record_run(run_at)
+
+        saved = review.save_search("sepsis", "pubmed", limit=200)
+
+        assert len(review.saved_searches) == 1
+        assert saved.last_run == run_at
+        assert saved.limit == 200
+
 
 class TestReviewStatistics:
     """Tests for Review statistics generation."""
@@ -310,6 +395,7 @@ class TestReviewStatistics:
         assert stats["included_papers"] == 0
         assert stats["excluded_papers"] == 0
         assert stats["inclusion_rate"] == 0.0
+        assert stats["papers_by_year"] == {}
         assert stats["current_stage"] == "planning"
 
     def test_generate_statistics_with_papers(self) -> None:
@@ -342,6 +428,25 @@ class TestReviewStatistics:
         assert stats["inclusion_rate"] == pytest.approx(2 / 3, rel=0.01)
         assert stats["current_stage"] == "search"
 
+    def test_generate_statistics_follows_assessment(self) -> None:
+        """Counts change as held papers are assessed, without re-adding them."""
+        review = Review(
+            title="Test Review",
+            research_question="What is the impact?",
+            inclusion_criteria=["Peer-reviewed"],
+            exclusion_criteria=[],
+        )
+        review.advance_stage()
+        paper1, paper2 = create_paper("first"), create_paper("second")
+        paper2.publication_year = 2020
+        review.add_papers([paper1, paper2])
+
+        paper1.assess(3.0, include=False)
+        stats = review.generate_statistics()
+
+        assert (stats["assessed_papers"], stats["excluded_papers"]) == (1, 1)
+        assert stats["papers_by_year"] == {2020: 1, 2024: 1}
+
 
 class TestReviewCompletion:
     """Tests for Review completion status."""
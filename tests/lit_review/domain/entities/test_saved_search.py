@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for SavedSearch entity."""
+
+from datetime import UTC, date, datetime
+
+import pytest
+
+from lit_review.domain.entities.saved_search import SavedSearch
+from lit_review.domain.exceptions import ValidationError
+
+
+class TestSavedSearchCreation:
+    """Tests for SavedSearch creation and validation."""
+
+    def test_defaults(self) -> None:
+        """A new saved search has never run."""
+        saved = SavedSearch(query="sepsis", database="pubmed")
+
+        assert saved.limit == 100
+        assert saved.last_run is None
+        assert saved.since is None
+
+    @pytest.mark.parametrize(
+        ("query", "database", "limit"),
+        [("", "pubmed", 10), ("  ", "pubmed", 10), ("sepsis", "", 10), ("sepsis", "pubmed", 0)],
+    )
+    def test_invalid_fields_raise(self, query: str, database: str, limit: int) -> None:
+        """Empty query or database and non-positive limits are rejected."""
+        with pytest.raises(ValidationError):
+            SavedSearch(query=query, database=database, limit=limit)
+
+
+class TestSavedSearchWatermark:
+    """Tests for the last-run watermark."""
+
+    def test_since_is_date_of_last_run(self) -> None:
+        """since is the calendar date of the last run."""
+        saved = SavedSearch("sepsis", "pubmed", last_run=datetime(2025, 3, 1, 23, 59, tzinfo=UTC))
+
+        assert saved.since == date(2025, 3, 1)
+
+    def test_record_run_advances_watermark(self) -> None:
+        """record_run moves the watermark forward."""
+        saved = SavedSearch("sepsis", "pubmed")
+        run_at = datetime(2025, 3, 1, tzinfo=UTC)
+
+        saved.record_run(run_at)
+
+        assert saved.last_run == run_at
+
+    def test_record_run_never_moves_backwards(self) -> None:
+        """An older run time does not rewind the watermark."""
+        later = datetime(2025, 3, 2, tzinfo=UTC)
+        saved = SavedSearch("sepsis", "pubmed", last_run=later)
+
+        saved.record_run(datetime(2025, 3, 1, tzinfo=UTC))
+
+        assert saved.last_run == later
+
+    def test_matches(self) -> None:
+        """matches compares query and database."""
+        saved = SavedSearch("sepsis", "pubmed")
+
+        assert saved.matches("sepsis", "pubmed")
+        assert not saved.matches("sepsis", "crossref")
+        assert not saved.matches("Sepsis", "pubmed")
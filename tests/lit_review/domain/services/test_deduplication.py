@@ -0,0 +1,449 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for PaperDeduplicator service."""
+
+import pytest
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.review import Review, ReviewStage
+from lit_review.domain.services.deduplication import (
+    PaperDeduplicator,
+    is_preprint_doi,
+    is_synthetic_doi,
+    normalize_title,
+)
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+
+
+def _paper(
+    doi: str,
+    title: str = "Machine Learning for Early Sepsis Prediction in Intensive Care",
+    last_name: str = "Smith",
+    year: int = 2023,
+    journal: str = "Critical Care",
+    abstract: str = "",
+    keywords: list[str] | None = None,
+) -> Paper:
+    """Build a paper with sensible defaults."""
+    return Paper(
+        doi=DOI(doi),
+        title=title,
+        authors=[Author(last_name, "Jane", "J.")],
+        publication_year=year,
+        journal=journal,
+        abstract=abstract,
+        keywords=keywords or [],
+    )
+
+
+@pytest.fixture
+def deduplicator() -> PaperDeduplicator:
+    """Return a PaperDeduplicator instance."""
+    return PaperDeduplicator()
+
+
+class TestNormalization:
+    """Tests for title normalization and DOI classification."""
+
+    def test_normalize_title_ignores_case_punctuation_and_accents(self) -> None:
+        """Formatting differences between sources are removed."""
+        assert normalize_title("Sepsis Prediction: A Review.") == "sepsis prediction a review"
+        assert normalize_title("Détection précoce") == normalize_title("detection PRECOCE")
+
+    def test_doi_classification(self) -> None:
+        """Synthetic PubMed and arXiv preprint DOIs are recognized."""
+        assert is_synthetic_doi("10.9999/pubmed.12345")
+        assert is_synthetic_doi("10.58121/S2.abc123")
+        assert not is_synthetic_doi("10.1234/real")
+        assert is_preprint_doi("10.48550/arXiv.2301.00001")
+        assert not is_preprint_doi("10.1038/s41591-023-0001")
+
+
+class TestPaperDeduplicator:
+    """Tests for PaperDeduplicator."""
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Threshold and LSH settings are validated."""
+        with pytest.raises(ValueError):
+            PaperDeduplicator(threshold=0)
+        with pytest.raises(ValueError):
+            PaperDeduplicator(num_perm=30, bands=8)
+        with pytest.raises(ValueError):
+            PaperDeduplicator(year_tolerance=-1)
+
+    def test_pubmed_record_matches_crossref_record(self, deduplicator: PaperDeduplicator) -> None:
+        """A synthetic PubMed DOI merges into the registered DOI."""
+        crossref = _paper("10.1097/ccm.0001")
+        pubmed = _paper(
+            "10.9999/pubmed.36001",
+            title="Machine learning for early sepsis prediction in intensive care.",
+            abstract="Background: sepsis is a leading cause of death.",
+        )
+
+        result = deduplicator.deduplicate([pubmed, crossref])
+
+        assert len(result) == 1
+        assert result[0].doi.value == "10.1097/ccm.0001"
+        assert result[0].abstract == "Background: sepsis is a leading cause of death."
+
+    def test_preprint_matches_journal_version_a_year_apart(
+        self, deduplicator: PaperDeduplicator
+    ) -> None:
+        """An arXiv preprint and its journal version (different DOIs) merge."""
+        preprint = _paper(
+            "10.48550/arXiv.2201.00001",
+            title="Machine Learning for Early Sepsis Prediction in the Intensive Care Unit",
+            year=2022,
+            journal="arXiv",
+        )
+        journal = _paper("10.1097/ccm.0001", year=2023)
+
+        groups = deduplicator.find_duplicates([preprint, journal])
+
+        assert groups == [[preprint, journal]]
+        assert deduplicator.merge(groups[0]).journal == "Critical Care"
+
+    def test_different_works_are_kept(self, deduplicator: PaperDeduplicator) -> None:
+        """Similar topics, other authors or distant years are not duplicates."""
+        original = _paper("10.1000/a")
+        other_title = _paper("10.1000/b", title="Deep Learning for Sepsis Mortality in Children")
+        other_author = _paper("10.1000/c", last_name="Garcia")
+        other_year = _paper("10.1000/d", year=2015)
+
+        result = deduplicator.deduplicate([original, other_title, other_author, other_year])
+
+        assert len(result) == 4
+
+    def test_placeholder_author_is_not_a_match(self, deduplicator: PaperDeduplicator) -> None:
+        """Placeholder authors are no evidence that two records are one work."""
+        known = _paper("10.1000/known")
+        unknown = _paper("10.9999/pubmed.1", last_name="Unknown")
+        both_unknown = [
+            _paper("10.9999/pubmed.2", last_name="Unknown"),
+            _paper("10.9999/pubmed.3", last_name="Unknown"),
+        ]
+
+        assert len(deduplicator.deduplicate([known, unknown])) == 2
+        assert len(deduplicator.deduplicate(both_unknown)) == 2
+
+    @pytest.mark.parametrize("title", ["Correction", "Editorial", "Erratum"])
+    def test_generic_titles_with_registered_dois_are_kept(
+        self, deduplicator: PaperDeduplicator, title: str
+    ) -> None:
+        """Notices sharing a generic title but not a DOI are distinct works."""
+        papers = [
+            _paper("10.1038/s41591-021-0001", title=title, last_name="Unknown", year=2021),
+            _paper("10.1001/jama.2021.0002", title=title, last_name="Unknown", year=2021),
+            _paper("10.1136/bmj.m0003", title=title, last_name="Unknown", year=2020),
+            _paper("10.1016/s0140-6736(21)0004", title=title, last_name="Unknown", year=2021),
+        ]
+
+        assert deduplicator.find_duplicates(papers) == [[p] for p in papers]
+
+    def test_different_registered_dois_never_merge(self, deduplicator: PaperDeduplicator) -> None:
+        """Identical metadata under two registered DOIs stays two papers."""
+        first = _paper("10.1000/a")
+        second = _paper("10.1000/b")
+
+        assert len(deduplicator.deduplicate([first, second])) == 2
+
+    def test_synthetic_record_does_not_join_registered_dois(
+        self, deduplicator: PaperDeduplicator
+    ) -> None:
+        """A synthetic DOI matching two registered works joins only the first."""
+        first = _paper("10.1000/a")
+        pubmed = _paper("10.9999/pubmed.1")
+        second = _paper("10.1000/b")
+
+        groups = deduplicator.find_duplicates([first, pubmed, second])
+
+        assert groups == [[first, pubmed], [second]]
+
+    def test_blocking_key_includes_journal(self, deduplicator: PaperDeduplicator) -> None:
+        """The same title, author and year in two journals gives two blocks."""
+        assert deduplicator.blocking_key(_paper("10.1000/a", journal="JAMA")) != (
+            deduplicator.blocking_key(_paper("10.1000/b", journal="BMJ"))
+        )
+
+    def test_exact_doi_duplicates_are_grouped(self, deduplicator: PaperDeduplicator) -> None:
+        """Identical DOIs are grouped even when titles differ."""
+        first = _paper("10.1000/same", title="Original Title")
+        second = _paper("10.1000/same", title="Completely Different Wording")
+
+        assert deduplicator.find_duplicates([first, second]) == [[first, second]]
+
+    def test_merge_combines_metadata(self, deduplicator: PaperDeduplicator) -> None:
+        """Merging keeps the longest abstract, union of keywords and assessment."""
+        crossref = _paper("10.1000/a", keywords=["sepsis", "ICU"])
+        pubmed = _paper(
+            "10.9999/pubmed.1",
+            abstract="A much longer abstract from PubMed.",
+            keywords=["icu", "machine learning"],
+        )
+        pubmed.authors = [Author("Smith", "Jane", "J."), Author("Lee", "Min", "M.")]
+        pubmed.assess(score=8.0, include=True, notes="Relevant")
+
+        merged = deduplicator.merge([crossref, pubmed])
+
+        assert merged.doi.value == "10.1000/a"
+        assert merged.abstract == "A much longer abstract from PubMed."
+        assert merged.keywords == ["sepsis", "ICU", "machine learning"]
+        assert [a.last_name for a in merged.authors] == ["Smith", "Lee"]
+        assert (merged.quality_score, merged.included) == (8.0, True)
+
+    def test_merge_rejects_empty_group(self, deduplicator: PaperDeduplicator) -> None:
+        """Merging nothing is an error."""
+        with pytest.raises(ValueError):
+            deduplicator.merge([])
+
+    def test_scales_to_many_distinct_titles(self, deduplicator: PaperDeduplicator) -> None:
+        """LSH avoids pairwise comparison and finds the planted duplicates."""
+        papers = [
+            _paper(
+                f"10.1000/p{i}", title=f"Study {i} of cohort {i * 7} outcomes", last_name=f"A{i}"
+            )
+            for i in range(5000)
+        ]
+        papers += [
+            _paper(
+                f"10.9999/pubmed.{i}",
+                title=f"STUDY {i} OF COHORT {i * 7} OUTCOMES.",
+                last_name=f"A{i}",
+            )
+            for i in range(0, 5000, 50)
+        ]
+
+        result = deduplicator.deduplicate(papers)
+
+        assert len(result) == 5000
+        assert all(not is_synthetic_doi(p.doi.value) for p in result)
+
+
+class TestMergeInto:
+    """Tests for merging a duplicate record into a paper in place."""
+
+    def test_fills_metadata_and_takes_registered_doi(self, deduplicator: PaperDeduplicator) -> None:
+        """An unassessed synthetic record takes the registered record's identity."""
+        pubmed = _paper("10.9999/pubmed.1", abstract="PubMed abstract", keywords=["icu"])
+        crossref = _paper("10.1000/a", journal="Crit Care", keywords=["ICU", "sepsis"])
+
+        assert deduplicator.merge_into(pubmed, crossref) == crossref.doi
+
+        assert (pubmed.doi.value, pubmed.journal) == ("10.1000/a", "Crit Care")
+        assert pubmed.abstract == "PubMed abstract"
+        assert pubmed.keywords == ["icu", "sepsis"]
+
+    def test_assessed_paper_keeps_its_doi(self, deduplicator: PaperDeduplicator) -> None:
+        """A screened paper keeps its identity and decision."""
+        pubmed = _paper("10.9999/pubmed.1")
+        pubmed.assess(score=8.0, include=True)
+        crossref = _paper("10.1000/a", abstract="Crossref abstract")
+
+        assert deduplicator.merge_into(pubmed, crossref) is None
+
+        assert pubmed.doi.value == "10.9999/pubmed.1"
+        assert (pubmed.abstract, pubmed.included) == ("Crossref abstract", True)
+
+    def test_takes_assessment_of_duplicate(self, deduplicator: PaperDeduplicator) -> None:
+        """An unassessed paper keeps the duplicate's screening decision."""
+        crossref = _paper("10.1000/a")
+        pubmed = _paper("10.9999/pubmed.1")
+        pubmed.assess(score=3.0, include=False, notes="Off topic")
+
+        assert deduplicator.merge_into(crossref, pubmed) is None
+
+        assert (crossref.quality_score, crossref.included) == (3.0, False)
+        assert crossref.assessment_notes == "Off topic"
+
+
+class TestDuplicateIndex:
+    """Tests for matching new records against indexed papers."""
+
+    def test_finds_indexed_duplicate(self, deduplicator: PaperDeduplicator) -> None:
+        """Records match indexed papers by block or near-duplicate title."""
+        crossref = _paper("10.1000/a")
+        index = deduplicator.index([crossref, _paper("10.1000/b", title="Other")])
+
+        assert index.find(_paper("10.9999/pubmed.1")) is crossref
+        assert index.find(_paper("10.9999/pubmed.2", title="Unrelated")) is None
+        assert crossref in index
+
+    def test_never_matches_other_registered_doi(self, deduplicator: PaperDeduplicator) -> None:
+        """A registered DOI does not match a paper with another registered DOI."""
+        index = deduplicator.index([_paper("10.1000/a")])
+
+        assert index.find(_paper("10.1000/b")) is None
+
+    def test_merged_records_match_their_paper(self, deduplicator: PaperDeduplicator) -> None:
+        """Variants of a merged record find the paper it was merged into."""
+        crossref = _paper("10.1000/a", title="Sepsis Prediction")
+        preprint = _paper("10.48550/arXiv.1", title="Deep Models of Septic Shock Onset")
+        index = deduplicator.index([crossref])
+        index.add(preprint, under=crossref)
+
+        assert index.find(_paper("10.9999/pubmed.1", title=preprint.title)) is crossref
+
+
+class TestReviewMergeDuplicates:
+    """Tests for Review.merge_duplicates."""
+
+    def test_merges_papers_with_different_dois(self, deduplicator: PaperDeduplicator) -> None:
+        """Duplicates that slipped past DOI deduplication are merged."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        review.add_papers(
+            [_paper("10.1000/a"), _paper("10.9999/pubmed.1"), _paper("10.1000/b", title="Other")]
+        )
+
+        removed = review.merge_duplicates(deduplicator)
+
+        assert removed == 1
+        assert {p.doi.value for p in review.papers} == {"10.1000/a", "10.1000/b"}
+
+    def test_counts_only_merges_of_new_papers(self, deduplicator: PaperDeduplicator) -> None:
+        """Merges among earlier papers do not count against the new ones."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        review.add_papers([_paper("10.1000/a"), _paper("10.9999/pubmed.1")])
+        new = [
+            _paper("10.1000/b", title="Other"),
+            _paper("10.9999/pubmed.2", title="Other"),
+            _paper("10.1000/c", title="Third"),
+            _paper("10.1000/d", title="Fourth", last_name="Jones"),
+        ]
+        review.add_papers(new)
+        review.add_papers([_paper("10.9999/pubmed.3", title="Fourth", last_name="Jones")])
+
+        removed = review.merge_duplicates(deduplicator, new=new)
+
+        # b and pubmed.2 are one new work; d duplicates a paper from another run
+        assert removed == 2
+        assert len(review.papers) == 4
+
+    def test_merges_into_existing_paper_in_place(self, deduplicator: PaperDeduplicator) -> None:
+        """The held paper survives with its assessment; the new record is dropped."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        pubmed, other = _paper("10.9999/pubmed.1"), _paper("10.1000/b", title="Other")
+        review.add_papers([pubmed, other])
+        review.assess_paper(pubmed.doi, 8.0, include=True)
+        new = [_paper("10.1000/a", abstract="Crossref abstract")]
+        review.add_papers(new)
+
+        assert review.merge_duplicates(deduplicator, new=new) == 1
+
+        assert list(review.papers) == [pubmed, other]
+        assert review.get_paper_by_doi(DOI("10.9999/pubmed.1")) is pubmed
+        assert (pubmed.abstract, review.get_included_papers()) == ("Crossref abstract", [pubmed])
+
+    def test_unassessed_paper_takes_registered_doi(self, deduplicator: PaperDeduplicator) -> None:
+        """A synthetic DOI is upgraded in place, keeping the paper's position."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        pubmed, other = _paper("10.9999/pubmed.1"), _paper("10.1000/b", title="Other")
+        review.add_papers([pubmed, other])
+        new = [_paper("10.1000/a")]
+        review.add_papers(new)
+
+        assert review.merge_duplicates(deduplicator, new=new) == 1
+
+        assert [p.doi.value for p in review.papers] == ["10.1000/a", "10.1000/b"]
+        assert review.get_paper_by_doi(DOI("10.1000/a")) is pubmed
+        assert set(review.get_unassessed_papers()) == {pubmed, other}
+
+    def test_hashes_only_unindexed_papers(
+        self, deduplicator: PaperDeduplicator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Later merges with the same deduplicator reuse the review's index."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        review.add_papers(
+            [_paper(f"10.1000/p{i}", title=f"Study {i} of sepsis") for i in range(20)]
+        )
+        review.merge_duplicates(deduplicator)
+        hashed: list[object] = []
+        minhash = deduplicator._minhash
+        monkeypatch.setattr(
+            deduplicator, "_minhash", lambda *args: hashed.append(args) or minhash(*args)
+        )
+        new = [_paper("10.9999/pubmed.3", title="Study 3 of sepsis")]
+        review.add_papers(new)
+
+        assert review.merge_duplicates(deduplicator, new=new) == 1
+        assert len(hashed) == 1
+        assert len(review.papers) == 20
+
+    def test_keeps_insertion_order(self, deduplicator: PaperDeduplicator) -> None:
+        """Merging neither sorts the review nor moves the surviving papers."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        review.add_papers(
+            [
+                _paper("10.1000/z", title="Zeta"),
+                _paper("10.1000/y", title="Upsilon"),
+                _paper("10.9999/pubmed.1", title="Upsilon"),
+                _paper("10.1000/x", title="Xi"),
+            ]
+        )
+
+        assert review.merge_duplicates(deduplicator) == 1
+        assert [p.doi.value for p in review.papers] == ["10.1000/z", "10.1000/y", "10.1000/x"]
+
+        assert review.merge_duplicates(deduplicator) == 0
+        assert [p.doi.value for p in review.papers] == ["10.1000/z", "10.1000/y", "10.1000/x"]
+
+    def test_keeps_generic_titles_from_different_journals(
+        self, deduplicator: PaperDeduplicator
+    ) -> None:
+        """Corrections and editorials with their own DOIs all survive."""
+        review = Review(
+            title="Sepsis ML",
+            research_question="Can ML predict sepsis?",
+            inclusion_criteria=["Peer reviewed"],
+            exclusion_criteria=[],
+            stage=ReviewStage.SEARCH,
+        )
+        review.add_papers(
+            [
+                _paper("10.1038/nm.1", title="Correction", last_name="Unknown", journal="Nat Med"),
+                _paper("10.1001/jama.1", title="Correction", last_name="Unknown", journal="JAMA"),
+                _paper("10.1136/bmj.1", title="Editorial", last_name="Unknown", journal="BMJ"),
+                _paper(
+                    "10.1016/lancet.1", title="Editorial", last_name="Unknown", journal="Lancet"
+                ),
+            ]
+        )
+
+        assert review.merge_duplicates(deduplicator) == 0
+        assert len(review.papers) == 4
@@ -85,6 +85,22 @@ class TestAuthorImmutability:
             author.last_name = "Jones"  # type: ignore[misc]
 
 
+class TestAuthorTrusted:
+    """Tests for authors created without validation."""
+
+    def test_trusted_author_equals_validated_author(self) -> None:
+        """Author.trusted builds an equal author with interned names."""
+        author = Author.trusted("".join(["Smi", "th"]), "John", "J.", "0000-0001-2345-6789")
+
+        assert author == Author("Smith", "John", "J.", "0000-0001-2345-6789")
+        assert author.last_name is Author("Smith", "Jane", "J.").last_name
+
+    def test_validate_checks_trusted_author(self) -> None:
+        """validate raises for an invalid trusted author."""
+        with pytest.raises(ValidationError, match="Invalid ORCID format"):
+            Author.trusted("Smith", "John", "J.", "bad-orcid").validate()
+
+
 class TestAuthorEquality:
     """Tests for Author equality."""
 
@@ -67,6 +67,20 @@ class TestDOIImmutability:
             doi.value = "10.5678/new"  # type: ignore[misc]
 
 
+class TestDOITrusted:
+    """Tests for DOIs created without validation."""
+
+    def test_trusted_doi_equals_validated_doi(self) -> None:
+        """DOI.trusted builds an equal, hashable DOI."""
+        assert DOI.trusted("10.1234/test") == DOI("10.1234/test")
+        assert hash(DOI.trusted("10.1234/test")) == hash(DOI("10.1234/test"))
+
+    def test_validate_checks_trusted_doi(self) -> None:
+        """validate raises for an invalid trusted DOI."""
+        with pytest.raises(ValidationError, match="Invalid DOI format"):
+            DOI.trusted("invalid").validate()
+
+
 class TestDOIEquality:
     """Tests for DOI equality and hashing."""
 
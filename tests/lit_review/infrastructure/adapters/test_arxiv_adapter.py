@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for ArxivAdapter."""
 
+import asyncio
+from datetime import date
 from unittest.mock import MagicMock, patch
 from xml.etree import ElementTree
 
 import httpx
 import pytest
 
-from lit_review.infrastructure.adapters.arxiv_adapter import ArxivAdapter
+from lit_review.infrastructure.adapters.arxiv_adapter import ArxivAdapter, AsyncArxivAdapter
 
 
 @pytest.fixture
@@ -315,7 +317,7 @@ class TestArxivAdapter:
 
         assert "failed" in str(exc_info.value)
 
-    @patch("lit_review.infrastructure.adapters.arxiv_adapter.time.sleep")
+    @patch("lit_review.infrastructure.adapters.rate_limiter.time.sleep")
     def test_rate_limiting(self, mock_sleep: MagicMock) -> None:
         """_rate_limit_sleep respects rate limits."""
         adapter = ArxivAdapter(rate_limit=3.0)
@@ -324,11 +326,76 @@ class TestArxivAdapter:
         adapter._rate_limit_sleep()
         mock_sleep.assert_not_called()
 
-        # Immediate second call should sleep for 3 seconds
-        adapter._last_request_time = adapter._last_request_time - 1.0  # 1 second ago
+        # Immediate second call waits for the next token (~3 seconds)
         adapter._rate_limit_sleep()
-        # Should sleep for ~2 seconds (3 seconds - 1 second elapsed)
         assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(3.0, abs=0.1)
+
+
+class TestArxivAdapterSearchSince:
+    """Tests for delta searches with a submittedDate range."""
+
+    def test_search_since_adds_submitted_date_range(self, mock_arxiv_atom: bytes) -> None:
+        """search_since wraps the query in a submittedDate range ending today."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=mock_arxiv_atom)
+
+        adapter = ArxivAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_since("all:sepsis", date(2025, 3, 1), limit=10)
+
+        assert len(papers) == 2
+        today = date.today().strftime("%Y%m%d")
+        params = requests[0].url.params
+        assert params["search_query"] == (
+            f"(all:sepsis) AND submittedDate:[202503010000 TO {today}2359]"
+        )
+        assert params["sortBy"] == "submittedDate"
+
+
+class TestArxivAdapterDateRange:
+    """Tests for submission date partitions."""
+
+    def test_search_range_adds_submitted_date_range(self, mock_arxiv_atom: bytes) -> None:
+        """search_range wraps the query in the given submittedDate range."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=mock_arxiv_atom)
+
+        adapter = ArxivAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_range("all:sepsis", date(2020, 1, 1), date(2020, 6, 30))
+
+        assert len(papers) == 2
+        assert requests[0].url.params["search_query"] == (
+            "(all:sepsis) AND submittedDate:[202001010000 TO 202006302359]"
+        )
+
+    def test_count_range_reads_total_results(self) -> None:
+        """count_range requests no entries and parses opensearch:totalResults."""
+        feed = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom" '
+            b'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+            b"<opensearch:totalResults>421</opensearch:totalResults></feed>"
+        )
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=feed)
+
+        adapter = ArxivAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert adapter.count_range("all:sepsis", date(2020, 1, 1), date(2020, 12, 31)) == 421
+        assert requests[0].url.params["max_results"] == "0"
 
 
 @pytest.mark.integration
@@ -466,3 +533,28 @@ class TestArxivAdapterIntegration:
             paper.doi.value.startswith("10.48550/arXiv.") or "." in paper.doi.value
             for paper in papers
         )
+
+
+class TestAsyncArxivAdapter:
+    """Tests for AsyncArxivAdapter."""
+
+    def test_search_returns_papers(self, mock_arxiv_atom: bytes) -> None:
+        """Async search parses the ATOM feed like the blocking adapter."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=mock_arxiv_atom)
+
+        async def run() -> list:
+            async with AsyncArxivAdapter(rate_limit=0.0) as adapter:
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await adapter.search("machine learning")
+
+        papers = asyncio.run(run())
+
+        assert len(papers) == 2
+        assert papers[0].doi.value == "10.1234/arxiv.2024.001"
+        assert papers[1].doi.value == "10.48550/arXiv.2401.67890v2"
+
+    def test_get_service_name(self) -> None:
+        """get_service_name returns 'ArXiv'."""
+        assert AsyncArxivAdapter().get_service_name() == "ArXiv"
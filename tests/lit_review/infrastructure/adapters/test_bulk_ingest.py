@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for bulk ingestion of PubMed baseline and Crossref snapshot dumps."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from lit_review.infrastructure.adapters.bulk_ingest import (
+    BulkIngester,
+    DumpFormat,
+    FileIngestResult,
+    ingest_file,
+)
+from lit_review.infrastructure.adapters.local_corpus import LocalCorpusSearchService
+from lit_review.infrastructure.persistence.ingest_checkpoint import JSONLinesIngestCheckpoint
+
+
+def _pubmed_article(pmid: int, title: str) -> str:
+    return (
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>{title}</ArticleTitle>"
+        "<AuthorList><Author><LastName>Smith</LastName><ForeName>John</ForeName></Author>"
+        "</AuthorList><Journal><Title>Journal</Title></Journal>"
+        "<PubDate><Year>2022</Year></PubDate></Article>"
+        "<MeshHeadingList><MeshHeading><DescriptorName>Sepsis</DescriptorName></MeshHeading>"
+        "</MeshHeadingList></MedlineCitation>"
+        f'<PubmedData><ArticleIdList><ArticleId IdType="doi">10.1234/pm.{pmid}</ArticleId>'
+        "</ArticleIdList></PubmedData></PubmedArticle>"
+    )
+
+
+def _write_baseline(path: Path, pmids: range, title: str = "Baseline article") -> Path:
+    articles = "".join(_pubmed_article(pmid, f"{title} {pmid}") for pmid in pmids)
+    # An article without a title is dropped
+    articles += "<PubmedArticle><MedlineCitation><PMID>0</PMID></MedlineCitation></PubmedArticle>"
+    xml = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2025//EN" '
+        '"https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_250101.dtd">\n'
+        f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+    )
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(xml)
+    return path
+
+
+def _crossref_item(n: int) -> dict[str, object]:
+    return {
+        "DOI": f"10.5555/cr.{n}",
+        "title": [f"Crossref work {n} on sepsis"],
+        "author": [{"family": "Doe", "given": "Jane"}],
+        "published": {"date-parts": [[2021]]},
+        "container-title": ["Snapshot Journal"],
+    }
+
+
+def _write_snapshot(path: Path) -> Path:
+    lines = [
+        json.dumps(_crossref_item(1)),
+        json.dumps({"items": [_crossref_item(2), _crossref_item(3)]}),
+        json.dumps({"DOI": "10.5555/untitled"}),
+        "{not json",
+        "",
+    ]
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+class TestDumpFormat:
+    """Tests for detecting dump formats from file names."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("pubmed25n0001.xml.gz", DumpFormat.PUBMED_BASELINE),
+            ("pubmed25n0001.xml", DumpFormat.PUBMED_BASELINE),
+            ("crossref-0001.jsonl.gz", DumpFormat.CROSSREF_SNAPSHOT),
+            ("works.jsonl", DumpFormat.CROSSREF_SNAPSHOT),
+        ],
+    )
+    def test_detect(self, name: str, expected: DumpFormat) -> None:
+        """Formats are recognized with or without gzip compression."""
+        assert DumpFormat.detect(Path(name)) is expected
+
+    def test_detect_rejects_unknown_extension(self) -> None:
+        """Unknown files are rejected."""
+        with pytest.raises(ValueError, match="Unrecognized dump file"):
+            DumpFormat.detect(Path("notes.txt"))
+
+
+@pytest.mark.integration
+class TestIngestFile:
+    """Tests for streaming one dump file into the corpus."""
+
+    def test_pubmed_baseline_uses_adapter_conversion(self, tmp_path: Path) -> None:
+        """Baseline articles become papers with DOIs and MeSH keywords."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        dump = _write_baseline(tmp_path / "pubmed25n0001.xml.gz", range(1, 4))
+
+        result = ingest_file(dump, corpus_path, chunk_size=2)
+
+        assert (result.papers, result.dropped, result.written) == (3, 1, 3)
+        with LocalCorpusSearchService(corpus_path) as corpus:
+            (paper,) = corpus.search('"baseline article 2"')
+            assert paper.doi.value == "10.1234/pm.2"
+            assert paper.keywords == ["Sepsis"]
+
+    def test_crossref_snapshot_lines_and_pages(self, tmp_path: Path) -> None:
+        """Item lines and page lines are ingested; bad lines are dropped."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        dump = _write_snapshot(tmp_path / "crossref-0001.jsonl.gz")
+
+        result = ingest_file(dump, corpus_path)
+
+        assert (result.papers, result.dropped) == (3, 2)
+        with LocalCorpusSearchService(corpus_path) as corpus:
+            assert len(corpus.search("sepsis")) == 3
+
+    def test_reingesting_writes_nothing(self, tmp_path: Path) -> None:
+        """A file ingested twice converts its papers but rewrites none."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        dump = _write_baseline(tmp_path / "pubmed25n0001.xml.gz", range(1, 4))
+        ingest_file(dump, corpus_path)
+
+        assert ingest_file(dump, corpus_path).written == 0
+
+
+@pytest.mark.integration
+class TestBulkIngester:
+    """Tests for pooled, resumable ingestion of many files."""
+
+    def test_process_pool_ingests_all_files(self, tmp_path: Path) -> None:
+        """Files mapped to worker processes all land in the corpus."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        files = [
+            _write_baseline(tmp_path / f"pubmed25n000{i}.xml.gz", range(i * 10, i * 10 + 10))
+            for i in range(1, 4)
+        ] + [_write_snapshot(tmp_path / "crossref-0001.jsonl.gz")]
+        seen: list[FileIngestResult] = []
+
+        report = BulkIngester(corpus_path, workers=2).ingest(files, on_file=seen.append)
+
+        assert report.papers == 33
+        assert report.written == 33
+        assert {r.file for r in seen} == set(files)
+        with LocalCorpusSearchService(corpus_path) as corpus:
+            assert len(corpus) == 33
+
+    def test_checkpoint_skips_completed_files(self, tmp_path: Path) -> None:
+        """A resumed run skips files the checkpoint records as done."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        checkpoint = JSONLinesIngestCheckpoint(tmp_path / "ingest.jsonl")
+        first = _write_baseline(tmp_path / "pubmed25n0001.xml.gz", range(1, 4))
+        BulkIngester(corpus_path, workers=1, checkpoint=checkpoint).ingest([first])
+        second = _write_baseline(tmp_path / "pubmed25n0002.xml.gz", range(4, 6))
+
+        report = BulkIngester(
+            corpus_path, workers=1, checkpoint=JSONLinesIngestCheckpoint(checkpoint.path)
+        ).ingest([first, second])
+
+        assert [(r.file, r.skipped) for r in report.files] == [(first, True), (second, False)]
+        assert report.papers == 2
+
+    def test_unrecognized_file_fails_before_ingesting(self, tmp_path: Path) -> None:
+        """Format detection runs before any file is ingested."""
+        corpus_path = tmp_path / "corpus.sqlite"
+        dump = _write_baseline(tmp_path / "pubmed25n0001.xml.gz", range(1, 4))
+        notes = tmp_path / "notes.txt"
+        notes.write_text("x")
+
+        with pytest.raises(ValueError):
+            BulkIngester(corpus_path, workers=1).ingest([dump, notes])
+
+        assert not corpus_path.exists()
+
+    def test_rejects_invalid_settings(self, tmp_path: Path) -> None:
+        """workers and chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            BulkIngester(tmp_path / "corpus.sqlite", workers=-1)
+        with pytest.raises(ValueError):
+            BulkIngester(tmp_path / "corpus.sqlite", chunk_size=0)
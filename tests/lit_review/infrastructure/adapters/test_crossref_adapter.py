@@ -2,11 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for CrossrefAdapter."""
 
+import asyncio
+from datetime import date
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from lit_review.infrastructure.adapters.crossref_adapter import CrossrefAdapter
+from lit_review.application.ports.search_events import SearchEvent, SearchEventKind
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.crossref_adapter import (
+    AsyncCrossrefAdapter,
+    CrossrefAdapter,
+)
 
 
 @pytest.fixture
@@ -270,3 +280,413 @@ class TestCrossrefAdapterParsing:
         clean = adapter._clean_html(html)
 
         assert clean == "This is bold text."
+
+
+class TestAsyncCrossrefAdapter:
+    """Tests for AsyncCrossrefAdapter."""
+
+    def test_search_returns_papers(self, mock_crossref_response: dict) -> None:
+        """Async search parses results exactly like the blocking adapter."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_crossref_response)
+
+        async def run() -> list:
+            async with AsyncCrossrefAdapter(email="me@example.com") as adapter:
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await adapter.search("test query", limit=10)
+
+        papers = asyncio.run(run())
+
+        assert [p.doi.value for p in papers] == ["10.1234/test1", "10.1234/test2"]
+        assert requests[0].url.params["rows"] == "10"
+        assert "mailto:me@example.com" in requests[0].headers["User-Agent"]
+
+    def test_search_raises_connection_error_after_retries(self) -> None:
+        """Async search raises ConnectionError after exhausting retries."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        async def run() -> list:
+            adapter = AsyncCrossrefAdapter(max_retries=1)
+            adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                return await adapter.search("test query")
+            finally:
+                await adapter.aclose()
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run())
+
+    def test_search_follows_cursor_beyond_page_size(self) -> None:
+        """Async search pages with next-cursor like the blocking adapter."""
+        pages = [
+            _crossref_page(0, 3, "cursor-2"),
+            _crossref_page(3, 3, "cursor-3"),
+            _crossref_page(6, 3, "cursor-4"),
+        ]
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=pages[len(requests) - 1])
+
+        async def run() -> list:
+            async with AsyncCrossrefAdapter(rate_limit=0.0, page_size=3) as adapter:
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await adapter.search("query", limit=7)
+
+        papers = asyncio.run(run())
+
+        assert [p.doi.value for p in papers] == [f"10.1234/page-{i}" for i in range(7)]
+        assert [r.url.params["cursor"] for r in requests] == ["*", "cursor-2", "cursor-3"]
+        assert [r.url.params["rows"] for r in requests] == ["3", "3", "1"]
+
+    @patch("lit_review.infrastructure.adapters.crossref_adapter.asyncio.sleep")
+    def test_retries_are_reported(self, mock_sleep: MagicMock) -> None:
+        """Async retries emit the same events as the blocking adapter."""
+        attempts: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json=_crossref_page(0, 2, None))
+
+        events: list[SearchEvent] = []
+
+        async def run() -> list:
+            async with AsyncCrossrefAdapter(rate_limit=0.0) as adapter:
+                adapter.set_event_hook(events.append)
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await adapter.search("query", limit=10)
+
+        papers = asyncio.run(run())
+
+        assert len(papers) == 2
+        assert [e.kind for e in events] == [
+            SearchEventKind.REQUEST_START,
+            SearchEventKind.REQUEST_END,
+            SearchEventKind.RETRY,
+            SearchEventKind.REQUEST_START,
+            SearchEventKind.REQUEST_END,
+            SearchEventKind.PARSE,
+        ]
+        assert (events[2].attempt, events[2].seconds) == (1, 1.0)
+        mock_sleep.assert_awaited_once_with(1.0)
+
+
+def _crossref_page(start: int, count: int, next_cursor: str | None) -> dict:
+    """Build a Crossref response page with sequential DOIs."""
+    message: dict = {
+        "items": [
+            {
+                "DOI": f"10.1234/page-{i}",
+                "title": [f"Paper {i}"],
+                "author": [{"family": "Smith", "given": "John"}],
+                "published": {"date-parts": [[2023]]},
+                "container-title": ["Journal"],
+            }
+            for i in range(start, start + count)
+        ]
+    }
+    if next_cursor:
+        message["next-cursor"] = next_cursor
+    return {"message": message}
+
+
+class TestCrossrefAdapterDeepPaging:
+    """Tests for cursor-based deep paging."""
+
+    def _adapter_with_pages(self, pages: list[dict], **kwargs: object) -> tuple:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=pages[len(requests) - 1])
+
+        adapter = CrossrefAdapter(rate_limit=0.0, **kwargs)  # type: ignore[arg-type]
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return adapter, requests
+
+    def test_search_pages_beyond_100_rows(self) -> None:
+        """search follows next-cursor until the limit is reached."""
+        pages = [
+            _crossref_page(0, 3, "cursor-2"),
+            _crossref_page(3, 3, "cursor-3"),
+            _crossref_page(6, 3, "cursor-4"),
+        ]
+        adapter, requests = self._adapter_with_pages(pages, page_size=3)
+
+        papers = adapter.search("query", limit=7)
+
+        assert len(papers) == 7
+        assert [r.url.params["cursor"] for r in requests] == ["*", "cursor-2", "cursor-3"]
+        assert [r.url.params["rows"] for r in requests] == ["3", "3", "1"]
+
+    def test_iter_search_is_lazy(self) -> None:
+        """iter_search only requests the next page when it is consumed."""
+        pages = [_crossref_page(0, 2, "next"), _crossref_page(2, 2, "next")]
+        adapter, requests = self._adapter_with_pages(pages, page_size=2)
+
+        results = adapter.iter_search("query", limit=100)
+        first = next(results)
+
+        assert first.doi.value == "10.1234/page-0"
+        assert len(requests) == 1
+
+    def test_iter_search_stops_on_short_page(self) -> None:
+        """Paging ends when a page returns fewer rows than requested."""
+        pages = [_crossref_page(0, 2, "next"), _crossref_page(2, 1, "next")]
+        adapter, requests = self._adapter_with_pages(pages, page_size=2)
+
+        papers = list(adapter.iter_search("query", limit=100))
+
+        assert len(papers) == 3
+        assert len(requests) == 2
+
+    def test_page_size_capped_at_crossref_maximum(self) -> None:
+        """page_size never exceeds Crossref's 1000-row maximum."""
+        adapter = CrossrefAdapter(page_size=5000)
+        assert adapter.page_size == 1000
+        assert adapter._build_params("q", 2000)["rows"] == 1000
+
+    @patch("lit_review.infrastructure.adapters.crossref_adapter.sleep")
+    def test_retry_applies_to_each_page(self, mock_sleep: MagicMock) -> None:
+        """A transient failure on a later page is retried without restarting."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cursor = request.url.params["cursor"]
+            calls.append(cursor)
+            if cursor == "second" and calls.count("second") == 1:
+                return httpx.Response(503)
+            if cursor == "*":
+                return httpx.Response(200, json=_crossref_page(0, 2, "second"))
+            return httpx.Response(200, json=_crossref_page(2, 1, None))
+
+        adapter = CrossrefAdapter(rate_limit=0.0, page_size=2)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search("query", limit=10)
+
+        assert len(papers) == 3
+        assert calls == ["*", "second", "second"]
+
+    @patch("lit_review.infrastructure.adapters.crossref_adapter.sleep")
+    def test_retry_after_defers_to_rate_limiter(self, mock_sleep: MagicMock) -> None:
+        """A 429 with Retry-After pauses the limiter instead of exponential backoff."""
+        attempts: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(429, headers={"Retry-After": "2"})
+            return httpx.Response(200, json=_crossref_page(0, 1, None))
+
+        limiter = MagicMock()
+        adapter = CrossrefAdapter(rate_limiter=limiter)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search("query", limit=10)
+
+        assert len(papers) == 1
+        limiter.penalize.assert_called_once_with(2.0)
+        mock_sleep.assert_called_once_with(0.0)
+
+
+class TestCrossrefAdapterSearchSince:
+    """Tests for delta searches with from-index-date."""
+
+    def test_search_since_filters_by_index_date(self) -> None:
+        """search_since adds a from-index-date filter to every page request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_crossref_page(0, 2, None))
+
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_since("query", date(2025, 3, 1), limit=10)
+
+        assert len(papers) == 2
+        assert requests[0].url.params["filter"] == "from-index-date:2025-03-01"
+        assert requests[0].url.params["query"] == "query"
+
+
+class TestCrossrefAdapterDateRange:
+    """Tests for publication date partitions."""
+
+    def test_search_range_filters_by_pub_date(self) -> None:
+        """search_range restricts every page to the publication date range."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_crossref_page(0, 2, None))
+
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_range("query", date(2020, 1, 1), date(2021, 12, 31), limit=10)
+
+        assert len(papers) == 2
+        assert requests[0].url.params["filter"] == (
+            "from-pub-date:2020-01-01,until-pub-date:2021-12-31"
+        )
+
+    def test_count_range_reads_total_results(self) -> None:
+        """count_range asks for no rows and returns total-results."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"message": {"total-results": 1234, "items": []}})
+
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert adapter.count_range("query", date(2020, 1, 1), date(2020, 12, 31)) == 1234
+        assert requests[0].url.params["rows"] == "0"
+
+
+def _stub(doi: str) -> Paper:
+    """Build a stub paper without abstract."""
+    return Paper(
+        doi=DOI(doi),
+        title=f"Stub {doi}",
+        authors=[Author("Smith", "John", "J.")],
+        publication_year=2023,
+        journal="Journal",
+    )
+
+
+class TestCrossrefAdapterStubs:
+    """Tests for stub searches and abstract hydration."""
+
+    def _adapter(self, handler: object) -> CrossrefAdapter:
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+        return adapter
+
+    def test_search_stubs_selects_minimal_fields(self) -> None:
+        """search_stubs does not request abstracts."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_crossref_page(0, 2, None))
+
+        papers = self._adapter(handler).search_stubs("query", limit=10)
+
+        assert len(papers) == 2
+        assert requests[0].url.params["select"] == "DOI,title,author,published,container-title"
+
+    def test_hydrate_fetches_abstracts_by_doi_filter(self) -> None:
+        """hydrate looks DOIs up in batches and fills in cleaned abstracts."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            items = [
+                {"DOI": "10.1234/A", "abstract": "<jats:p>First abstract.</jats:p>"},
+                {"DOI": "10.1234/c", "abstract": "Third abstract."},
+            ]
+            return httpx.Response(200, json={"message": {"items": items}})
+
+        adapter = self._adapter(handler)
+        adapter.HYDRATE_BATCH = 2
+        papers = [_stub("10.1234/a"), _stub("10.1234/b"), _stub("10.1234/c")]
+        papers.append(_stub("10.9999/pubmed.1"))
+
+        hydrated = adapter.hydrate(papers)
+
+        assert [r.url.params["filter"] for r in requests] == [
+            "doi:10.1234/a,doi:10.1234/b",
+            "doi:10.1234/c",
+        ]
+        assert requests[0].url.params["select"] == "DOI,abstract,author"
+        assert hydrated == [papers[0], papers[2]]
+        assert papers[0].abstract == "First abstract."
+        assert papers[1].abstract == ""
+
+    def test_hydrate_replaces_placeholder_authors_only(self) -> None:
+        """Real authors replace the "Unknown" placeholder; abstracts are not overwritten."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            items = [
+                {
+                    "DOI": "10.1234/a",
+                    "abstract": "New abstract.",
+                    "author": [{"family": "Jones", "given": "Jane"}],
+                }
+            ]
+            return httpx.Response(200, json={"message": {"items": items}})
+
+        paper = _stub("10.1234/a")
+        paper.authors = [Author("Unknown", "Author", "U.")]
+        paper.abstract = "Existing abstract."
+
+        hydrated = self._adapter(handler).hydrate([paper])
+
+        assert hydrated == [paper]
+        assert [a.last_name for a in paper.authors] == ["Jones"]
+        assert paper.abstract == "Existing abstract."
+
+
+class TestCrossrefAdapterInstrumentation:
+    """Tests for the instrumentation events of Crossref searches."""
+
+    @patch("lit_review.infrastructure.adapters.crossref_adapter.sleep")
+    def test_events_cover_requests_retries_and_parsing(self, mock_sleep: MagicMock) -> None:
+        """A search reports each attempt, the retry and the records it dropped."""
+        attempts: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            page = _crossref_page(0, 2, None)
+            page["message"]["items"].append({"DOI": "10.1234/untitled"})
+            return httpx.Response(200, json=page)
+
+        events: list[SearchEvent] = []
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter.set_event_hook(events.append)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search("query", limit=10)
+
+        assert len(papers) == 2
+        assert [e.kind for e in events] == [
+            SearchEventKind.REQUEST_START,
+            SearchEventKind.REQUEST_END,
+            SearchEventKind.RETRY,
+            SearchEventKind.REQUEST_START,
+            SearchEventKind.REQUEST_END,
+            SearchEventKind.PARSE,
+        ]
+        first, retry, second, parse = events[1], events[2], events[4], events[5]
+        assert (first.status_code, first.attempt) == (503, 0)
+        assert (retry.attempt, retry.seconds) == (1, 1.0)
+        assert (second.status_code, second.attempt) == (200, 1)
+        assert second.bytes_received > 0
+        assert (parse.produced, parse.dropped) == (2, 1)
+        assert {e.service for e in events} == {"Crossref"}
+
+    def test_no_hook_emits_nothing(self) -> None:
+        """Adapters without a hook search as before."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=_crossref_page(0, 1, None))
+
+        adapter = CrossrefAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert adapter.event_hook is None
+        assert len(adapter.search("query", limit=10)) == 1
@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for pooled HTTP client support."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from lit_review.infrastructure.adapters.arxiv_adapter import ArxivAdapter
+from lit_review.infrastructure.adapters.crossref_adapter import CrossrefAdapter
+from lit_review.infrastructure.adapters.http_client import (
+    PooledAsyncHTTPClientMixin,
+    PooledHTTPClientMixin,
+    http2_available,
+)
+from lit_review.infrastructure.adapters.semantic_scholar_adapter import SemanticScholarAdapter
+
+
+class PooledAdapter(PooledHTTPClientMixin):
+    """Minimal adapter using the pooled client mixin."""
+
+    def __init__(self, **kwargs: object) -> None:
+        self._init_http_client(timeout=5, **kwargs)  # type: ignore[arg-type]
+
+
+class PooledAsyncAdapter(PooledAsyncHTTPClientMixin):
+    """Minimal adapter using the pooled async client mixin."""
+
+    def __init__(self) -> None:
+        self._init_async_http_client(timeout=5)
+
+
+class TestPooledHTTPClientMixin:
+    """Tests for PooledHTTPClientMixin."""
+
+    def test_client_created_lazily(self) -> None:
+        """No client is created until first use."""
+        adapter = PooledAdapter()
+        assert adapter._client is None
+
+    def test_client_reused_across_calls(self) -> None:
+        """_get_client returns the same client instance on repeated calls."""
+        adapter = PooledAdapter()
+        try:
+            first = adapter._get_client()
+            second = adapter._get_client()
+            assert first is second
+            assert isinstance(first, httpx.Client)
+        finally:
+            adapter.close()
+
+    def test_concurrent_first_use_creates_one_client(self) -> None:
+        """Threads racing on first use share a single client."""
+
+        def slow_client(**kwargs: object) -> MagicMock:
+            time.sleep(0.01)
+            return MagicMock()
+
+        with patch(
+            "lit_review.infrastructure.adapters.http_client.httpx.Client",
+            side_effect=slow_client,
+        ) as mock_client:
+            adapter = PooledAdapter()
+            clients: list[object] = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(adapter._get_client()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_client.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    def test_client_uses_configured_limits(self) -> None:
+        """Connection pool limits are passed to the client."""
+        with patch("lit_review.infrastructure.adapters.http_client.httpx.Client") as mock_client:
+            adapter = PooledAdapter(max_connections=20, max_keepalive_connections=8)
+            adapter._get_client()
+
+        limits = mock_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 20
+        assert limits.max_keepalive_connections == 8
+        assert mock_client.call_args.kwargs["timeout"] == 5
+
+    def test_close_releases_client(self) -> None:
+        """close() closes the client and allows a fresh one to be created."""
+        adapter = PooledAdapter()
+        client = adapter._get_client()
+        adapter.close()
+
+        assert client.is_closed
+        assert adapter._client is None
+
+    def test_close_without_client_is_noop(self) -> None:
+        """close() is safe when no client was ever created."""
+        adapter = PooledAdapter()
+        adapter.close()
+        assert adapter._client is None
+
+    def test_context_manager_closes_client(self) -> None:
+        """Exiting the context manager closes the pooled client."""
+        with PooledAdapter() as adapter:
+            client = adapter._get_client()
+
+        assert client.is_closed
+
+    def test_http2_falls_back_without_h2(self) -> None:
+        """http2 is only enabled when the h2 package is importable."""
+        adapter = PooledAdapter(http2=True)
+        assert adapter.http2 is http2_available()
+
+
+class TestPooledAsyncHTTPClientMixin:
+    """Tests for PooledAsyncHTTPClientMixin."""
+
+    def test_client_reused_within_loop(self) -> None:
+        """_get_async_client returns one client per event loop run."""
+        adapter = PooledAsyncAdapter()
+
+        async def run() -> bool:
+            try:
+                return adapter._get_async_client() is adapter._get_async_client()
+            finally:
+                await adapter.aclose()
+
+        assert asyncio.run(run()) is True
+        assert adapter._async_client is None
+
+    def test_client_from_other_loop_rejected(self) -> None:
+        """An unclosed client is not reused on another event loop."""
+        adapter = PooledAsyncAdapter()
+
+        async def create() -> None:
+            adapter._get_async_client()
+
+        asyncio.run(create())
+
+        with pytest.raises(RuntimeError, match="another event loop"):
+            asyncio.run(create())
+
+    def test_aclose_allows_new_loop(self) -> None:
+        """After aclose, the adapter can be used from a new event loop."""
+        adapter = PooledAsyncAdapter()
+
+        async def run() -> httpx.AsyncClient:
+            try:
+                return adapter._get_async_client()
+            finally:
+                await adapter.aclose()
+
+        assert asyncio.run(run()) is not asyncio.run(run())
+
+
+class TestAdapterConnectionReuse:
+    """Tests that adapters reuse one client across requests."""
+
+    @patch("lit_review.infrastructure.adapters.crossref_adapter.httpx.Client")
+    def test_crossref_reuses_client(self, mock_client_class: MagicMock) -> None:
+        """Repeated Crossref searches construct a single client."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"message": {"items": []}}
+        mock_client_class.return_value.get.return_value = mock_response
+
+        adapter = CrossrefAdapter()
+        adapter.search("first")
+        adapter.search("second")
+
+        assert mock_client_class.call_count == 1
+        assert mock_client_class.return_value.get.call_count == 2
+
+    @patch("lit_review.infrastructure.adapters.semantic_scholar_adapter.httpx.Client")
+    def test_semantic_scholar_reuses_client(self, mock_client_class: MagicMock) -> None:
+        """Repeated Semantic Scholar searches construct a single client."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"data": []}
+        mock_client_class.return_value.get.return_value = mock_response
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter.search("first")
+        adapter.search("second")
+
+        assert mock_client_class.call_count == 1
+
+    @patch("lit_review.infrastructure.adapters.arxiv_adapter.httpx.Client")
+    def test_arxiv_close_closes_client(self, mock_client_class: MagicMock) -> None:
+        """ArxivAdapter.close() closes the pooled client."""
+        mock_response = MagicMock()
+        mock_response.content = b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>'
+        mock_client_class.return_value.get.return_value = mock_response
+
+        with ArxivAdapter(rate_limit=0.0) as adapter:
+            adapter.search("query")
+
+        mock_client_class.return_value.close.assert_called_once()
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for LocalCorpusSearchService."""
+
+import threading
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.local_corpus import LocalCorpusSearchService
+
+
+def _paper(
+    suffix: str,
+    title: str,
+    abstract: str = "",
+    keywords: list[str] | None = None,
+    year: int = 2022,
+) -> Paper:
+    return Paper(
+        doi=DOI(f"10.1234/{suffix}"),
+        title=title,
+        authors=[Author("Smith", "John", "J.", "0000-0002-1825-0097")],
+        publication_year=year,
+        journal="Journal",
+        abstract=abstract,
+        keywords=keywords or [],
+    )
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> LocalCorpusSearchService:
+    """Create a corpus with a few indexed papers."""
+    service = LocalCorpusSearchService(tmp_path / "corpus.sqlite")
+    service.index(
+        [
+            _paper("a", "Machine learning for sepsis prediction", year=2020),
+            _paper("b", "Hospital staffing", abstract="Sepsis is mentioned once.", year=2021),
+            _paper("c", "Intensive care outcomes", keywords=["Sepsis", "Shock, Septic"]),
+            _paper("d", "Deep learning in radiology", year=2023),
+        ]
+    )
+    return service
+
+
+@pytest.mark.integration
+class TestLocalCorpusSearchService:
+    """Tests for indexing and ranked search (integration - SQLite file)."""
+
+    def test_title_matches_rank_above_abstract_matches(
+        self, corpus: LocalCorpusSearchService
+    ) -> None:
+        """BM25 weights title, then keywords, above abstract."""
+        papers = corpus.search("sepsis")
+
+        assert [p.doi.value for p in papers] == ["10.1234/a", "10.1234/c", "10.1234/b"]
+
+    def test_round_trips_bibliographic_metadata(self, corpus: LocalCorpusSearchService) -> None:
+        """Search results carry authors, keywords and abstract."""
+        (paper,) = corpus.search("intensive")
+
+        assert paper.keywords == ["Sepsis", "Shock, Septic"]
+        assert paper.authors == [Author("Smith", "John", "J.", "0000-0002-1825-0097")]
+        assert paper.publication_year == 2022
+
+    def test_stemming_and_fts_syntax(self, corpus: LocalCorpusSearchService) -> None:
+        """Queries are stemmed and support boolean operators."""
+        assert {p.doi.value for p in corpus.search("learn")} == {"10.1234/a", "10.1234/d"}
+        assert [p.doi.value for p in corpus.search("learning NOT sepsis")] == ["10.1234/d"]
+
+    def test_invalid_fts_syntax_falls_back_to_words(self, corpus: LocalCorpusSearchService) -> None:
+        """Free text with punctuation is searched as the AND of its words."""
+        assert [p.doi.value for p in corpus.search("sepsis-prediction (")] == ["10.1234/a"]
+        assert corpus.search("(((") == []
+
+    def test_limit(self, corpus: LocalCorpusSearchService) -> None:
+        """At most limit papers are returned."""
+        assert len(corpus.search("sepsis", limit=2)) == 2
+
+    def test_search_range_and_count_range(self, corpus: LocalCorpusSearchService) -> None:
+        """Publication-year filters apply to search and count."""
+        start, end = date(2021, 1, 1), date(2022, 12, 31)
+
+        assert {p.doi.value for p in corpus.search_range("sepsis", start, end)} == {
+            "10.1234/b",
+            "10.1234/c",
+        }
+        assert corpus.count_range("sepsis", start, end) == 2
+
+    def test_search_since_filters_by_indexing_date(self, corpus: LocalCorpusSearchService) -> None:
+        """search_since uses the date a paper was first indexed."""
+        assert len(corpus.search_since("sepsis", date.today())) == 3
+        assert corpus.search_since("sepsis", date(9999, 1, 1)) == []
+
+    def test_reindexing_writes_only_changed_papers(self, corpus: LocalCorpusSearchService) -> None:
+        """Unchanged papers are skipped; changed ones replace their index entry."""
+        unchanged = _paper("a", "Machine learning for sepsis prediction", year=2020)
+        changed = _paper("d", "Deep learning in pathology", year=2023)
+
+        assert corpus.index([unchanged, changed]) == 1
+        assert len(corpus) == 4
+        assert corpus.search("radiology") == []
+        assert [p.doi.value for p in corpus.search("pathology")] == ["10.1234/d"]
+
+    def test_index_persists_across_instances(
+        self, tmp_path: Path, corpus: LocalCorpusSearchService
+    ) -> None:
+        """A reopened corpus searches and skips papers indexed earlier."""
+        corpus.close()
+
+        with LocalCorpusSearchService(tmp_path / "corpus.sqlite") as reopened:
+            assert len(reopened.search("sepsis")) == 3
+            assert (
+                reopened.index([_paper("a", "Machine learning for sepsis prediction", year=2020)])
+                == 0
+            )
+
+    def test_concurrent_indexing_and_search(self, corpus: LocalCorpusSearchService) -> None:
+        """The corpus may be shared between search threads."""
+        errors: list[Exception] = []
+
+        def work(n: int) -> None:
+            try:
+                for i in range(20):
+                    corpus.index([_paper(f"t{n}.{i}", f"Threaded sepsis paper {n} {i}")])
+                    corpus.search("sepsis")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(corpus) == 84
+
+    def test_service_name(self, corpus: LocalCorpusSearchService) -> None:
+        """Service name identifies the local corpus."""
+        assert corpus.get_service_name() == "Local corpus"
@@ -0,0 +1,290 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for OpenAlexAdapter."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from lit_review.application.ports.search_events import SearchEvent, SearchEventKind
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.openalex_adapter import OpenAlexAdapter
+
+
+def _work(n: int, **fields: object) -> dict[str, object]:
+    """Build one OpenAlex work."""
+    work: dict[str, object] = {
+        "id": f"https://openalex.org/W{n}",
+        "doi": f"https://doi.org/10.1234/work-{n}",
+        "title": f"Work {n}",
+        "authorships": [
+            {
+                "author": {
+                    "display_name": "Jane Q. Doe",
+                    "orcid": "https://orcid.org/0000-0002-1825-0097",
+                }
+            }
+        ],
+        "publication_year": 2022,
+        "primary_location": {"source": {"display_name": "Journal of Tests"}},
+    }
+    work.update(fields)
+    return work
+
+
+def _page(start: int, count: int, next_cursor: str | None) -> dict[str, object]:
+    """Build one page of OpenAlex works."""
+    return {
+        "meta": {"count": 1000, "next_cursor": next_cursor},
+        "results": [_work(i) for i in range(start, start + count)],
+    }
+
+
+def _adapter(handler: object, **kwargs: object) -> OpenAlexAdapter:
+    adapter = OpenAlexAdapter(rate_limit=0.0, **kwargs)  # type: ignore[arg-type]
+    adapter._client = httpx.Client(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+    return adapter
+
+
+def _stub(doi: str) -> Paper:
+    """Build a stub paper without abstract."""
+    return Paper(
+        doi=DOI(doi),
+        title=f"Stub {doi}",
+        authors=[Author("Smith", "John", "J.")],
+        publication_year=2023,
+        journal="Journal",
+    )
+
+
+@pytest.mark.integration
+class TestOpenAlexAdapter:
+    """Tests for searching OpenAlex works (integration - mocked HTTP)."""
+
+    def test_get_service_name(self) -> None:
+        """get_service_name returns 'OpenAlex'."""
+        assert OpenAlexAdapter().get_service_name() == "OpenAlex"
+
+    def test_converts_works_to_papers(self) -> None:
+        """Works become papers with bare DOIs, authors, venue and rebuilt abstract."""
+        work = _work(
+            1,
+            abstract_inverted_index={"Sepsis": [0], "kills.": [2], "often": [1]},
+            keywords=[{"display_name": "Sepsis"}, {"display_name": "Mortality"}],
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"meta": {"next_cursor": None}, "results": [work]})
+
+        (paper,) = _adapter(handler).search("sepsis", limit=10)
+
+        assert paper.doi.value == "10.1234/work-1"
+        assert paper.abstract == "Sepsis often kills."
+        assert paper.keywords == ["Sepsis", "Mortality"]
+        assert paper.authors == [Author("Doe", "Jane Q.", "J.Q.", "0000-0002-1825-0097")]
+        assert (paper.publication_year, paper.journal) == (2022, "Journal of Tests")
+
+    def test_work_without_doi_gets_synthetic_doi(self) -> None:
+        """Works without a DOI are kept under their OpenAlex ID."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            results = [_work(7, doi=None), _work(8, title=None)]
+            return httpx.Response(200, json={"meta": {}, "results": results})
+
+        papers = _adapter(handler).search("query")
+
+        assert [p.doi.value for p in papers] == ["10.9999/openalex.W7"]
+
+    def test_cursor_paging_with_200_per_page(self) -> None:
+        """search follows next_cursor with per-page up to 200 and select projection."""
+        pages = [_page(0, 200, "c2"), _page(200, 200, "c3"), _page(400, 200, "c4")]
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=pages[len(requests) - 1])
+
+        papers = _adapter(handler).search("query", limit=450)
+
+        assert len(papers) == 450
+        assert [r.url.params["cursor"] for r in requests] == ["*", "c2", "c3"]
+        assert [r.url.params["per-page"] for r in requests] == ["200", "200", "50"]
+        assert requests[0].url.params["select"] == OpenAlexAdapter.FULL_SELECT
+        assert requests[0].url.params["search"] == "query"
+
+    def test_paging_stops_on_short_page(self) -> None:
+        """Paging ends when a page returns fewer works than requested."""
+        pages = [_page(0, 2, "next"), _page(2, 1, "next")]
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=pages[len(requests) - 1])
+
+        papers = _adapter(handler, page_size=2).search("query", limit=100)
+
+        assert len(papers) == 3
+        assert len(requests) == 2
+
+    def test_page_size_capped_at_openalex_maximum(self) -> None:
+        """page_size never exceeds OpenAlex's 200 per page."""
+        assert OpenAlexAdapter(page_size=1000).page_size == 200
+
+    def test_email_is_sent_as_mailto(self) -> None:
+        """The polite-pool email is sent on every request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_page(0, 1, None))
+
+        _adapter(handler, email="me@example.org").search("query")
+
+        assert requests[0].url.params["mailto"] == "me@example.org"
+
+    @patch("lit_review.infrastructure.adapters.openalex_adapter.sleep")
+    def test_retries_then_raises_connection_error(self, mock_sleep: MagicMock) -> None:
+        """Failed requests are retried max_retries times."""
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(503)
+
+        with pytest.raises(ConnectionError, match="OpenAlex request failed"):
+            _adapter(handler).search("query")
+
+        assert len(calls) == 3
+        assert mock_sleep.call_count == 2
+
+
+@pytest.mark.integration
+class TestOpenAlexAdapterDateFilters:
+    """Tests for delta searches and publication date partitions."""
+
+    def test_search_since_and_range_filter_by_publication_date(self) -> None:
+        """Date filters use from/to_publication_date."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_page(0, 1, None))
+
+        adapter = _adapter(handler)
+        adapter.search_since("query", date(2025, 3, 1))
+        adapter.search_range("query", date(2020, 1, 1), date(2021, 12, 31))
+
+        assert [r.url.params["filter"] for r in requests] == [
+            "from_publication_date:2025-03-01",
+            "from_publication_date:2020-01-01,to_publication_date:2021-12-31",
+        ]
+
+    def test_count_range_reads_meta_count(self) -> None:
+        """count_range fetches a one-work page and returns meta.count."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"meta": {"count": 4321}, "results": []})
+
+        adapter = _adapter(handler)
+
+        assert adapter.count_range("query", date(2020, 1, 1), date(2020, 12, 31)) == 4321
+        assert requests[0].url.params["per-page"] == "1"
+
+
+@pytest.mark.integration
+class TestOpenAlexAdapterHydrate:
+    """Tests for stub searches and batched DOI lookups."""
+
+    def test_search_stubs_selects_minimal_fields(self) -> None:
+        """search_stubs does not request abstracts or keywords."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_page(0, 2, None))
+
+        _adapter(handler).search_stubs("query")
+
+        assert requests[0].url.params["select"] == OpenAlexAdapter.STUB_SELECT
+
+    def test_hydrate_looks_up_50_dois_per_request(self) -> None:
+        """hydrate ORs up to 50 DOIs per filter and fills missing fields."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            dois = request.url.params["filter"].removeprefix("doi:").split("|")
+            results = [
+                {
+                    "doi": f"https://doi.org/{doi.upper()}",
+                    "abstract_inverted_index": {"Abstract": [0], doi: [1]},
+                    "keywords": [{"display_name": "Sepsis"}],
+                }
+                for doi in dois
+                if doi != "10.1234/missing"
+            ]
+            return httpx.Response(200, json={"meta": {}, "results": results})
+
+        papers = [_stub(f"10.1234/p{i}") for i in range(120)] + [_stub("10.1234/missing")]
+        papers.append(_stub("10.9999/pubmed.1"))
+
+        hydrated = _adapter(handler).hydrate(papers)
+
+        assert [len(r.url.params["filter"].split("|")) for r in requests] == [50, 50, 21]
+        assert requests[0].url.params["per-page"] == "50"
+        assert requests[0].url.params["select"] == OpenAlexAdapter.HYDRATE_SELECT
+        assert hydrated == papers[:120]
+        assert papers[0].abstract == "Abstract 10.1234/p0"
+        assert papers[0].keywords == ["Sepsis"]
+        assert papers[120].abstract == ""
+
+    def test_hydrate_replaces_placeholder_authors_only(self) -> None:
+        """Real authors replace the placeholder; existing abstracts are kept."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            result = {
+                "doi": "https://doi.org/10.1234/a",
+                "abstract_inverted_index": {"New": [0]},
+                "authorships": [{"author": {"display_name": "Ada Lovelace"}}],
+            }
+            return httpx.Response(200, json={"meta": {}, "results": [result]})
+
+        paper = _stub("10.1234/a")
+        paper.authors = [Author("Unknown", "Author", "U.")]
+        paper.abstract = "Existing abstract."
+
+        assert _adapter(handler).hydrate([paper]) == [paper]
+        assert [a.last_name for a in paper.authors] == ["Lovelace"]
+        assert paper.abstract == "Existing abstract."
+
+
+@pytest.mark.integration
+class TestOpenAlexAdapterInstrumentation:
+    """Tests for request and parse events."""
+
+    def test_events_cover_requests_and_parsing(self) -> None:
+        """Each page emits request and parse events."""
+        events: list[SearchEvent] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"meta": {}, "results": [_work(1), {"id": "W2"}]})
+
+        adapter = _adapter(handler)
+        adapter.set_event_hook(events.append)
+        adapter.search("query")
+
+        kinds = [e.kind for e in events]
+        assert kinds == [
+            SearchEventKind.REQUEST_START,
+            SearchEventKind.REQUEST_END,
+            SearchEventKind.PARSE,
+        ]
+        assert events[1].status_code == 200
+        assert (events[2].produced, events[2].dropped) == (1, 1)
+        assert events[2].service == "OpenAlex"
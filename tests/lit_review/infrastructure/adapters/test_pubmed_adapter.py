@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for PubMedAdapter."""
 
+import io
+from datetime import date
+from email.message import Message
+from pathlib import Path
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 from xml.etree import ElementTree
 
 import pytest
 
+from lit_review.application.ports.search_events import SearchEvent, SearchEventKind
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
 from lit_review.infrastructure.adapters.pubmed_adapter import PubMedAdapter
+from lit_review.infrastructure.adapters.rate_limiter import TokenBucketRateLimiter
+from lit_review.infrastructure.adapters.response_cache import ResponseCache
 
 
 @pytest.fixture
@@ -142,15 +153,12 @@ class TestPubMedAdapter:
         mock_search_handle.__exit__ = MagicMock()
         mock_esearch.return_value = mock_search_handle
 
-        mock_search_result = {"IdList": ["12345678"]}
+        mock_search_result = {"Count": "1", "WebEnv": "W", "QueryKey": "1", "IdList": []}
         with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
             mock_read.return_value = mock_search_result
 
             # Mock fetch response
-            mock_fetch_handle = MagicMock()
-            mock_fetch_handle.read.return_value = mock_pubmed_xml
-            mock_fetch_handle.close.return_value = None
-            mock_efetch.return_value = mock_fetch_handle
+            mock_efetch.return_value = io.BytesIO(mock_pubmed_xml)
 
             adapter = PubMedAdapter(email="test@example.com")
             papers = adapter.search("machine learning", limit=10)
@@ -173,14 +181,11 @@ class TestPubMedAdapter:
         mock_search_handle = MagicMock()
         mock_esearch.return_value = mock_search_handle
 
-        mock_search_result = {"IdList": ["12345678"]}
+        mock_search_result = {"Count": "1", "WebEnv": "W", "QueryKey": "1", "IdList": []}
         with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
             mock_read.return_value = mock_search_result
 
-            mock_fetch_handle = MagicMock()
-            mock_fetch_handle.read.return_value = mock_pubmed_xml
-            mock_fetch_handle.close.return_value = None
-            mock_efetch.return_value = mock_fetch_handle
+            mock_efetch.return_value = io.BytesIO(mock_pubmed_xml)
 
             adapter = PubMedAdapter(email="test@example.com")
             papers = adapter.search("test")
@@ -205,14 +210,11 @@ class TestPubMedAdapter:
         mock_search_handle = MagicMock()
         mock_esearch.return_value = mock_search_handle
 
-        mock_search_result = {"IdList": ["12345678"]}
+        mock_search_result = {"Count": "1", "WebEnv": "W", "QueryKey": "1", "IdList": []}
         with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
             mock_read.return_value = mock_search_result
 
-            mock_fetch_handle = MagicMock()
-            mock_fetch_handle.read.return_value = mock_pubmed_xml
-            mock_fetch_handle.close.return_value = None
-            mock_efetch.return_value = mock_fetch_handle
+            mock_efetch.return_value = io.BytesIO(mock_pubmed_xml)
 
             adapter = PubMedAdapter(email="test@example.com")
             papers = adapter.search("test")
@@ -232,14 +234,11 @@ class TestPubMedAdapter:
         mock_search_handle = MagicMock()
         mock_esearch.return_value = mock_search_handle
 
-        mock_search_result = {"IdList": ["87654321"]}
+        mock_search_result = {"Count": "1", "WebEnv": "W", "QueryKey": "1", "IdList": []}
         with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
             mock_read.return_value = mock_search_result
 
-            mock_fetch_handle = MagicMock()
-            mock_fetch_handle.read.return_value = mock_pubmed_xml_no_doi
-            mock_fetch_handle.close.return_value = None
-            mock_efetch.return_value = mock_fetch_handle
+            mock_efetch.return_value = io.BytesIO(mock_pubmed_xml_no_doi)
 
             adapter = PubMedAdapter(email="test@example.com")
             papers = adapter.search("test")
@@ -253,7 +252,7 @@ class TestPubMedAdapter:
         mock_search_handle = MagicMock()
         mock_esearch.return_value = mock_search_handle
 
-        mock_search_result = {"IdList": []}
+        mock_search_result = {"Count": "0", "IdList": []}
         with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
             mock_read.return_value = mock_search_result
 
@@ -262,6 +261,32 @@ class TestPubMedAdapter:
 
             assert papers == []
 
+    @patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+    @patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.efetch")
+    def test_search_without_history_server_fetches_pmids(
+        self,
+        mock_efetch: MagicMock,
+        mock_esearch: MagicMock,
+        mock_pubmed_xml: bytes,
+    ) -> None:
+        """Without WebEnv/QueryKey the PMIDs are searched for again and fetched by ID."""
+        with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read") as mock_read:
+            mock_read.side_effect = [
+                {"Count": "1", "IdList": []},
+                {"Count": "1", "IdList": ["12345678"]},
+            ]
+            mock_efetch.return_value = io.BytesIO(mock_pubmed_xml)
+
+            adapter = PubMedAdapter(email="test@example.com")
+            papers = adapter.search("test", limit=10)
+
+        history_search, id_search = mock_esearch.call_args_list
+        assert history_search.kwargs["retmax"] == 0
+        assert id_search.kwargs["retmax"] == 1
+        assert "usehistory" not in id_search.kwargs
+        assert mock_efetch.call_args.kwargs["id"] == "12345678"
+        assert [p.doi.value for p in papers] == ["10.1234/jmai.2024.001"]
+
     @patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
     def test_search_raises_connection_error_on_failure(self, mock_esearch: MagicMock) -> None:
         """search raises ConnectionError on failure."""
@@ -286,7 +311,7 @@ class TestPubMedAdapter:
 
         assert "timed out" in str(exc_info.value)
 
-    @patch("lit_review.infrastructure.adapters.pubmed_adapter.time.sleep")
+    @patch("lit_review.infrastructure.adapters.rate_limiter.time.sleep")
     def test_rate_limiting_with_api_key(self, mock_sleep: MagicMock) -> None:
         """_rate_limit_sleep respects higher rate with API key."""
         adapter = PubMedAdapter(email="test@example.com", api_key="test_key")
@@ -295,13 +320,12 @@ class TestPubMedAdapter:
         adapter._rate_limit_sleep()
         mock_sleep.assert_not_called()
 
-        # Immediate second call should sleep
-        adapter._last_request_time = adapter._last_request_time - 0.05  # 50ms ago
+        # Immediate second call waits for the next token (~100ms interval)
         adapter._rate_limit_sleep()
-        # Should sleep for ~50ms (100ms interval - 50ms elapsed)
         assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.1, abs=0.02)
 
-    @patch("lit_review.infrastructure.adapters.pubmed_adapter.time.sleep")
+    @patch("lit_review.infrastructure.adapters.rate_limiter.time.sleep")
     def test_rate_limiting_without_api_key(self, mock_sleep: MagicMock) -> None:
         """_rate_limit_sleep respects standard rate without API key."""
         adapter = PubMedAdapter(email="test@example.com")
@@ -311,6 +335,22 @@ class TestPubMedAdapter:
         adapter._rate_limit_sleep()
         mock_sleep.assert_not_called()
 
+    @patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+    def test_retry_after_pauses_shared_limiter(self, mock_esearch: MagicMock) -> None:
+        """A 429 with Retry-After pauses every caller sharing the limiter."""
+        limiter = TokenBucketRateLimiter(rate=10)
+        adapter = PubMedAdapter(email="test@example.com", rate_limiter=limiter)
+        mock_esearch.side_effect = HTTPError(
+            "https://eutils.ncbi.nlm.nih.gov", 429, "Too Many Requests", Message(), None
+        )
+        mock_esearch.side_effect.headers["Retry-After"] = "5"
+
+        with pytest.raises(ConnectionError):
+            adapter.search("test")
+
+        assert adapter.rate_limiter is limiter
+        assert limiter._reserve(1) == pytest.approx(5.1, abs=0.1)
+
 
 class TestPubMedAdapterParsing:
     """Tests for PubMed XML parsing."""
@@ -493,3 +533,404 @@ class TestPubMedAdapterParsing:
         keywords = adapter._extract_keywords(medline_citation)
 
         assert len(keywords) == 10
+
+
+def _pubmed_batch_xml(pmids: list[int]) -> bytes:
+    """Build a PubmedArticleSet document with one article per PMID."""
+    articles = "".join(
+        f"""
+        <PubmedArticle>
+            <MedlineCitation>
+                <PMID>{pmid}</PMID>
+                <Article>
+                    <ArticleTitle>Article {pmid}</ArticleTitle>
+                    <AuthorList>
+                        <Author><LastName>Smith</LastName><ForeName>John</ForeName></Author>
+                    </AuthorList>
+                    <Journal><Title>Journal</Title></Journal>
+                    <PubDate><Year>2022</Year></PubDate>
+                </Article>
+            </MedlineCitation>
+        </PubmedArticle>"""
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+
+
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.efetch")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+class TestPubMedAdapterHistoryBatching:
+    """Tests for history-server batched efetch with streaming parse."""
+
+    def _setup(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock, count: int
+    ) -> None:
+        mock_read.return_value = {
+            "Count": str(count),
+            "WebEnv": "WEBENV_1",
+            "QueryKey": "1",
+            "IdList": [],
+        }
+
+        def efetch(**kwargs: object) -> io.BytesIO:
+            start = int(kwargs["retstart"])  # type: ignore[call-overload]
+            size = int(kwargs["retmax"])  # type: ignore[call-overload]
+            return io.BytesIO(_pubmed_batch_xml(list(range(start, start + size))))
+
+        mock_efetch.side_effect = efetch
+
+    def test_search_uses_history_server(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """esearch stores results on the history server and efetch pages through it."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=1200)
+        adapter = PubMedAdapter(
+            email="test@example.com",
+            api_key="key",
+            batch_size=500,
+            rate_limiter=TokenBucketRateLimiter(rate=1000),
+        )
+
+        papers = adapter.search("sepsis", limit=1100)
+
+        assert len(papers) == 1100
+        assert mock_esearch.call_args.kwargs["usehistory"] == "y"
+        batches = [
+            (c.kwargs["retstart"], c.kwargs["retmax"], c.kwargs["webenv"], c.kwargs["query_key"])
+            for c in mock_efetch.call_args_list
+        ]
+        assert batches == [
+            (0, 500, "WEBENV_1", "1"),
+            (500, 500, "WEBENV_1", "1"),
+            (1000, 100, "WEBENV_1", "1"),
+        ]
+
+    def test_search_limited_by_result_count(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """No more records are requested than the query matched."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=3)
+        adapter = PubMedAdapter(email="test@example.com", batch_size=500)
+
+        papers = adapter.search("rare", limit=100)
+
+        assert [p.doi.value for p in papers] == [f"10.9999/pubmed.{i}" for i in range(3)]
+        assert mock_efetch.call_count == 1
+
+    def test_search_stops_at_result_cap(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """Batches stop at RESULT_CAP, which PubMed enforces on the history server too."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=20_000)
+        adapter = PubMedAdapter(
+            email="test@example.com",
+            batch_size=5000,
+            rate_limiter=TokenBucketRateLimiter(rate=1000),
+        )
+
+        papers = adapter.search("sepsis", limit=20_000)
+
+        assert len(papers) == PubMedAdapter.RESULT_CAP
+        assert [(c.kwargs["retstart"], c.kwargs["retmax"]) for c in mock_efetch.call_args_list] == [
+            (0, 5000),
+            (5000, 5000),
+        ]
+
+    def test_iter_search_fetches_batches_lazily(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """iter_search only fetches the next batch once the current one is consumed."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=10)
+        adapter = PubMedAdapter(email="test@example.com", batch_size=2)
+
+        results = adapter.iter_search("query", limit=10)
+        next(results)
+        next(results)
+
+        assert mock_efetch.call_count == 1
+        next(results)
+        assert mock_efetch.call_count == 2
+
+    def test_search_since_restricts_entrez_date(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """search_since limits esearch to records entered since the given date."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=2)
+        adapter = PubMedAdapter(email="test@example.com")
+
+        papers = adapter.search_since("sepsis", date(2025, 3, 1), limit=10)
+
+        assert len(papers) == 2
+        kwargs = mock_esearch.call_args.kwargs
+        assert kwargs["term"] == "sepsis"
+        assert kwargs["datetype"] == "edat"
+        assert kwargs["mindate"] == "2025/03/01"
+        assert kwargs["maxdate"] == date.today().strftime("%Y/%m/%d")
+
+    def test_search_range_restricts_publication_date(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """search_range limits esearch to the publication date range."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=2)
+        adapter = PubMedAdapter(email="test@example.com")
+
+        papers = adapter.search_range("sepsis", date(2020, 1, 1), date(2020, 6, 30), limit=10)
+
+        assert len(papers) == 2
+        kwargs = mock_esearch.call_args.kwargs
+        assert (kwargs["datetype"], kwargs["mindate"], kwargs["maxdate"]) == (
+            "pdat",
+            "2020/01/01",
+            "2020/06/30",
+        )
+
+    def test_count_range_returns_esearch_count(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """count_range runs one esearch without fetching records."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=25_000)
+        adapter = PubMedAdapter(email="test@example.com")
+
+        count = adapter.count_range("sepsis", date(2020, 1, 1), date(2020, 12, 31))
+
+        assert count == 25_000
+        assert mock_esearch.call_args.kwargs["retmax"] == 0
+        mock_efetch.assert_not_called()
+
+    def test_iter_search_wraps_failures(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """Failures while fetching a batch surface as ConnectionError."""
+        self._setup(mock_esearch, mock_efetch, mock_read, count=10)
+        mock_efetch.side_effect = Exception("HTTP 500")
+        adapter = PubMedAdapter(email="test@example.com")
+
+        with pytest.raises(ConnectionError):
+            list(adapter.iter_search("query", limit=10))
+
+
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.efetch")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+class TestPubMedAdapterCaching:
+    """Tests for caching efetch batches in a ResponseCache."""
+
+    def test_repeated_search_reuses_cached_batches(
+        self,
+        mock_esearch: MagicMock,
+        mock_efetch: MagicMock,
+        mock_read: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Batches are cached by query and offset, independent of WebEnv."""
+        sessions = iter(["WEBENV_1", "WEBENV_2"])
+        mock_read.side_effect = lambda handle: {
+            "Count": "3",
+            "WebEnv": next(sessions),
+            "QueryKey": "1",
+            "IdList": [],
+        }
+        mock_efetch.side_effect = lambda **kwargs: io.BytesIO(_pubmed_batch_xml([1, 2, 3]))
+        cache = ResponseCache(tmp_path / "http.sqlite")
+        adapter = PubMedAdapter(email="test@example.com", cache=cache)
+
+        first = adapter.search("sepsis", limit=10)
+        second = adapter.search("sepsis", limit=10)
+
+        assert [p.doi for p in first] == [p.doi for p in second]
+        assert mock_efetch.call_count == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_different_queries_are_cached_separately(
+        self,
+        mock_esearch: MagicMock,
+        mock_efetch: MagicMock,
+        mock_read: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Each query gets its own cache entries."""
+        mock_read.return_value = {"Count": "1", "WebEnv": "W", "QueryKey": "1", "IdList": []}
+        mock_efetch.side_effect = lambda **kwargs: io.BytesIO(_pubmed_batch_xml([1]))
+        adapter = PubMedAdapter(
+            email="test@example.com", cache=ResponseCache(tmp_path / "http.sqlite")
+        )
+
+        adapter.search("sepsis", limit=10)
+        adapter.search("stroke", limit=10)
+
+        assert mock_efetch.call_count == 2
+
+
+class TestPubMedAdapterStreamingParse:
+    """Tests for incremental iterparse-based XML parsing."""
+
+    def test_iter_parse_xml_clears_processed_articles(self) -> None:
+        """Parsed articles are cleared from the tree as parsing proceeds."""
+        adapter = PubMedAdapter(email="test@example.com")
+        source = io.BytesIO(_pubmed_batch_xml(list(range(50))))
+
+        seen_children: list[int] = []
+        parser = adapter._iter_parse_xml(source)
+        for _ in parser:
+            # Walk back to the root via the generator frame's local state
+            root = parser.gi_frame.f_locals["root"] if parser.gi_frame else None
+            if root is not None:
+                seen_children.append(len(root))
+
+        assert max(seen_children) <= 1
+
+    def test_iter_parse_xml_skips_malformed_articles(self) -> None:
+        """Articles that cannot be converted are skipped."""
+        xml = b"""<PubmedArticleSet>
+            <PubmedArticle><MedlineCitation><PMID>1</PMID></MedlineCitation></PubmedArticle>
+        </PubmedArticleSet>"""
+        adapter = PubMedAdapter(email="test@example.com")
+
+        assert list(adapter._iter_parse_xml(io.BytesIO(xml))) == []
+
+
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esummary")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+class TestPubMedAdapterStubs:
+    """Tests for esummary stub searches."""
+
+    def test_search_stubs_uses_esummary(
+        self, mock_esearch: MagicMock, mock_esummary: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """Stubs come from document summaries, without abstracts."""
+        summaries = [
+            {
+                "Id": "101",
+                "Title": "Sepsis prediction.",
+                "AuthorList": ["Smith JA", "van der Berg K"],
+                "PubDate": "2023 Jan 5",
+                "FullJournalName": "Critical Care",
+                "ArticleIds": {"pubmed": ["101"], "doi": "10.1000/cc.101"},
+            },
+            {"Id": "102", "Title": "No DOI.", "AuthorList": [], "PubDate": "2021", "Source": "J"},
+        ]
+        mock_read.side_effect = [
+            {"Count": "2", "WebEnv": "WEBENV_1", "QueryKey": "1", "IdList": []},
+            summaries,
+        ]
+        mock_esummary.return_value = io.BytesIO(b"<eSummaryResult/>")
+        adapter = PubMedAdapter(email="test@example.com")
+
+        papers = adapter.search_stubs("sepsis", limit=10)
+
+        assert mock_esummary.call_args.kwargs["webenv"] == "WEBENV_1"
+        assert [p.doi.value for p in papers] == ["10.1000/cc.101", "10.9999/pubmed.102"]
+        assert papers[0].publication_year == 2023
+        assert papers[0].journal == "Critical Care"
+        assert [(a.last_name, a.initials) for a in papers[0].authors] == [
+            ("Smith", "J.A."),
+            ("van der Berg", "K."),
+        ]
+        assert papers[1].authors[0].last_name == "Unknown"
+        assert all(p.abstract == "" for p in papers)
+
+
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.efetch")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+class TestPubMedAdapterHydrate:
+    """Tests for hydrating stubs with efetch."""
+
+    def test_hydrate_resolves_pmids_and_fills_abstracts(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """Fallback DOIs give PMIDs directly; other DOIs are looked up with esearch."""
+        xml = b"""<PubmedArticleSet>
+            <PubmedArticle><MedlineCitation><PMID>5</PMID><Article>
+                <ArticleTitle>Five</ArticleTitle>
+                <Journal><Title>J</Title></Journal>
+                <Abstract><AbstractText>Abstract five.</AbstractText></Abstract>
+            </Article></MedlineCitation></PubmedArticle>
+            <PubmedArticle><MedlineCitation><PMID>7</PMID><Article>
+                <ArticleTitle>Seven</ArticleTitle>
+                <Journal><Title>J</Title></Journal>
+                <Abstract><AbstractText>Abstract seven.</AbstractText></Abstract>
+            </Article></MedlineCitation>
+            <PubmedData><ArticleIdList>
+                <ArticleId IdType="doi">10.1000/REAL</ArticleId>
+            </ArticleIdList></PubmedData></PubmedArticle>
+        </PubmedArticleSet>"""
+        mock_read.return_value = {"IdList": ["7"]}
+        mock_efetch.return_value = io.BytesIO(xml)
+        papers = [
+            Paper(
+                doi=DOI(doi),
+                title="Stub",
+                authors=[Author("Smith", "John", "J.")],
+                publication_year=2023,
+                journal="Journal",
+            )
+            for doi in ["10.9999/pubmed.5", "10.1000/real", "10.1000/missing"]
+        ]
+        adapter = PubMedAdapter(email="test@example.com")
+
+        hydrated = adapter.hydrate(papers)
+
+        assert mock_esearch.call_args.kwargs["term"] == (
+            '"10.1000/real"[doi] OR "10.1000/missing"[doi]'
+        )
+        assert mock_efetch.call_args.kwargs["id"] == "5,7"
+        assert hydrated == [papers[0], papers[1]]
+        assert papers[0].abstract == "Abstract five."
+        assert papers[1].abstract == "Abstract seven."
+        assert papers[2].abstract == ""
+
+
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.read")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.efetch")
+@patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez.esearch")
+class TestPubMedAdapterInstrumentation:
+    """Tests for the instrumentation events of PubMed searches."""
+
+    def test_events_cover_eutilities_and_streamed_parsing(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """esearch and efetch are reported as requests; parsing counts dropped articles."""
+        mock_read.return_value = {"Count": "2", "WebEnv": "W", "QueryKey": "1", "IdList": []}
+        malformed = (
+            b"<PubmedArticle><MedlineCitation><PMID>9</PMID></MedlineCitation></PubmedArticle>"
+        )
+        xml = _pubmed_batch_xml([1, 2]).replace(
+            b"</PubmedArticleSet>", malformed + b"</PubmedArticleSet>"
+        )
+        mock_efetch.return_value = io.BytesIO(xml)
+        events: list[SearchEvent] = []
+        adapter = PubMedAdapter(
+            email="test@example.com", rate_limiter=TokenBucketRateLimiter(rate=1000)
+        )
+        adapter.set_event_hook(events.append)
+
+        papers = adapter.search("sepsis", limit=10)
+
+        assert len(papers) == 2
+        requests = [e for e in events if e.kind is SearchEventKind.REQUEST_END]
+        assert [e.url for e in requests] == ["esearch", "efetch"]
+        assert requests[1].bytes_received == len(xml)
+        (parse,) = [e for e in events if e.kind is SearchEventKind.PARSE]
+        assert (parse.produced, parse.dropped) == (2, 1)
+
+    def test_failed_request_reports_status(
+        self, mock_esearch: MagicMock, mock_efetch: MagicMock, mock_read: MagicMock
+    ) -> None:
+        """An E-utilities HTTP error ends the request event with its status."""
+        mock_esearch.side_effect = HTTPError(
+            "https://eutils.ncbi.nlm.nih.gov", 429, "Too Many Requests", Message(), None
+        )
+        events: list[SearchEvent] = []
+        adapter = PubMedAdapter(email="test@example.com")
+        adapter.set_event_hook(events.append)
+
+        with pytest.raises(ConnectionError):
+            adapter.search("sepsis", limit=10)
+
+        assert [(e.kind, e.status_code) for e in events] == [
+            (SearchEventKind.REQUEST_START, None),
+            (SearchEventKind.REQUEST_END, 429),
+        ]
@@ -0,0 +1,332 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the shared token-bucket rate limiter."""
+
+import asyncio
+import math
+import multiprocessing
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lit_review.infrastructure.adapters import rate_limiter
+from lit_review.infrastructure.adapters.pubmed_adapter import PubMedAdapter
+from lit_review.infrastructure.adapters.rate_limiter import (
+    TokenBucketRateLimiter,
+    credential_fingerprint,
+    default_rate_limiter,
+    parse_retry_after,
+    rate_limit_dir,
+    shared_rate_limiter,
+)
+
+
+def _acquire_in_process(state_file: str, count: int) -> None:
+    """Acquire tokens from a file-backed limiter in a child process."""
+    limiter = TokenBucketRateLimiter(rate=20, capacity=1, state_file=Path(state_file))
+    for _ in range(count):
+        limiter.acquire()
+
+
+class TestTokenBucketRateLimiter:
+    """Tests for TokenBucketRateLimiter."""
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Rate must be positive and capacity at least one token."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=1, capacity=0.5)
+
+    def test_burst_capacity_allows_back_to_back_requests(self) -> None:
+        """Up to capacity tokens are granted without waiting."""
+        limiter = TokenBucketRateLimiter(rate=1, capacity=3)
+
+        waits = [limiter._reserve(1) for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0, abs=0.05)
+
+    def test_reservations_are_spaced_by_rate(self) -> None:
+        """Queued callers wait successively longer for their tokens."""
+        limiter = TokenBucketRateLimiter(rate=2, capacity=1)
+
+        waits = [limiter._reserve(1) for _ in range(3)]
+
+        assert waits == pytest.approx([0.0, 0.5, 1.0], abs=0.05)
+
+    def test_tokens_refill_over_time(self) -> None:
+        """Elapsed time refills the bucket up to capacity."""
+        limiter = TokenBucketRateLimiter(rate=10, capacity=2)
+        limiter._reserve(2)
+
+        with patch(
+            "lit_review.infrastructure.adapters.rate_limiter.time.time",
+            return_value=time.time() + 60,
+        ):
+            assert limiter._reserve(1) == 0.0
+            assert limiter._reserve(1) == 0.0
+            assert limiter._reserve(1) > 0.0
+
+    def test_from_interval_zero_disables_limiting(self) -> None:
+        """A zero interval produces an unlimited bucket."""
+        limiter = TokenBucketRateLimiter.from_interval(0)
+
+        assert math.isinf(limiter.rate)
+        assert all(limiter._reserve(1) == 0.0 for _ in range(100))
+
+    @patch("lit_review.infrastructure.adapters.rate_limiter.time.sleep")
+    def test_acquire_sleeps_for_reservation(self, mock_sleep: MagicMock) -> None:
+        """acquire() sleeps only when the bucket is empty."""
+        limiter = TokenBucketRateLimiter.from_interval(3.0)
+
+        assert limiter.acquire() == 0.0
+        mock_sleep.assert_not_called()
+
+        limiter.acquire()
+        assert mock_sleep.call_args.args[0] == pytest.approx(3.0, abs=0.05)
+
+    def test_acquire_async_does_not_block_event_loop(self) -> None:
+        """Concurrent tasks are spaced by the bucket while the loop stays free."""
+        limiter = TokenBucketRateLimiter(rate=20, capacity=1)
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+
+        async def run() -> float:
+            start = time.perf_counter()
+            await asyncio.gather(ticker(), *(limiter.acquire_async() for _ in range(4)))
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        assert ticks == [0, 1, 2, 3, 4]
+        assert elapsed >= 0.14  # three waits of 50ms after the initial token
+
+    def test_file_backed_acquire_async_waits_for_lock_off_loop(self, tmp_path: Path) -> None:
+        """The event loop keeps running while another holder has the state file lock."""
+        fcntl = pytest.importorskip("fcntl")
+        state_file = tmp_path / "locked.json"
+        limiter = TokenBucketRateLimiter(rate=100, capacity=1, state_file=state_file)
+        locked = threading.Event()
+        release = threading.Event()
+        released: list[bool] = []
+
+        def hold_lock() -> None:
+            with open(state_file, "a+", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                locked.set()
+                released.append(release.wait(timeout=5))
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait(timeout=5)
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+            release.set()
+
+        async def run() -> None:
+            await asyncio.gather(ticker(), limiter.acquire_async())
+
+        try:
+            asyncio.run(run())
+        finally:
+            release.set()
+            holder.join()
+
+        # The ticker, not the timeout, released the lock
+        assert released == [True]
+        assert ticks == [0, 1, 2, 3, 4]
+
+    def test_thread_safe_across_threads(self) -> None:
+        """Threads sharing a limiter never exceed the configured rate."""
+        limiter = TokenBucketRateLimiter(rate=50, capacity=1)
+        grants: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(5):
+                limiter.acquire()
+                with lock:
+                    grants.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(grants) == 20
+        # 20 tokens at 50/s with a burst of one take at least 19 intervals
+        assert max(grants) - start >= 19 / 50 - 0.02
+
+    def test_penalize_pauses_all_callers(self) -> None:
+        """Retry-After drains the bucket and delays refilling."""
+        limiter = TokenBucketRateLimiter(rate=100, capacity=5)
+
+        limiter.penalize(2.0)
+
+        assert limiter._reserve(1) == pytest.approx(2.01, abs=0.05)
+
+    def test_file_backed_state_is_shared(self, tmp_path: Path) -> None:
+        """Limiters using the same state file share one budget."""
+        state_file = tmp_path / "ncbi.json"
+        first = TokenBucketRateLimiter(rate=1, capacity=1, state_file=state_file)
+        second = TokenBucketRateLimiter(rate=1, capacity=1, state_file=state_file)
+
+        assert first._reserve(1) == 0.0
+        assert second._reserve(1) == pytest.approx(1.0, abs=0.05)
+        assert state_file.exists()
+
+    def test_corrupt_state_file_starts_full(self, tmp_path: Path) -> None:
+        """An unreadable state file is treated as a full bucket."""
+        state_file = tmp_path / "bucket.json"
+        state_file.write_text("not json")
+        limiter = TokenBucketRateLimiter(rate=1, capacity=1, state_file=state_file)
+
+        assert limiter._reserve(1) == 0.0
+
+    def test_file_backed_state_is_shared_across_processes(self, tmp_path: Path) -> None:
+        """Separate processes respect one shared request budget."""
+        state_file = tmp_path / "shared.json"
+        ctx = multiprocessing.get_context("fork")
+        processes = [
+            ctx.Process(target=_acquire_in_process, args=(str(state_file), 3)) for _ in range(2)
+        ]
+
+        start = time.monotonic()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=10)
+        elapsed = time.monotonic() - start
+
+        assert all(process.exitcode == 0 for process in processes)
+        # Six tokens at 20/s with a burst of one need five intervals
+        assert elapsed >= 5 / 20 - 0.02
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_parses_delay_seconds(self) -> None:
+        """Numeric values are seconds."""
+        assert parse_retry_after("7") == 7.0
+
+    def test_parses_http_date(self) -> None:
+        """HTTP-dates are converted to a delay from now."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay == pytest.approx(30, abs=2)
+
+    def test_invalid_or_missing_values(self) -> None:
+        """Missing or malformed headers return None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestSharedRateLimiter:
+    """Tests for shared_rate_limiter, default_rate_limiter and credential_fingerprint."""
+
+    def test_same_key_returns_same_limiter(self) -> None:
+        """Adapters asking for the same key share one bucket."""
+        first = shared_rate_limiter("test:same-key", rate=5)
+        second = shared_rate_limiter("test:same-key", rate=50)
+
+        assert first is second
+        assert second.rate == 5
+
+    def test_state_dir_enables_file_backing(self, tmp_path: Path) -> None:
+        """A state directory makes the limiter cross-process."""
+        limiter = shared_rate_limiter("ncbi:abc/def", rate=10, state_dir=tmp_path)
+
+        assert limiter.state_file == tmp_path / "ncbi_abc_def.json"
+
+    def test_off_gives_private_limiters(self) -> None:
+        """LIT_REVIEW_RATE_LIMIT_DIR=off gives each adapter its own bucket."""
+        first = default_rate_limiter("test:private", interval=1.0)
+        second = default_rate_limiter("test:private", interval=1.0)
+
+        assert rate_limit_dir() is None
+        assert first is not second
+        assert first.state_file is None
+
+    def test_default_is_shared_under_data_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without LIT_REVIEW_RATE_LIMIT_DIR limiters are shared under the data dir."""
+        monkeypatch.delenv("LIT_REVIEW_RATE_LIMIT_DIR")
+        monkeypatch.setenv("LIT_REVIEW_DATA_DIR", str(tmp_path))
+
+        first = default_rate_limiter("test:default", interval=1.0)
+        second = default_rate_limiter("test:default", interval=1.0)
+
+        assert first is second
+        assert first.state_file == tmp_path / "ratelimits" / "test_default.json"
+
+    def test_unwritable_dir_falls_back_to_private(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A state directory that cannot be created gives a private bucket."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setenv("LIT_REVIEW_RATE_LIMIT_DIR", str(blocker / "ratelimits"))
+
+        limiter = default_rate_limiter("test:unwritable", interval=1.0)
+
+        assert limiter.state_file is None
+
+    def test_no_file_locks_falls_back_to_private(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without fcntl (e.g. on Windows) adapters get private buckets."""
+        monkeypatch.setenv("LIT_REVIEW_RATE_LIMIT_DIR", str(tmp_path))
+        monkeypatch.setattr(rate_limiter, "file_locks_available", lambda: False)
+
+        limiter = default_rate_limiter("test:no-fcntl", interval=1.0)
+
+        assert limiter.state_file is None
+        with pytest.raises(OSError, match="fcntl"):
+            TokenBucketRateLimiter(rate=1, state_file=tmp_path / "state.json")
+
+    def test_env_var_shares_file_backed_limiter(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PubMed jobs using one NCBI key share a file-backed bucket."""
+        monkeypatch.setenv("LIT_REVIEW_RATE_LIMIT_DIR", str(tmp_path))
+
+        first = PubMedAdapter(email="a@example.com", api_key="shared-ncbi-key")
+        second = PubMedAdapter(email="b@example.com", api_key="shared-ncbi-key")
+        other = PubMedAdapter(email="c@example.com", api_key="other-ncbi-key")
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not other.rate_limiter
+        assert first.rate_limiter.rate == 10
+        assert first.rate_limiter.state_file is not None
+        assert first.rate_limiter.state_file.parent == tmp_path
+        assert "shared-ncbi-key" not in first.rate_limiter.state_file.name
+
+    def test_credential_fingerprint_hides_secret(self) -> None:
+        """Fingerprints are stable and never contain the secret."""
+        fingerprint = credential_fingerprint("super-secret-key")
+
+        assert fingerprint == credential_fingerprint("super-secret-key")
+        assert "secret" not in fingerprint
+        assert len(fingerprint) == 12
+        assert credential_fingerprint(None) == "public"
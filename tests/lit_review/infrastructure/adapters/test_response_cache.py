@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the on-disk HTTP response cache."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from lit_review.infrastructure.adapters.crossref_adapter import (
+    AsyncCrossrefAdapter,
+    CrossrefAdapter,
+)
+from lit_review.infrastructure.adapters.response_cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    ResponseCache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ResponseCache]:
+    """Return a response cache in a temporary directory."""
+    response_cache = ResponseCache(tmp_path / "http.sqlite", ttl=60)
+    yield response_cache
+    response_cache.close()
+
+
+def _crossref_body(doi: str = "10.1234/cached") -> dict:
+    """Build a one-item Crossref response."""
+    return {
+        "status": "ok",
+        "message": {
+            "items": [
+                {
+                    "DOI": doi,
+                    "title": ["Cached Paper"],
+                    "author": [{"family": "Smith", "given": "Jane"}],
+                    "published": {"date-parts": [[2023]]},
+                }
+            ]
+        },
+    }
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage."""
+
+    def test_rejects_invalid_settings(self, tmp_path: Path) -> None:
+        """TTL and size bounds are validated."""
+        with pytest.raises(ValueError):
+            ResponseCache(tmp_path / "a.sqlite", ttl=-1)
+        with pytest.raises(ValueError):
+            ResponseCache(tmp_path / "b.sqlite", max_bytes=0)
+
+    def test_make_key_normalizes_parameter_order(self) -> None:
+        """Equivalent requests share a key regardless of parameter order."""
+        first = ResponseCache.make_key("get", "https://API.example.org/works", {"b": 2, "a": 1})
+        second = ResponseCache.make_key("GET", "https://api.example.org/works?a=1&b=2")
+
+        assert first == second
+
+    def test_put_and_get_roundtrip(self, cache: ResponseCache) -> None:
+        """Stored bodies and headers are returned intact."""
+        cache.put("k", b"body", headers={"ETag": '"v1"', "Content-Encoding": "gzip"})
+
+        entry = cache.get("k")
+
+        assert entry is not None
+        assert entry.content == b"body"
+        assert entry.etag == '"v1"'
+        assert "content-encoding" not in entry.headers
+        assert cache.is_fresh(entry)
+
+    def test_entries_expire_after_ttl(self, cache: ResponseCache) -> None:
+        """Entries older than the TTL are stale."""
+        cache.put("k", b"body")
+
+        with patch(
+            "lit_review.infrastructure.adapters.response_cache.time.time",
+            return_value=time.time() + 120,
+        ):
+            entry = cache.get("k")
+            assert entry is not None
+            assert not cache.is_fresh(entry)
+            assert not cache.contains_fresh("k")
+
+    def test_lru_eviction_keeps_size_bounded(self, tmp_path: Path) -> None:
+        """Least recently used entries are evicted past max_bytes."""
+        cache = ResponseCache(tmp_path / "lru.sqlite", max_bytes=25)
+        cache.put("old", b"x" * 10)
+        cache.put("recent", b"y" * 10)
+        cache.get("old")  # "recent" is now least recently used
+        cache.put("new", b"z" * 10)
+
+        assert cache.get("recent") is None
+        assert cache.get("old") is not None
+        assert cache.total_size() <= 25
+        assert cache.stats.evictions == 1
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Entries survive reopening the cache file."""
+        path = tmp_path / "persist.sqlite"
+        ResponseCache(path).put("k", b"body")
+
+        assert ResponseCache(path).contains_fresh("k")
+
+
+class TestCachingTransport:
+    """Tests for CachingTransport and AsyncCachingTransport."""
+
+    def test_second_request_served_from_cache(self, cache: ResponseCache) -> None:
+        """A fresh entry answers the request without network access."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"n": len(calls)})
+
+        client = httpx.Client(transport=CachingTransport(cache, httpx.MockTransport(handler)))
+
+        first = client.get("https://api.example.org/works", params={"q": "ml"})
+        second = client.get("https://api.example.org/works", params={"q": "ml"})
+
+        assert first.json() == second.json() == {"n": 1}
+        assert len(calls) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_stale_entry_revalidated_with_etag(self, cache: ResponseCache) -> None:
+        """Stale entries send If-None-Match and reuse the body on 304."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"data": "original"},
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+
+        cache.ttl = 0
+        client = httpx.Client(transport=CachingTransport(cache, httpx.MockTransport(handler)))
+
+        client.get("https://api.example.org/works")
+        response = client.get("https://api.example.org/works")
+
+        assert response.status_code == 200
+        assert response.json() == {"data": "original"}
+        assert calls[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert cache.stats.revalidations == 1
+
+    def test_error_responses_not_cached(self, cache: ResponseCache) -> None:
+        """Only successful responses are stored."""
+        client = httpx.Client(
+            transport=CachingTransport(
+                cache, httpx.MockTransport(lambda request: httpx.Response(500))
+            )
+        )
+
+        client.get("https://api.example.org/works")
+        client.get("https://api.example.org/works")
+
+        assert cache.stats.misses == 2
+        assert cache.total_size() == 0
+
+    def test_async_transport_serves_from_cache(self, cache: ResponseCache) -> None:
+        """AsyncCachingTransport shares entries with the sync transport."""
+        cache.put(
+            ResponseCache.make_key("GET", "https://api.example.org/works", {"q": "ml"}),
+            b'{"cached": true}',
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("network should not be used")
+
+        async def run() -> httpx.Response:
+            transport = AsyncCachingTransport(cache, httpx.MockTransport(handler))
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.get("https://api.example.org/works", params={"q": "ml"})
+
+        response = asyncio.run(run())
+
+        assert response.json() == {"cached": True}
+        assert cache.stats.hits == 1
+
+
+class TestAdapterCaching:
+    """Tests for search adapters backed by a response cache."""
+
+    def test_repeated_search_skips_network_and_rate_limiter(self, cache: ResponseCache) -> None:
+        """A repeated Crossref search is answered from cache without a token."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=_crossref_body())
+
+        limiter = MagicMock()
+        adapter = CrossrefAdapter(cache=cache, rate_limiter=limiter)
+        adapter._client = httpx.Client(
+            transport=CachingTransport(cache, httpx.MockTransport(handler))
+        )
+
+        first = adapter.search("sepsis", limit=5)
+        second = adapter.search("sepsis", limit=5)
+
+        assert first == second
+        assert len(calls) == 1
+        assert limiter.acquire.call_count == 1
+        assert cache.stats.hits == 1
+
+    def test_pooled_client_uses_caching_transport(self, cache: ResponseCache) -> None:
+        """Adapters with a cache route requests through CachingTransport."""
+        with CrossrefAdapter(cache=cache) as adapter:
+            client = adapter._get_client()
+            assert isinstance(client._transport, CachingTransport)
+
+    def test_new_adapter_reuses_persisted_results(self, tmp_path: Path) -> None:
+        """A later run (new adapter, reopened cache) needs no network access."""
+        path = tmp_path / "http.sqlite"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=_crossref_body())
+
+        first_cache = ResponseCache(path)
+        first = CrossrefAdapter(cache=first_cache)
+        first._client = httpx.Client(
+            transport=CachingTransport(first_cache, httpx.MockTransport(handler))
+        )
+        first.search("sepsis", limit=5)
+
+        second_cache = ResponseCache(path)
+        with CrossrefAdapter(cache=second_cache) as second:  # real transport underneath
+            papers = second.search("sepsis", limit=5)
+
+        assert [str(p.doi) for p in papers] == ["10.1234/cached"]
+        assert (second_cache.stats.hits, second_cache.stats.misses) == (1, 0)
+
+    def test_async_adapter_uses_cache(self, cache: ResponseCache) -> None:
+        """Async adapters route requests through AsyncCachingTransport."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=_crossref_body())
+
+        async def run() -> None:
+            adapter = AsyncCrossrefAdapter(cache=cache)
+            adapter._async_client = httpx.AsyncClient(
+                transport=AsyncCachingTransport(cache, httpx.MockTransport(handler))
+            )
+            async with adapter:
+                await adapter.search("sepsis", limit=5)
+                await adapter.search("sepsis", limit=5)
+
+        asyncio.run(run())
+
+        assert len(calls) == 1
+        assert cache.stats.hits == 1
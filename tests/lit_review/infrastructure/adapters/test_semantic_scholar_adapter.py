@@ -2,12 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for SemanticScholarAdapter."""
 
+import asyncio
+import json
+import time
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
 from lit_review.infrastructure.adapters.semantic_scholar_adapter import (
+    AsyncSemanticScholarAdapter,
     SemanticScholarAdapter,
 )
 
@@ -349,7 +357,7 @@ class TestSemanticScholarAdapter:
 
         assert "failed" in str(exc_info.value)
 
-    @patch("lit_review.infrastructure.adapters.semantic_scholar_adapter.time.sleep")
+    @patch("lit_review.infrastructure.adapters.rate_limiter.time.sleep")
     def test_rate_limiting(self, mock_sleep: MagicMock) -> None:
         """_rate_limit_sleep respects rate limits."""
         adapter = SemanticScholarAdapter(rate_limit=3.0)
@@ -358,11 +366,224 @@ class TestSemanticScholarAdapter:
         adapter._rate_limit_sleep()
         mock_sleep.assert_not_called()
 
-        # Immediate second call should sleep
-        adapter._last_request_time = adapter._last_request_time - 1.0  # 1 second ago
+        # Immediate second call waits for the next token (~3 seconds)
         adapter._rate_limit_sleep()
-        # Should sleep for ~2 seconds
         assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(3.0, abs=0.1)
+
+
+class TestSemanticScholarAdapterSearchSince:
+    """Tests for delta searches with a year filter."""
+
+    def test_search_since_filters_by_year(self, mock_s2_response: dict) -> None:
+        """search_since requests papers from the watermark's year onwards."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_s2_response)
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_since("sepsis", date(2025, 3, 1), limit=10)
+
+        assert papers
+        assert requests[0].url.params["year"] == "2025-"
+
+
+class TestSemanticScholarAdapterDateRange:
+    """Tests for publication date partitions."""
+
+    def test_search_range_filters_by_publication_date(self, mock_s2_response: dict) -> None:
+        """search_range sends the range as publicationDateOrYear."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_s2_response)
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.search_range("sepsis", date(2020, 1, 1), date(2020, 6, 30))
+
+        assert papers
+        assert requests[0].url.params["publicationDateOrYear"] == "2020-01-01:2020-06-30"
+
+    def test_count_range_reads_total(self) -> None:
+        """count_range fetches one ID and returns the search total."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["limit"] == "1"
+            return httpx.Response(200, json={"total": 5678, "data": [{"paperId": "p1"}]})
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert adapter.count_range("sepsis", date(2020, 1, 1), date(2020, 12, 31)) == 5678
+
+
+class TestSemanticScholarAdapterStubs:
+    """Tests for stub searches and batch hydration."""
+
+    def test_search_stubs_requests_minimal_fields(self, mock_s2_response: dict) -> None:
+        """search_stubs does not request abstracts or citation counts."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_s2_response)
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        adapter.search_stubs("sepsis", limit=10)
+
+        assert requests[0].url.params["fields"] == "paperId,externalIds,title,authors,year,venue"
+
+    def test_hydrate_posts_ids_to_batch_endpoint(self) -> None:
+        """hydrate looks papers up by DOI or S2 ID and fills abstract and citations."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json=[{"abstract": "Found abstract.", "citationCount": 7}, None],
+            )
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        papers = [
+            Paper(
+                doi=DOI(doi),
+                title="Stub",
+                authors=[Author("Smith", "John", "J.")],
+                publication_year=2023,
+                journal="Journal",
+            )
+            for doi in ["10.1234/a", "10.58121/S2.abc123"]
+        ]
+
+        hydrated = adapter.hydrate(papers)
+
+        assert requests[0].method == "POST"
+        assert requests[0].url.path.endswith("/paper/batch")
+        assert json.loads(requests[0].content) == {"ids": ["DOI:10.1234/a", "abc123"]}
+        assert hydrated == [papers[0]]
+        assert papers[0].abstract == "Found abstract."
+        assert papers[0].keywords == ["citations:7"]
+
+    def test_hydrate_replaces_placeholder_authors_only(self) -> None:
+        """hydrate fills placeholder authors but keeps existing fields."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            item = {
+                "abstract": "Other abstract.",
+                "authors": [{"name": "Jane Doe"}],
+                "citationCount": 3,
+            }
+            return httpx.Response(200, json=[item, item])
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+        placeholder = Paper(
+            doi=DOI("10.1234/a"),
+            title="Stub",
+            authors=[Author("Unknown", "Author", "U.")],
+            publication_year=2023,
+            journal="Journal",
+            abstract="Kept abstract.",
+            keywords=["citations:1"],
+        )
+        known = Paper(
+            doi=DOI("10.1234/b"),
+            title="Stub",
+            authors=[Author("Smith", "John", "J.")],
+            publication_year=2023,
+            journal="Journal",
+            abstract="Kept abstract.",
+            keywords=["citations:1"],
+        )
+
+        hydrated = adapter.hydrate([placeholder, known])
+
+        assert hydrated == [placeholder]
+        assert placeholder.authors[0].last_name == "Doe"
+        assert placeholder.abstract == "Kept abstract."
+        assert placeholder.keywords == ["citations:1"]
+        assert known.authors[0].last_name == "Smith"
+
+
+class TestSemanticScholarAdapterCitationGraph:
+    """Tests for the references and citations endpoints."""
+
+    @staticmethod
+    def _entry(key: str, index: int) -> dict:
+        return {
+            key: {
+                "paperId": f"p{index}",
+                "externalIds": {"DOI": f"10.1234/linked.{index}"},
+                "title": f"Linked Paper {index}",
+                "authors": [{"name": "Jane Doe"}],
+                "year": 2022,
+            }
+        }
+
+    def test_get_references_pages_through_results(self) -> None:
+        """References are fetched page by page up to the limit."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            offset = int(request.url.params["offset"])
+            size = int(request.url.params["limit"])
+            entries = [self._entry("citedPaper", i) for i in range(offset, offset + size)]
+            return httpx.Response(
+                200, json={"offset": offset, "next": offset + size, "data": entries}
+            )
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter.GRAPH_PAGE = 2
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.get_references("10.1234/seed", limit=5)
+
+        assert [p.doi.value for p in papers] == [f"10.1234/linked.{i}" for i in range(5)]
+        assert requests[0].url.path.endswith("/paper/DOI:10.1234/seed/references")
+        assert [int(r.url.params["limit"]) for r in requests] == [2, 2, 1]
+
+    def test_get_citations_stops_on_last_page(self) -> None:
+        """Citations of a fallback DOI use the S2 paper ID and stop without "next"."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"offset": 0, "data": [self._entry("citingPaper", 0)]})
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        papers = adapter.get_citations("10.58121/S2.abc123")
+
+        assert len(requests) == 1
+        assert requests[0].url.path.endswith("/paper/abc123/citations")
+        assert papers[0].title == "Linked Paper 0"
+
+    def test_unknown_paper_returns_empty(self) -> None:
+        """A 404 for an unknown paper is not retried."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(404, json={"error": "Paper not found"})
+
+        adapter = SemanticScholarAdapter(rate_limit=0.0)
+        adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert adapter.get_references("10.1234/missing") == []
+        assert len(requests) == 1
 
 
 @pytest.mark.integration
@@ -468,3 +689,44 @@ class TestSemanticScholarAdapterIntegration:
         assert all(paper.doi.value for paper in papers)
         # Check citation count is present
         assert any("citations:" in kw for paper in papers for kw in paper.keywords)
+
+
+class TestAsyncSemanticScholarAdapter:
+    """Tests for AsyncSemanticScholarAdapter."""
+
+    def test_search_returns_papers(self, mock_s2_response: dict) -> None:
+        """Async search parses results and sends the API key."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_s2_response)
+
+        async def run() -> list:
+            async with AsyncSemanticScholarAdapter(rate_limit=0.0, api_key="key") as adapter:
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await adapter.search("machine learning")
+
+        papers = asyncio.run(run())
+
+        assert len(papers) == 2
+        assert papers[0].doi.value == "10.1234/test1"
+        assert requests[0].headers["x-api-key"] == "key"
+
+    def test_concurrent_searches_are_spaced_by_rate_limit(self) -> None:
+        """Concurrent searches await successive rate-limit slots."""
+        sent_at: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_at.append(time.monotonic())
+            return httpx.Response(200, json={"data": []})
+
+        async def run() -> None:
+            async with AsyncSemanticScholarAdapter(rate_limit=0.1) as adapter:
+                adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                await asyncio.gather(*(adapter.search(f"q{i}") for i in range(3)))
+
+        asyncio.run(run())
+
+        assert len(sent_at) == 3
+        assert sent_at[2] - sent_at[0] >= 0.19
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for JSONLinesEnrichmentCheckpoint."""
+
+from pathlib import Path
+
+from lit_review.infrastructure.persistence.enrichment_checkpoint import (
+    JSONLinesEnrichmentCheckpoint,
+)
+
+
+class TestJSONLinesEnrichmentCheckpoint:
+    """Tests for the append-only enrichment checkpoint."""
+
+    def test_load_without_file(self, tmp_path: Path) -> None:
+        """A missing checkpoint has no completed lookups."""
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+
+        assert checkpoint.load() == {}
+
+    def test_record_and_load(self, tmp_path: Path) -> None:
+        """Recorded batches are grouped by database."""
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+        checkpoint.record("crossref", ["10.1234/a", "10.1234/b"])
+        checkpoint.record("semantic-scholar", ["10.1234/a"])
+        checkpoint.record("crossref", ["10.1234/c"])
+        checkpoint.record("crossref", [])
+
+        assert checkpoint.load() == {
+            "crossref": {"10.1234/a", "10.1234/b", "10.1234/c"},
+            "semantic-scholar": {"10.1234/a"},
+        }
+
+    def test_truncated_line_is_ignored(self, tmp_path: Path) -> None:
+        """An interrupted write loses only its own batch."""
+        path = tmp_path / "enrich.jsonl"
+        checkpoint = JSONLinesEnrichmentCheckpoint(path)
+        checkpoint.record("crossref", ["10.1234/a"])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"database": "crossref", "dois": ["10.12')
+
+        checkpoint.record("crossref", ["10.1234/b"])
+
+        assert checkpoint.load() == {"crossref": {"10.1234/a", "10.1234/b"}}
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Clearing deletes the file; clearing again is harmless."""
+        checkpoint = JSONLinesEnrichmentCheckpoint(tmp_path / "enrich.jsonl")
+        checkpoint.record("crossref", ["10.1234/a"])
+
+        checkpoint.clear()
+        checkpoint.clear()
+
+        assert not checkpoint.path.exists()
+        assert checkpoint.load() == {}
+
+    def test_for_review(self, tmp_path: Path) -> None:
+        """Each review gets its own file under the data directory."""
+        checkpoint = JSONLinesEnrichmentCheckpoint.for_review(tmp_path, "ML / Health Care")
+
+        assert checkpoint.path == tmp_path / ".checkpoints" / "ML___Health_Care.enrich.jsonl"
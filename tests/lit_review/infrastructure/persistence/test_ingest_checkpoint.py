@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for JSONLinesIngestCheckpoint."""
+
+import os
+from pathlib import Path
+
+from lit_review.infrastructure.persistence.ingest_checkpoint import JSONLinesIngestCheckpoint
+
+
+class TestJSONLinesIngestCheckpoint:
+    """Tests for the per-file ingestion checkpoint."""
+
+    def test_record_marks_file_done(self, tmp_path: Path) -> None:
+        """Recorded files are done, in this and later instances."""
+        dump = tmp_path / "pubmed25n0001.xml.gz"
+        dump.write_bytes(b"data")
+        checkpoint = JSONLinesIngestCheckpoint(tmp_path / "ingest.jsonl")
+
+        assert not checkpoint.is_done(dump)
+        checkpoint.record(dump, papers=10)
+
+        assert checkpoint.is_done(dump)
+        assert JSONLinesIngestCheckpoint(checkpoint.path).is_done(dump)
+
+    def test_replaced_file_is_not_done(self, tmp_path: Path) -> None:
+        """A dump file rewritten with new content must be ingested again."""
+        dump = tmp_path / "pubmed25n0001.xml.gz"
+        dump.write_bytes(b"data")
+        checkpoint = JSONLinesIngestCheckpoint(tmp_path / "ingest.jsonl")
+        checkpoint.record(dump, papers=10)
+
+        dump.write_bytes(b"newer release")
+        os.utime(dump, ns=(0, 1))
+
+        assert not JSONLinesIngestCheckpoint(checkpoint.path).is_done(dump)
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear forgets all completed files."""
+        dump = tmp_path / "works.jsonl"
+        dump.write_bytes(b"{}")
+        checkpoint = JSONLinesIngestCheckpoint(tmp_path / "ingest.jsonl")
+        checkpoint.record(dump, papers=1)
+
+        checkpoint.clear()
+
+        assert not checkpoint.is_done(dump)
+        assert not checkpoint.path.exists()
@@ -2,17 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for JSONReviewRepository."""
 
+import gc
 import json
 import tempfile
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review, ReviewStage
-from lit_review.domain.exceptions import EntityNotFoundError
+from lit_review.domain.entities.saved_search import SavedSearch
+from lit_review.domain.exceptions import EntityNotFoundError, ValidationError
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.adapters.local_corpus import LocalCorpusSearchService
 from lit_review.infrastructure.persistence.json_repository import JSONReviewRepository
 
 
@@ -161,6 +165,21 @@ class TestJSONReviewRepository:
         assert len(paper.authors) == 1
         assert paper.authors[0].last_name == "Smith"
 
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_load_restores_gc_state(
+        self, repository: JSONReviewRepository, sample_review: Review, enabled: bool
+    ) -> None:
+        """Garbage collection is paused while loading and then left as it was."""
+        repository.save(sample_review)
+        was_enabled = gc.isenabled()
+        (gc.enable if enabled else gc.disable)()
+        try:
+            repository.load(sample_review.title)
+
+            assert gc.isenabled() is enabled
+        finally:
+            (gc.enable if was_enabled else gc.disable)()
+
     def test_load_raises_not_found(self, repository: JSONReviewRepository) -> None:
         """load raises EntityNotFoundError for missing review."""
         with pytest.raises(EntityNotFoundError) as exc_info:
@@ -284,6 +303,46 @@ class TestJSONReviewRepositoryPaperSerialization:
 
         assert loaded_paper.authors[0].orcid == "0000-0001-2345-6789"
 
+    def test_validate_on_load_rejects_edited_papers(
+        self, temp_data_dir: Path, repository: JSONReviewRepository, sample_review: Review
+    ) -> None:
+        """Hand-edited invalid papers load by default and fail with validate_on_load."""
+        sample_review.advance_stage()
+        sample_review.add_paper(
+            Paper(
+                doi=DOI("10.1234/edited"),
+                title="Edited Paper",
+                authors=[Author("Smith", "John", "J.")],
+                publication_year=2024,
+                journal="Journal",
+            )
+        )
+        repository.save(sample_review)
+        path = repository._get_review_path(sample_review.title)
+        data = json.loads(path.read_text())
+        data["papers"][0]["title"] = ""
+        path.write_text(json.dumps(data))
+
+        assert len(repository.load(sample_review.title).papers) == 1
+        with pytest.raises(ValidationError, match="title cannot be empty"):
+            JSONReviewRepository(temp_data_dir, validate_on_load=True).load(sample_review.title)
+
+    def test_saved_searches_preserved(
+        self, repository: JSONReviewRepository, sample_review: Review
+    ) -> None:
+        """Saved searches and their watermarks are preserved through save/load."""
+        run_at = datetime(2025, 3, 1, 12, 30, tzinfo=UTC)
+        sample_review.save_search("sepsis", "pubmed", limit=50).record_run(run_at)
+        sample_review.save_search("sepsis", "crossref")
+        repository.save(sample_review)
+
+        loaded = repository.load(sample_review.title)
+
+        assert loaded.saved_searches == [
+            SavedSearch("sepsis", "pubmed", limit=50, last_run=run_at),
+            SavedSearch("sepsis", "crossref", limit=100, last_run=None),
+        ]
+
 
 @pytest.mark.integration
 class TestJSONReviewRepositoryBackupRecovery:
@@ -423,3 +482,40 @@ class TestJSONReviewRepositoryFileLocking:
         # All reads should succeed
         assert len(results) == 5
         assert all(r == sample_review.title for r in results)
+
+
+@pytest.mark.integration
+class TestJSONReviewRepositoryLocalCorpus:
+    """Tests for keeping the local corpus index up to date."""
+
+    def test_save_indexes_review_papers(
+        self, temp_data_dir: Path, sample_review: Review, sample_paper: Paper
+    ) -> None:
+        """Saved papers become searchable, and unchanged ones are not rewritten."""
+        corpus = LocalCorpusSearchService(temp_data_dir / "corpus.sqlite")
+        repository = JSONReviewRepository(temp_data_dir, corpus=corpus)
+        sample_review.advance_stage()
+        sample_review.add_paper(sample_paper)
+
+        repository.save(sample_review)
+
+        assert [p.doi for p in corpus.search("test")] == [sample_paper.doi]
+        assert corpus.index(sample_review.papers) == 0
+
+    def test_index_corpus_backfills_existing_reviews(
+        self, repository: JSONReviewRepository, sample_review: Review, sample_paper: Paper
+    ) -> None:
+        """Reviews saved without a corpus are indexed by index_corpus."""
+        sample_review.advance_stage()
+        sample_review.add_paper(sample_paper)
+        repository.save(sample_review)
+
+        repository.corpus = LocalCorpusSearchService(repository.data_dir / "corpus.sqlite")
+
+        assert repository.index_corpus() == 1
+        assert repository.index_corpus() == 0
+
+    def test_index_corpus_requires_corpus(self, repository: JSONReviewRepository) -> None:
+        """index_corpus fails without a corpus."""
+        with pytest.raises(ValueError, match="no local corpus"):
+            repository.index_corpus()
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for JSONLinesSnowballCheckpoint."""
+
+from pathlib import Path
+
+from lit_review.infrastructure.persistence.snowball_checkpoint import JSONLinesSnowballCheckpoint
+
+
+class TestJSONLinesSnowballCheckpoint:
+    """Tests for the append-only snowball checkpoint."""
+
+    def test_load_without_file(self, tmp_path: Path) -> None:
+        """A missing checkpoint has no progress."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+
+        assert checkpoint.load() is None
+
+    def test_load_returns_last_level(self, tmp_path: Path) -> None:
+        """Only the papers expanded since the last level started are returned."""
+        checkpoint = JSONLinesSnowballCheckpoint(tmp_path / "snowball.jsonl")
+        checkpoint.start_level("both", 0, ["10.1234/seed"], ["10.1234/seed"])
+        checkpoint.record("10.1234/seed", ["10.1234/a", "10.1234/b"])
+        checkpoint.start_level("both", 1, ["10.1234/a", "10.1234/b"], ["10.1234/seed"])
+        checkpoint.record("10.1234/b", [])
+
+        progress = checkpoint.load()
+
+        assert progress is not None
+        assert progress.direction == "both"
+        assert progress.level == 1
+        assert progress.frontier == ["10.1234/a", "10.1234/b"]
+        assert progress.expanded == {"10.1234/b": []}
+        assert progress.seeds == ["10.1234/seed"]
+
+    def test_truncated_line_is_ignored(self, tmp_path: Path) -> None:
+        """An interrupted write loses only its own entry."""
+        path = tmp_path / "snowball.jsonl"
+        checkpoint = JSONLinesSnowballCheckpoint(path)
+        checkpoint.start_level("backward", 0, ["10.1234/seed"])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"node": "10.1234/se')
+
+        checkpoint.record("10.1234/seed", ["10.1234/a"])
+
+        progress = checkpoint.load()
+        assert progress is not None
+        assert progress.expanded == {"10.1234/seed": ["10.1234/a"]}
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Clearing deletes the file."""
+        checkpoint = JSONLinesSnowballCheckpoint.for_review(tmp_path, "ML Review")
+        checkpoint.start_level("both", 0, ["10.1234/seed"])
+
+        checkpoint.clear()
+
+        assert checkpoint.path == tmp_path / ".checkpoints" / "ML_Review.snowball.jsonl"
+        assert checkpoint.load() is None
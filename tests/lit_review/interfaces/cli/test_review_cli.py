@@ -2,20 +2,61 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for review CLI."""
 
+import json
 import tempfile
+from collections.abc import Iterator
+from datetime import date
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from lit_review.application.ports.citation_graph import CitationGraphService
+from lit_review.application.ports.search_events import SearchEventKind
+from lit_review.application.ports.search_service import SearchService
+from lit_review.application.usecases.enrich_papers import EnrichPapersUseCase
+from lit_review.application.usecases.search_papers import SearchPapersUseCase
+from lit_review.application.usecases.snowball_papers import SnowballPapersUseCase
 from lit_review.domain.entities.paper import Paper
 from lit_review.domain.entities.review import Review, ReviewStage
 from lit_review.domain.values.author import Author
 from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.persistence.enrichment_checkpoint import (
+    JSONLinesEnrichmentCheckpoint,
+)
 from lit_review.infrastructure.persistence.json_repository import JSONReviewRepository
+from lit_review.infrastructure.persistence.snowball_checkpoint import JSONLinesSnowballCheckpoint
+from lit_review.interfaces.cli import review_cli
 from lit_review.interfaces.cli.review_cli import review
 
 
+class StreamingSearchService(SearchService):
+    """Search service yielding numbered papers, optionally failing mid-stream."""
+
+    def __init__(self, count: int, fail_after: int | None = None) -> None:
+        self.count = count
+        self.fail_after = fail_after
+
+    def search(self, query: str, limit: int = 100) -> list[Paper]:
+        return list(self.iter_search(query, limit))
+
+    def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+        for i in range(min(limit, self.count)):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("connection reset")
+            yield Paper(
+                doi=DOI(f"10.1234/stream.{i}"),
+                title=f"Streamed Paper {i}",
+                authors=[Author("Smith", "John", "J.")],
+                publication_year=2023,
+                journal="Journal",
+            )
+
+    def get_service_name(self) -> str:
+        return "Streaming"
+
+
 @pytest.fixture
 def runner() -> CliRunner:
     """Create CLI test runner."""
@@ -123,6 +164,7 @@ class TestStatusCommand:
 
         assert result.exit_code == 0
         assert "Total: 1" in result.output
+        assert "By Year: 2024: 1" in result.output
 
     def test_status_fails_if_not_found(self, runner: CliRunner, temp_data_dir: Path) -> None:
         """status fails for nonexistent review."""
@@ -210,6 +252,75 @@ class TestListCommand:
         assert "No reviews found" in result.output
 
 
+class TestIndexCommand:
+    """Tests for the local corpus index and ingest commands."""
+
+    def test_index_then_search_local_corpus(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """Papers of existing reviews are indexed and found offline by -d local."""
+        source = Review(
+            title="Source", research_question="Q", inclusion_criteria=["RCT"], exclusion_criteria=[]
+        )
+        source.advance_stage()
+        source.add_paper(
+            Paper(
+                doi=DOI("10.1234/sepsis"),
+                title="Machine learning for sepsis prediction",
+                authors=[Author("Smith", "John", "J.")],
+                publication_year=2022,
+                journal="Journal",
+            )
+        )
+        JSONReviewRepository(temp_data_dir).save(source)
+        runner.invoke(review, ["init", "Target", "-q", "Q"])
+
+        indexed = runner.invoke(review, ["index"])
+        result = runner.invoke(review, ["search", "Target", "-d", "local", "-k", "sepsis"])
+
+        assert indexed.exit_code == 0
+        assert "Indexed 1 new or changed papers (1 in local corpus)" in indexed.output
+        assert result.exit_code == 0
+        assert "New papers added: 1" in result.output
+        loaded = JSONReviewRepository(temp_data_dir).load("Target")
+        assert [p.doi.value for p in loaded.papers] == ["10.1234/sepsis"]
+
+    def test_ingest_resumes_and_feeds_local_search(
+        self, runner: CliRunner, temp_data_dir: Path
+    ) -> None:
+        """Ingested dump files are searchable and skipped when run again."""
+        dump = temp_data_dir / "works.jsonl"
+        dump.write_text(
+            json.dumps(
+                {
+                    "DOI": "10.5555/mirror",
+                    "title": ["Mirrored sepsis study"],
+                    "author": [{"family": "Doe", "given": "Jane"}],
+                    "published": {"date-parts": [[2021]]},
+                    "container-title": ["Journal"],
+                }
+            )
+        )
+
+        first = runner.invoke(review, ["ingest", str(dump), "--workers", "1"])
+        again = runner.invoke(review, ["ingest", str(dump), "--workers", "1"])
+        runner.invoke(review, ["init", "Target", "-q", "Q"])
+        result = runner.invoke(review, ["search", "Target", "-d", "local", "-k", "mirrored"])
+
+        assert first.exit_code == 0
+        assert "works.jsonl: 1 papers, 0 dropped, 1 new or changed" in first.output
+        assert "works.jsonl: already ingested" in again.output
+        assert "New papers added: 1" in result.output
+
+    def test_ingest_rejects_unknown_files(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """Files of unknown format are an error."""
+        notes = temp_data_dir / "notes.txt"
+        notes.write_text("x")
+
+        result = runner.invoke(review, ["ingest", str(notes)])
+
+        assert result.exit_code == 1
+        assert "Unrecognized dump file" in result.output
+
+
 class TestDeleteCommand:
     """Tests for delete command."""
 
@@ -542,3 +653,650 @@ class TestSearchCommandEnhanced:
         assert "Searching Academic Databases" in result.output
         assert "crossref" in result.output
         assert "Search Results" in result.output
+
+    def _patch_use_case(self, monkeypatch: pytest.MonkeyPatch, service: SearchService) -> None:
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            use_case = SearchPapersUseCase(services={"crossref": service}, max_retries=1)
+            use_case.stream_batch_size = 10
+            return use_case
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+
+    def test_search_streams_results_into_review(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Streamed batches are added to the review and saved."""
+        self._patch_use_case(monkeypatch, StreamingSearchService(count=35))
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review, ["search", "Test Review", "-k", "sepsis", "-l", "50", "--no-cache"]
+        )
+
+        assert result.exit_code == 0
+        assert "New papers added: 35" in result.output
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review")
+        assert len(saved.papers) == 35
+
+    def test_search_keeps_results_streamed_before_failure(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Papers received before a mid-stream failure are persisted."""
+        self._patch_use_case(monkeypatch, StreamingSearchService(count=50, fail_after=25))
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review, ["search", "Test Review", "-k", "sepsis", "-l", "50", "--no-cache"]
+        )
+
+        assert result.exit_code == 0
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review")
+        assert len(saved.papers) == 20  # two complete batches of 10
+
+    def test_search_merges_same_work_under_different_dois(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A PubMed record with a synthetic DOI is merged into its Crossref twin."""
+
+        class TwinRecordsService(SearchService):
+            def search(self, query: str, limit: int = 100) -> list[Paper]:
+                return [
+                    Paper(
+                        doi=DOI(doi),
+                        title=title,
+                        authors=[Author("Smith", "John", "J.")],
+                        publication_year=2023,
+                        journal="Journal",
+                        abstract=abstract,
+                    )
+                    for doi, title, abstract in [
+                        ("10.1234/sepsis", "Sepsis Prediction With ML", ""),
+                        ("10.9999/pubmed.1", "Sepsis prediction with ML.", "PubMed abstract"),
+                    ]
+                ]
+
+            def get_service_name(self) -> str:
+                return "Twins"
+
+        self._patch_use_case(monkeypatch, TwinRecordsService())
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "Duplicates skipped: 1" in result.output
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review")
+        (paper,) = saved.papers
+        assert (paper.doi.value, paper.abstract) == ("10.1234/sepsis", "PubMed abstract")
+
+    def test_search_partition_splits_capped_database(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--partition searches date ranges that each stay below the cap."""
+
+        class CappedService(StreamingSearchService):
+            RESULT_CAP = 3
+
+            def search_range(
+                self, query: str, start: date, end: date, limit: int = 100
+            ) -> list[Paper]:
+                papers = self.search(query)
+                for year, paper in enumerate(papers, start=2020):
+                    paper.publication_year = year
+                in_range = [p for p in papers if start.year <= p.publication_year <= end.year]
+                return in_range[: self.RESULT_CAP]
+
+            def count_range(self, query: str, start: date, end: date) -> int | None:
+                return len(self.search_range(query, start, end))
+
+        self._patch_use_case(monkeypatch, CappedService(count=4))
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review,
+            [
+                "search",
+                "Test Review",
+                "-k",
+                "sepsis",
+                "-l",
+                "10",
+                "--partition",
+                "--start-year",
+                "2020",
+                "--no-cache",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Partitions: " in result.output
+        assert "New papers added: 4" in result.output
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review")
+        assert len(saved.papers) == 4
+        assert len(saved.saved_searches) == 1
+
+    def test_search_stats_prints_and_dumps_json(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--stats prints per-database totals and --stats-json saves them."""
+
+        class InstrumentedService(StreamingSearchService):
+            def iter_search(self, query: str, limit: int = 100) -> Iterator[Paper]:
+                self._emit(SearchEventKind.RATE_LIMIT_SLEEP, seconds=0.5)
+                self._emit(SearchEventKind.REQUEST_END, status_code=200, bytes_received=2048)
+                self._emit(SearchEventKind.PARSE, produced=3, dropped=1)
+                yield from super().iter_search(query, limit)
+
+        self._patch_use_case(monkeypatch, InstrumentedService(count=3))
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        stats_file = temp_data_dir / "stats.json"
+
+        result = runner.invoke(
+            review,
+            [
+                "search",
+                "Test Review",
+                "-k",
+                "sepsis",
+                "--no-cache",
+                "--stats",
+                "--stats-json",
+                str(stats_file),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "=== Search Statistics ===" in result.output
+        assert "Rate-limit sleeps: 1 (0.50s)" in result.output
+        assert "Parsing: 0.00s, 3 papers, 1 dropped" in result.output
+        crossref = json.loads(stats_file.read_text())["crossref"]
+        assert (crossref["requests"], crossref["bytes_received"]) == (1, 2048)
+
+    def test_search_use_case_registers_every_database(
+        self, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every -d choice has a service, PubMed once NCBI_EMAIL is set."""
+        monkeypatch.setenv("NCBI_EMAIL", "test@example.com")
+
+        use_case = review_cli.get_search_use_case()
+
+        assert sorted(use_case.services) == sorted(review_cli.SEARCH_DATABASES)
+
+    def test_search_use_case_builds_only_requested_databases(
+        self, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unrequested adapters are not built, and a given corpus is reused."""
+        monkeypatch.setenv("NCBI_EMAIL", "test@example.com")
+        corpus = review_cli.get_local_corpus()
+
+        with patch.object(review_cli, "PubMedAdapter") as pubmed:
+            use_case = review_cli.get_search_use_case(
+                databases=["crossref", "local"], corpus=corpus
+            )
+
+        assert list(use_case.services) == ["crossref", "local"]
+        assert use_case.services["local"] is corpus
+        pubmed.assert_not_called()
+
+    def test_search_shares_the_repository_corpus(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """search -d local opens one corpus, shared with the repository."""
+        opened: list[object] = []
+        get_local_corpus = review_cli.get_local_corpus
+
+        def counting_corpus() -> object:
+            opened.append(get_local_corpus())
+            return opened[-1]
+
+        monkeypatch.setattr(review_cli, "get_local_corpus", counting_corpus)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        opened.clear()
+
+        result = runner.invoke(review, ["search", "Test Review", "-d", "local", "-k", "sepsis"])
+
+        assert result.exit_code == 0
+        assert len(opened) == 1
+
+    def test_search_rejects_unconfigured_database(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PubMed without NCBI_EMAIL is an error, not an empty search."""
+        monkeypatch.delenv("NCBI_EMAIL", raising=False)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review, ["search", "Test Review", "-d", "pubmed", "-k", "sepsis", "--no-cache"]
+        )
+
+        assert result.exit_code == 1
+        assert "Database 'pubmed' is not configured. Set NCBI_EMAIL" in result.output
+        assert JSONReviewRepository(temp_data_dir).load("Test Review").saved_searches == []
+
+
+class TestSearchBatchCommand:
+    """Tests for search-batch command."""
+
+    def test_search_batch_adds_papers_and_reports_per_query(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """All query variants are searched and counted per query."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=3)})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("# variants\nsepsis AND ml\n\nsepsis AND ai\n")
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["search-batch", "Test Review", str(queries), "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "Batch Search: 2 queries" in result.output
+        assert "    3  sepsis AND ml" in result.output
+        assert "New papers added: 3" in result.output
+        assert len(JSONReviewRepository(temp_data_dir).load("Test Review").papers) == 3
+
+    def test_search_batch_counts_only_its_own_papers(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Merging two papers that were already in the review does not lower the count."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=3)})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        repo = JSONReviewRepository(temp_data_dir)
+        review_obj = repo.load("Test Review")
+        review_obj.advance_stage()
+        review_obj.add_papers(
+            [
+                Paper(
+                    doi=DOI(doi),
+                    title="Earlier Work on Sepsis Prediction",
+                    authors=[Author("Jones", "Ann", "A.")],
+                    publication_year=2020,
+                    journal="Journal",
+                )
+                for doi in ("10.1000/earlier", "10.9999/pubmed.1")
+            ]
+        )
+        repo.save(review_obj)
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("sepsis\n")
+
+        result = runner.invoke(review, ["search-batch", "Test Review", str(queries), "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "New papers added: 3" in result.output
+        assert "Total papers in review: 4" in result.output
+
+    def test_search_batch_skips_local_corpus_by_default(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without -d the local corpus is neither searched nor saved for update."""
+        local = MagicMock(spec=SearchService)
+
+        services = {"crossref": StreamingSearchService(count=2), "local": local}
+
+        def get_use_case(
+            cache: object = None, databases: list[str] | None = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            names = databases or list(services)
+            return SearchPapersUseCase(services={n: services[n] for n in names if n in services})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("sepsis\n")
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["search-batch", "Test Review", str(queries), "--no-cache"])
+
+        assert result.exit_code == 0
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review").saved_searches
+        assert [(s.query, s.database) for s in saved] == [("sepsis", "crossref")]
+        assert not local.method_calls
+
+    def test_search_batch_rejects_empty_file(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """A file without queries is an error."""
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("# nothing yet\n")
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["search-batch", "Test Review", str(queries)])
+
+        assert result.exit_code == 1
+        assert "No queries found" in result.output
+
+    def test_search_batch_rejects_unconfigured_database(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every requested database must have a configured service."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=3)})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("sepsis\n")
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review,
+            ["search-batch", "Test Review", str(queries), "-d", "crossref", "-d", "arxiv"],
+        )
+
+        assert result.exit_code == 1
+        assert "Database 'arxiv' is not configured." in result.output
+
+
+class TestUpdateCommand:
+    """Tests for the update command (delta re-run of saved searches)."""
+
+    def test_search_saves_search_with_watermark(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A successful search is saved on the review with its run time."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=2)})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "-l", "5", "--no-cache"])
+
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review").saved_searches
+        assert [(s.query, s.database, s.limit) for s in saved] == [("sepsis", "crossref", 5)]
+        assert saved[0].last_run is not None
+
+    def test_failed_search_keeps_no_watermark(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A search that failed part-way is saved without a watermark."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            use_case = SearchPapersUseCase(
+                services={"crossref": StreamingSearchService(count=50, fail_after=25)},
+                max_retries=1,
+            )
+            use_case.stream_batch_size = 10
+            return use_case
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(
+            review, ["search", "Test Review", "-k", "sepsis", "-l", "50", "--no-cache"]
+        )
+
+        assert "crossref search did not complete" in result.output
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review").saved_searches
+        assert [(s.query, s.last_run) for s in saved] == [("sepsis", None)]
+
+    def test_search_batch_watermarks_only_successful_pairs(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Failed (query, database) pairs keep no watermark."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(
+                services={
+                    "crossref": StreamingSearchService(count=2),
+                    "openalex": StreamingSearchService(count=2, fail_after=0),
+                },
+                max_retries=1,
+            )
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        queries = temp_data_dir / "queries.txt"
+        queries.write_text("sepsis\n")
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        runner.invoke(review, ["search-batch", "Test Review", str(queries), "--no-cache"])
+
+        saved = JSONReviewRepository(temp_data_dir).load("Test Review").saved_searches
+        assert {s.database: s.last_run is not None for s in saved} == {
+            "crossref": True,
+            "openalex": False,
+        }
+
+    def test_update_reruns_saved_searches_since_last_run(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """update reruns saved searches and adds only papers not yet in the review."""
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=2)})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "--no-cache"])
+
+        result = runner.invoke(review, ["update", "Test Review", "--no-cache"])
+
+        # Without a server-side date filter the same papers come back as duplicates
+        assert result.exit_code == 0
+        assert "Updating 1 saved searches" in result.output
+        assert "since " in result.output
+        assert "New papers added: 0" in result.output
+        assert "Total papers in review: 2" in result.output
+
+    def test_update_without_saved_searches_fails(
+        self, runner: CliRunner, temp_data_dir: Path
+    ) -> None:
+        """A review with no saved searches cannot be updated."""
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["update", "Test Review"])
+
+        assert result.exit_code == 1
+        assert "no saved searches" in result.output
+
+
+class TestHydrateCommand:
+    """Tests for stub searches and the hydrate command."""
+
+    def test_search_stubs_then_hydrate(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Papers found with --stubs get abstracts from hydrate, except excluded ones."""
+
+        class HydratingService(StreamingSearchService):
+            def __init__(self) -> None:
+                super().__init__(count=2)
+                self.stub_searches = 0
+
+            def search_stubs(self, query: str, limit: int = 100) -> list[Paper]:
+                self.stub_searches += 1
+                return self.search(query, limit)
+
+            def hydrate(self, papers: list[Paper]) -> list[Paper]:
+                for paper in papers:
+                    paper.abstract = f"Abstract of {paper.title}"
+                return papers
+
+        service = HydratingService()
+
+        def get_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": service})
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "--stubs", "--no-cache"])
+        repo = JSONReviewRepository(temp_data_dir)
+        review_obj = repo.load("Test Review")
+        excluded = review_obj.get_paper_by_doi(DOI("10.1234/stream.1"))
+        assert excluded is not None
+        excluded.assess(2.0, include=False)
+        repo.save(review_obj)
+
+        result = runner.invoke(review, ["hydrate", "Test Review", "--no-cache"])
+
+        assert service.stub_searches == 1
+        assert result.exit_code == 0
+        assert "Papers hydrated: 1" in result.output
+        papers = {p.doi.value: p for p in repo.load("Test Review").papers}
+        assert papers["10.1234/stream.0"].abstract == "Abstract of Streamed Paper 0"
+        assert papers["10.1234/stream.1"].abstract == ""
+
+    def test_hydrate_with_nothing_to_do(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """A review without stub papers needs no hydration."""
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["hydrate", "Test Review"])
+
+        assert result.exit_code == 0
+        assert "No papers need hydrating." in result.output
+
+
+class TestEnrichCommand:
+    """Tests for the enrich command."""
+
+    def test_enrich_fills_missing_metadata(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Incomplete papers get abstracts and keywords, and the checkpoint is cleared."""
+
+        class EnrichingService(StreamingSearchService):
+            def hydrate(self, papers: list[Paper]) -> list[Paper]:
+                for paper in papers:
+                    paper.abstract = f"Abstract of {paper.title}"
+                    paper.keywords = ["sepsis"]
+                return papers
+
+        checkpoints: list[JSONLinesEnrichmentCheckpoint | None] = []
+
+        def get_search_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=2)})
+
+        def get_enrich_use_case(
+            cache: object = None, checkpoint: JSONLinesEnrichmentCheckpoint | None = None
+        ) -> EnrichPapersUseCase:
+            checkpoints.append(checkpoint)
+            return EnrichPapersUseCase(
+                services={"crossref": EnrichingService(count=2)}, checkpoint=checkpoint
+            )
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_search_use_case)
+        monkeypatch.setattr(review_cli, "get_enrich_use_case", get_enrich_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "--no-cache"])
+
+        result = runner.invoke(review, ["enrich", "Test Review", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "Papers enriched: 2" in result.output
+        assert "Still incomplete: 0" in result.output
+        assert "Papers with abstracts: 2/2" in result.output
+        papers = JSONReviewRepository(temp_data_dir).load("Test Review").papers
+        assert all(p.keywords == ["sepsis"] for p in papers)
+        assert checkpoints[0] is not None
+        assert not checkpoints[0].path.exists()
+
+    def test_enrich_with_nothing_to_do(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """A review without incomplete papers needs no enrichment."""
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+
+        result = runner.invoke(review, ["enrich", "Test Review"])
+
+        assert result.exit_code == 0
+        assert "No papers need enriching." in result.output
+
+    def test_enrich_nonexistent_review(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """Enriching an unknown review fails."""
+        result = runner.invoke(review, ["enrich", "Missing Review"])
+
+        assert result.exit_code == 1
+        assert "not found" in result.output
+
+
+class TestSnowballCommand:
+    """Tests for the snowball command."""
+
+    def test_snowball_from_included_papers(
+        self, runner: CliRunner, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Included papers seed the snowball and linked papers are added."""
+
+        class Graph(CitationGraphService):
+            def __init__(self) -> None:
+                self.seeds: list[str] = []
+
+            def get_references(self, doi: str, limit: int = 1000) -> list[Paper]:
+                self.seeds.append(doi)
+                return [
+                    Paper(
+                        doi=DOI("10.1234/cited"),
+                        title="Cited Paper",
+                        authors=[Author("Doe", "Jane", "J.")],
+                        publication_year=2020,
+                        journal="Journal",
+                    )
+                ]
+
+            def get_citations(self, doi: str, limit: int = 1000) -> list[Paper]:
+                return []
+
+        graph = Graph()
+
+        def get_search_use_case(
+            cache: object = None, databases: object = None, corpus: object = None
+        ) -> SearchPapersUseCase:
+            return SearchPapersUseCase(services={"crossref": StreamingSearchService(count=2)})
+
+        def get_snowball_use_case(
+            cache: object = None, checkpoint: JSONLinesSnowballCheckpoint | None = None
+        ) -> SnowballPapersUseCase:
+            return SnowballPapersUseCase(graph=graph, checkpoint=checkpoint)
+
+        monkeypatch.setattr(review_cli, "get_search_use_case", get_search_use_case)
+        monkeypatch.setattr(review_cli, "get_snowball_use_case", get_snowball_use_case)
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        runner.invoke(review, ["search", "Test Review", "-k", "sepsis", "--no-cache"])
+        runner.invoke(
+            review,
+            ["assess", "Test Review", "--doi", "10.1234/stream.0", "--score", "8", "--include"],
+        )
+
+        result = runner.invoke(
+            review, ["snowball", "Test Review", "--direction", "backward", "--no-cache"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert graph.seeds == ["10.1234/stream.0"]
+        assert "Papers added: 1" in result.output
+        papers = JSONReviewRepository(temp_data_dir).load("Test Review").papers
+        assert DOI("10.1234/cited") in {p.doi for p in papers}
+
+    def test_snowball_without_seeds(self, runner: CliRunner, temp_data_dir: Path) -> None:
+        """Snowballing needs included papers or explicit seeds."""
+        runner.invoke(review, ["init", "Test Review", "-q", "Question"])
+        runner.invoke(review, ["advance", "Test Review"])
+
+        result = runner.invoke(review, ["snowball", "Test Review"])
+
+        assert result.exit_code == 1
+        assert "No seed papers" in result.output
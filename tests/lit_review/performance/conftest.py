@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Shared fixtures for the performance benchmarks."""
+
+from collections.abc import Callable
+
+import pytest
+
+from tests.lit_review.performance.replay_corpus import Cassettes, record_corpus
+
+
+@pytest.fixture(scope="session")
+def recorded_corpus(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int], Cassettes]:
+    """Return a function recording (once per session) the corpus of a given size."""
+    recorded: dict[int, Cassettes] = {}
+
+    def get(size: int) -> Cassettes:
+        if size not in recorded:
+            recorded[size] = record_corpus(size, tmp_path_factory.mktemp(f"cassettes-{size}"))
+        return recorded[size]
+
+    return get
@@ -0,0 +1,445 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Record/replay of API responses for offline tests and benchmarks.
+
+A Cassette is a JSON Lines file of recorded responses keyed like the
+ResponseCache (method plus normalized URL, plus a body digest for POSTs).
+RecordingTransport stores every response passing through an httpx
+transport; ReplayTransport answers requests from a cassette alone, with
+optional injected latency and 429 responses so that retry and rate-limit
+handling can be exercised deterministically. EntrezRecorder and
+EntrezReplayer do the same for the Bio.Entrez functions used by
+PubMedAdapter.
+
+Example:
+    >>> cassette = Cassette(Path("cassettes/crossref.jsonl"))
+    >>> adapter = CrossrefAdapter(rate_limit=0.0)
+    >>> adapter._client = httpx.Client(transport=ReplayTransport(cassette, latency=0.05))
+"""
+
+import hashlib
+import io
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.message import Message
+from pathlib import Path
+from typing import IO, Any
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+
+import httpx
+from Bio import Entrez
+
+from lit_review.infrastructure.adapters.response_cache import CachedResponse, ResponseCache
+from lit_review.infrastructure.persistence.json_lines import append_json_line, read_json_lines
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+_HOP_BY_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+
+class Cassette:
+    """Recorded responses stored in a JSON Lines file.
+
+    Each line holds one response (key, status code, headers and body).
+    Re-recording a key replaces its response; the file is append-only and
+    the last line for a key wins when it is loaded.
+
+    Attributes:
+        path: JSON Lines file backing the cassette.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load a cassette, or start an empty one if the file is missing.
+
+        Args:
+            path: JSON Lines file backing the cassette.
+        """
+        self.path = path
+        self._responses: dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+        for entry in read_json_lines(path):
+            self._responses[entry["key"]] = CachedResponse(
+                status_code=entry["status_code"],
+                headers=entry["headers"],
+                content=entry["body"].encode("utf-8", errors="surrogateescape"),
+                stored_at=entry["recorded_at"],
+            )
+
+    @staticmethod
+    def key_for_request(request: httpx.Request) -> str:
+        """Return the cassette key for an httpx request.
+
+        Args:
+            request: Outgoing request (its body must already be read).
+
+        Returns:
+            ResponseCache key, followed by a digest of the body if it has one.
+        """
+        key = ResponseCache.make_key(request.method, request.url)
+        if request.content:
+            key += f" {hashlib.sha256(request.content).hexdigest()[:16]}"
+        return key
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the recorded response for a key.
+
+        Args:
+            key: Cassette key.
+
+        Returns:
+            Recorded response, or None if the key was never recorded.
+        """
+        return self._responses.get(key)
+
+    def record(
+        self,
+        key: str,
+        content: bytes,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record a response and append it to the cassette file.
+
+        Args:
+            key: Cassette key.
+            content: Decoded response body.
+            status_code: HTTP status code.
+            headers: Response headers (wire-encoding headers are dropped).
+        """
+        stored_headers = {
+            name.lower(): value
+            for name, value in (headers or {}).items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        }
+        response = CachedResponse(status_code, stored_headers, content, time.time())
+        with self._lock:
+            self._responses[key] = response
+            append_json_line(
+                self.path,
+                {
+                    "key": key,
+                    "status_code": status_code,
+                    "headers": stored_headers,
+                    "body": content.decode("utf-8", errors="surrogateescape"),
+                    "recorded_at": response.stored_at,
+                },
+            )
+
+    def __len__(self) -> int:
+        """Return the number of recorded responses."""
+        return len(self._responses)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key was recorded."""
+        return key in self._responses
+
+
+class FaultInjector:
+    """Injected latency and rate-limit responses for replayed requests.
+
+    A request is answered with a 429 with probability ``rate_limited``, but
+    never twice in a row for the same key, so adapters retrying once always
+    get through. Decisions come from a seeded generator, so a replay with
+    the same seed and request order is reproducible.
+
+    Attributes:
+        latency: Seconds added to every request.
+        rate_limited: Fraction of requests answered with a 429.
+        retry_after: Retry-After seconds sent with injected 429 responses.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limited: float = 0.0,
+        retry_after: float = 0.0,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Configure the injected faults.
+
+        Args:
+            latency: Seconds added to every request.
+            rate_limited: Fraction of requests (0-1) answered with a 429.
+            retry_after: Retry-After seconds sent with injected 429 responses.
+            seed: Seed of the random generator choosing rate-limited requests.
+            sleep: Sleep function used for latency (injectable for tests).
+
+        Raises:
+            ValueError: If latency is negative or rate_limited is outside 0-1.
+        """
+        if latency < 0:
+            raise ValueError(f"latency must be non-negative, got {latency}")
+        if not 0.0 <= rate_limited <= 1.0:
+            raise ValueError(f"rate_limited must be between 0 and 1, got {rate_limited}")
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.injected = 0
+        self._random = random.Random(seed)
+        self._sleep = sleep
+        self._limited_keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    def delay(self) -> None:
+        """Sleep for the configured latency."""
+        if self.latency > 0:
+            self._sleep(self.latency)
+
+    def should_rate_limit(self, key: str) -> bool:
+        """Decide whether to answer a request with a 429.
+
+        Args:
+            key: Cassette key of the request.
+
+        Returns:
+            True if the request should be rejected.
+        """
+        with self._lock:
+            if key in self._limited_keys:
+                self._limited_keys.discard(key)
+                return False
+            if self.rate_limited and self._random.random() < self.rate_limited:
+                self._limited_keys.add(key)
+                self.injected += 1
+                return True
+            return False
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """httpx transport that records every response into a cassette.
+
+    Example:
+        >>> transport = RecordingTransport(cassette, httpx.HTTPTransport())
+        >>> adapter._client = httpx.Client(transport=transport)
+    """
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport) -> None:
+        """Wrap a transport with recording.
+
+        Args:
+            cassette: Cassette receiving the responses.
+            transport: Transport used for network requests.
+        """
+        self.cassette = cassette
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward a request and record its response.
+
+        Args:
+            request: Outgoing request.
+
+        Returns:
+            Network response.
+        """
+        request.read()
+        response = self._transport.handle_request(request)
+        response.read()
+        # Rate-limit and server errors are not worth replaying
+        if response.status_code < 500 and response.status_code != 429:
+            self.cassette.record(
+                Cassette.key_for_request(request),
+                response.content,
+                response.status_code,
+                response.headers,
+            )
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """httpx transport answering requests from a cassette only.
+
+    Example:
+        >>> transport = ReplayTransport(cassette, FaultInjector(latency=0.05, rate_limited=0.1))
+        >>> adapter._client = httpx.Client(transport=transport)
+    """
+
+    def __init__(self, cassette: Cassette, faults: FaultInjector | None = None) -> None:
+        """Replay a cassette.
+
+        Args:
+            cassette: Cassette with the recorded responses.
+            faults: Optional injected latency and 429 responses.
+        """
+        self.cassette = cassette
+        self.faults = faults or FaultInjector()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request with its recorded response.
+
+        Args:
+            request: Outgoing request.
+
+        Returns:
+            Recorded response, or an injected 429.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        request.read()
+        key = Cassette.key_for_request(request)
+        entry = self.cassette.get(key)
+        if entry is None:
+            raise CassetteMissError(f"Request not in cassette {self.cassette.path}: {key}")
+
+        self.faults.delay()
+        if self.faults.should_rate_limit(key):
+            return httpx.Response(
+                429, headers={"Retry-After": str(self.faults.retry_after)}, request=request
+            )
+        return entry.to_response(request)
+
+
+def _entrez_key(function: str, params: Mapping[str, Any]) -> str:
+    """Build the cassette key of a Bio.Entrez call.
+
+    Args:
+        function: Entrez function name (esearch, efetch, esummary).
+        params: Keyword arguments of the call.
+
+    Returns:
+        Key with the arguments in sorted order.
+    """
+    return f"ENTREZ {function}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+
+class EntrezRecorder:
+    """Bio.Entrez stand-in recording the E-utilities responses it relays.
+
+    Patch it over the ``Entrez`` name used by PubMedAdapter to record a
+    PubMed session; ``read`` is Bio.Entrez's own parser.
+
+    Example:
+        >>> recorder = EntrezRecorder(Cassette(Path("cassettes/pubmed.jsonl")))
+        >>> with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez", recorder):
+        ...     PubMedAdapter(email="me@example.com").search("sepsis", limit=500)
+    """
+
+    def __init__(self, cassette: Cassette, entrez: Any = Entrez) -> None:
+        """Wrap an Entrez module.
+
+        Args:
+            cassette: Cassette receiving the responses.
+            entrez: Module (or stand-in) making the real calls.
+        """
+        self.cassette = cassette
+        self.email: str | None = None
+        self.api_key: str | None = None
+        self._entrez = entrez
+
+    def esearch(self, **params: Any) -> IO[bytes]:
+        """Relay and record an esearch call."""
+        return self._call("esearch", params)
+
+    def efetch(self, **params: Any) -> IO[bytes]:
+        """Relay and record an efetch call."""
+        return self._call("efetch", params)
+
+    def esummary(self, **params: Any) -> IO[bytes]:
+        """Relay and record an esummary call."""
+        return self._call("esummary", params)
+
+    @staticmethod
+    def read(handle: IO[bytes]) -> Any:
+        """Parse an E-utilities response with Bio.Entrez."""
+        return Entrez.read(handle)
+
+    def _call(self, function: str, params: dict[str, Any]) -> IO[bytes]:
+        """Call the wrapped function and record its response body.
+
+        Args:
+            function: Entrez function name.
+            params: Keyword arguments of the call.
+
+        Returns:
+            In-memory handle with the response body.
+        """
+        self._entrez.email = self.email
+        self._entrez.api_key = self.api_key
+        handle = getattr(self._entrez, function)(**params)
+        try:
+            content = handle.read()
+        finally:
+            handle.close()
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self.cassette.record(_entrez_key(function, params), content)
+        return io.BytesIO(content)
+
+
+class EntrezReplayer:
+    """Bio.Entrez stand-in answering E-utilities calls from a cassette.
+
+    Injected 429s are raised as urllib HTTPErrors, as Bio.Entrez does.
+
+    Example:
+        >>> replayer = EntrezReplayer(cassette, FaultInjector(latency=0.1))
+        >>> with patch("lit_review.infrastructure.adapters.pubmed_adapter.Entrez", replayer):
+        ...     papers = PubMedAdapter(email="me@example.com").search("sepsis", limit=500)
+    """
+
+    def __init__(self, cassette: Cassette, faults: FaultInjector | None = None) -> None:
+        """Replay a cassette.
+
+        Args:
+            cassette: Cassette with the recorded responses.
+            faults: Optional injected latency and 429 responses.
+        """
+        self.cassette = cassette
+        self.faults = faults or FaultInjector()
+        self.email: str | None = None
+        self.api_key: str | None = None
+
+    def esearch(self, **params: Any) -> IO[bytes]:
+        """Replay an esearch call."""
+        return self._call("esearch", params)
+
+    def efetch(self, **params: Any) -> IO[bytes]:
+        """Replay an efetch call."""
+        return self._call("efetch", params)
+
+    def esummary(self, **params: Any) -> IO[bytes]:
+        """Replay an esummary call."""
+        return self._call("esummary", params)
+
+    @staticmethod
+    def read(handle: IO[bytes]) -> Any:
+        """Parse an E-utilities response with Bio.Entrez."""
+        return Entrez.read(handle)
+
+    def _call(self, function: str, params: dict[str, Any]) -> IO[bytes]:
+        """Return the recorded response body of a call.
+
+        Args:
+            function: Entrez function name.
+            params: Keyword arguments of the call.
+
+        Returns:
+            In-memory handle with the recorded body.
+
+        Raises:
+            CassetteMissError: If the call was never recorded.
+            HTTPError: If a 429 is injected.
+        """
+        key = _entrez_key(function, params)
+        entry = self.cassette.get(key)
+        if entry is None:
+            raise CassetteMissError(f"Call not in cassette {self.cassette.path}: {key}")
+
+        self.faults.delay()
+        if self.faults.should_rate_limit(key):
+            headers = Message()
+            headers["Retry-After"] = str(self.faults.retry_after)
+            raise HTTPError(function, 429, "Too Many Requests", headers, None)
+        return io.BytesIO(entry.content)
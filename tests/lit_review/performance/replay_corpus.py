@@ -0,0 +1,367 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Synthetic API servers and recorded cassettes for offline search benchmarks.
+
+The servers generate realistic Crossref, arXiv, Semantic Scholar and PubMed
+payloads (abstracts, several authors, keywords) for any corpus size. Each
+corpus is recorded once per session into on-disk cassettes, which the
+benchmarks replay through ReplayTransport and EntrezReplayer, so that the
+measured path is the adapters' real parsing, Paper construction and
+deduplication without network access.
+"""
+
+import io
+import random
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+from xml.sax.saxutils import escape
+
+import httpx
+
+from lit_review.application.usecases.search_papers import SearchPapersUseCase
+from lit_review.domain.services.deduplication import PaperDeduplicator
+from lit_review.infrastructure.adapters.arxiv_adapter import ArxivAdapter
+from lit_review.infrastructure.adapters.crossref_adapter import CrossrefAdapter
+from lit_review.infrastructure.adapters.pubmed_adapter import PubMedAdapter
+from lit_review.infrastructure.adapters.rate_limiter import TokenBucketRateLimiter
+from lit_review.infrastructure.adapters.semantic_scholar_adapter import SemanticScholarAdapter
+from tests.lit_review.performance.replay import (
+    Cassette,
+    EntrezRecorder,
+    EntrezReplayer,
+    FaultInjector,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+QUERY = "machine learning sepsis"
+CAPPED_RECORDS = 100  # arXiv and Semantic Scholar return one page per query
+DUPLICATE_EVERY = 50  # Every 50th PubMed record is a Crossref paper without DOI
+PUBMED_ENTREZ = "lit_review.infrastructure.adapters.pubmed_adapter.Entrez"
+
+WORDS = (
+    "sepsis mortality prediction model clinical cohort intensive care patients "
+    "learning neural network gradient boosting validation cohort outcome risk "
+    "electronic health records early warning score biomarker lactate survival "
+    "retrospective multicenter deep features calibration discrimination "
+    "pediatric adult emergency department septic shock vasopressor antibiotic "
+    "timing bundle compliance readmission length stay transformer attention "
+    "interpretability fairness bias external temporal prospective randomized "
+    "trial registry federated imaging laboratory vital signs time series"
+).split()
+SURNAMES = ["Smith", "Garcia", "Chen", "Müller", "Okafor", "Rossi", "Kowalski", "Tanaka"]
+GIVEN = ["Anna", "Wei", "José", "Fatima", "John", "Priya", "Lukas", "Amara"]
+
+
+@dataclass(frozen=True)
+class Record:
+    """One synthetic paper, rendered differently by each server."""
+
+    key: str
+    title: str
+    authors: tuple[tuple[str, str], ...]
+    year: int
+    abstract: str
+    keywords: tuple[str, ...]
+
+
+def make_records(prefix: str, count: int, seed: int) -> list[Record]:
+    """Generate reproducible synthetic records.
+
+    Args:
+        prefix: Prefix making record keys unique per database.
+        count: Number of records.
+        seed: Random seed.
+
+    Returns:
+        Records with realistic field sizes (~600 character abstracts).
+    """
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        records.append(
+            Record(
+                key=f"{prefix}{index}",
+                title=" ".join(rng.choices(WORDS, k=10)).capitalize() + f" ({prefix}{index})",
+                authors=tuple(
+                    (rng.choice(SURNAMES), rng.choice(GIVEN)) for _ in range(rng.randint(2, 6))
+                ),
+                year=rng.randint(2005, 2024),
+                abstract=" ".join(rng.choices(WORDS, k=80)),
+                keywords=tuple(rng.sample(WORDS, 5)),
+            )
+        )
+    return records
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """Records served by each synthetic database for one benchmark size."""
+
+    crossref: list[Record]
+    pubmed: list[Record]
+    arxiv: list[Record]
+    semantic_scholar: list[Record]
+
+    @classmethod
+    def of_size(cls, size: int) -> "Corpus":
+        """Split ``size`` records over the four databases.
+
+        arXiv and Semantic Scholar serve CAPPED_RECORDS each; Crossref and
+        PubMed share the rest, PubMed up to its RESULT_CAP, and every
+        DUPLICATE_EVERY-th PubMed record repeats a Crossref paper (same
+        title, authors and year).
+        """
+        pubmed_count = min(size - size // 2 - 2 * CAPPED_RECORDS, PubMedAdapter.RESULT_CAP)
+        crossref_count = size - pubmed_count - 2 * CAPPED_RECORDS
+        crossref = make_records("cr", crossref_count, seed=1)
+        pubmed = make_records("pm", pubmed_count, seed=2)
+        for index in range(0, min(len(pubmed), crossref_count), DUPLICATE_EVERY):
+            pubmed[index] = crossref[index]
+        return cls(
+            crossref=crossref,
+            pubmed=pubmed,
+            arxiv=make_records("ax", CAPPED_RECORDS, seed=3),
+            semantic_scholar=make_records("s2", CAPPED_RECORDS, seed=4),
+        )
+
+    @property
+    def size(self) -> int:
+        """Total records served."""
+        return sum(
+            len(records)
+            for records in (self.crossref, self.pubmed, self.arxiv, self.semantic_scholar)
+        )
+
+    @property
+    def unique(self) -> int:
+        """Distinct works after deduplication."""
+        crossref_keys = {record.key for record in self.crossref}
+        return self.size - sum(1 for record in self.pubmed if record.key in crossref_keys)
+
+
+def crossref_server(records: list[Record]) -> Callable[[httpx.Request], httpx.Response]:
+    """Return a handler serving records through Crossref cursor paging."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        cursor = params.get("cursor", "*")
+        start = 0 if cursor == "*" else int(cursor)
+        end = min(start + int(params["rows"]), len(records))
+        items = [
+            {
+                "DOI": f"10.5555/{record.key}",
+                "title": [record.title],
+                "author": [{"family": family, "given": given} for family, given in record.authors],
+                "published": {"date-parts": [[record.year, 3, 1]]},
+                "container-title": ["Journal of Critical Care"],
+                "abstract": f"<jats:p>{escape(record.abstract)}</jats:p>",
+            }
+            for record in records[start:end]
+        ]
+        message: dict[str, Any] = {"total-results": len(records), "items": items}
+        if end < len(records):
+            message["next-cursor"] = str(end)
+        return httpx.Response(200, json={"status": "ok", "message": message})
+
+    return handler
+
+
+def arxiv_server(records: list[Record]) -> Callable[[httpx.Request], httpx.Response]:
+    """Return a handler serving records as an arXiv Atom feed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        count = min(int(request.url.params["max_results"]), len(records))
+        entries = "".join(
+            f"""<entry>
+<id>http://arxiv.org/abs/2401.{index:05d}v1</id>
+<title>{escape(record.title)}</title>
+{"".join(f"<author><name>{given} {family}</name></author>" for family, given in record.authors)}
+<published>{record.year}-02-01T10:00:00Z</published>
+<summary>{escape(record.abstract)}</summary>
+<arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+<category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+<category term="stat.ML" scheme="http://arxiv.org/schemas/atom"/>
+</entry>"""
+            for index, record in enumerate(records[:count])
+        )
+        feed = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom" '
+            'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+            f"{entries}</feed>"
+        )
+        return httpx.Response(200, content=feed.encode())
+
+    return handler
+
+
+def semantic_scholar_server(records: list[Record]) -> Callable[[httpx.Request], httpx.Response]:
+    """Return a handler serving records from the Semantic Scholar search endpoint."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        count = min(int(request.url.params["limit"]), len(records))
+        data = [
+            {
+                "paperId": f"s2{index:08x}",
+                "externalIds": {"DOI": f"10.6666/{record.key}"},
+                "title": record.title,
+                "authors": [
+                    {"authorId": str(i), "name": f"{given} {family}"}
+                    for i, (family, given) in enumerate(record.authors)
+                ],
+                "year": record.year,
+                "venue": "Critical Care Medicine",
+                "abstract": record.abstract,
+            }
+            for index, record in enumerate(records[:count])
+        ]
+        return httpx.Response(200, json={"total": len(records), "offset": 0, "data": data})
+
+    return handler
+
+
+class SyntheticEntrez:
+    """Bio.Entrez stand-in generating E-utilities responses for records."""
+
+    def __init__(self, records: list[Record]) -> None:
+        self.records = records
+        self.email: str | None = None
+        self.api_key: str | None = None
+
+    def esearch(self, **params: Any) -> io.BytesIO:
+        xml = (
+            '<?xml version="1.0" ?>'
+            '<!DOCTYPE eSearchResult PUBLIC "-//NLM//DTD esearch 20060628//EN" '
+            '"https://eutils.ncbi.nlm.nih.gov/eutils/dtd/20060628/esearch.dtd">'
+            f"<eSearchResult><Count>{len(self.records)}</Count><RetMax>0</RetMax>"
+            "<RetStart>0</RetStart><QueryKey>1</QueryKey><WebEnv>SYNTHETIC</WebEnv>"
+            "<IdList></IdList><TranslationSet></TranslationSet>"
+            f"<QueryTranslation>{escape(str(params['term']))}</QueryTranslation>"
+            "</eSearchResult>"
+        )
+        return io.BytesIO(xml.encode())
+
+    def efetch(self, **params: Any) -> io.BytesIO:
+        start = int(params["retstart"])
+        end = min(start + int(params["retmax"]), len(self.records))
+        articles = "".join(self._article(pmid, self.records[pmid]) for pmid in range(start, end))
+        return io.BytesIO(f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode())
+
+    @staticmethod
+    def _article(pmid: int, record: Record) -> str:
+        authors = "".join(
+            f"<Author><LastName>{family}</LastName><ForeName>{given}</ForeName>"
+            f"<Initials>{given[0]}</Initials></Author>"
+            for family, given in record.authors
+        )
+        keywords = "".join(f"<Keyword>{keyword}</Keyword>" for keyword in record.keywords)
+        return f"""<PubmedArticle><MedlineCitation><PMID>{pmid + 1}</PMID><Article>
+<Journal><Title>Critical Care Medicine</Title>
+<JournalIssue><PubDate><Year>{record.year}</Year></PubDate></JournalIssue></Journal>
+<ArticleTitle>{escape(record.title)}</ArticleTitle>
+<Abstract><AbstractText>{escape(record.abstract)}</AbstractText></Abstract>
+<AuthorList>{authors}</AuthorList></Article>
+<KeywordList>{keywords}</KeywordList></MedlineCitation>
+<PubmedData><ArticleIdList><ArticleId IdType="pubmed">{pmid + 1}</ArticleId></ArticleIdList>
+</PubmedData></PubmedArticle>"""
+
+
+@dataclass(frozen=True)
+class Cassettes:
+    """On-disk cassettes of one corpus, one per database."""
+
+    corpus: Corpus
+    directory: Path
+
+    def path(self, database: str) -> Path:
+        """Return the cassette file of a database."""
+        return self.directory / f"{database}.jsonl"
+
+
+def build_use_case(
+    transports: dict[str, httpx.BaseTransport], deduplicator: PaperDeduplicator | None = None
+) -> SearchPapersUseCase:
+    """Create a use case whose adapters send requests through the given transports.
+
+    Args:
+        transports: Transport per HTTP database (crossref, arxiv, semantic-scholar).
+        deduplicator: Optional fuzzy deduplicator.
+
+    Returns:
+        SearchPapersUseCase with the four adapters (PubMed uses the patched Entrez).
+    """
+    adapters: dict[str, Any] = {
+        "crossref": CrossrefAdapter(rate_limit=0.0),
+        "arxiv": ArxivAdapter(rate_limit=0.0),
+        "semantic-scholar": SemanticScholarAdapter(rate_limit=0.0),
+    }
+    use_case = SearchPapersUseCase(deduplicator=deduplicator, max_retries=1)
+    for name, adapter in adapters.items():
+        adapter._client = httpx.Client(transport=transports[name])
+        use_case.add_service(name, adapter)
+    use_case.add_service(
+        "pubmed",
+        PubMedAdapter(
+            email="bench@example.com",
+            rate_limiter=TokenBucketRateLimiter.from_interval(0.0),
+        ),
+    )
+    return use_case
+
+
+@contextmanager
+def replaying(
+    cassettes: Cassettes,
+    faults: Callable[[], FaultInjector] = FaultInjector,
+    deduplicator: PaperDeduplicator | None = None,
+) -> Iterator[SearchPapersUseCase]:
+    """Build a use case replaying recorded cassettes.
+
+    Args:
+        cassettes: Recorded corpus.
+        faults: Factory of the fault injector used for each database.
+        deduplicator: Optional fuzzy deduplicator.
+
+    Yields:
+        SearchPapersUseCase answering every request from the cassettes.
+    """
+    transports: dict[str, httpx.BaseTransport] = {
+        name: ReplayTransport(Cassette(cassettes.path(name)), faults())
+        for name in ("crossref", "arxiv", "semantic-scholar")
+    }
+    entrez = EntrezReplayer(Cassette(cassettes.path("pubmed")), faults())
+    with patch(PUBMED_ENTREZ, entrez):
+        yield build_use_case(transports, deduplicator)
+
+
+def record_corpus(size: int, directory: Path) -> Cassettes:
+    """Record one search over the synthetic servers into cassettes.
+
+    Args:
+        size: Total records served by the four databases.
+        directory: Directory receiving the cassette files.
+
+    Returns:
+        The recorded cassettes.
+    """
+    corpus = Corpus.of_size(size)
+    cassettes = Cassettes(corpus, directory)
+    servers = {
+        "crossref": crossref_server(corpus.crossref),
+        "arxiv": arxiv_server(corpus.arxiv),
+        "semantic-scholar": semantic_scholar_server(corpus.semantic_scholar),
+    }
+    transports: dict[str, httpx.BaseTransport] = {
+        name: RecordingTransport(Cassette(cassettes.path(name)), httpx.MockTransport(server))
+        for name, server in servers.items()
+    }
+    recorder = EntrezRecorder(Cassette(cassettes.path("pubmed")), SyntheticEntrez(corpus.pubmed))
+    with patch(PUBMED_ENTREZ, recorder):
+        papers = build_use_case(transports).execute(QUERY, limit=size)
+    assert len(papers) == corpus.size, "recording did not capture every record"
+    return cassettes
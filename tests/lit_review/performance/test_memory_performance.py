@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Memory footprint of a loaded review.
+
+Saves a synthetic review whose journals, author names and keywords recur
+across papers the way they do in real search results, then measures the
+bytes retained per paper after JSONReviewRepository.load. Slotted Paper,
+Author and DOI instances and interned repeated strings keep the footprint
+below BYTES_PER_PAPER_BUDGET.
+
+Run with: pytest tests/lit_review/performance/test_memory_performance.py --benchmark-only
+Skip the 100k-paper run: add -m "not slow"
+"""
+
+import random
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from lit_review.domain.entities.paper import Paper
+from lit_review.domain.entities.review import Review
+from lit_review.domain.values.author import Author
+from lit_review.domain.values.doi import DOI
+from lit_review.infrastructure.persistence.json_repository import JSONReviewRepository
+
+# Before slots and interning a loaded paper retained about 2.3 kB
+BYTES_PER_PAPER_BUDGET = 1_200
+
+SIZES = [
+    pytest.param(10_000, id="10k"),
+    pytest.param(100_000, id="100k", marks=pytest.mark.slow),
+]
+
+
+def generate_review(count: int) -> Review:
+    """Generate a review with realistic repetition of metadata strings."""
+    rng = random.Random(0)
+    journals = [f"Journal of Clinical Topic {i}" for i in range(200)]
+    last_names = [f"Surname{i}" for i in range(3_000)]
+    first_names = [f"Given{i}" for i in range(500)]
+    keywords = [f"keyword {i}" for i in range(1_000)]
+
+    review = Review(
+        title="Memory Benchmark",
+        research_question="How much memory does a loaded review use?",
+        inclusion_criteria=["Any"],
+        exclusion_criteria=[],
+    )
+    review.advance_stage()
+    review.add_papers(
+        [
+            Paper(
+                doi=DOI(f"10.1234/memory.{i}"),
+                title=f"Paper {i} on a clinical topic",
+                authors=[
+                    Author(rng.choice(last_names), rng.choice(first_names), "G.")
+                    for _ in range(rng.randint(2, 6))
+                ],
+                publication_year=2000 + i % 25,
+                journal=rng.choice(journals),
+                keywords=rng.sample(keywords, 5),
+            )
+            for i in range(count)
+        ]
+    )
+    return review
+
+
+def retained_bytes_per_paper(repo: JSONReviewRepository, title: str) -> float:
+    """Load a review and return the bytes it retains per paper."""
+    tracemalloc.start()
+    try:
+        review = repo.load(title)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained / len(review.papers)
+
+
+@pytest.mark.benchmark
+class TestLoadedReviewMemory:
+    """Bytes retained per paper by a review loaded from JSON."""
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_bytes_per_paper(self, benchmark, tmp_path: Path, size: int) -> None:
+        """A loaded paper stays within the per-paper memory budget."""
+        repo = JSONReviewRepository(tmp_path)
+        repo.save(generate_review(size))
+
+        bytes_per_paper = benchmark.pedantic(
+            retained_bytes_per_paper, args=(repo, "Memory Benchmark"), rounds=1
+        )
+
+        benchmark.extra_info["bytes_per_paper"] = round(bytes_per_paper)
+        assert bytes_per_paper < BYTES_PER_PAPER_BUDGET
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Aggregate queries over a 500k-paper PaperTable.
+
+The table is generated column by column, so the benchmarks measure only the
+vectorized filters and group-bys, not Paper construction.
+
+Run with: pytest tests/lit_review/performance/test_paper_table_performance.py --benchmark-only
+"""
+
+import numpy as np
+import pytest
+
+from lit_review.application.services.paper_table import PaperTable
+from lit_review.domain.values.author import Author
+
+ROWS = 500_000
+
+# Target for each aggregate query over ROWS papers
+TARGET_SECONDS = 0.1
+
+
+@pytest.fixture(scope="module")
+def table() -> PaperTable:
+    """A 500k-row table with 200 journals, 5k authors and 1k keywords."""
+    rng = np.random.default_rng(0)
+    authors_per_paper = rng.integers(1, 7, ROWS)
+    keywords_per_paper = rng.integers(0, 6, ROWS)
+    author_offsets = np.concatenate([[0], np.cumsum(authors_per_paper)]).astype(np.int64)
+    keyword_offsets = np.concatenate([[0], np.cumsum(keywords_per_paper)]).astype(np.int64)
+    scores = rng.uniform(0, 10, ROWS)
+    scores[rng.random(ROWS) < 0.3] = np.nan
+    included = np.where(np.isnan(scores), -1, scores >= 5).astype(np.int8)
+    text = np.array([f"10.1234/{i}" for i in range(ROWS)], dtype=object)
+    return PaperTable(
+        dois=text,
+        titles=text,
+        abstracts=text,
+        notes=np.full(ROWS, "", dtype=object),
+        years=rng.integers(1990, 2025, ROWS).astype(np.int32),
+        scores=scores,
+        included=included,
+        journal_codes=rng.integers(0, 200, ROWS).astype(np.int32),
+        journals=[f"Journal {i}" for i in range(200)],
+        author_codes=rng.integers(0, 5_000, author_offsets[-1]).astype(np.int32),
+        author_offsets=author_offsets,
+        authors=[Author(f"Surname{i}", "Given", "G.") for i in range(5_000)],
+        keyword_codes=rng.integers(0, 1_000, keyword_offsets[-1]).astype(np.int32),
+        keyword_offsets=keyword_offsets,
+        keywords=[f"keyword {i}" for i in range(1_000)],
+    )
+
+
+@pytest.mark.benchmark
+class TestPaperTableAggregates:
+    """Aggregate queries over 500k papers take milliseconds."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            pytest.param(PaperTable.statistics, id="statistics"),
+            pytest.param(PaperTable.count_by_journal, id="count_by_journal"),
+            pytest.param(PaperTable.count_by_author, id="count_by_author"),
+            pytest.param(PaperTable.score_histogram, id="score_histogram"),
+            pytest.param(PaperTable.inclusion_rate_by_year, id="inclusion_rate_by_year"),
+            pytest.param(PaperTable.inclusion_rate_by_journal, id="inclusion_rate_by_journal"),
+            pytest.param(
+                lambda t: t.filter(year_from=2015, included=True, min_score=7.0),
+                id="filter",
+            ),
+        ],
+    )
+    def test_aggregate(self, benchmark, table: PaperTable, query) -> None:
+        """Each query over the full table meets the target."""
+        benchmark(query, table)
+
+        if benchmark.stats:  # None with --benchmark-disable
+            assert benchmark.stats.stats.mean < TARGET_SECONDS
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for record/replay transports and the Entrez stand-ins."""
+
+import io
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from lit_review.infrastructure.adapters.crossref_adapter import CrossrefAdapter
+from lit_review.infrastructure.adapters.pubmed_adapter import PubMedAdapter
+from lit_review.infrastructure.adapters.rate_limiter import TokenBucketRateLimiter
+from tests.lit_review.performance.replay import (
+    Cassette,
+    CassetteMissError,
+    EntrezRecorder,
+    EntrezReplayer,
+    FaultInjector,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+PUBMED_ADAPTER_ENTREZ = "lit_review.infrastructure.adapters.pubmed_adapter.Entrez"
+
+
+def _crossref_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a one-page Crossref result echoing the query."""
+    query = request.url.params["query"]
+    items = [
+        {
+            "DOI": f"10.1234/{query}-{i}",
+            "title": [f"Paper {i} on {query}"],
+            "author": [{"family": "Smith", "given": "John"}],
+            "published": {"date-parts": [[2023]]},
+            "container-title": ["Journal"],
+        }
+        for i in range(3)
+    ]
+    return httpx.Response(200, json={"message": {"items": items}})
+
+
+def _crossref(transport: httpx.BaseTransport) -> CrossrefAdapter:
+    adapter = CrossrefAdapter(rate_limit=0.0)
+    adapter._client = httpx.Client(transport=transport)
+    return adapter
+
+
+class TestCassette:
+    """Tests for recording and replaying HTTP responses."""
+
+    def test_recorded_responses_replay_from_disk(self, tmp_path: Path) -> None:
+        """A cassette recorded once answers the same requests without a server."""
+        path = tmp_path / "crossref.jsonl"
+        recorded = _crossref(
+            RecordingTransport(Cassette(path), httpx.MockTransport(_crossref_handler))
+        ).search("sepsis", limit=3)
+
+        replayed = _crossref(ReplayTransport(Cassette(path))).search("sepsis", limit=3)
+
+        assert [p.doi.value for p in replayed] == [p.doi.value for p in recorded]
+        assert len(Cassette(path)) == 1
+
+    def test_unrecorded_request_raises(self, tmp_path: Path) -> None:
+        """Replaying a request that was never recorded fails loudly."""
+        client = httpx.Client(transport=ReplayTransport(Cassette(tmp_path / "empty.jsonl")))
+
+        with pytest.raises(CassetteMissError):
+            client.get("https://api.crossref.org/works", params={"query": "sepsis"})
+
+    def test_post_bodies_are_part_of_the_key(self, tmp_path: Path) -> None:
+        """POSTs to the same URL with different bodies are recorded separately."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=request.content)
+
+        cassette = Cassette(tmp_path / "posts.jsonl")
+        recorder = httpx.Client(
+            transport=RecordingTransport(cassette, httpx.MockTransport(handler))
+        )
+        recorder.post("https://example.org/batch", json={"ids": ["a"]})
+        recorder.post("https://example.org/batch", json={"ids": ["b"]})
+
+        replay = httpx.Client(transport=ReplayTransport(Cassette(cassette.path)))
+
+        assert replay.post("https://example.org/batch", json={"ids": ["b"]}).json() == {
+            "ids": ["b"]
+        }
+        assert len(cassette) == 2
+
+    def test_rate_limit_responses_are_not_recorded(self, tmp_path: Path) -> None:
+        """429s seen while recording are not replayed later."""
+        cassette = Cassette(tmp_path / "limited.jsonl")
+        client = httpx.Client(
+            transport=RecordingTransport(
+                cassette, httpx.MockTransport(lambda request: httpx.Response(429))
+            )
+        )
+
+        client.get("https://example.org/search")
+
+        assert len(cassette) == 0
+
+
+class TestFaultInjection:
+    """Tests for injected latency and 429 responses."""
+
+    def test_injected_rate_limits_are_retried_by_adapters(self, tmp_path: Path) -> None:
+        """Every request is rejected once, and the adapter's retry succeeds."""
+        path = tmp_path / "crossref.jsonl"
+        _crossref(
+            RecordingTransport(Cassette(path), httpx.MockTransport(_crossref_handler))
+        ).search("sepsis", limit=3)
+        faults = FaultInjector(rate_limited=1.0)
+
+        papers = _crossref(ReplayTransport(Cassette(path), faults)).search("sepsis", limit=3)
+
+        assert len(papers) == 3
+        assert faults.injected == 1
+
+    def test_latency_is_added_to_each_request(self, tmp_path: Path) -> None:
+        """Each replayed request sleeps for the configured latency."""
+        path = tmp_path / "crossref.jsonl"
+        _crossref(
+            RecordingTransport(Cassette(path), httpx.MockTransport(_crossref_handler))
+        ).search("sepsis", limit=3)
+        sleeps: list[float] = []
+        faults = FaultInjector(latency=0.25, sleep=sleeps.append)
+
+        _crossref(ReplayTransport(Cassette(path), faults)).search("sepsis", limit=3)
+
+        assert sleeps == [0.25]
+
+    def test_same_seed_injects_same_faults(self) -> None:
+        """Fault decisions are reproducible for a given seed."""
+        keys = [f"GET /page/{i}" for i in range(50)]
+
+        first, second = (
+            FaultInjector(rate_limited=0.3, seed=7),
+            FaultInjector(rate_limited=0.3, seed=7),
+        )
+
+        assert [first.should_rate_limit(k) for k in keys] == [
+            second.should_rate_limit(k) for k in keys
+        ]
+        assert 0 < first.injected < len(keys)
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Latency and the rate-limited fraction are validated."""
+        with pytest.raises(ValueError):
+            FaultInjector(latency=-1.0)
+        with pytest.raises(ValueError):
+            FaultInjector(rate_limited=1.5)
+
+
+def _fake_entrez() -> SimpleNamespace:
+    """Build an Entrez stand-in serving one esearch and one efetch batch."""
+    esearch_xml = (
+        b'<?xml version="1.0" ?>'
+        b'<!DOCTYPE eSearchResult PUBLIC "-//NLM//DTD esearch 20060628//EN" '
+        b'"https://eutils.ncbi.nlm.nih.gov/eutils/dtd/20060628/esearch.dtd">'
+        b"<eSearchResult><Count>2</Count><RetMax>0</RetMax><RetStart>0</RetStart>"
+        b"<QueryKey>1</QueryKey><WebEnv>WEBENV_1</WebEnv><IdList></IdList>"
+        b"<TranslationSet></TranslationSet><QueryTranslation>sepsis</QueryTranslation>"
+        b"</eSearchResult>"
+    )
+    articles = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>Article {pmid}</ArticleTitle>"
+        "<AuthorList><Author><LastName>Smith</LastName><ForeName>John</ForeName></Author>"
+        "</AuthorList><Journal><Title>Journal</Title></Journal>"
+        "<PubDate><Year>2022</Year></PubDate></Article></MedlineCitation></PubmedArticle>"
+        for pmid in (1, 2)
+    )
+
+    def efetch(**params: Any) -> io.BytesIO:
+        return io.BytesIO(f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode())
+
+    return SimpleNamespace(
+        esearch=lambda **params: io.BytesIO(esearch_xml),
+        efetch=efetch,
+        email=None,
+        api_key=None,
+    )
+
+
+class TestEntrezReplay:
+    """Tests for the Bio.Entrez stand-ins."""
+
+    def _search(self) -> list[str]:
+        adapter = PubMedAdapter(
+            email="test@example.com", rate_limiter=TokenBucketRateLimiter(rate=1000)
+        )
+        return [p.doi.value for p in adapter.search("sepsis", limit=10)]
+
+    def test_recorded_session_replays(self, tmp_path: Path) -> None:
+        """A PubMed search recorded through EntrezRecorder replays identically."""
+        path = tmp_path / "pubmed.jsonl"
+        with patch(PUBMED_ADAPTER_ENTREZ, EntrezRecorder(Cassette(path), _fake_entrez())):
+            recorded = self._search()
+        with patch(PUBMED_ADAPTER_ENTREZ, EntrezReplayer(Cassette(path))):
+            replayed = self._search()
+
+        assert replayed == recorded
+        assert len(recorded) == 2
+
+    def test_injected_rate_limit_surfaces_as_connection_error(self, tmp_path: Path) -> None:
+        """An injected 429 is raised like an E-utilities HTTP error."""
+        path = tmp_path / "pubmed.jsonl"
+        with patch(PUBMED_ADAPTER_ENTREZ, EntrezRecorder(Cassette(path), _fake_entrez())):
+            self._search()
+
+        replayer = EntrezReplayer(Cassette(path), FaultInjector(rate_limited=1.0))
+        with patch(PUBMED_ADAPTER_ENTREZ, replayer), pytest.raises(ConnectionError):
+            self._search()
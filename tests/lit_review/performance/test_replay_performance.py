@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 Yuimedi Corp.
+# SPDX-License-Identifier: Apache-2.0
+"""Offline end-to-end search benchmarks replaying recorded API responses.
+
+Unlike test_search_performance.py, which mocks the adapters, these
+benchmarks run the real Crossref, PubMed, arXiv and Semantic Scholar
+adapters against cassettes recorded from synthetic servers (see
+replay_corpus.py), so they measure response parsing, Paper construction and
+deduplication without network access.
+
+Run with: pytest tests/lit_review/performance/test_replay_performance.py --benchmark-only
+Skip the 100k-record runs: add -m "not slow"
+Catch regressions: run once with --benchmark-autosave, then later runs with
+--benchmark-compare --benchmark-compare-fail=mean:20%
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+from lit_review.domain.services.deduplication import PaperDeduplicator
+from tests.lit_review.performance.replay import FaultInjector
+from tests.lit_review.performance.replay_corpus import QUERY, Cassettes, replaying
+
+SIZES = [
+    pytest.param(1_000, id="1k"),
+    pytest.param(10_000, id="10k"),
+    pytest.param(100_000, id="100k", marks=pytest.mark.slow),
+]
+
+
+@pytest.mark.benchmark
+class TestReplaySearchThroughput:
+    """End-to-end SearchPapersUseCase throughput on replayed responses."""
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_search_all_databases(
+        self, benchmark, recorded_corpus: Callable[[int], Cassettes], size: int
+    ) -> None:
+        """Search four databases and deduplicate by DOI."""
+        cassettes = recorded_corpus(size)
+
+        with replaying(cassettes) as use_case:
+            papers = benchmark.pedantic(
+                use_case.execute, args=(QUERY,), kwargs={"limit": size}, rounds=3
+            )
+
+        assert len(papers) == cassettes.corpus.size
+        if benchmark.stats:  # None with --benchmark-disable
+            benchmark.extra_info["records_per_second"] = size / benchmark.stats.stats.mean
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_search_with_fuzzy_deduplication(
+        self, benchmark, recorded_corpus: Callable[[int], Cassettes], size: int
+    ) -> None:
+        """Search four databases and merge duplicates found under different DOIs."""
+        cassettes = recorded_corpus(size)
+
+        with replaying(cassettes, deduplicator=PaperDeduplicator()) as use_case:
+            papers = benchmark.pedantic(
+                use_case.execute, args=(QUERY,), kwargs={"limit": size}, rounds=3
+            )
+
+        assert len(papers) == cassettes.corpus.unique
+        if benchmark.stats:  # None with --benchmark-disable
+            benchmark.extra_info["records_per_second"] = size / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark
+class TestReplayUnderFaults:
+    """Throughput with injected latency and rate limiting."""
+
+    def test_search_with_latency_and_rate_limits(
+        self, benchmark, recorded_corpus: Callable[[int], Cassettes]
+    ) -> None:
+        """Every paper still arrives when 20% of HTTP requests get a 429.
+
+        PubMed is replayed with latency only: its 429s are retried by the
+        use case after seconds of backoff, which would dominate the timing.
+        """
+        cassettes = recorded_corpus(10_000)
+        injectors: list[FaultInjector] = []
+
+        def faults() -> FaultInjector:
+            rate_limited = 0.2 if len(injectors) < 3 else 0.0
+            injectors.append(FaultInjector(latency=0.005, rate_limited=rate_limited, seed=1))
+            return injectors[-1]
+
+        with replaying(cassettes, faults) as use_case:
+            papers = benchmark.pedantic(
+                use_case.execute, args=(QUERY,), kwargs={"limit": 10_000}, rounds=3
+            )
+
+        assert len(papers) == cassettes.corpus.size
+        assert sum(injector.injected for injector in injectors) > 0